@@ -13,7 +13,7 @@ async def start_app():
     Инициализирует конфиг, Redis, Database, запуск отложенных задач.
     """
 
-    app_container = AppContainer()
+    app_container = await AppContainer.create()
     async_session_factory = app_container.conf.db_connection.session_local
 
     # заполнение кэша
@@ -7,7 +7,7 @@ from src.exceptions.domain import StickerNotFound
 from src.exceptions.telegram import TelegramBadRequestService, TelegramForbiddenErrorService
 from src.infrastructure.files.file_system import FileStorage
 from src.infrastructure.files.path_builder import PathBuilder
-from src.infrastructure.telegram.rate_limit import RateLimiter
+from src.infrastructure.telegram.rate_limit import RateLimiter, Priority
 from src.models.update_models import UpdateUiImageDTO
 from src.models.update_models.bot_actions import EditMessagePhoto
 from src.application.bot.send_message import SendMessageService
@@ -76,6 +76,8 @@ class EditMessageService:
 
         image_key = self._resolve_image_key(image_key, event_message_key)
 
+        await self.limiter.acquire(chat_id, Priority.INTERACTIVE)
+
         # Если есть image_key — пробуем редактировать/заменить media
         if image_key:
             ui_image = await self.ui_images_service.get_ui_image(image_key)
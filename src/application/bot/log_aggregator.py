@@ -0,0 +1,81 @@
+from logging import Logger
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from src.infrastructure.buffering import CoalescingBuffer
+
+
+DeliverCallback = Callable[[List[str]], Awaitable[None]]
+
+# максимальная длина сообщения Telegram
+MESSAGE_LIMIT = 4096
+SEPARATOR = "\n\n"
+
+
+class LogAggregator:
+    """
+    Накопление логов для канала логов.
+
+    Логи копятся `window` секунд, одинаковые тексты схлопываются в один со счётчиком повторов,
+    а затем всё упаковывается в сообщения до 4096 символов. При всплеске ошибок канал получает
+    несколько длинных сообщений вместо сотен коротких.
+
+    Если `window` не задан, логи отправляются сразу при добавлении (используется без AppContainer).
+    """
+
+    def __init__(self, deliver: DeliverCallback, logger: Logger, window: Optional[float] = None):
+        """
+        :param deliver: корутина, отправляющая готовые сообщения в канал логов
+        """
+        self.deliver = deliver
+        self._buffer = CoalescingBuffer(
+            factory=dict,
+            handle=self._deliver,
+            logger=logger,
+            name="LogAggregator",
+            window=window,
+        )
+
+    async def add(self, text: str) -> None:
+        pending = self._buffer.pending
+        pending[text] = pending.get(text, 0) + 1
+        await self._buffer.touch()
+
+    async def _deliver(self, pending: Dict[str, int]) -> None:
+        await self.deliver(self.pack(pending))
+
+    async def flush(self) -> None:
+        """Отправит все накопленные логи"""
+        await self._buffer.flush()
+
+    async def stop(self) -> None:
+        """Отменит ожидание окна и сразу отправит накопленное"""
+        await self._buffer.stop()
+
+    @staticmethod
+    def pack(pending: Dict[str, int], limit: int = MESSAGE_LIMIT) -> List[str]:
+        """
+        :param pending: Dict[текст лога, количество повторов] в порядке поступления
+        :return: сообщения не длиннее `limit`. Лог длиннее `limit` разбивается на несколько сообщений
+        """
+        messages: List[str] = []
+        current = ""
+
+        for text, count in pending.items():
+            entry = text if count == 1 else f"[x{count}] {text}"
+
+            if len(entry) > limit:
+                if current:
+                    messages.append(current)
+                    current = ""
+                messages.extend(entry[i:i + limit] for i in range(0, len(entry), limit))
+                continue
+
+            if current and len(current) + len(SEPARATOR) + len(entry) > limit:
+                messages.append(current)
+                current = ""
+
+            current = f"{current}{SEPARATOR}{entry}" if current else entry
+
+        if current:
+            messages.append(current)
+        return messages
@@ -1,20 +1,24 @@
 import asyncio
 import html
 import re
+import time
 import validators
 
 from logging import Logger
-from typing import Optional, Tuple, AsyncGenerator, TYPE_CHECKING
+from typing import Optional, Tuple, AsyncGenerator, Dict, List, Set, TYPE_CHECKING
 
 from src.config import Config
 from src.exceptions import TextTooLong, TextNotLinc
 from src.exceptions.telegram import TelegramRetryAfterService, TelegramForbiddenErrorService, TelegramNotFoundService
-from src.infrastructure.telegram.rate_limit import RateLimiter
-from src.models.create_models.admins import CreateSentMassMessages
+from src.infrastructure.telegram.rate_limit import RateLimiter, Priority
+from src.infrastructure.translations import get_text
+from src.models.create_models.admins import CreateSentMassMessages, BroadcastSegment
+from src.models.read_models.admins import MassMailingJobDTO, MassMailingProgress
 from src.models.telegram import InlineKeyboardMarkupService, InlineKeyboardButtonService
 from src.repository.database.users import UsersRepository
 from src.infrastructure.files.file_system import copy_file
-from src.application.models.admins import SentMassMessagesService
+from src.application.models.admins import SentMassMessagesService, MassMailingJobsService
+from src.application.models.users import SuppressedRecipientsService
 
 
 if TYPE_CHECKING:
@@ -27,8 +31,16 @@ MAX_CHARS_WITHOUT_PHOTO = 4096
 
 HTML_TAG_RE = re.compile(r"<[^>]+>")  # удаляет теги <...>
 
+# ошибки, после которых пользователь исключается из рассылок
+SUPPRESSION_REASONS = {
+    TelegramForbiddenErrorService: "forbidden",  # бот заблокирован
+    TelegramNotFoundService: "not_found",  # аккаунт удалён
+}
+
 
 class MassTgMailingService:
+    # рассылки, выполняемые этим процессом (сервис создаётся на каждый запрос)
+    _running_jobs: Set[int] = set()
 
     def __init__(
         self,
@@ -36,6 +48,8 @@ class MassTgMailingService:
         limiter: RateLimiter,
         users_repo: UsersRepository,
         sent_mass_msg_service: SentMassMessagesService,
+        mailing_jobs_service: MassMailingJobsService,
+        suppressed_recipients_service: SuppressedRecipientsService,
         conf: Config,
         logger: Logger,
     ):
@@ -43,6 +57,8 @@ class MassTgMailingService:
         self.limiter = limiter
         self.users_repo = users_repo
         self.sent_mass_msg_service = sent_mass_msg_service
+        self.mailing_jobs_service = mailing_jobs_service
+        self.suppressed_recipients_service = suppressed_recipients_service
         self.conf = conf
         self.logger = logger
 
@@ -96,11 +112,7 @@ class MassTgMailingService:
             if not validators.url(button_url):
                 raise TextNotLinc()
 
-            inline_kb = await self.tg_client.get_inline_keyboard_markup(
-                inline_keyboard=InlineKeyboardMarkupService(inline_keyboard=[
-                    [InlineKeyboardButtonService(text="Open", url=button_url)]
-                ])
-            )
+            inline_kb = await self._build_inline_kb(button_url)
 
         photo_id = None
         new_file_path = None
@@ -110,6 +122,13 @@ class MassTgMailingService:
 
         return text, photo_id, new_file_path, inline_kb
 
+    async def _build_inline_kb(self, button_url: str) -> "InlineKeyboardMarkup":
+        return await self.tg_client.get_inline_keyboard_markup(
+            inline_keyboard=InlineKeyboardMarkupService(inline_keyboard=[
+                [InlineKeyboardButtonService(text="Open", url=button_url)]
+            ])
+        )
+
     async def _get_photo_identifier(
         self,
         admin_chat_id: int,
@@ -150,7 +169,7 @@ class MassTgMailingService:
         """
 
         async with self.conf.different.semaphore_mailing_limit:
-            await self.limiter.acquire()
+            await self.limiter.acquire(user_id, Priority.BROADCAST)
 
             try:
                 if file_id:
@@ -160,6 +179,8 @@ class MassTgMailingService:
                 return user_id, True, None
 
             except TelegramRetryAfterService as e:
+                # чат уже приостановлен клиентом, притормаживаем всю рассылку, не трогая ответы пользователям
+                self.limiter.pause(e.retry_after, priority=Priority.BROADCAST)
                 return user_id, False, e
 
             except (TelegramForbiddenErrorService, TelegramNotFoundService) as e:
@@ -170,28 +191,104 @@ class MassTgMailingService:
                 return user_id, False, e
 
 
-    async def broadcast_message_generator(
+    async def _send_batch(
+        self,
+        user_ids: List[int],
+        text: str,
+        file_id: Optional[str],
+        inline_kb: Optional["InlineKeyboardMarkup"],
+    ) -> Tuple[int, int, Dict[int, str]]:
+        """
+        Отправит сообщение пачке пользователей.
+
+        Пользователи, для которых Telegram вернул RetryAfter, не считаются ошибкой: они отправляются повторно
+        после паузы лимитера, но не более `mailing_retry_attempts` раз.
+        :return: Tuple(дошло до пользователей, повторных отправок, Dict[user_id, причина] для SuppressedRecipients)
+        """
+        received = 0
+        retried = 0
+        suppressed: Dict[int, str] = {}
+        pending = user_ids
+
+        for attempt in range(self.conf.different.mailing_retry_attempts + 1):
+            if attempt:
+                retried += len(pending)
+
+            results = await asyncio.gather(*(
+                self._send_single(user_id, text, file_id, inline_kb) for user_id in pending
+            ))
+            received += sum(1 for _, ok, _ in results if ok)
+            pending = [user_id for user_id, _, exc in results if isinstance(exc, TelegramRetryAfterService)]
+
+            for user_id, _, exc in results:
+                reason = SUPPRESSION_REASONS.get(type(exc))
+                if reason:
+                    suppressed[user_id] = reason
+
+            if not pending:
+                break
+
+        return received, retried, suppressed
+
+    @staticmethod
+    def _progress(job: MassMailingJobDTO, started: float, sent_on_start: int) -> MassMailingProgress:
+        """
+        :param started: `time.monotonic()` запуска (или продолжения) рассылки этим процессом
+        :param sent_on_start: сколько было обработано до запуска, скорость считается только по текущему запуску
+        """
+        elapsed = time.monotonic() - started
+        rate = (job.number_sent - sent_on_start) / elapsed if elapsed > 0 else 0.0
+        finished = job.status != "running"
+
+        eta_seconds = None
+        if finished:
+            eta_seconds = 0
+        elif rate > 0:
+            eta_seconds = int(max(job.total_users - job.number_sent, 0) / rate)
+
+        return MassMailingProgress(
+            job_id=job.job_id,
+            finished=finished,
+            total_users=max(job.total_users, job.number_sent),
+            number_received=job.number_received,
+            number_sent=job.number_sent,
+            number_retried=job.number_retried,
+            messages_per_second=round(rate, 1),
+            eta_seconds=eta_seconds,
+        )
+
+    @staticmethod
+    def format_progress(language: str, progress: MassMailingProgress) -> str:
+        return get_text(language, "admins_editor_mass_mailing", "mailing_statistics").format(
+            quantity_successfully=progress.number_received,
+            quantity_sent_total=progress.number_sent,
+            quantity_users=progress.total_users,
+            quantity_retried=progress.number_retried,
+            messages_per_second=progress.messages_per_second,
+            eta_seconds=progress.eta_seconds if progress.eta_seconds is not None else "?",
+        )
+
+    async def start_broadcast(
         self,
         text: str,
         admin_id: int,
         show_image: bool = False,
         photo_path: Optional[str] = None,
         button_url: Optional[str] = None,
-    ) -> AsyncGenerator[Tuple[int, bool, Optional[Exception]], None]:
+        segment: Optional[BroadcastSegment] = None,
+    ) -> MassMailingJobDTO:
         """
-        Асинхронный генератор, который после отправки сообщения возвращает кортеж
+        Проверит сообщение и сохранит новую рассылку. Отправка выполняется в `run_broadcast`.
+        :param segment: фильтр получателей, None - все пользователи, кроме SuppressedRecipients
 
-        Файл копируется на сервер и новый путь присваивается в SentMasMessages,
+        Файл копируется на сервер и новый путь присваивается рассылке,
         что бы в дальнейшем админ не мог изменить фото
 
-        :return: AsyncGenerator[Tuple(user_id, success: bool, error_or_none)]
-
         :except TextTooLong: текст слишком длинный
         :except TextNotLinc: текст в кнопке не является ссылкой
         :except FileNotFoundError: фото не найдено
         """
-
-        text, file_id, new_photo_path, inline_kb = await self._validate_broadcast_inputs(
+        text, file_id, new_photo_path, _ = await self._validate_broadcast_inputs(
             admin_chat_id=admin_id,
             text=text,
             show_image=show_image,
@@ -199,49 +296,119 @@ class MassTgMailingService:
             button_url=button_url
         )
 
-        tasks = set()
-        success = 0
-        failed = 0
-        batch_size = max(1, self.conf.different.semaphore_mailing_limit_in_int * 2)  # сколько тасков держать в пуле (безопасно немного больше concurrency)
-
-        async for uid in self.users_repo.gen_user_ids():
-            task = asyncio.create_task(self._send_single(uid, text, file_id, inline_kb))
-            tasks.add(task)
-
-            # если пул большой — дожидаемся хотя бы одного завершения
-            if len(tasks) >= batch_size:
-                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
-                for d in done:
-                    uid_res, ok, exc = d.result()
-                    if ok:
-                        success += 1
-                    else:
-                        failed += 1
-                    yield uid_res, ok, exc
-
-        # дождаться оставшихся
-        if tasks:
-            done, _ = await asyncio.wait(tasks)
-            for d in done:
-                uid_res, ok, exc = d.result()
-                if ok:
-                    success += 1
-                else:
-                    failed += 1
-                yield uid_res, ok, exc
-
-
-        await self.sent_mass_msg_service.create_msg(
-            user_id=admin_id,
-            data=CreateSentMassMessages(
-                content=text,
-                photo_path=new_photo_path,
-                photo_id=file_id,
-                button_url=button_url,
-                number_received=success,
-                number_sent=failed + success
-            ),
-            make_commit=True
+        return await self.mailing_jobs_service.create_job(
+            admin_id=admin_id,
+            content=text,
+            total_users=await self.count_recipients(segment),
+            photo_path=new_photo_path,
+            photo_id=file_id,
+            button_url=button_url,
+            segment=segment,
+            make_commit=True,
+        )
+
+    async def count_recipients(self, segment: Optional[BroadcastSegment] = None) -> int:
+        """Пробный запуск: сколько пользователей получит рассылку, без отправки"""
+        return await self.users_repo.count_recipients(segment)
+
+    async def run_broadcast(self, job_id: int) -> AsyncGenerator[MassMailingProgress, None]:
+        """
+        Асинхронный генератор: отправляет рассылку пачками по `mailing_batch_size` пользователей
+        (keyset-пагинация по user_id) и после сохранения каждой пачки возвращает текущие показатели.
+
+        Курсор и итоги пачки сохраняются одним commit, поэтому прерванная рассылка продолжается с курсора
+        и уже получившие сообщение пользователи его повторно не получат. Повторно может уйти только пачка,
+        во время отправки которой упал процесс.
+
+        Завершённая, неизвестная или уже выполняемая этим процессом рассылка ничего не возвращает.
+        :return: AsyncGenerator[MassMailingProgress], последний элемент с `finished=True`
+        """
+        job = await self.mailing_jobs_service.get_job(job_id)
+        if job is None or job.status != "running" or job_id in self._running_jobs:
+            return
+
+        self._running_jobs.add(job_id)
+        try:
+            inline_kb = await self._build_inline_kb(job.button_url) if job.button_url else None
+            segment = BroadcastSegment.model_validate(job.segment) if job.segment else None
+            batch_size = max(1, self.conf.different.mailing_batch_size)
+            started = time.monotonic()
+            sent_on_start = job.number_sent
+
+            while True:
+                user_ids = await self.users_repo.get_user_ids_after(job.cursor_user_id, batch_size, segment)
+                if not user_ids:
+                    break
+
+                batch_started = time.monotonic()
+                received, retried, suppressed = await self._send_batch(
+                    user_ids, job.content, job.photo_id, inline_kb
+                )
+                # сохраняется одним commit с курсором
+                await self.suppressed_recipients_service.suppress_many(suppressed)
+                job = await self.mailing_jobs_service.save_batch(
+                    job_id=job_id,
+                    user_ids=user_ids,
+                    number_received=received,
+                    number_retried=retried,
+                    duration=time.monotonic() - batch_started,
+                )
+                yield self._progress(job, started, sent_on_start)
+
+            sent_msg = await self.sent_mass_msg_service.create_msg(
+                user_id=job.user_id,
+                data=CreateSentMassMessages(
+                    content=job.content,
+                    photo_path=job.photo_path,
+                    photo_id=job.photo_id,
+                    button_url=job.button_url,
+                    number_received=job.number_received,
+                    number_sent=job.number_sent
+                ),
+            )
+            job = await self.mailing_jobs_service.complete_job(
+                job_id, sent_message_id=sent_msg.message_id, make_commit=True
+            )
+
+            self.logger.info(
+                f"Рассылка job_id={job_id} закончена, успешных {job.number_received} из {job.number_sent}, "
+                f"повторов после RetryAfter {job.number_retried}"
+            )
+            yield self._progress(job, started, sent_on_start)
+        finally:
+            self._running_jobs.discard(job_id)
+
+    async def resume_broadcasts(self) -> List[MassMailingProgress]:
+        """
+        Продолжит рассылки, прерванные перезапуском бота, и сообщит админам об их завершении.
+        :return: итоги завершённых рассылок
+        """
+        results = []
+
+        for job in await self.mailing_jobs_service.get_running_jobs():
+            self.logger.info(f"Продолжение рассылки job_id={job.job_id} с user_id > {job.cursor_user_id}")
+
+            progress = None
+            async for progress in self.run_broadcast(job.job_id):
+                pass
+
+            if progress is None or not progress.finished:
+                continue
+
+            results.append(progress)
+            await self._notify_admin(job.user_id, progress)
+
+        return results
+
+    async def _notify_admin(self, admin_id: int, progress: MassMailingProgress):
+        admin = await self.users_repo.get_by_id(admin_id)
+        language = admin.language if admin else self.conf.app.default_lang
+        message = get_text(language, "admins_editor_mass_mailing", "mailing_completed").format(
+            result=self.format_progress(language, progress)
         )
 
-        self.logger.info(f"Рассылка закончена, успешных {success} из {failed + success}")
+        try:
+            await self.limiter.acquire(admin_id, Priority.TRANSACTIONAL)
+            await self.tg_client.send_message(admin_id, text=message)
+        except Exception as e:
+            self.logger.warning(f"Не удалось уведомить админа {admin_id} о завершении рассылки: {str(e)}")
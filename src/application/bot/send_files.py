@@ -6,7 +6,7 @@ from typing import Optional, TYPE_CHECKING, Union
 from src.exceptions.telegram import TelegramBadRequestService, TelegramAPIErrorService
 from src.infrastructure.files.file_system import FileStorage
 from src.infrastructure.files.path_builder import PathBuilder
-from src.infrastructure.telegram.rate_limit import RateLimiter
+from src.infrastructure.telegram.rate_limit import RateLimiter, Priority
 from src.application.bot.sticker_sender import StickerSender
 from src.application.models.systems import FilesService
 from src.application.events.publish_event_handler import PublishEventHandler
@@ -179,7 +179,7 @@ class SendFileService:
                 self.logger.exception("Unexpected error while sending via file_path: %s", e)
                 return None
 
-        await self.limiter.acquire()
+        await self.limiter.acquire(chat_id, Priority.TRANSACTIONAL)
 
         if file_id:
             # Если type_based и мы знаем media_kind — пробуем сразу с тем типом
@@ -257,7 +257,7 @@ class SendFileService:
 
             document = await self.tg_client.get_input_file(full_file_path)
 
-        await self.limiter.acquire()
+        await self.limiter.acquire(chat_id, Priority.TRANSACTIONAL)
         try:
             message = await self.tg_client.send_document(
                 chat_id=chat_id,
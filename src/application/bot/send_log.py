@@ -1,8 +1,9 @@
 from logging import Logger
-from typing import Optional, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
+from src.application.bot.log_aggregator import LogAggregator
 from src.config import Config
-from src.infrastructure.telegram.rate_limit import RateLimiter
+from src.infrastructure.telegram.rate_limit import RateLimiter, Priority
 from src.models.read_models import LogLevel
 from src.application.models.systems import SettingsService
 
@@ -19,19 +20,22 @@ class SendLogs:
         settings_service: SettingsService,
         conf: Config,
         logger: Logger,
+        log_aggregator: Optional[LogAggregator] = None,
     ):
         """
-        :param limiter: ОБЯЗАТЕЛЬНОГО ГЛОБАЛЬНЫЙ!
+        :param limiter: ОБЯЗАТЕЛЬНО ГЛОБАЛЬНЫЙ для бота логов! Логи отправляются с приоритетом `Priority.LOGS`
+        :param log_aggregator: общий агрегатор процесса. Без него логи отправляются сразу
         """
         self.tg_logger_client = tg_logger_client
         self.limiter = limiter
         self.settings_service = settings_service
         self.conf = conf
         self.logger = logger
+        self.log_aggregator = log_aggregator or LogAggregator(deliver=self.deliver, logger=logger)
 
     async def send_log(self, text: str, log_lvl: Optional[LogLevel] = None):
         """
-        Отошлёт лог в файл и в канал.
+        Отошлёт лог в файл и в канал. В канал лог уходит через агрегатор вместе с другими логами.
         :param log_lvl: При наличии, запишет в файл с соответствующим уровнем
         """
 
@@ -43,17 +47,19 @@ class SendLogs:
             if log_lvl == LogLevel.ERROR:
                 self.logger.error(text)
 
-        # формируем сообщения разбивая по максимальной длине (4096)
-        parts = []
-        for i in range(0, len(text), 4096):
-            parts.append(text[i:i + 4096])
+        await self.log_aggregator.add(text)
 
+    async def deliver(self, parts: List[str]):
+        """
+        Отправит готовые сообщения в канал логов, при ошибке - support и MAIN_ADMIN.
+        :param parts: сообщения не длиннее 4096 символов
+        """
         settings = await self.settings_service.get_settings()
         channel_for_logging_id = settings.channel_for_logging_id
 
         try:
             for message in parts:
-                await self.limiter.acquire()
+                await self.limiter.acquire(int(channel_for_logging_id), Priority.LOGS)
                 await self.tg_logger_client.send_message(int(channel_for_logging_id), message)
         except Exception as e:
             settings = await self.settings_service.get_settings()
@@ -66,19 +72,19 @@ class SendLogs:
 
             try:
                 if settings.support_username:
-                    await self.limiter.acquire()
+                    await self.limiter.acquire(settings.support_username, Priority.LOGS)
                     await self.tg_logger_client.send_message(settings.support_username, message_error)
                     for message in parts:
-                        await self.limiter.acquire()
+                        await self.limiter.acquire(settings.support_username, Priority.LOGS)
                         await self.tg_logger_client.send_message(settings.support_username, message)
             except Exception as e:
                 self.logger.error(f"Ошибка отправки сообщения support. Ошибка: {str(e)}")
 
             try:
-                await self.limiter.acquire()
+                await self.limiter.acquire(self.conf.env.main_admin, Priority.LOGS)
                 await self.tg_logger_client.send_message(self.conf.env.main_admin, message_error)
                 for message in parts:
-                    await self.limiter.acquire()
+                    await self.limiter.acquire(self.conf.env.main_admin, Priority.LOGS)
                     await self.tg_logger_client.send_message(self.conf.env.main_admin, message)
             except Exception as e:
                 self.logger.error(f"Ошибка отправки сообщения MAIN_ADMIN. Ошибка: {str(e)}")
\ No newline at end of file
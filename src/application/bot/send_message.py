@@ -5,7 +5,7 @@ from src.exceptions.domain import StickerNotFound
 from src.exceptions.telegram import TelegramBadRequestService
 from src.infrastructure.files.file_system import FileStorage
 from src.infrastructure.files.path_builder import PathBuilder
-from src.infrastructure.telegram.rate_limit import RateLimiter
+from src.infrastructure.telegram.rate_limit import RateLimiter, Priority
 from src.models.update_models import UpdateUiImageDTO
 from src.application.bot.sticker_sender import StickerSender
 from src.application.models.systems import UiImagesService
@@ -61,6 +61,7 @@ class SendMessageService:
         parse_mode: Optional[str] = "HTML",
         always_show_photos: bool = False,
         message_effect_id: str = None,
+        priority: Priority = Priority.INTERACTIVE,
         _retry_without_effect: bool = False,
     ) -> "Message":
         if not message and not (image_key or event_message_key):
@@ -69,7 +70,7 @@ class SendMessageService:
         await self._send_sticker_if_needed(chat_id, event_message_key)
         image_key = self._resolve_image_key(image_key, event_message_key)
 
-        await self.limiter.acquire()
+        await self.limiter.acquire(chat_id, priority)
 
         if image_key:
             result = await self._send_with_image(
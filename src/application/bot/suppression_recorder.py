@@ -0,0 +1,44 @@
+from logging import Logger
+from typing import Awaitable, Callable, Dict
+
+from src.infrastructure.buffering import CoalescingBuffer
+
+
+SaveCallback = Callable[[Dict[int, str]], Awaitable[None]]
+
+
+class SuppressionRecorder:
+    """
+    Сбор пользователей, до которых не доходят сообщения бота, для SuppressedRecipients.
+
+    Вызывается из `TelegramClient.on_unreachable`, поэтому срабатывает на любой отправке бота,
+    а не только в рассылке. Отметки копятся `window` секунд и записываются в БД одним запросом.
+    """
+
+    def __init__(self, save: SaveCallback, logger: Logger, window: float = 1.0):
+        """
+        :param save: корутина, сохраняющая Dict[user_id, причина]
+        """
+        self.save = save
+        self._buffer = CoalescingBuffer(
+            factory=dict,
+            handle=self.save,
+            logger=logger,
+            name="SuppressionRecorder",
+            window=window,
+        )
+
+    def mark(self, chat_id: int | str, reason: str) -> None:
+        # группы, каналы (отрицательный id) и @username в рассылках не участвуют
+        if not isinstance(chat_id, int) or chat_id <= 0:
+            return
+
+        self._buffer.pending[chat_id] = reason
+        self._buffer.schedule()
+
+    async def flush(self) -> None:
+        await self._buffer.flush()
+
+    async def stop(self) -> None:
+        """Отменит ожидание окна и сразу сохранит накопленное"""
+        await self._buffer.stop()
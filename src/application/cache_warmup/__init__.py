@@ -1,5 +1,7 @@
+from src.application.cache_warmup.cache_refresh_scheduler import CacheRefreshScheduler
 from src.application.cache_warmup.cache_warmup_service import CacheWarmupService
 
 __all__ = [
+    "CacheRefreshScheduler",
     "CacheWarmupService"
 ]
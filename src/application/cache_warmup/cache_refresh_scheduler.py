@@ -0,0 +1,63 @@
+from dataclasses import dataclass, field
+from logging import Logger
+from typing import Awaitable, Callable, Iterable, Optional, Set
+
+from src.infrastructure.buffering import CoalescingBuffer
+
+
+RefreshCallback = Callable[[Set[int], Set[int]], Awaitable[None]]
+
+
+@dataclass
+class _RefreshMarks:
+    category_ids: Set[int] = field(default_factory=set)
+    product_universal_ids: Set[int] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        return bool(self.category_ids or self.product_universal_ids)
+
+
+class CacheRefreshScheduler:
+    """
+    Отложенное обновление кэша товаров и категорий после покупок.
+
+    Сервисы только помечают изменившиеся категории и товары, а обновление выполняется одним
+    пакетом раз в `window` секунд: все пометки за окно схлопываются, поэтому при распродаже
+    ключи одной категории перестраиваются не чаще одного раза за окно.
+
+    Если `window` не задан, обновление выполняется сразу при пометке (используется без AppContainer).
+    """
+
+    def __init__(self, refresh: RefreshCallback, logger: Logger, window: Optional[float] = None):
+        """
+        :param refresh: корутина, обновляющая кэш (category_ids, product_universal_ids)
+        """
+        self.refresh = refresh
+        self._buffer = CoalescingBuffer(
+            factory=_RefreshMarks,
+            handle=self._refresh,
+            logger=logger,
+            name="CacheRefreshScheduler",
+            window=window,
+        )
+
+    async def mark(
+        self,
+        category_ids: Iterable[int] = (),
+        product_universal_ids: Iterable[int] = (),
+    ) -> None:
+        """Пометит категории и универсальные товары, кэш которых необходимо обновить"""
+        self._buffer.pending.category_ids.update(category_ids)
+        self._buffer.pending.product_universal_ids.update(product_universal_ids)
+        await self._buffer.touch()
+
+    async def _refresh(self, marks: _RefreshMarks) -> None:
+        await self.refresh(marks.category_ids, marks.product_universal_ids)
+
+    async def flush(self) -> None:
+        """Обновит кэш для всех накопленных пометок"""
+        await self._buffer.flush()
+
+    async def stop(self) -> None:
+        """Отменит ожидание окна и сразу обновит накопленное"""
+        await self._buffer.stop()
@@ -1,13 +1,23 @@
+import asyncio
+import time
+import uuid
+from collections import defaultdict
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from fnmatch import fnmatchcase
 from logging import Logger
-from typing import Iterable, Optional
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple, TypeVar
 
+from orjson import orjson
+from pydantic import BaseModel
 from redis.asyncio import Redis
 
 from src.config import Config
+from src.infrastructure.redis import LocalCache
 from src.database.models.discount.schemas import SmallVoucher
-from src.models.read_models import SoldAccountFull, SoldAccountSmall
-from src.models.read_models.categories.product_universal import SoldUniversalFull, SoldUniversalSmall
+from src.models.read_models import SoldAccountFull, SoldAccountSmall, ProductAccountSmall, CategoryFull
+from src.models.read_models.categories.product_universal import SoldUniversalFull, SoldUniversalSmall, \
+    ProductUniversalSmall
 from src.models.read_models.other import VouchersDTO
 from src.repository.database.admins import AdminsRepository
 from src.repository.database.categories import CategoriesRepository
@@ -28,6 +38,7 @@ from src.repository.database.systems import (
     SettingsRepository,
 )
 from src.repository.database.users import BannedAccountsRepository, UsersRepository
+from src.repository.redis.base import BaseRedisRepo, INDEX_PREFIX, index_key_for, prune_index
 from src.repository.redis import (
     AccountsCacheRepository,
     AdminsCacheRepository,
@@ -48,7 +59,51 @@ from src.application.models.products.accounts import AccountsCacheFillerService
 from src.application.models.products.universal import UniversalCacheFillerService
 
 
+T = TypeVar("T")
+
+# Ключи, которыми владеет прогрев. Должны совпадать с ключами соответствующих Redis-репозиториев.
+# Ключи этих шаблонов, не перезаписанные прогревом, считаются устаревшими и удаляются после него.
+WARMUP_KEY_PATTERNS = (
+    "settings",
+    "sticker:*",
+    "referral_levels",
+    "all_types_payments",
+    "type_payments:*",
+    "ui_image:*",
+    "voucher_by_user:*",
+    "voucher:*",
+    "promo_code:*",
+    "admin:*",
+    "banned_account:*",
+    "main_categories:*",
+    "categories_by_parent:*",
+    "category:*",
+    "product_accounts_by_category:*",
+    "product_account:*",
+    "sold_accounts_by_owner_id:*",
+    "sold_account:*",
+    "product_universal_by_category:*",
+    "product_universal:*",
+    "sold_universal_by_owner_id:*",
+    "sold_universal:*",
+)
+
+WARMUP_LOCK_KEY = "cache_warmup:lock"
+# Номер последнего завершённого поколения. Сборка мусора прошлого поколения останавливается,
+# как только начался или завершился следующий прогрев: её список устаревших ключей уже неверен
+WARMUP_GENERATION_KEY = "cache_warmup:generation"
+
+
 class CacheWarmupService:
+    """
+    Прогрев кэша без очистки Redis.
+
+    Новое поколение ключей записывается поверх текущего: SET заменяет значение атомарно,
+    поэтому читатели всех процессов всё время видят либо старое, либо новое значение и не уходят в БД.
+    Ключи прошлого поколения, которые не были перезаписаны, удаляются в фоне после переключения поколения,
+    вместе с ними из множеств-индексов убираются ключи, истёкшие по ttl.
+    Одновременно прогрев выполняет только одна реплика.
+    """
 
     def __init__(
         self,
@@ -87,6 +142,7 @@ class CacheWarmupService:
         session_redis: Redis,
         logger: Logger,
         conf: Config,
+        local_cache: Optional[LocalCache] = None,
     ):
         self.settings_repo = settings_repo
         self.stickers_repo = stickers_repo
@@ -123,235 +179,474 @@ class CacheWarmupService:
         self.logger = logger
         self.session_redis = session_redis
         self.conf = conf
+        self.local_cache = local_cache
+
+        self._db_lock = asyncio.Lock()
+        self._written: Set[str] = set()
+        self.gc_task: Optional[asyncio.Task] = None
+
+    async def warmup(self) -> bool:
+        """
+        Заполнит Redis новым поколением ключей.
+        Разделы заполняются параллельно: каждый раздел делает один запрос в БД
+        и пишет ключи в Redis pipeline ограниченного размера.
+        :return: False если прогрев уже выполняет другой процесс
+        """
+        token = uuid.uuid4().hex
+        lock_ttl = self.conf.different.cache_warmup_lock_ttl
+        if not await self.session_redis.set(WARMUP_LOCK_KEY, token, nx=True, ex=lock_ttl):
+            self.logger.info("[CacheWarmup] Прогрев уже выполняется другим процессом, пропускаем")
+            return False
+
+        try:
+            started = time.perf_counter()
+            previous_keys, indexes = await self._scan_warmup_keys()
+            await self._backfill_indexes(previous_keys)
+            self._written = set()
+
+            sections = {
+                "settings": self._fill_settings,
+                "stickers": self._fill_stickers,
+                "referral_levels": self._fill_referral_levels,
+                "type_payments": self._fill_type_payments,
+                "ui_images": self._fill_ui_images,
+                "vouchers_per_user": self._fill_vouchers_per_user,
+                "voucher_codes": self._fill_voucher_codes,
+                "promo_codes": self._fill_promo_codes,
+                "admins": self._fill_admins,
+                "banned_accounts": self._fill_banned_accounts,
+                "categories": self._fill_categories,
+                "product_accounts": self._fill_product_accounts,
+                "product_universal": self._fill_product_universal,
+                "sold_accounts": self._fill_sold_accounts,
+                "sold_universal": self._fill_sold_universal,
+            }
+            results = await asyncio.gather(
+                *(self._run_section(name, fill) for name, fill in sections.items()),
+                return_exceptions=True,
+            )
 
-    async def warmup(self):
-        await self._flush_redis()
-        await self._fill_settings()
-        await self._fill_stickers()
-        await self._fill_referral_levels()
-        await self._fill_type_payments()
-        await self._fill_ui_images()
-        await self._fill_vouchers_per_user()
-        await self._fill_voucher_codes()
-        await self._fill_promo_codes()
-        await self._fill_admins()
-        await self._fill_banned_accounts()
-        await self._fill_categories()
-        await self._fill_product_accounts()
-        await self._fill_product_universal()
-        await self._fill_sold_accounts()
-        await self._fill_sold_universal()
-        self.logger.info("Redis filling successfully")
-
-    async def _flush_redis(self):
-        await self.session_redis.flushall()
-
-    async def _fill_settings(self):
-        settings = await self.settings_repo.get()
-        if settings:
-            await self.settings_cache_repo.set(settings)
-
-    async def _fill_stickers(self):
-        stickers = await self.stickers_repo.get_all()
-        if not stickers:
-            return
-        await self.stickers_cache_repo.set_many(stickers)
-        for sticker in stickers:
-            await self.stickers_cache_repo.set(sticker)
-
-    async def _fill_referral_levels(self):
-        referral_levels = await self.referral_levels_repo.get_all()
-        if referral_levels:
-            await self.referral_levels_cache_repo.set(referral_levels)
+            errors = [result for result in results if isinstance(result, Exception)]
+            if errors:
+                # старое поколение не трогаем: недописанные разделы продолжают читаться из него
+                raise errors[0]
+
+            generation = await self.session_redis.incr(WARMUP_GENERATION_KEY)
+            self.logger.info(
+                "Redis filling successfully: generation %d, %d keys in %.2f s",
+                generation,
+                sum(results),
+                time.perf_counter() - started,
+            )
 
-    async def _fill_type_payments(self):
-        types = await self.type_payments_repo.get_all()
-        if not types:
+            stale_keys = previous_keys - self._written
+            self._written = set()
+        finally:
+            await self._release_lock(token)
+
+        # после снятия блокировки: занятая блокировка для сборки мусора означает следующий прогрев
+        self.gc_task = asyncio.create_task(self._collect_garbage(stale_keys, generation, indexes))
+        return True
+
+    async def _release_lock(self, token: str) -> None:
+        current = await self.session_redis.get(WARMUP_LOCK_KEY)
+        if isinstance(current, bytes):
+            current = current.decode("utf-8")
+        if current == token:
+            await self.session_redis.delete(WARMUP_LOCK_KEY)
+
+    async def _scan_warmup_keys(self) -> Tuple[Set[str], Set[str]]:
+        """
+        Один проход SCAN
+        :return: ключи прогрева, которые сейчас есть в Redis, и множества-индексы
+        """
+        keys, indexes = set(), set()
+        async for key in self.session_redis.scan_iter(count=self.conf.different.warmup_pipeline_size):
+            if isinstance(key, bytes):
+                key = key.decode("utf-8")
+            if key.startswith(INDEX_PREFIX):
+                if ":del:" not in key: # индекс, который сейчас удаляет `_delete_index`
+                    indexes.add(key)
+            elif any(fnmatchcase(key, pattern) for pattern in WARMUP_KEY_PATTERNS):
+                keys.add(key)
+        return keys, indexes
+
+    async def _backfill_indexes(self, keys: Iterable[str]) -> None:
+        """
+        Добавит в индексы ключи, записанные до появления индексов: иначе удаление по индексу
+        их не видит, пока прогрев не перезапишет или сборка мусора не удалит их
+        """
+        indexed = [(index, key) for key in keys if (index := index_key_for(key))]
+        size = self.conf.different.warmup_pipeline_size
+        for start in range(0, len(indexed), size):
+            async with self.session_redis.pipeline(transaction=False) as pipe:
+                for index, key in indexed[start:start + size]:
+                    await pipe.sadd(index, key)
+                await pipe.execute()
+
+    async def _collect_garbage(self, keys: Set[str], generation: int, indexes: Set[str] = frozenset()) -> None:
+        """
+        Удалит ключи прошлого поколения, которые не были перезаписаны прогревом поколения `generation`,
+        и уберёт их из индексов. Затем уберёт из индексов `indexes` ключи, истёкшие по ttl.
+        Перед каждой пачкой проверяет, что поколение всё ещё текущее и новый прогрев не идёт,
+        иначе останавливается: ключи нового поколения удалять нельзя, мусор соберёт новый прогрев.
+        """
+        if not keys and not indexes:
             return
-        await self.type_payments_cache_repo.set_all(types)
-        for item in types:
-            await self.type_payments_cache_repo.set_one(item)
 
-    async def _fill_ui_images(self):
-        images = await self.ui_image_repo.get_all()
-        for image in images:
-            await self.ui_images_cache_repo.set(image)
+        keys = list(keys)
+        size = self.conf.different.warmup_pipeline_size
+        try:
+            for start in range(0, len(keys), size):
+                if not await self._can_collect(generation):
+                    return
+
+                chunk = keys[start:start + size]
+                async with self.session_redis.pipeline(transaction=False) as pipe:
+                    await pipe.delete(*chunk)
+                    for key in chunk:
+                        index = index_key_for(key)
+                        if index:
+                            await pipe.srem(index, key)
+                    await pipe.execute()
+                if self.local_cache:
+                    await self.local_cache.invalidate(*chunk)
+
+            pruned = 0
+            for index in indexes:
+                if not await self._can_collect(generation):
+                    return
+                pruned += await prune_index(self.session_redis, index)
+        except Exception as e:
+            self.logger.exception(f"[CacheWarmup] Ошибка удаления устаревших ключей: {str(e)}")
+            return
 
-    async def _fill_vouchers_per_user(self):
-        ttl = int(self.conf.redis_time_storage.all_voucher.total_seconds())
-        async for user_id in self.users_repo.gen_user_ids():
-            vouchers = await self.vouchers_repo.get_valid_by_page(user_id=user_id)
-            small_items = [self._map_to_small_voucher(v) for v in vouchers]
-            await self.vouchers_cache_repo.set_small_by_user(
-                user_id=user_id,
-                vouchers=small_items,
-                ttl=ttl,
-            )
+        self.logger.info("[CacheWarmup] Удалено устаревших ключей: %d, из индексов убрано: %d", len(keys), pruned)
 
-    async def _fill_voucher_codes(self):
-        vouchers = await self.vouchers_repo.get_valid_by_page()
-        for voucher in vouchers:
-            ttl = self._calc_ttl(voucher.expire_at)
-            await self.vouchers_cache_repo.set_by_code(voucher, ttl=ttl)
-
-    async def _fill_promo_codes(self):
-        promo_codes = await self.promo_codes_repo.get_page()
-        for promo in promo_codes:
-            ttl = self._calc_ttl(promo.expire_at)
-            await self.promo_codes_cache_repo.set(promo, ttl=ttl)
-
-    async def _fill_admins(self):
-        admin_ids = await self.admins_repo.get_all_user_ids()
-        for user_id in admin_ids:
-            await self.admins_cache_repo.set(user_id)
-
-    async def _fill_banned_accounts(self):
-        banned_accounts = await self.banned_accounts_repo.get_all()
-        for ban in banned_accounts:
-            await self.banned_accounts_cache_repo.set(ban.user_id, ban.reason)
-
-    async def _fill_categories(self):
-        category_ids = await self.categories_repo.get_all_ids()
-        if not category_ids:
-            return
-        await self.category_cache_filler_service.fill_need_category(
-            categories_ids=category_ids
+    async def _can_collect(self, generation: int) -> bool:
+        """:return: False если сборку мусора поколения `generation` пора остановить"""
+        if await self._is_current_generation(generation):
+            return True
+        self.logger.info(
+            "[CacheWarmup] Сборка мусора поколения %d остановлена: начался следующий прогрев", generation
         )
+        return False
+
+    async def _is_current_generation(self, generation: int) -> bool:
+        async with self.session_redis.pipeline(transaction=False) as pipe:
+            await pipe.get(WARMUP_GENERATION_KEY)
+            await pipe.exists(WARMUP_LOCK_KEY)
+            current, locked = await pipe.execute()
+        return int(current or 0) == generation and not locked
+
+    async def _run_section(self, name: str, fill: Callable[[], Awaitable[int]]) -> int:
+        started = time.perf_counter()
+        try:
+            count = await fill()
+        except Exception as e:
+            self.logger.exception(f"[CacheWarmup] Ошибка заполнения раздела {name}: {str(e)}")
+            raise
+
+        self.logger.info("[CacheWarmup] %s: %d keys in %.2f s", name, count, time.perf_counter() - started)
+        return count
+
+    @asynccontextmanager
+    async def _db(self):
+        """
+        Сессия БД одна на все разделы и не допускает параллельных запросов,
+        поэтому запросы разделов идут по очереди, а запись в Redis - параллельно
+        """
+        async with self._db_lock:
+            yield
+
+    async def _write(self, repo: BaseRedisRepo, items: List[Tuple[str, bytes, int]]) -> int:
+        """
+        Запишет ключи pipeline-ами не более `warmup_pipeline_size` команд
+        :param items: List[tuple[ключ, данные, ttl]]
+        :return: число записанных ключей
+        """
+        size = self.conf.different.warmup_pipeline_size
+        for start in range(0, len(items), size):
+            await repo.bulk_set(items[start:start + size])
+        self._written.update(key for key, _, _ in items)
+        return len(items)
 
-    async def _fill_product_accounts(self):
-        category_ids = await self.product_accounts_repo.get_all_category_ids()
-        for category_id in set(category_ids):
-            await self.accounts_cache_filler_service.fill_product_accounts_by_category_id(
-                category_id
-            )
-        account_ids = await self.product_accounts_repo.get_all_account_ids()
-        for account_id in account_ids:
-            await self.accounts_cache_filler_service.fill_product_account_by_account_id(
-                account_id
-            )
+    @staticmethod
+    def _dump_one(value: BaseModel) -> bytes:
+        return orjson.dumps(value.model_dump())
 
-    async def _fill_product_universal(self):
-        category_ids = await self.product_universal_repo.get_all_category_ids()
-        for category_id in set(category_ids):
-            await self.universal_cache_filler_service.fill_product_universal_by_category_id(
-                category_id
-            )
-        product_ids = await self.product_universal_repo.get_all_ids()
-        for product_id in product_ids:
-            await self.universal_cache_filler_service.fill_product_universal_by_product_id(
-                product_id
-            )
+    @staticmethod
+    def _dump_many(values: Iterable[BaseModel]) -> bytes:
+        return orjson.dumps([v.model_dump() for v in values])
 
-    async def _fill_sold_accounts(self):
-        owner_ids = await self.sold_accounts_repo.get_all_owner_ids()
-        for owner_id in owner_ids:
-            await self._fill_sold_accounts_by_owner(owner_id)
+    async def _fill_settings(self) -> int:
+        async with self._db():
+            settings = await self.settings_repo.get()
+        if not settings:
+            return 0
 
-        sold_ids = await self.sold_accounts_repo.get_all_ids()
-        for sold_id in sold_ids:
-            await self._fill_sold_account_by_id(sold_id)
+        repo = self.settings_cache_repo
+        return await self._write(repo, [(repo._key(), self._dump_one(settings), 0)])
 
-    async def _fill_sold_accounts_by_owner(self, owner_id: int):
-        sold_accounts = await self.sold_accounts_repo.get_by_owner_id_with_relations(
-            owner_id,
-            active_only=True,
-        )
-        if not sold_accounts:
-            await self.accounts_cache_repo.delete_sold_accounts_by_owner_id(owner_id)
-            return
+    async def _fill_stickers(self) -> int:
+        async with self._db():
+            stickers = await self.stickers_repo.get_all()
 
-        languages = self._extract_account_languages(sold_accounts)
-        if not languages:
-            await self.accounts_cache_repo.delete_sold_accounts_by_owner_id(owner_id)
-            return
+        repo = self.stickers_cache_repo
+        return await self._write(repo, [(repo._key(s.key), self._dump_one(s), 0) for s in stickers])
 
-        for language in languages:
-            items = [
-                SoldAccountSmall.from_orm_with_translation(account, language=language)
-                for account in sold_accounts
-            ]
-            await self.accounts_cache_repo.set_sold_accounts_by_owner_id(
-                owner_id,
-                items,
-                language,
-            )
+    async def _fill_referral_levels(self) -> int:
+        async with self._db():
+            referral_levels = await self.referral_levels_repo.get_all()
+        if not referral_levels:
+            return 0
 
-    async def _fill_sold_account_by_id(self, sold_account_id: int):
-        sold_account = await self.sold_accounts_repo.get_by_id_with_relations(
-            sold_account_id,
-            active_only=True,
-        )
-        if not sold_account:
-            await self.accounts_cache_repo.delete_sold_accounts_by_account_id(sold_account_id)
-            return
+        repo = self.referral_levels_cache_repo
+        return await self._write(repo, [(repo._key(), self._dump_many(referral_levels), 0)])
 
-        languages = self._extract_account_languages([sold_account])
-        if not languages:
-            await self.accounts_cache_repo.delete_sold_accounts_by_account_id(sold_account_id)
-            return
+    async def _fill_type_payments(self) -> int:
+        async with self._db():
+            types = await self.type_payments_repo.get_all()
+        if not types:
+            return 0
 
-        for language in languages:
-            dto = SoldAccountFull.from_orm_with_translation(sold_account, language=language)
-            await self.accounts_cache_repo.set_sold_accounts_by_account_id(dto, language)
+        repo = self.type_payments_cache_repo
+        items = [(repo._key_all(), self._dump_many(types), 0)]
+        items.extend((repo._key_one(t.type_payment_id), self._dump_one(t), 0) for t in types)
+        return await self._write(repo, items)
 
-    async def _fill_sold_universal(self):
-        owner_ids = await self.sold_universal_repo.get_all_owner_ids()
-        owner_ttl = int(
-            self.conf.redis_time_storage.sold_universal_account_product_by_owner.total_seconds()
+    async def _fill_ui_images(self) -> int:
+        async with self._db():
+            images = await self.ui_image_repo.get_all()
+
+        repo = self.ui_images_cache_repo
+        return await self._write(repo, [(repo._key(image.key), self._dump_one(image), 0) for image in images])
+
+    async def _fill_vouchers_per_user(self) -> int:
+        """Ключ заполняется для каждого пользователя, в том числе пустым списком"""
+        async with self._db():
+            user_ids = [user_id async for user_id in self.users_repo.gen_user_ids()]
+            vouchers = await self.vouchers_repo.get_valid_by_page()
+
+        by_user: Dict[int, List[SmallVoucher]] = defaultdict(list)
+        for voucher in vouchers:
+            if voucher.creator_id is not None:
+                by_user[voucher.creator_id].append(self._map_to_small_voucher(voucher))
+
+        repo = self.vouchers_cache_repo
+        ttl = int(self.conf.redis_time_storage.all_voucher.total_seconds())
+        return await self._write(
+            repo,
+            [(repo._key_by_user(user_id), self._dump_many(by_user.get(user_id, [])), ttl) for user_id in user_ids],
         )
-        for owner_id in owner_ids:
-            await self._fill_sold_universal_by_owner(owner_id, owner_ttl)
 
-        sold_ids = await self.sold_universal_repo.get_all_ids()
-        sold_ttl = int(
-            self.conf.redis_time_storage.sold_universal_product_by_product.total_seconds()
+    async def _fill_voucher_codes(self) -> int:
+        async with self._db():
+            vouchers = await self.vouchers_repo.get_valid_by_page()
+
+        repo = self.vouchers_cache_repo
+        return await self._write(
+            repo,
+            [
+                (repo._key_one(v.activation_code), self._dump_one(v), self._calc_ttl(v.expire_at) or 0)
+                for v in vouchers
+            ],
         )
-        for sold_id in sold_ids:
-            await self._fill_sold_universal_by_id(sold_id, sold_ttl)
 
-    async def _fill_sold_universal_by_owner(self, owner_id: int, ttl: int):
-        sold_items = await self.sold_universal_repo.get_by_owner_with_relations(
-            owner_id,
-            active_only=True,
+    async def _fill_promo_codes(self) -> int:
+        async with self._db():
+            promo_codes = await self.promo_codes_repo.get_page()
+
+        repo = self.promo_codes_cache_repo
+        return await self._write(
+            repo,
+            [
+                (repo._key(p.activation_code), self._dump_one(p), self._calc_ttl(p.expire_at) or 0)
+                for p in promo_codes
+            ],
         )
-        if not sold_items:
-            await self.sold_universal_cache_repo.delete_by_owner(owner_id)
-            return
 
-        languages = self._extract_universal_languages(sold_items)
-        if not languages:
-            await self.sold_universal_cache_repo.delete_by_owner(owner_id)
-            return
+    async def _fill_admins(self) -> int:
+        async with self._db():
+            admin_ids = await self.admins_repo.get_all_user_ids()
+
+        repo = self.admins_cache_repo
+        return await self._write(repo, [(repo._key(user_id), b"_", 0) for user_id in admin_ids])
+
+    async def _fill_banned_accounts(self) -> int:
+        async with self._db():
+            banned_accounts = await self.banned_accounts_repo.get_all()
+
+        repo = self.banned_accounts_cache_repo
+        return await self._write(
+            repo,
+            [(repo._key(ban.user_id), ban.reason.encode("utf-8"), 0) for ban in banned_accounts],
+        )
 
-        for language in languages:
-            items = [
-                SoldUniversalSmall.from_orm_model(sold, language)
-                for sold in sold_items
-            ]
-            await self.sold_universal_cache_repo.set_by_owner(
-                owner_id,
-                language,
-                items,
-                ttl,
+    async def _fill_categories(self) -> int:
+        async with self._db():
+            categories = await self.categories_repo.get_all_with_translations()
+            quantity_map = await self.categories_repo.get_quantity_products_map(
+                [category.category_id for category in categories]
             )
 
-    async def _fill_sold_universal_by_id(self, sold_id: int, ttl: int):
-        sold_item = await self.sold_universal_repo.get_by_id_with_relations(
-            sold_id,
-            active_only=True,
+        filler = self.category_cache_filler_service
+        repo = self.categories_cache_repo
+        items = []
+
+        main = await filler._build_category_full_list(
+            [category for category in categories if category.is_main],
+            quantity_map=quantity_map,
         )
-        if not sold_item:
-            await self.sold_universal_single_cache_repo.delete_by_id(sold_id)
-            return
+        for language, main_items in main.items():
+            items.append((repo._key_main_categories(language), self._dump_many(main_items), 0))
+
+        by_parent: Dict[int, list] = defaultdict(list)
+        for category in categories:
+            if category.parent_id:
+                by_parent[category.parent_id].append(category)
+
+        for parent_id, children in by_parent.items():
+            data = await filler._build_category_full_list(children, quantity_map=quantity_map)
+            for language, children_items in data.items():
+                items.append((
+                    repo._key_categories_by_parent(parent_id, language),
+                    self._dump_many(children_items),
+                    0,
+                ))
+
+        for category in categories:
+            for translation in category.translations:
+                dto = CategoryFull.from_orm_with_translation(
+                    category=category,
+                    quantity_product=quantity_map.get(category.category_id, 0),
+                    language=translation.language,
+                )
+                items.append((
+                    repo._key_category(category.category_id, translation.language),
+                    self._dump_one(dto),
+                    0,
+                ))
+
+        return await self._write(repo, items)
+
+    async def _fill_product_accounts(self) -> int:
+        async with self._db():
+            products = await self.product_accounts_repo.get_all_full_for_sale()
+
+        by_category: Dict[int, List[ProductAccountSmall]] = defaultdict(list)
+        for product in products:
+            by_category[product.category_id].append(ProductAccountSmall(**product.model_dump()))
+
+        repo = self.accounts_cache_repo
+        items = [
+            (repo._key_product_account_by_category(category_id), self._dump_many(category_products), 0)
+            for category_id, category_products in by_category.items()
+        ]
+        items.extend(
+            (repo._key_product_account_by_account_id(product.account_id), self._dump_one(product), 0)
+            for product in products
+        )
+        return await self._write(repo, items)
+
+    async def _fill_product_universal(self) -> int:
+        async with self._db():
+            for_sale = await self.product_universal_repo.get_all_for_sale()
+            products = await self.product_universal_repo.get_all_full(language=self.conf.app.default_lang)
+
+        by_category: Dict[int, List[ProductUniversalSmall]] = defaultdict(list)
+        for product in for_sale:
+            by_category[product.category_id].append(ProductUniversalSmall(**product.model_dump()))
+
+        category_repo = self.universal_cache_filler_service.product_cache_repo
+        single_repo = self.universal_cache_filler_service.product_single_cache_repo
+
+        count = await self._write(
+            category_repo,
+            [
+                (category_repo._key_by_category(category_id), self._dump_many(category_products), 0)
+                for category_id, category_products in by_category.items()
+            ],
+        )
+        count += await self._write(
+            single_repo,
+            [(single_repo._key(product.product_universal_id), self._dump_one(product), 0) for product in products],
+        )
+        return count
+
+    async def _fill_sold_accounts(self) -> int:
+        async with self._db():
+            sold_accounts = await self.sold_accounts_repo.get_all_with_relations(active_only=True)
+
+        repo = self.accounts_cache_repo
+        owner_ttl = int(self.conf.redis_time_storage.sold_accounts_by_owner.total_seconds())
+        items = []
+
+        for owner_id, owner_accounts in self._group_by_owner(sold_accounts).items():
+            for language in self._extract_account_languages(owner_accounts):
+                small = [
+                    SoldAccountSmall.from_orm_with_translation(account, language=language)
+                    for account in owner_accounts
+                ]
+                items.append((
+                    repo._key_sold_accounts_by_owner_id(owner_id, language),
+                    self._dump_many(small),
+                    owner_ttl,
+                ))
+
+        for account in sold_accounts:
+            for language in self._extract_account_languages([account]):
+                dto = SoldAccountFull.from_orm_with_translation(account, language=language)
+                items.append((
+                    repo._key_sold_accounts_by_account_id(account.sold_account_id, language),
+                    self._dump_one(dto),
+                    0,
+                ))
+
+        return await self._write(repo, items)
+
+    async def _fill_sold_universal(self) -> int:
+        async with self._db():
+            sold_items = await self.sold_universal_repo.get_all_with_relations(active_only=True)
 
-        languages = self._extract_universal_languages([sold_item])
-        if not languages:
-            await self.sold_universal_single_cache_repo.delete_by_id(sold_id)
-            return
+        owner_ttl = int(
+            self.conf.redis_time_storage.sold_universal_account_product_by_owner.total_seconds()
+        )
+        sold_ttl = int(
+            self.conf.redis_time_storage.sold_universal_product_by_product.total_seconds()
+        )
+
+        owner_items = []
+        for owner_id, owner_sold in self._group_by_owner(sold_items).items():
+            for language in self._extract_universal_languages(owner_sold):
+                small = [SoldUniversalSmall.from_orm_model(sold, language) for sold in owner_sold]
+                owner_items.append((
+                    self.sold_universal_cache_repo._key_by_owner(owner_id, language),
+                    self._dump_many(small),
+                    owner_ttl,
+                ))
+
+        single_items = []
+        for sold in sold_items:
+            for language in self._extract_universal_languages([sold]):
+                dto = SoldUniversalFull.from_orm_model(sold, language=language)
+                single_items.append((
+                    self.sold_universal_single_cache_repo._key(sold.sold_universal_id, language),
+                    self._dump_one(dto),
+                    sold_ttl,
+                ))
+
+        count = await self._write(self.sold_universal_cache_repo, owner_items)
+        count += await self._write(self.sold_universal_single_cache_repo, single_items)
+        return count
 
-        for language in languages:
-            dto = SoldUniversalFull.from_orm_model(sold_item, language=language)
-            await self.sold_universal_single_cache_repo.set(dto, language, ttl)
+    @staticmethod
+    def _group_by_owner(items: Iterable[T]) -> Dict[int, List[T]]:
+        """Сгруппирует по `owner_id`, сохраняя порядок внутри владельца"""
+        result: Dict[int, List[T]] = defaultdict(list)
+        for item in items:
+            result[item.owner_id].append(item)
+        return result
 
     @staticmethod
     def _extract_account_languages(accounts: Iterable["SoldAccounts"]):
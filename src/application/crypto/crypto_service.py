@@ -0,0 +1,136 @@
+import base64
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable, Protocol
+
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from src.application.crypto.crypto_context import CryptoProvider
+
+
+class WrappedKeyHolder(Protocol):
+    """Хранилище товара с DEK, зашифрованным KEK (AccountStorage, UniversalStorage и их DTO)"""
+    encrypted_key: str
+    encrypted_key_nonce: str
+
+
+@dataclass
+class _CachedKey:
+    key: bytearray
+    cipher: AESGCM
+    expires_at: float
+
+    def zeroize(self) -> None:
+        self.key[:] = bytes(len(self.key))
+
+
+class CryptoService:
+    """
+    Горячий путь расшифровки товаров поверх CryptoProvider.
+    Объекты AESGCM для KEK и глобального DEK создаются один раз. Расшифрованные DEK товаров держатся
+    в ограниченном LRU-кэше с TTL: один и тот же товар расшифровывается при проверке, покупке и выдаче,
+    и каждый раз разворачивать его ключ не нужно. Вытесненные и просроченные ключи затираются нулями.
+
+    Затирание best effort: копии ключа, отданные вызывающему коду (unwrap_dek), и память внутри AESGCM
+    живут, пока на них есть ссылки. Потокобезопасен: расшифровка файлов идёт и в asyncio.to_thread.
+    """
+
+    def __init__(self, crypto_provider: CryptoProvider, max_items: int = 1024, ttl: float = 300):
+        self.crypto_provider = crypto_provider
+        self.max_items = max_items
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._keys: "OrderedDict[tuple[str, str], _CachedKey]" = OrderedDict()
+        self._kek_cipher: AESGCM | None = None
+        self._dek_cipher: AESGCM | None = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def kek_cipher(self) -> AESGCM:
+        if self._kek_cipher is None:
+            self._kek_cipher = AESGCM(self.crypto_provider.get().kek)
+        return self._kek_cipher
+
+    @property
+    def dek_cipher(self) -> AESGCM:
+        """Шифр глобального DEK (секреты конфига и прочие данные не привязанные к товару)"""
+        if self._dek_cipher is None:
+            self._dek_cipher = AESGCM(self.crypto_provider.get().dek)
+        return self._dek_cipher
+
+    def _get(self, encrypted_key_b64: str, nonce_b64: str) -> _CachedKey:
+        cache_key = (encrypted_key_b64, nonce_b64)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._keys.get(cache_key)
+            if entry is not None:
+                if entry.expires_at > now:
+                    self._keys.move_to_end(cache_key)
+                    self.hits += 1
+                    return entry
+                self._drop(cache_key)
+
+            self.misses += 1
+            key = bytearray(self.kek_cipher.decrypt(
+                base64.b64decode(nonce_b64), base64.b64decode(encrypted_key_b64), None
+            ))
+            entry = _CachedKey(key=key, cipher=AESGCM(bytes(key)), expires_at=now + self.ttl)
+            self._keys[cache_key] = entry
+
+            while len(self._keys) > self.max_items:
+                self._drop(next(iter(self._keys)))
+                self.evictions += 1
+            return entry
+
+    def _drop(self, cache_key: tuple[str, str]) -> None:
+        self._keys.pop(cache_key).zeroize()
+
+    def unwrap_dek(self, encrypted_key_b64: str, nonce_b64: str) -> bytes:
+        """Аналог key_ops.unwrap_dek с KEK из CryptoProvider и кэшем"""
+        return bytes(self._get(encrypted_key_b64, nonce_b64).key)
+
+    def unwrap_storage(self, storage: WrappedKeyHolder) -> bytes:
+        return self.unwrap_dek(storage.encrypted_key, storage.encrypted_key_nonce)
+
+    def unwrap_many(self, storages: Iterable[WrappedKeyHolder]) -> list[bytes]:
+        """DEK для списка хранилищ в том же порядке, одинаковые ключи разворачиваются один раз"""
+        unwrapped: dict[tuple[str, str], bytes] = {}
+        result = []
+        for storage in storages:
+            cache_key = (storage.encrypted_key, storage.encrypted_key_nonce)
+            if cache_key not in unwrapped:
+                unwrapped[cache_key] = self.unwrap_dek(*cache_key)
+            result.append(unwrapped[cache_key])
+        return result
+
+    def decrypt_text(self, storage: WrappedKeyHolder, encrypted_data_b64: str, nonce_b64: str) -> str:
+        """Расшифрует поле хранилища (логин, пароль, описание) его DEK"""
+        cipher = self._get(storage.encrypted_key, storage.encrypted_key_nonce).cipher
+        return cipher.decrypt(
+            base64.b64decode(nonce_b64), base64.b64decode(encrypted_data_b64), None
+        ).decode("utf-8")
+
+    def decrypt_global_text(self, encrypted_data_b64: str, nonce_b64: str) -> str:
+        return self.dek_cipher.decrypt(
+            base64.b64decode(nonce_b64), base64.b64decode(encrypted_data_b64), None
+        ).decode("utf-8")
+
+    def clear(self) -> None:
+        with self._lock:
+            while self._keys:
+                self._drop(next(iter(self._keys)))
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._keys),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -1,10 +1,51 @@
 import os
 from logging import Logger
 
-from src.application.crypto.crypto_context import CryptoProvider
-from src.config import RuntimeConfig
+from src.application.crypto.crypto_context import CryptoProvider, GLOBAL_DEK_NAME
+from src.config import RuntimeConfig, SECRET_NAMES
 from src.domain.crypto.decrypt import decrypt_text
-from src.infrastructure.crypto.secret_storage.secrets_storage import SecretsStorage
+from src.exceptions import StorageNotFound
+from src.infrastructure.crypto.secret_storage.secrets_storage import SecretsStorage, AsyncSecretsStorage
+
+
+class SecretsSnapshot:
+    """
+    Заранее загруженные ответы сервиса хранения. Отдаёт их через get_secret из SecretsStorage,
+    поэтому InitCryptoContext и GetSecret работают с ним без запросов по сети.
+    """
+
+    def __init__(self, payloads: dict[str, dict]):
+        self._payloads = payloads
+
+    def get_secret(self, name: str, version: int | None = None) -> dict:
+        if version is not None or name not in self._payloads:
+            raise StorageNotFound()
+        return self._payloads[name]
+
+
+class PrefetchSecrets:
+    """
+    Секреты запуска (глобальный DEK и секреты конфига) одной параллельной пачкой,
+    а не по одному последовательному TLS-запросу на секрет
+    """
+
+    def __init__(
+        self,
+        storage: AsyncSecretsStorage,
+        logger: Logger,
+        runtime_conf: RuntimeConfig
+    ):
+        self.storage = storage
+        self.logger = logger
+        self.runtime_conf = runtime_conf
+
+    async def execute(self) -> SecretsSnapshot:
+        if not self.runtime_conf.env.use_secret_storage:
+            return SecretsSnapshot({})
+
+        payloads = await self.storage.get_secrets([GLOBAL_DEK_NAME, *SECRET_NAMES.values()])
+        self.logger.info("Received %s startup secrets from storage", len(payloads))
+        return SecretsSnapshot(payloads)
 
 
 class GetSecret:
@@ -1,10 +1,12 @@
 from collections.abc import Callable
+from datetime import datetime
 from typing import AsyncGenerator
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 from src.containers import RequestContainer
-from src.application.deferred_tasks.jobs import deactivate_discounts_job, dollar_rate_job
+from src.application.deferred_tasks.jobs import deactivate_discounts_job, dollar_rate_job, \
+    universal_integrity_job, statistics_rollup_job
 
 
 class InitScheduler:
@@ -28,4 +30,19 @@ class InitScheduler:
             "interval",
             seconds=3600, # час
             args=[container_factory],
-        )
\ No newline at end of file
+        )
+
+        scheduler.add_job(
+            universal_integrity_job,
+            "interval",
+            seconds=600, # 10 минут
+            args=[container_factory],
+        )
+
+        scheduler.add_job(
+            statistics_rollup_job,
+            "interval",
+            seconds=3600, # час
+            next_run_time=datetime.now(), # сразу при запуске, чтобы свернуть дни, пока бот был выключен
+            args=[container_factory],
+        )
@@ -11,4 +11,14 @@ async def deactivate_discounts_job(container_factory: Callable[[], AsyncGenerato
 
 async def dollar_rate_job(container_factory: Callable[[], AsyncGenerator[RequestContainer, None]]):
     async for container in container_factory():
-        await container.update_dollar_rate_use_case.execute()
\ No newline at end of file
+        await container.update_dollar_rate_use_case.execute()
+
+
+async def universal_integrity_job(container_factory: Callable[[], AsyncGenerator[RequestContainer, None]]):
+    async for container in container_factory():
+        await container.verify_universal_integrity_use_case.execute()
+
+
+async def statistics_rollup_job(container_factory: Callable[[], AsyncGenerator[RequestContainer, None]]):
+    async for container in container_factory():
+        await container.statistics_rollup_service.close_days()
@@ -1,14 +1,18 @@
-from src.models.read_models import EventSentLog
+from src.infrastructure.telegram.rate_limit import Priority
+from src.models.read_models import EventSentLog, EventSendUserMessage
 from src.application.bot.send_log import SendLogs
+from src.application.bot.send_message import SendMessageService
 
 
 class MessageEventHandler:
 
     def __init__(
         self,
-        send_log: SendLogs
+        send_log: SendLogs,
+        send_msg: SendMessageService,
     ):
         self.send_log = send_log
+        self.send_msg = send_msg
 
     async def message_event_handler(self, event):
         payload = event["payload"]
@@ -18,4 +22,11 @@ class MessageEventHandler:
             await self.send_log.send_log(
                 text=obj.text,
                 log_lvl=obj.log_lvl,
-            )
\ No newline at end of file
+            )
+        elif event["event"] == "message.send_user":
+            obj = EventSendUserMessage.model_validate(payload)
+            await self.send_msg.send(
+                chat_id=obj.user_id,
+                message=obj.text,
+                priority=Priority.TRANSACTIONAL,
+            )
@@ -2,6 +2,7 @@ from logging import Logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.models.categories import CategoryService
+from src.application.models.systems import StatisticsRollupService
 from src.models.read_models import LogLevel
 from src.models.create_models.users import CreateUserAuditLogDTO, CreateWalletTransactionDTO
 from src.models.read_models import NewPurchaseAccount, NewPurchaseUniversal
@@ -16,6 +17,7 @@ class PurchaseEventHandler:
         publish_event: PublishEventHandler,
         user_log_service: UserLogService,
         wallet_trans_service: WalletTransactionService,
+        statistics_rollup_service: StatisticsRollupService,
         category_service: CategoryService,
         session_db: AsyncSession,
         logger: Logger,
@@ -23,6 +25,7 @@ class PurchaseEventHandler:
         self.publish_event = publish_event
         self.user_log_service = user_log_service
         self.wallet_trans_service = wallet_trans_service
+        self.statistics_rollup_service = statistics_rollup_service
         self.category_service = category_service
         self.session_db = session_db
         self.logger = logger
@@ -103,6 +106,10 @@ class PurchaseEventHandler:
                 balance_after=new_purchase.user_balance_after
             )
         )
+        await self.statistics_rollup_service.record_sales(
+            category_id=new_purchase.category_id,
+            purchase_ids=[account_data.purchase_id for account_data in new_purchase.account_movement],
+        )
 
         await self.session_db.commit()
 
@@ -168,5 +175,9 @@ class PurchaseEventHandler:
                 balance_after=new_purchase.user_balance_after
             )
         )
+        await self.statistics_rollup_service.record_sales(
+            category_id=new_purchase.category_id,
+            purchase_ids=[product_data.purchase_id for product_data in new_purchase.product_movement],
+        )
 
         await self.session_db.commit()
@@ -10,6 +10,7 @@ from src.application.bot import SendMessageService
 from src.application.events.publish_event_handler import PublishEventHandler
 from src.application.models.referrals import ReferralService
 from src.application.models.users.notifications_service import NotificationSettingsService
+from src.infrastructure.telegram.rate_limit import Priority
 from src.infrastructure.translations import get_text
 
 
@@ -64,7 +65,7 @@ class ReferralEventHandler:
     async def _notify_owner_on_income(self, result: ReferralIncomeResult) -> None:
         try:
             message = self._build_referral_income_message(result)
-            await self.send_msg_service.send(result.owner_user_id, message)
+            await self.send_msg_service.send(result.owner_user_id, message, priority=Priority.TRANSACTIONAL)
         except TelegramForbiddenErrorService:
             return
         except Exception as e:
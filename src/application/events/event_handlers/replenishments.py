@@ -10,6 +10,7 @@ from src.models.read_models import NewReplenishment, ReplenishmentCompleted, Rep
 from src.application.bot import SendMessageService
 from src.application.events.publish_event_handler import PublishEventHandler
 from src.application.models.users.replenishment_service import ReplenishmentsService
+from src.infrastructure.telegram.rate_limit import Priority
 from src.infrastructure.translations import get_text, n_get_text
 
 
@@ -69,7 +70,7 @@ class ReplenishmentsEventHandler:
             event.amount,
         ).format(sum=event.amount)
 
-        await self.send_msg_service.send(event.user_id, message_success)
+        await self.send_msg_service.send(event.user_id, message_success, priority=Priority.TRANSACTIONAL)
 
         if not event.error:
             message_log = n_get_text(
@@ -113,6 +114,7 @@ class ReplenishmentsEventHandler:
             event.user_id,
             message_for_user,
             reply_markup=await self.support_kb_builder(event.language, settings.support_username),
+            priority=Priority.TRANSACTIONAL,
         )
 
         message_log = get_text(
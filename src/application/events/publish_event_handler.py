@@ -1,6 +1,6 @@
 from src.infrastructure.rabbit_mq.producer import RabbitMQProducer
 from src.models.read_models.events.discounts import NewActivationVoucher, NewActivatePromoCode
-from src.models.read_models import EventSentLog, LogLevel, NewPurchaseAccount, NewPurchaseUniversal, NewReplenishment
+from src.models.read_models import EventSentLog, EventSendUserMessage, LogLevel, NewPurchaseAccount, NewPurchaseUniversal, NewReplenishment
 from src.models.read_models import EventCreateUiImage
 
 
@@ -16,6 +16,10 @@ class PublishEventHandler:
         event = EventSentLog(text=text, log_lvl=log_lvl)
         await self.producer.publish(event.model_dump(), "message.send_log")
 
+    async def send_user_message(self, user_id: int, text: str):
+        event = EventSendUserMessage(user_id=user_id, text=text)
+        await self.producer.publish(event.model_dump(), "message.send_user")
+
     async def create_ui_image(
         self,
         ui_image_key: str,
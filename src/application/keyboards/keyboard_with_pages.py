@@ -1,8 +1,43 @@
-from typing import Optional
+from math import ceil
+from typing import Optional, Callable, Awaitable, Any, List, Tuple
 
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 from aiogram.types import InlineKeyboardButton
 
+from src.models.read_models.pagination import PageCursor
+
+
+def _build_keyboard(
+        records: list,
+        item_button_func,
+        navigation: Optional[List[InlineKeyboardButton]],
+        back_text: str,
+        back_callback: str,
+        helpers_text: Optional[str] = None,
+        helpers_callback: Optional[str] = None
+):
+    keyboard = InlineKeyboardBuilder()
+
+    # --- Кнопки элементов ---
+    for record in records:
+        keyboard.row(item_button_func(record))
+
+    # --- Кнопки пагинации ---
+    if navigation:
+        keyboard.row(*navigation)
+
+    if helpers_text is not None and helpers_callback is not None:
+        keyboard.row(
+            InlineKeyboardButton(text=helpers_text, callback_data=helpers_callback)
+        )
+
+    # --- Кнопка Назад ---
+    keyboard.row(
+        InlineKeyboardButton(text=back_text, callback_data=back_callback)
+    )
+
+    return keyboard.as_markup()
+
 
 def pagination_keyboard(
         records: list,
@@ -30,14 +65,7 @@ def pagination_keyboard(
     :param helpers_text: текст помогающей кнопки
     :param helpers_callback: callback помогающей кнопки
     """
-
-    keyboard = InlineKeyboardBuilder()
-
-    # --- Кнопки элементов ---
-    for record in records:
-        keyboard.row(item_button_func(record))
-
-    # --- Кнопки пагинации ---
+    navigation = None
     if records and total_pages > 1:
         # значения по умолчанию (когда переход невозможен)
         left_button = f"{left_prefix}_none"
@@ -51,20 +79,83 @@ def pagination_keyboard(
         elif current_page > 1:
             left_button = f"{left_prefix}:{current_page - 1}"
 
-        keyboard.row(
+        navigation = [
             InlineKeyboardButton(text="⬅️", callback_data=left_button),
             InlineKeyboardButton(text=f"{current_page}/{total_pages}", callback_data="none"),
             InlineKeyboardButton(text="➡️", callback_data=right_button),
-        )
-
-    if helpers_text is not None and helpers_callback is not None:
-        keyboard.row(
-            InlineKeyboardButton(text=helpers_text, callback_data=helpers_callback)
-        )
+        ]
 
-    # --- Кнопка Назад ---
-    keyboard.row(
-        InlineKeyboardButton(text=back_text, callback_data=back_callback)
+    return _build_keyboard(
+        records, item_button_func, navigation, back_text, back_callback, helpers_text, helpers_callback
     )
 
-    return keyboard.as_markup()
+
+async def load_cursor_page(
+        cursor: PageCursor,
+        fetch: Callable[[PageCursor], Awaitable[list]],
+        count: Callable[[], Awaitable[int]],
+) -> Tuple[list, PageCursor]:
+    """
+    Загрузит страницу списка по курсору.
+
+    Если по якорю ничего не нашлось (запись удалили или список сократился), список откроется с первой страницы.
+    Общее кол-во записей считается через `count` только когда его ещё нет в курсоре, т.е. при открытии списка.
+
+    :param fetch: функция(cursor) → записи страницы
+    :param count: функция() → общее кол-во записей
+    :return: записи и курсор с заполненным `total`
+    """
+    records = await fetch(cursor)
+    if not records and (cursor.anchor_id is not None or cursor.page > 1):
+        cursor = PageCursor()
+        records = await fetch(cursor)
+
+    if cursor.total is None:
+        cursor = cursor.model_copy(update={"total": await count()})
+
+    return records, cursor
+
+
+def cursor_pagination_keyboard(
+        records: list,
+        cursor: PageCursor,
+        page_size: int,
+        record_id: Callable[[Any], int],
+        item_button_func,
+        prefix: str,
+        back_text: str,
+        back_callback: str,
+        helpers_text: Optional[str] = None,
+        helpers_callback: Optional[str] = None
+):
+    """
+    Пагинационная клавиатура для keyset-пагинации, кнопки 'влево' и 'вправо' несут `PageCursor.encode()`.
+
+    :param records: список записей для текущей страницы (от новых к старым)
+    :param cursor: курсор текущей страницы с заполненным `total` (см. `load_cursor_page`)
+    :param record_id: функция(record) → id записи, по которому строится якорь соседней страницы
+    :param prefix: callback prefix кнопок 'влево' и 'вправо'
+    Остальные параметры как в `pagination_keyboard`
+    """
+    total_pages = max(ceil((cursor.total or 0) / page_size), 1)
+
+    navigation = None
+    if records and total_pages > 1:
+        # значения по умолчанию (когда переход невозможен), prefix_none попал бы в хендлер списка
+        left_button = "none"
+        right_button = "none"
+
+        if cursor.page > 1:
+            left_button = f"{prefix}:{cursor.previous(record_id(records[0])).encode()}"
+        if cursor.page < total_pages and len(records) >= page_size:
+            right_button = f"{prefix}:{cursor.next(record_id(records[-1])).encode()}"
+
+        navigation = [
+            InlineKeyboardButton(text="⬅️", callback_data=left_button),
+            InlineKeyboardButton(text=f"{min(cursor.page, total_pages)}/{total_pages}", callback_data="none"),
+            InlineKeyboardButton(text="➡️", callback_data=right_button),
+        ]
+
+    return _build_keyboard(
+        records, item_button_func, navigation, back_text, back_callback, helpers_text, helpers_callback
+    )
@@ -1,11 +1,13 @@
 from src.application.models.admins.admin_action_service import AdminActionsService
 from src.application.models.admins.admin_service import AdminsService
+from src.application.models.admins.mass_mailing_job_service import MassMailingJobsService
 from src.application.models.admins.message_for_sending_service import MessageForSendingService
 from src.application.models.admins.sent_mass_message_service import SentMassMessagesService
 
 __all__ = [
     "AdminActionsService",
     "AdminsService",
+    "MassMailingJobsService",
     "MessageForSendingService",
     "SentMassMessagesService",
 ]
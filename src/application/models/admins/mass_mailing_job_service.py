@@ -0,0 +1,81 @@
+from typing import Optional, List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.create_models.admins import BroadcastSegment
+from src.models.read_models.admins import MassMailingJobDTO, MassMailingBatchDTO
+from src.repository.database.admins import MassMailingJobsRepository
+
+
+class MassMailingJobsService:
+
+    def __init__(self, jobs_repo: MassMailingJobsRepository, session_db: AsyncSession):
+        self.jobs_repo = jobs_repo
+        self.session_db = session_db
+
+    async def create_job(
+        self,
+        admin_id: int,
+        content: str,
+        total_users: int,
+        photo_path: Optional[str] = None,
+        photo_id: Optional[str] = None,
+        button_url: Optional[str] = None,
+        segment: Optional[BroadcastSegment] = None,
+        make_commit: Optional[bool] = False,
+    ) -> MassMailingJobDTO:
+        job = await self.jobs_repo.create_job(
+            user_id=admin_id,
+            content=content,
+            total_users=total_users,
+            photo_path=photo_path,
+            photo_id=photo_id,
+            button_url=button_url,
+            segment=segment.model_dump(exclude_none=True) if segment else None,
+        )
+        if make_commit:
+            await self.session_db.commit()
+
+        return job
+
+    async def get_job(self, job_id: int) -> Optional[MassMailingJobDTO]:
+        return await self.jobs_repo.get_job(job_id)
+
+    async def get_running_jobs(self) -> List[MassMailingJobDTO]:
+        return await self.jobs_repo.get_jobs_by_status("running")
+
+    async def save_batch(
+        self,
+        job_id: int,
+        user_ids: List[int],
+        number_received: int,
+        number_retried: int,
+        duration: float,
+    ) -> MassMailingJobDTO:
+        """
+        Сохранит итог пачки и курсор одной транзакцией.
+        После commit пачка считается отправленной и при продолжении рассылки повторно не отправляется.
+        """
+        job = await self.jobs_repo.add_batch_result(
+            job_id=job_id,
+            first_user_id=user_ids[0],
+            last_user_id=user_ids[-1],
+            number_received=number_received,
+            number_sent=len(user_ids),
+            number_retried=number_retried,
+            duration=duration,
+        )
+        await self.session_db.commit()
+        return job
+
+    async def complete_job(
+        self, job_id: int, sent_message_id: Optional[int] = None, make_commit: Optional[bool] = False
+    ) -> MassMailingJobDTO:
+        job = await self.jobs_repo.finish_job(job_id, status="completed", sent_message_id=sent_message_id)
+        if make_commit:
+            await self.session_db.commit()
+
+        return job
+
+    async def get_batches(self, job_id: int) -> List[MassMailingBatchDTO]:
+        return await self.jobs_repo.get_batches(job_id)
@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.create_models.admins import CreateSentMassMessages
 from src.models.read_models.admins import SentMasMessagesDTO
+from src.models.read_models.pagination import PageCursor
 from src.repository.database.admins import SentMasMessagesRepository
 
 
@@ -26,8 +27,10 @@ class SentMassMessagesService:
     async def get_msg(self, message_id: int) -> SentMasMessagesDTO:
         return await self.sent_msg_repo.get_sent_mass_message(message_id)
 
-    async def get_msgs_by_page(self, page: int = None, page_size: int = None) -> List[SentMasMessagesDTO]:
-        return await self.sent_msg_repo.get_sent_mass_messages(page=page, page_size=page_size)
+    async def get_msgs_by_page(
+        self, page: int = None, page_size: int = None, cursor: Optional[PageCursor] = None
+    ) -> List[SentMasMessagesDTO]:
+        return await self.sent_msg_repo.get_sent_mass_messages(page=page, page_size=page_size, cursor=cursor)
 
     async def get_count_msgs(self) -> int:
         return await self.sent_msg_repo.count_sent_mass_messages()
\ No newline at end of file
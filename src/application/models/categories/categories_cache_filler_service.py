@@ -21,15 +21,20 @@ class CategoriesCacheFillerService:
 
     async def _build_category_full_list(
             self,
-            categories: list[Categories]
+            categories: list[Categories],
+            quantity_map: Optional[dict[int, int]] = None,
     ) -> dict[str, list[CategoryFull]]:
+        """
+        :param quantity_map: Количество товаров по категориям, если уже получено. Иначе будет запрошено
+        """
         if not categories:
             return {}
 
         categories = sorted(categories, key=lambda x: x.index or 0)
 
-        category_ids = [c.category_id for c in categories]
-        quantity_map = await self.category_repo.get_quantity_products_map(category_ids)
+        if quantity_map is None:
+            category_ids = [c.category_id for c in categories]
+            quantity_map = await self.category_repo.get_quantity_products_map(category_ids)
 
         langs = {
             t.language
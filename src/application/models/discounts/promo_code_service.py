@@ -11,6 +11,7 @@ from src.models.create_models.discounts import CreatePromoCodeDTO, CreateActivat
 from src.models.create_models.users import CreateUserAuditLogDTO
 from src.models.read_models import LogLevel
 from src.models.read_models.other import PromoCodesDTO, ResultActivatePromoCodeDTO
+from src.models.read_models.pagination import PageCursor
 from src.repository.database.admins import AdminActionsRepository
 from src.repository.database.discount import PromoCodeRepository
 from src.repository.redis import PromoCodesCacheRepository
@@ -47,6 +48,7 @@ class PromoCodeService:
         page: Optional[int] = None,
         page_size: Optional[int] = None,
         show_not_valid: bool = False,
+        cursor: Optional[PageCursor] = None,
     ) -> List[PromoCodesDTO]:
         if page_size is None:
             page_size = self.conf.different.page_size
@@ -55,6 +57,7 @@ class PromoCodeService:
             page=page,
             page_size=page_size,
             show_not_valid=show_not_valid,
+            cursor=cursor,
         )
 
     async def get_count_promo_codes(self, consider_invalid: bool = False) -> int:
@@ -1,42 +1,71 @@
+import uuid
+from collections import defaultdict
 from datetime import datetime, timezone
 from logging import Logger
-from typing import TYPE_CHECKING
+from typing import Dict, List
+
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.events.publish_event_handler import PublishEventHandler
-from src.application.models.discounts import VoucherService, PromoCodeService
-from src.application.models.users import UserService
+from src.config import Config
 from src.models.read_models import LogLevel, VouchersDTO
 from src.repository.database.discount import PromoCodeRepository, VouchersRepository
+from src.repository.database.users import UsersRepository, WalletTransactionRepository, UserAuditLogsRepository
+from src.repository.redis import PromoCodesCacheRepository, VouchersCacheRepository, UsersCacheRepository
 from src.infrastructure.translations import get_text
 
 
-if TYPE_CHECKING:
-    from src.infrastructure.telegram.bot_client import TelegramClient
+EXPIRY_LOCK_KEY = "discount_expiry:lock"
 
 
 class RemoveInvalidDiscountsUseCase:
+    """
+    Деактивирует истёкшие промокоды и ваучеры.
+
+    Записи обрабатываются пачками по `conf.different.discount_expiry_batch`: одна пачка это один UPDATE ... RETURNING,
+    возврат денег создателям ваучеров одним UPDATE по всем создателям пачки (сумма по всем его ваучерам),
+    одна очистка кэша. Уведомления пользователям уходят событиями `message.send_user` и отправляются
+    обработчиками событий с учётом лимитов Telegram, поэтому задача планировщика не ждёт отправки.
+    Одновременно задачу выполняет только одна реплика (блокировка в Redis).
+    """
 
     def __init__(
         self,
-        user_service: UserService,
         promo_code_repo: PromoCodeRepository,
-        promo_code_service: PromoCodeService,
         voucher_repo: VouchersRepository,
-        voucher_service: VoucherService,
+        users_repo: UsersRepository,
+        wallet_transaction_repo: WalletTransactionRepository,
+        user_log_repo: UserAuditLogsRepository,
+        promo_code_cache_repo: PromoCodesCacheRepository,
+        vouchers_cache_repo: VouchersCacheRepository,
+        users_cache_repo: UsersCacheRepository,
         publish_event_handler: PublishEventHandler,
-        tg_client: "TelegramClient",
+        session_db: AsyncSession,
+        session_redis: Redis,
+        conf: Config,
         logger: Logger,
     ):
-        self.user_service = user_service
         self.promo_code_repo = promo_code_repo
-        self.promo_code_service = promo_code_service
         self.voucher_repo = voucher_repo
-        self.voucher_service = voucher_service
+        self.users_repo = users_repo
+        self.wallet_transaction_repo = wallet_transaction_repo
+        self.user_log_repo = user_log_repo
+        self.promo_code_cache_repo = promo_code_cache_repo
+        self.vouchers_cache_repo = vouchers_cache_repo
+        self.users_cache_repo = users_cache_repo
         self.publish_event_handler = publish_event_handler
-        self.tg_client = tg_client
+        self.session_db = session_db
+        self.session_redis = session_redis
+        self.conf = conf
         self.logger = logger
 
     async def execute(self):
+        token = uuid.uuid4().hex
+        lock_ttl = self.conf.different.discount_expiry_lock_ttl
+        if not await self.session_redis.set(EXPIRY_LOCK_KEY, token, nx=True, ex=lock_ttl):
+            return # выполняет другая реплика
+
         try:
             now = datetime.now(timezone.utc)
 
@@ -47,52 +76,149 @@ class RemoveInvalidDiscountsUseCase:
             self.logger.exception(
                 "Ошибка при деактивации промокодов/ваучеров: %s", e
             )
+        finally:
+            await self._release_lock(token)
 
-    async def _send_set_not_valid_voucher(self, user_id: int, voucher: VouchersDTO, limit_reached: bool, language: str):
-        """
-        Отошлёт сообщение в канал или пользователю в зависимости от 'is_created_admin' в voucher
-        :param user_id: id пользователя
-        :param voucher: объект БД ваучера
-        :param limit_reached: флаг получения лимита по активации
-        :param language: язык пользователя
-        :return:
-        """
-        if voucher.is_created_admin: # отсылка лога в канал
-            await self.publish_event_handler.send_log(
-                text=get_text(
-                    'ru',
-                    "discount",
-                    "log_voucher_expired"
-                ).format(id=voucher.voucher_id, code=voucher.activation_code),
-                log_lvl=LogLevel.INFO
-            )
-
-        else:
-            if limit_reached: # если достигли лимита по активациям
-                message_user = get_text(
-                    language,
-                    "discount",
-                    "voucher_reached_activation_limit"
-                ).format(id=voucher.voucher_id, code=voucher.activation_code)
-            else: # если достигли лимита по времени
-                message_user = get_text(
-                    language,
-                    "discount",
-                    "voucher_expired_due_to_time"
-                ).format(id=voucher.voucher_id, code=voucher.activation_code)
-
-            await self.tg_client.send_message(user_id, message_user)
+    async def _release_lock(self, token: str) -> None:
+        current = await self.session_redis.get(EXPIRY_LOCK_KEY)
+        if isinstance(current, bytes):
+            current = current.decode("utf-8")
+        if current == token:
+            await self.session_redis.delete(EXPIRY_LOCK_KEY)
 
     async def _set_not_valid_promo_code(self, data_time_to: datetime) -> None:
-        invalid_promo_codes = await self.promo_code_repo.get_not_valid_promo_codes(data_time_to)
+        batch_size = self.conf.different.discount_expiry_batch
+
+        while True:
+            promo_codes = await self.promo_code_repo.deactivate_expired(data_time_to, batch_size)
+            await self.session_db.commit()
+
+            await self.promo_code_cache_repo.delete_many(
+                [promo.activation_code for promo in promo_codes if promo.activation_code]
+            )
+            for promo in promo_codes:
+                message_log = get_text(
+                    'ru', "discount", "log_promo_code_expired"
+                ).format(id=promo.promo_code_id, code=promo.activation_code)
+                await self.publish_event_handler.send_log(text=message_log, log_lvl=LogLevel.WARNING)
+
+            if len(promo_codes) < batch_size:
+                break
 
-        for promo in invalid_promo_codes:
-            await self.promo_code_service.deactivate_promo_code(promo_code_id=promo.promo_code_id)
+        # ключи промокодов с ttl истекают сами, а их индекс постоянный
+        await self.promo_code_cache_repo.prune_index()
 
     async def _set_not_valid_vouchers(self, data_time_to: datetime) -> None:
-        invalid_vouchers = await self.voucher_repo.get_not_valid_voucher(data_time_to)
+        batch_size = self.conf.different.discount_expiry_batch
 
-        for voucher in invalid_vouchers:
-            await self.voucher_service.deactivate_voucher(voucher.voucher_id)
-            user = await self.user_service.get_user(voucher.creator_id)
-            await self._send_set_not_valid_voucher(voucher.creator_id, voucher, False, user.language)
\ No newline at end of file
+        while True:
+            vouchers = await self.voucher_repo.deactivate_expired(data_time_to, batch_size)
+            if not vouchers:
+                await self.session_db.commit()
+                return
+
+            refunded_users = await self._refund(vouchers)
+            await self.session_db.commit()
+
+            await self.vouchers_cache_repo.delete_many(
+                codes=[voucher.activation_code for voucher in vouchers if voucher.activation_code],
+                user_ids=list({voucher.creator_id for voucher in vouchers if not voucher.is_created_admin}),
+            )
+            await self.users_cache_repo.set_many(
+                refunded_users,
+                ttl=int(self.conf.redis_time_storage.user.total_seconds()),
+            )
+            await self._notify(vouchers, {user.user_id: user.language for user in refunded_users})
+
+            if len(vouchers) < batch_size:
+                return
+
+    async def _refund(self, vouchers: List[VouchersDTO]) -> list:
+        """
+        Вернёт создателям ваучеров деньги за неиспользованные активации: одна транзакция на создателя
+        с суммой по всем его ваучерам из пачки. Коммит на вызывающей стороне.
+        :return: Пользователи с обновлённым балансом
+        """
+        refunds: Dict[int, int] = defaultdict(int)
+        refunded_vouchers: Dict[int, List[int]] = defaultdict(list)
+        for voucher in vouchers:
+            if voucher.is_created_admin:
+                continue
+
+            remaining = (voucher.number_of_activations or 0) - voucher.activated_counter
+            refund_amount = remaining * voucher.amount
+            if refund_amount > 0:
+                refunds[voucher.creator_id] += refund_amount
+                refunded_vouchers[voucher.creator_id].append(voucher.voucher_id)
+
+        users = await self.users_repo.update_balances_by_delta(refunds)
+        if not users:
+            return []
+
+        transactions = await self.wallet_transaction_repo.create_many([
+            {
+                "user_id": user.user_id,
+                "type": "refund",
+                "amount": refunds[user.user_id],
+                "balance_before": user.balance - refunds[user.user_id],
+                "balance_after": user.balance,
+            }
+            for user in users
+        ])
+
+        logs = []
+        for user, transaction in zip(users, transactions):
+            logs += [
+                {
+                    "user_id": user.user_id,
+                    "action_type": "deactivate_voucher",
+                    "message": "Ваучер деактивировался",
+                    "details": {"voucher_id": voucher_id},
+                }
+                for voucher_id in refunded_vouchers[user.user_id]
+            ]
+            logs.append({
+                "user_id": user.user_id,
+                "action_type": "return_money_from_vouchers",
+                "message": "Пользователю вернулись деньги за ваучеры которые деактивировались",
+                "details": {
+                    "amount": refunds[user.user_id],
+                    "voucher_ids": refunded_vouchers[user.user_id],
+                    "transaction_id": transaction.wallet_transaction_id,
+                },
+            })
+        await self.user_log_repo.create_many(logs)
+
+        return users
+
+    async def _notify(self, vouchers: List[VouchersDTO], languages: Dict[int, str]) -> None:
+        """
+        Отошлёт лог в канал для ваучеров админов и уведомление создателю для остальных
+        :param languages: Dict(user_id, язык) уже известные языки пользователей, остальные берутся одним запросом
+        """
+        unknown = list({
+            voucher.creator_id for voucher in vouchers
+            if not voucher.is_created_admin and voucher.creator_id not in languages
+        })
+        if unknown:
+            languages.update({user.user_id: user.language for user in await self.users_repo.get_by_ids(unknown)})
+
+        for voucher in vouchers:
+            if voucher.is_created_admin: # отсылка лога в канал
+                await self.publish_event_handler.send_log(
+                    text=get_text(
+                        'ru',
+                        "discount",
+                        "log_voucher_expired"
+                    ).format(id=voucher.voucher_id, code=voucher.activation_code),
+                    log_lvl=LogLevel.INFO
+                )
+            elif voucher.creator_id in languages:
+                await self.publish_event_handler.send_user_message(
+                    user_id=voucher.creator_id,
+                    text=get_text(
+                        languages[voucher.creator_id],
+                        "discount",
+                        "voucher_expired_due_to_time"
+                    ).format(id=voucher.voucher_id, code=voucher.activation_code),
+                )
@@ -13,6 +13,7 @@ from src.database.models.discount import SmallVoucher
 from src.exceptions import NotEnoughMoney, UserNotFound
 from src.models.create_models.discounts import CreateVoucherDTO
 from src.models.read_models.other import UsersDTO, VouchersDTO
+from src.models.read_models.pagination import PageCursor
 from src.repository.database.admins import AdminActionsRepository
 from src.repository.database.discount import (
     VoucherActivationsRepository,
@@ -182,13 +183,17 @@ class VoucherService:
         page: Optional[int] = None,
         page_size: Optional[int] = None,
         only_created_admin: bool = False,
+        cursor: Optional[PageCursor] = None,
     ) -> List[SmallVoucher]:
         """
         :param user_id: необходим если получаем по пользователю, а не по админам
+        :param cursor: курсор страницы, в кэше ваучеров пользователя используется только номер страницы
         Если не указывать page, то вернётся весь список. Отсортирован по дате (desc)
         """
         if page_size is None:
             page_size = self.conf.different.page_size
+        if cursor is not None:
+            page = cursor.page
         if not only_created_admin and user_id is not None:
             if await self.cache_vouchers_repo.exists_by_user(user_id):
                 vouchers = await self.cache_vouchers_repo.get_small_by_user(user_id)
@@ -203,6 +208,7 @@ class VoucherService:
             page=page,
             page_size=page_size,
             only_created_admin=only_created_admin,
+            cursor=cursor,
         )
         return [
             SmallVoucher(
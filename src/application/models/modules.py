@@ -2,6 +2,7 @@ from logging import Logger
 
 from src.application.cache_warmup import CacheWarmupService
 from src.application.crypto.crypto_context import CryptoProvider
+from src.application.crypto.crypto_service import CryptoService
 from src.application.events.publish_event_handler import PublishEventHandler
 from src.application.models.admins import AdminsService, SentMassMessagesService, MessageForSendingService
 from src.application.models.categories import CategoryService, TranslationsCategoryService
@@ -31,7 +32,7 @@ from src.application.models.referrals import ReferralService, ReferralIncomeServ
 from src.application.models.systems import TypesPaymentsService, SettingsService, UiImagesService, StatisticsService, \
     EventMessageService, StickersService
 from src.application.models.users import WalletTransactionService, UserService, MoneyTransferService, \
-    NotificationSettingsService, BannedAccountService, ReplenishmentsService
+    NotificationSettingsService, BannedAccountService, ReplenishmentsService, SuppressedRecipientsService
 from src.application.models.users.permission_service import PermissionService
 from src.infrastructure.files.path_builder import PathBuilder
 from src.repository.database.categories import PurchasesRepository
@@ -98,6 +99,7 @@ class ProfileModule:
         wallet_transaction_service: WalletTransactionService,
         money_transfer_service: MoneyTransferService,
         notification_service: NotificationSettingsService,
+        suppressed_recipients_service: SuppressedRecipientsService,
         voucher_service: VoucherService,
         referral_income_service: ReferralIncomeService,
         referral_levels_service: ReferralLevelsService,
@@ -110,6 +112,7 @@ class ProfileModule:
         universal_moduls: UniversalModuls,
         account_service: AccountService,
         crypto_provider: CryptoProvider,
+        crypto_service: CryptoService,
         path_builder: PathBuilder,
         get_auth_codes_use_case: GetAuthCodesUseCase,
         validate_tg_account: ValidateTgAccount,
@@ -122,6 +125,7 @@ class ProfileModule:
         self.wallet_transaction_service = wallet_transaction_service
         self.money_transfer_service = money_transfer_service
         self.notification_service = notification_service
+        self.suppressed_recipients_service = suppressed_recipients_service
         self.voucher_service = voucher_service
         self.referral_income_service = referral_income_service
         self.referral_levels_service = referral_levels_service
@@ -134,6 +138,7 @@ class ProfileModule:
         self.universal_moduls = universal_moduls
         self.account_service = account_service
         self.crypto_provider = crypto_provider
+        self.crypto_service = crypto_service
         self.path_builder = path_builder
         self.get_auth_codes_use_case = get_auth_codes_use_case
         self.validate_tg_account = validate_tg_account
@@ -197,6 +202,7 @@ class AdminModule:
         admin_service: AdminsService,
         banned_account_service: BannedAccountService,
         crypto_provider: CryptoProvider,
+        crypto_service: CryptoService,
         publish_event_handler: PublishEventHandler,
         cache_warmup_service: CacheWarmupService,
         statistics_service: StatisticsService,
@@ -245,6 +251,7 @@ class AdminModule:
         self.admin_service = admin_service
         self.banned_account_service = banned_account_service
         self.crypto_provider = crypto_provider
+        self.crypto_service = crypto_service
         self.publish_event_handler = publish_event_handler
         self.cache_warmup_service = cache_warmup_service
         self.statistics_service = statistics_service
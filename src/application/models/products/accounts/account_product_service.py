@@ -111,6 +111,44 @@ class AccountProductService:
 
         return product_account
 
+    async def create_product_accounts(
+        self,
+        category_id: int,
+        account_storage_ids: List[int],
+        make_commit: bool = True,
+        filling_redis: bool = True,
+    ) -> List[ProductAccountSmall]:
+        """
+        Создаст товары одним INSERT. Кэш категории обновляется один раз на всю пачку,
+        карточки отдельных товаров заполнятся при первом чтении.
+        :exception CategoryNotFound: Категория не найдена.
+        :exception TheCategoryNotStorageAccount: Категория не является хранилищем аккаунтов.
+        """
+        category = await self.category_repo.get_by_id(category_id)
+        if not category:
+            raise CategoryNotFound(
+                f"Категория аккаунтов с id = {category_id} не найдена"
+            )
+        if not category.is_product_storage:
+            raise TheCategoryNotStorageAccount(
+                f"Категория аккаунтов с id = {category_id} не является хранилищем аккаунтов. "
+                f"Для добавления аккаунтов необходимо сделать хранилищем"
+            )
+
+        product_accounts = await self.product_repo.create_many([
+            CreateProductAccountDTO(category_id=category_id, account_storage_id=storage_id).model_dump()
+            for storage_id in account_storage_ids
+        ])
+
+        if make_commit:
+            await self.session_db.commit()
+
+        if filling_redis and product_accounts:
+            await self.accounts_cache_filler.fill_product_accounts_by_category_id(category_id)
+            await self.category_filler_service.fill_need_category(categories=[category])
+
+        return product_accounts
+
     async def delete_product_account(
         self,
         account_id: int,
@@ -10,7 +10,7 @@ from src.models.create_models.accounts import (
     CreateSoldAccountTranslationDTO,
     CreateSoldAccountWithTranslationDTO,
 )
-from src.models.read_models import SoldAccountFull, SoldAccountSmall
+from src.models.read_models import SoldAccountFull, SoldAccountSmall, PageCursor
 from src.repository.database.categories.accounts import (
     SoldAccountsRepository,
     SoldAccountsTranslationRepository,
@@ -76,9 +76,10 @@ class AccountSoldService:
         self,
         user_id: int,
         type_account_service: AccountServiceType,
-        page: int,
+        page: Optional[int],
         language: str,
         page_size: Optional[int] = None,
+        cursor: Optional[PageCursor] = None,
     ) -> List[SoldAccountSmall]:
         if page_size is None:
             page_size = self.conf.different.page_size
@@ -89,8 +90,8 @@ class AccountSoldService:
             page=page,
             page_size=page_size,
             active_only=True,
+            cursor=cursor,
         )
-        await self.accounts_cache_filler.fill_sold_accounts_by_owner_id(user_id)
         return [
             SoldAccountSmall.from_orm_with_translation(acc, language=language)
             for acc in accounts
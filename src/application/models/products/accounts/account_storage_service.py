@@ -1,4 +1,5 @@
 import uuid
+from typing import List
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -61,19 +62,7 @@ class AccountStorageService:
         :exception ValueError: Если type_account_service не найден.
         :exception ValueError: Если для не-telegram аккаунта не задан login_encrypted/password_encrypted.
         """
-        if not isinstance(data.type_account_service, AccountServiceType):
-            raise ValueError(f"type_account_service = {data.type_account_service} не найден")
-
-        if data.type_account_service != AccountServiceType.TELEGRAM:
-            if data.login_encrypted is None or data.password_encrypted is None:
-                raise ValueError("Необходимо указать login_encrypted и password_encrypted")
-
-        values = data.model_dump()
-        values["phone_number"] = phone_in_e164(values["phone_number"])
-
-        if data.type_account_service == AccountServiceType.TELEGRAM:
-            values.setdefault("storage_uuid", str(uuid.uuid4()))
-
+        values = self._prepare_values(data)
         storage = await self.storage_repo.create_storage(**values)
 
         if data.type_account_service == AccountServiceType.TELEGRAM:
@@ -84,6 +73,42 @@ class AccountStorageService:
 
         return storage
 
+    async def create_account_storages(
+        self,
+        data: List[CreateAccountStorageDTO],
+        make_commit: bool = True,
+    ) -> List[AccountStorageDTO]:
+        """
+        Создаст хранилища одним INSERT (и медиа для telegram аккаунтов вторым).
+        :return: Созданные хранилища в порядке `data`
+        :exception ValueError: см. create_account_storage.
+        """
+        storages = await self.storage_repo.create_many([self._prepare_values(item) for item in data])
+
+        await self.tg_media_repo.create_many([
+            {"account_storage_id": storage.account_storage_id}
+            for storage in storages
+            if storage.type_account_service == AccountServiceType.TELEGRAM
+        ])
+
+        if make_commit:
+            await self.session_db.commit()
+
+        return storages
+
+    def _prepare_values(self, data: CreateAccountStorageDTO) -> dict:
+        if not isinstance(data.type_account_service, AccountServiceType):
+            raise ValueError(f"type_account_service = {data.type_account_service} не найден")
+
+        if data.type_account_service != AccountServiceType.TELEGRAM:
+            if data.login_encrypted is None or data.password_encrypted is None:
+                raise ValueError("Необходимо указать login_encrypted и password_encrypted")
+
+        values = data.model_dump()
+        values["phone_number"] = phone_in_e164(values["phone_number"])
+        values["storage_uuid"] = values["storage_uuid"] or str(uuid.uuid4())
+        return values
+
     async def update_account_storage(
         self,
         account_storage_id: int,
@@ -1,5 +1,7 @@
 from typing import Iterable
 
+from orjson import orjson
+
 from src.config import Config
 from src.database.models.categories import SoldUniversal
 from src.models.read_models import (
@@ -59,6 +61,54 @@ class UniversalCacheFillerService:
 
         await self.product_single_cache_repo.set(product)
 
+    async def fill_product_universal_batch(
+        self,
+        category_ids: Iterable[int],
+        product_universal_ids: Iterable[int],
+    ) -> None:
+        """
+        Обновит кэш товаров сразу для нескольких категорий и товаров:
+        по одному запросу к БД на каждый вид данных и один pipeline в Redis.
+        """
+        category_ids = list(set(category_ids))
+        product_universal_ids = list(set(product_universal_ids))
+
+        by_category: dict[int, list[ProductUniversalSmall]] = {category_id: [] for category_id in category_ids}
+        for product in await self.product_repo.get_by_categories_for_sale(category_ids):
+            by_category[product.category_id].append(ProductUniversalSmall(**product.model_dump()))
+
+        products = await self.product_repo.get_full_by_ids(
+            product_universal_ids,
+            language=self.conf.app.default_lang,
+        )
+
+        items: list[tuple[str, bytes, int]] = []
+        delete_keys: list[str] = []
+
+        for category_id, category_products in by_category.items():
+            key = self.product_cache_repo._key_by_category(category_id)
+            if category_products:
+                items.append((key, orjson.dumps([p.model_dump() for p in category_products]), 0))
+            else:
+                delete_keys.append(key)
+
+        found_ids = set()
+        for product in products:
+            found_ids.add(product.product_universal_id)
+            items.append((
+                self.product_single_cache_repo._key(product.product_universal_id),
+                orjson.dumps(product.model_dump()),
+                0,
+            ))
+        delete_keys.extend(
+            self.product_single_cache_repo._key(product_id)
+            for product_id in product_universal_ids
+            if product_id not in found_ids
+        )
+
+        if items or delete_keys:
+            await self.product_cache_repo.bulk_set(items, delete_keys=delete_keys)
+
     async def fill_sold_universal_by_owner_id(self, owner_id: int) -> None:
         sold_items = await self.sold_repo.get_by_owner_with_relations(owner_id)
         if not sold_items:
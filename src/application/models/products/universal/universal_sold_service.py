@@ -5,7 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.config import Config
 from src.exceptions.domain import UniversalProductNotFound, UniversalStorageNotFound, UserNotFound
 from src.models.create_models.universal import CreateSoldUniversalDTO
-from src.models.read_models import SoldUniversalSmall, SoldUniversalFull, SoldUniversalDTO
+from src.models.read_models import SoldUniversalSmall, SoldUniversalFull, SoldUniversalDTO, PageCursor
 from src.repository.database.categories.universal import (
     SoldUniversalRepository,
     UniversalStorageRepository,
@@ -60,9 +60,10 @@ class UniversalSoldService:
     async def get_sold_universal_by_page(
         self,
         user_id: int,
-        page: int,
+        page: Optional[int],
         language: str,
         page_size: Optional[int] = None,
+        cursor: Optional[PageCursor] = None,
     ) -> List[SoldUniversalSmall]:
         if page_size is None:
             page_size = self.conf.different.page_size
@@ -72,8 +73,8 @@ class UniversalSoldService:
             page=page,
             page_size=page_size,
             active_only=True,
+            cursor=cursor,
         )
-        await self.cache_filler.fill_sold_universal_by_owner_id(user_id)
         return [SoldUniversalSmall.from_orm_model(item, language) for item in sold_items]
 
     async def get_sold_universal_by_universal_id(
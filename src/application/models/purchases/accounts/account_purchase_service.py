@@ -1,8 +1,6 @@
 ﻿import asyncio
-import shutil
 from collections import deque
 from logging import Logger
-from pathlib import Path
 from typing import List, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -18,7 +16,7 @@ from src.models.read_models import StartPurchaseAccount, AccountStorageDTO
 from src.models.read_models.events.purchase import AccountsData, NewPurchaseAccount
 from src.repository.redis import UsersCacheRepository
 from src.application.products.accounts.account_service import AccountService
-from src.infrastructure.files.file_system import move_file, rename_file
+from src.infrastructure.files.file_transaction import FileTransaction
 from src.application.models.categories.categories_cache_filler_service import CategoriesCacheFillerService
 from src.application.models.categories.category_service import CategoryService
 from src.application.models.products.accounts.account_deleted_service import AccountDeletedService
@@ -331,45 +329,42 @@ class AccountPurchaseService:
         :exception Exception: При ошибках переносит обработку в cancel_purchase_request.
         :summary: Перемещает файлы в final, удаляет ProductAccounts, создаёт SoldAccounts/Purchases и логирует результат.
         """
-        mapping: List[Tuple[str, str, str]] = []
+        files = FileTransaction(self.logger, self.conf.different.file_io_workers)
         sold_account_ids: List[int] = []
         purchase_ids: List[int] = []
         account_movement: List[AccountsData] = []
 
         try:
             for account in data.product_accounts:
-                orig = self.path_build.build_path_account(
-                    status=StorageStatus.FOR_SALE,
-                    type_account_service=data.type_service_account,
-                    uuid=account.account_storage.storage_uuid,
-                )
-                final = self.path_build.build_path_account(
-                    status=StorageStatus.BOUGHT,
-                    type_account_service=data.type_service_account,
-                    uuid=account.account_storage.storage_uuid,
+                files.add(
+                    orig=self.path_build.build_path_account(
+                        status=StorageStatus.FOR_SALE,
+                        type_account_service=data.type_service_account,
+                        uuid=account.account_storage.storage_uuid,
+                    ),
+                    final=self.path_build.build_path_account(
+                        status=StorageStatus.BOUGHT,
+                        type_account_service=data.type_service_account,
+                        uuid=account.account_storage.storage_uuid,
+                    ),
                 )
-                temp = final + ".part"
 
-                moved = await move_file(orig, temp)
-                if not moved:
-                    text = f"#Внимание \n\nАккаунт не найден/не удалось переместить: {orig}"
-                    self.logger.exception(text)
-                    await self.publish_event_handler.send_log(text=text)
+            if not await files.stage():
+                text = "#Внимание \n\nАккаунт не найден/не удалось переместить файлы покупки"
+                self.logger.error(text)
+                await self.publish_event_handler.send_log(text=text)
 
-                    await self.cancel_purchase_request(
-                        user_id=user_id,
-                        category_id=data.category_id,
-                        mapping=mapping,
-                        sold_account_ids=sold_account_ids,
-                        purchase_ids=purchase_ids,
-                        total_amount=data.total_amount,
-                        purchase_request_id=data.purchase_request_id,
-                        product_accounts=data.product_accounts,
-                    )
-                    return False
-
-                shutil.rmtree(str(Path(orig).parent))
-                mapping.append((orig, temp, final))
+                await self.cancel_purchase_request(
+                    user_id=user_id,
+                    category_id=data.category_id,
+                    mapping=files.mapping,
+                    sold_account_ids=sold_account_ids,
+                    purchase_ids=purchase_ids,
+                    total_amount=data.total_amount,
+                    purchase_request_id=data.purchase_request_id,
+                    product_accounts=data.product_accounts,
+                )
+                return False
 
             await self._reset_session_transaction()
             async with self.session_db.begin():
@@ -425,19 +420,11 @@ class AccountPurchaseService:
                     "used",
                 )
 
-            rename_fail = False
-            for orig, temp, final in mapping:
-                ok = await rename_file(temp, final)
-                if not ok:
-                    self.logger.exception("Failed to rename temp %s -> %s", temp, final)
-                    rename_fail = True
-                    break
-
-            if rename_fail:
+            if not await files.commit():
                 await self.cancel_purchase_request(
                     user_id=user_id,
                     category_id=data.category_id,
-                    mapping=mapping,
+                    mapping=files.mapping,
                     sold_account_ids=sold_account_ids,
                     purchase_ids=purchase_ids,
                     total_amount=data.total_amount,
@@ -486,7 +473,7 @@ class AccountPurchaseService:
             await self.cancel_purchase_request(
                 user_id=user_id,
                 category_id=data.category_id,
-                mapping=mapping,
+                mapping=files.mapping,
                 sold_account_ids=sold_account_ids,
                 purchase_ids=purchase_ids,
                 total_amount=data.total_amount,
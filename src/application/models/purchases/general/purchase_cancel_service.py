@@ -1,10 +1,8 @@
-﻿import asyncio
-import os
-import shutil
-from logging import Logger
+﻿from logging import Logger
 from typing import List, Tuple
 
 from src.application.models.purchases.general.purchase_request_service import PurchaseRequestService
+from src.infrastructure.files.file_transaction import restore_files
 
 
 class PurchaseCancelService:
@@ -31,18 +29,4 @@ class PurchaseCancelService:
         """
         :param mapping: List(orig_path, temp_path, final_path)
         """
-        for orig, temp, final in mapping:
-            for src in (temp, final):
-                if src and os.path.exists(src):
-                    try:
-                        os.makedirs(os.path.dirname(orig), exist_ok=True)
-                        await asyncio.to_thread(shutil.move, src, orig)
-                        break
-                    except Exception:
-                        self.logger.exception("Failed to restore file for %s from %s", orig, src)
-
-            try:
-                if final and os.path.exists(final):
-                    await asyncio.to_thread(shutil.move, final, orig)
-            except Exception:
-                self.logger.exception("Failed to move final back to orig for %s", orig)
+        await restore_files(mapping, self.logger)
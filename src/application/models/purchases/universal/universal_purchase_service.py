@@ -8,6 +8,7 @@ from typing import List, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.application.cache_warmup.cache_refresh_scheduler import CacheRefreshScheduler
 from src.application.crypto.crypto_context import CryptoProvider
 from src.application.events.publish_event_handler import PublishEventHandler
 from src.application.products.universals.universal_products import UniversalProduct
@@ -22,8 +23,8 @@ from src.models.read_models import ProductUniversalFull, UniversalStorageTransla
 from src.models.read_models.categories.purshanse_schem import StartPurchaseUniversalOne, StartPurchaseUniversal
 from src.models.read_models.events.purchase import UniversalProductData, NewPurchaseUniversal
 from src.repository.redis import UsersCacheRepository
-from src.infrastructure.files.file_system import move_file, copy_file, rename_file
-from src.application.models.categories.categories_cache_filler_service import CategoriesCacheFillerService
+from src.infrastructure.files.file_system import copy_file
+from src.infrastructure.files.file_transaction import FileTransaction
 from src.application.models.categories.category_service import CategoryService
 from src.application.models.products.universal.universal_cache_filler_service import UniversalCacheFillerService
 from src.application.models.products.universal.universal_deleted_service import UniversalDeletedService
@@ -61,7 +62,7 @@ class UniversalPurchaseService:
         deleted_service: UniversalDeletedService,
         category_service: CategoryService,
         cache_filler: UniversalCacheFillerService,
-        categories_cache_filler: CategoriesCacheFillerService,
+        cache_refresh_scheduler: CacheRefreshScheduler,
         user_cache_repo: UsersCacheRepository,
         publish_event_handler: PublishEventHandler,
         path_builder: PathBuilder,
@@ -84,7 +85,7 @@ class UniversalPurchaseService:
         self.deleted_service = deleted_service
         self.category_service = category_service
         self.cache_filler = cache_filler
-        self.categories_cache_filler = categories_cache_filler
+        self.cache_refresh_scheduler = cache_refresh_scheduler
         self.user_cache_repo = user_cache_repo
         self.publish_event_handler = publish_event_handler
         self.path_builder = path_builder
@@ -252,10 +253,10 @@ class UniversalPurchaseService:
         ]
 
         await self.user_cache_repo.set(user, int(self.conf.redis_time_storage.user.total_seconds()))
-        await self.cache_filler.fill_product_universal_by_category_id(category_id)
-        for prod_id in [product.product_universal_id for product in reserved_products]:
-            await self.cache_filler.fill_product_universal_by_product_id(prod_id)
-        await self.categories_cache_filler.fill_need_category(category_id)
+        await self.cache_refresh_scheduler.mark(
+            category_ids=[category_id],
+            product_universal_ids=[product.product_universal_id for product in reserved_products],
+        )
 
         return StartPurchaseUniversal(
             purchase_request_id=new_purchase_request.purchase_request_id,
@@ -312,29 +313,23 @@ class UniversalPurchaseService:
     ) -> List[ProductUniversalFull] | bool:
         """
         Проверяет каждый продукт, удаляет невалидные и подставляет кандидатов через PurchaseRequestUniversal.
+        Проверка идёт по индексу целостности, дешифруются только товары с устаревшей записью в индексе.
         """
         if not reserved_products:
             return False
 
-        crypto = self.crypto_provider.get()
-        sem = asyncio.Semaphore(SEMAPHORE_LIMIT_UNIVERSAL)
-
-        async def validate_slot(product: ProductUniversalFull):
-            async with sem:
-                return product, await self.validations_universal_products.check_valid_universal_product(
-                    product,
-                    StorageStatus.FOR_SALE,
-                )
-
-        initial_checks = await asyncio.gather(*[validate_slot(p) for p in reserved_products], return_exceptions=True)
+        try:
+            initial_checks = await self.validations_universal_products.check_valid_universal_products(
+                reserved_products,
+                StorageStatus.FOR_SALE,
+            )
+        except Exception as e:
+            self.logger.exception("Validation task exception: %s", e)
+            return False
 
         invalid_products: list[ProductUniversalFull] = []
         valid_products: list[ProductUniversalFull] = []
-        for res in initial_checks:
-            if isinstance(res, Exception):
-                self.logger.exception("Validation task exception: %s", res)
-                return False
-            prod, ok = res
+        for prod, ok in zip(reserved_products, initial_checks):
             if ok:
                 valid_products.append(prod)
             else:
@@ -382,19 +377,7 @@ class UniversalPurchaseService:
                 for c in candidates
             ]
 
-            async def validate_candidate(cand: ProductUniversalFull):
-                async with sem:
-                    try:
-                        ok = await self.validations_universal_products.check_valid_universal_product(
-                            cand,
-                            StorageStatus.FOR_SALE,
-                        )
-                        return cand, ok
-                    except Exception as e:
-                        self.logger.exception("Candidate validation exception: %s", e)
-                        return cand, False
-
-            checks = await asyncio.gather(*[validate_candidate(c) for c in candidates_full], return_exceptions=False)
+            checks = list(zip(candidates_full, await self._check_candidates(candidates_full)))
 
             valid_candidates = [c for c, ok in checks if ok]
             invalid_candidates = [c for c, ok in checks if not ok]
@@ -447,6 +430,35 @@ class UniversalPurchaseService:
 
         return valid_products
 
+    async def _check_candidates(self, candidates: List[ProductUniversalFull]) -> List[bool]:
+        """
+        Проверит кандидатов на замену по индексу целостности.
+        Если индекс недоступен, проверит каждого кандидата полным дешифрованием.
+        """
+        try:
+            return await self.validations_universal_products.check_valid_universal_products(
+                candidates,
+                StorageStatus.FOR_SALE,
+            )
+        except Exception as e:
+            self.logger.exception("Candidate batch validation exception: %s", e)
+            await self._reset_session_transaction()
+
+        sem = asyncio.Semaphore(SEMAPHORE_LIMIT_UNIVERSAL)
+
+        async def validate_candidate(cand: ProductUniversalFull) -> bool:
+            async with sem:
+                try:
+                    return await self.validations_universal_products.check_valid_universal_product(
+                        cand,
+                        StorageStatus.FOR_SALE,
+                    )
+                except Exception as e:
+                    self.logger.exception("Candidate validation exception: %s", e)
+                    return False
+
+        return list(await asyncio.gather(*[validate_candidate(c) for c in candidates]))
+
     async def finalize_purchase_different(self, user_id: int, data: StartPurchaseUniversal) -> bool:
         """
         :summary: Перемещает файлы, сохраняет SoldUniversal/Purchases и фиксирует статусы.
@@ -456,7 +468,7 @@ class UniversalPurchaseService:
         Переносит файлы в final, создаёт SoldUniversal + Purchases и обновляет _redis + статусы.
         :return: True при успехе, False при откате.
         """
-        mapping: List[Tuple[str, str, str]] = []
+        files = FileTransaction(self.logger, self.conf.different.file_io_workers)
         sold_product_ids: List[int] = []
         purchase_ids: List[int] = []
         product_movement: List[UniversalProductData] = []
@@ -466,67 +478,68 @@ class UniversalPurchaseService:
                 if not product.universal_storage.original_filename:
                     continue
 
-                orig = self.path_builder.build_path_universal_storage(
-                    status=StorageStatus.FOR_SALE,
-                    uuid=product.universal_storage.storage_uuid,
-                )
-                final = self.path_builder.build_path_universal_storage(
-                    status=StorageStatus.BOUGHT,
-                    uuid=product.universal_storage.storage_uuid,
+                files.add(
+                    orig=self.path_builder.build_path_universal_storage(
+                        status=StorageStatus.FOR_SALE,
+                        uuid=product.universal_storage.storage_uuid,
+                    ),
+                    final=self.path_builder.build_path_universal_storage(
+                        status=StorageStatus.BOUGHT,
+                        uuid=product.universal_storage.storage_uuid,
+                    ),
                 )
-                temp = final + ".part"
 
-                moved = await move_file(orig, temp)
-                if not moved:
-                    text = f"#Внимание \n\nПродукт не найден/не удалось переместить: {orig}"
-                    self.logger.exception(text)
-                    await self.publish_event_handler.send_log(text)
+            if not await files.stage():
+                text = "#Внимание \n\nПродукт не найден/не удалось переместить файлы покупки"
+                self.logger.error(text)
+                await self.publish_event_handler.send_log(text)
 
-                    await self.cancel_purchase_different(
-                        user_id=user_id,
-                        category_id=data.category_id,
-                        mapping=mapping,
-                        sold_universal_ids=sold_product_ids,
-                        purchase_ids=purchase_ids,
-                        total_amount=data.total_amount,
-                        purchase_request_id=data.purchase_request_id,
-                        product_universal=data.full_reserved_products,
-                    )
-                    return False
-
-                shutil.rmtree(str(Path(orig).parent))
-                mapping.append((orig, temp, final))
+                await self.cancel_purchase_different(
+                    user_id=user_id,
+                    category_id=data.category_id,
+                    mapping=files.mapping,
+                    sold_universal_ids=sold_product_ids,
+                    purchase_ids=purchase_ids,
+                    total_amount=data.total_amount,
+                    purchase_request_id=data.purchase_request_id,
+                    product_universal=data.full_reserved_products,
+                )
+                return False
 
             await self._reset_session_transaction()
+            # количество запросов не зависит от количества товаров в заказе
+            storage_ids = [product.universal_storage_id for product in data.full_reserved_products]
             async with self.session_db.begin():
-                for product in data.full_reserved_products:
-                    await self.product_repo.delete(product.product_universal_id)
-
-                    new_sold = await self.sold_repo.create_sold(
-                        owner_id=user_id,
-                        universal_storage_id=product.universal_storage_id,
-                    )
-                    sold_product_ids.append(new_sold.sold_universal_id)
-
-                    new_purchase = await self.purchases_repo.create_purchase(
-                        user_id=user_id,
-                        universal_storage_id=product.universal_storage_id,
-                        product_type=ProductType.UNIVERSAL,
-                        original_price=data.original_price_one,
-                        purchase_price=data.purchase_price_one,
-                        cost_price=data.cost_price_one,
-                        net_profit=data.purchase_price_one - data.cost_price_one,
-                    )
-                    purchase_ids.append(new_purchase.purchase_id)
-
-                    await self.storage_repo.update(
-                        product.universal_storage_id,
-                        status=StorageStatus.BOUGHT,
-                    )
+                await self.product_repo.delete_by_ids(
+                    [product.product_universal_id for product in data.full_reserved_products]
+                )
 
+                new_sold_list = await self.sold_repo.create_many(
+                    owner_id=user_id,
+                    universal_storage_ids=storage_ids,
+                )
+                sold_product_ids.extend(sold.sold_universal_id for sold in new_sold_list)
+
+                new_purchases = await self.purchases_repo.create_many([
+                    {
+                        "user_id": user_id,
+                        "universal_storage_id": storage_id,
+                        "product_type": ProductType.UNIVERSAL,
+                        "original_price": data.original_price_one,
+                        "purchase_price": data.purchase_price_one,
+                        "cost_price": data.cost_price_one,
+                        "net_profit": data.purchase_price_one - data.cost_price_one,
+                    }
+                    for storage_id in storage_ids
+                ])
+                purchase_ids.extend(purchase.purchase_id for purchase in new_purchases)
+
+                await self.storage_repo.update_status_by_ids(storage_ids, status=StorageStatus.BOUGHT)
+
+                for new_sold, new_purchase in zip(new_sold_list, new_purchases):
                     product_movement.append(
                         UniversalProductData(
-                            universal_storage_id=product.universal_storage_id,
+                            universal_storage_id=new_sold.universal_storage_id,
                             sold_universal_id=new_sold.sold_universal_id,
                             purchase_id=new_purchase.purchase_id,
                             cost_price=new_purchase.cost_price,
@@ -544,19 +557,11 @@ class UniversalPurchaseService:
                     "used",
                 )
 
-            rename_fail = False
-            for orig, temp, final in mapping:
-                ok = await rename_file(temp, final)
-                if not ok:
-                    self.logger.exception("Failed to rename temp %s -> %s", temp, final)
-                    rename_fail = True
-                    break
-
-            if rename_fail:
+            if not await files.commit():
                 await self.cancel_purchase_different(
                     user_id=user_id,
                     category_id=data.category_id,
-                    mapping=mapping,
+                    mapping=files.mapping,
                     sold_universal_ids=sold_product_ids,
                     purchase_ids=purchase_ids,
                     total_amount=data.total_amount,
@@ -565,14 +570,14 @@ class UniversalPurchaseService:
                 )
                 return False
 
-            await self.cache_filler.fill_product_universal_by_category_id(data.category_id)
             await self.cache_filler.fill_sold_universal_by_owner_id(user_id)
-            for product in data.full_reserved_products:
-                await self.cache_filler.fill_product_universal_by_product_id(product.product_universal_id)
             for sold_id in sold_product_ids:
                 await self.cache_filler.fill_sold_universal_by_universal_id(sold_id)
 
-            await self.categories_cache_filler.fill_need_category(data.category_id)
+            await self.cache_refresh_scheduler.mark(
+                category_ids=[data.category_id],
+                product_universal_ids=[product.product_universal_id for product in data.full_reserved_products],
+            )
 
             if data.promo_code_id:
                 await self.publish_event_handler.promo_code_activated(
@@ -602,7 +607,7 @@ class UniversalPurchaseService:
             await self.cancel_purchase_different(
                 user_id=user_id,
                 category_id=data.category_id,
-                mapping=mapping,
+                mapping=files.mapping,
                 sold_universal_ids=sold_product_ids,
                 purchase_ids=purchase_ids,
                 total_amount=data.total_amount,
@@ -687,9 +692,10 @@ class UniversalPurchaseService:
             await self.cache_filler.fill_sold_universal_by_owner_id(user_id)
             for sold_id in sold_ids:
                 await self.cache_filler.fill_sold_universal_by_universal_id(sold_id)
-            await self.cache_filler.fill_product_universal_by_category_id(data.category_id)
-            await self.cache_filler.fill_product_universal_by_product_id(data.full_product.product_universal_id)
-            await self.categories_cache_filler.fill_need_category(data.category_id)
+            await self.cache_refresh_scheduler.mark(
+                category_ids=[data.category_id],
+                product_universal_ids=[data.full_product.product_universal_id],
+            )
 
             if data.promo_code_id:
                 await self.publish_event_handler.promo_code_activated(
@@ -779,14 +785,14 @@ class UniversalPurchaseService:
         if user:
             await self.user_cache_repo.set(user, int(self.conf.redis_time_storage.user.total_seconds()))
 
-        await self.cache_filler.fill_product_universal_by_category_id(category_id)
         await self.cache_filler.fill_sold_universal_by_owner_id(user_id)
-        for prod in product_universal:
-            await self.cache_filler.fill_product_universal_by_product_id(prod.product_universal_id)
         for sold_id in sold_universal_ids:
             await self.cache_filler.fill_sold_universal_by_universal_id(sold_id)
 
-        await self.categories_cache_filler.fill_need_category(category_id)
+        await self.cache_refresh_scheduler.mark(
+            category_ids=[category_id],
+            product_universal_ids=[prod.product_universal_id for prod in product_universal],
+        )
 
     async def cancel_purchase_one(
         self,
@@ -836,9 +842,10 @@ class UniversalPurchaseService:
         await self.cache_filler.fill_sold_universal_by_owner_id(user_id)
         for sold_id in sold_universal_ids:
             await self.cache_filler.fill_sold_universal_by_universal_id(sold_id)
-        await self.cache_filler.fill_product_universal_by_category_id(category_id)
-        await self.cache_filler.fill_product_universal_by_product_id(product_universal.product_universal_id)
-        await self.categories_cache_filler.fill_need_category(category_id)
+        await self.cache_refresh_scheduler.mark(
+            category_ids=[category_id],
+            product_universal_ids=[product_universal.product_universal_id],
+        )
 
     async def _delete_universal(self, universal_product: List[ProductUniversalFull]) -> None:
         """
@@ -2,28 +2,35 @@ from typing import Optional, Sequence
 
 from src.models.create_models.referrals import CreateReferralIncomeDTO
 from src.models.read_models.other import IncomeFromReferralsDTO
+from src.models.read_models.pagination import PageCursor
 from src.repository.database.referrals import ReferralIncomeRepository
 
 
 class ReferralIncomeService:
 
-    def __init__(self, income_repo: ReferralIncomeRepository):
+    def __init__(self, income_repo: ReferralIncomeRepository, history_repo: Optional[ReferralIncomeRepository] = None):
+        """
+        :param history_repo: репозиторий на сессии реплики для страниц истории, по умолчанию `income_repo`
+        """
         self.income_repo = income_repo
+        self.history_repo = history_repo or income_repo
 
     async def get_referral_income_page(
         self,
         user_id: int,
         page: Optional[int] = None,
         page_size: Optional[int] = None,
+        cursor: Optional[PageCursor] = None,
     ) -> Sequence[IncomeFromReferralsDTO]:
-        return await self.income_repo.get_page_by_owner(
+        return await self.history_repo.get_page_by_owner(
             user_id=user_id,
             page=page,
             page_size=page_size,
+            cursor=cursor,
         )
 
     async def get_count_referral_income(self, user_id: int) -> int:
-        return await self.income_repo.count_by_owner(user_id)
+        return await self.history_repo.count_by_owner(user_id)
 
     async def get_income_from_referral(
         self,
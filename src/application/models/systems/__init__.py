@@ -2,6 +2,7 @@ from src.application.models.systems.backup_logs_service import BackupLogsService
 from src.application.models.systems.event_message_service import EventMessageService
 from src.application.models.systems.files_service import FilesService
 from src.application.models.systems.settings_service import SettingsService
+from src.application.models.systems.statistics_rollup_service import StatisticsRollupService
 from src.application.models.systems.statistics_service import StatisticsService
 from src.application.models.systems.stickers_service import StickersService
 from src.application.models.systems.types_payments_service import TypesPaymentsService
@@ -12,6 +13,7 @@ __all__ = [
     "EventMessageService",
     "FilesService",
     "SettingsService",
+    "StatisticsRollupService",
     "StatisticsService",
     "StickersService",
     "TypesPaymentsService",
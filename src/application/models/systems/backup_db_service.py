@@ -1,9 +1,11 @@
 import asyncio
+import base64
+import hashlib
 import os
-import tempfile
+import time
 from datetime import datetime, UTC
 from logging import Logger
-from pathlib import Path
+from typing import AsyncIterator, Callable
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
@@ -12,10 +14,39 @@ from src.application.crypto.crypto_context import CryptoProvider
 from src.application.models.systems import BackupLogsService
 from src.application.utils.date_time_formatter import DateTimeFormatter
 from src.config import Config
-from src.domain.crypto.encrypt import encrypt_file, wrap_dek
-from src.domain.crypto.utils import extract_nonce_b64, calc_sha256_b64
-from src.infrastructure.crypto.secret_storage.secrets_storage import SecretsStorage
+from src.database.models.system import BackupStatus
+from src.domain.crypto.encrypt import wrap_dek
+from src.domain.crypto.stream import EncryptingWriter
+from src.infrastructure.crypto.secret_storage.secrets_storage import AsyncSecretsStorage
 from src.models.create_models.system import CreateBackupLogDTO
+from src.models.update_models import UpdateBackupLogDTO
+
+
+BACKUP_READ_SIZE = 1024 * 1024 # байт за одно чтение stdout pg_dump
+
+
+class _EncryptedParts:
+    """Принимает зашифрованные части от EncryptingWriter до отправки и считает sha256 и размер файла"""
+
+    def __init__(self):
+        self.parts: list[bytes] = []
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        if data:
+            self.sha256.update(data)
+            self.size += len(data)
+            self.parts.append(bytes(data))
+        return len(data)
+
+    def take(self) -> bytes:
+        data = b"".join(self.parts)
+        self.parts.clear()
+        return data
+
+    def sha256_b64(self) -> str:
+        return base64.b64encode(self.sha256.digest()).decode("ascii")
 
 
 class BackupDBService:
@@ -25,7 +56,7 @@ class BackupDBService:
         conf: Config,
         logger: Logger,
         crypto_provider: CryptoProvider,
-        secret_storage: SecretsStorage,
+        secret_storage: AsyncSecretsStorage,
         backup_logs_service: BackupLogsService,
         dt_formatter: DateTimeFormatter,
     ):
@@ -58,123 +89,220 @@ class BackupDBService:
 
 
 
-    async def dump_postgres_db(
+    async def start_pg_dump(
         self,
         db_name: str,
         db_user: str,
         db_password: str,
         db_host: str,
-        output_file: Path,
-    ):
+    ) -> asyncio.subprocess.Process:
+        """Запустит pg_dump с выводом дампа в stdout"""
         env = os.environ.copy()
         env["PGPASSWORD"] = db_password
 
-        process = await asyncio.create_subprocess_exec(
+        return await asyncio.create_subprocess_exec(
             "pg_dump",
             "-h", db_host,
             "-U", db_user,
             "-F", "c",          # custom format (лучше для восстановления)
-            "-f", str(output_file),
             db_name,
             env=env,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
 
-        stdout, stderr = await process.communicate()
-
-        if process.returncode != 0:
-            raise RuntimeError(
-                f"pg_dump failed: {stderr.decode()}"
-            )
-
 
     async def backup_database(self,):
+        """
+        Бэкап без временных файлов: вывод pg_dump шифруется частями (src/domain/crypto/stream.py),
+        хешируется и сразу загружается в хранилище через общую aiohttp-сессию приложения.
+        Ход бэкапа пишется в BackupLogStats.
+        """
         crypto_context = self.crypto_provider.get()
         timestamp = self.dt_formatter.format(datetime.now(UTC))
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-
-            enc_name = f"db_{timestamp}.enc"
-            enc_name_secret = f"dump_db:{timestamp}"
-
-            dump_file = tmpdir / f"db_{timestamp}.dump"
-            encrypted_file = tmpdir / enc_name
+        enc_name = f"db_{timestamp}.enc"
+        enc_name_secret = f"dump_db:{timestamp}"
 
-            dek = os.urandom(32)
+        dek = os.urandom(32)
 
-            encrypted_dek_b64, dek_nonce_b64, dek_sha256_b64 = wrap_dek(
-                dek=dek,
-                kek=crypto_context.kek
-            )
-
-            await self.dump_postgres_db(
-                db_name=self.conf.env.db_name,
-                db_user=self.conf.env.db_user,
-                db_password=self.conf.secrets.db_password,
-                db_host=self.conf.env.db_host,
-                output_file=dump_file,
-            )
-
-            encrypt_file(
-                file_path=str(dump_file),
-                encrypted_path=str(encrypted_file),
-                dek=dek,
-            )
-
-            # SHA256 + nonce для файла
-            nonce_b64 = extract_nonce_b64(encrypted_file)
-            sha256_b64 = calc_sha256_b64(encrypted_file)
+        encrypted_dek_b64, dek_nonce_b64, dek_sha256_b64 = wrap_dek(
+            dek=dek,
+            kek=crypto_context.kek
+        )
 
-            size_bytes = encrypted_file.stat().st_size
+        backup_log = await self.backup_logs_service.add_backup_log(
+            data=CreateBackupLogDTO(
+                storage_file_name=enc_name,
+                storage_encrypted_dek_name=enc_name_secret,
+                encrypted_dek_b64=encrypted_dek_b64,
+                dek_nonce_b64=dek_nonce_b64,
+                size_bytes=0,
+                status=BackupStatus.IN_PROGRESS,
+            ),
+            make_commit=True
+        )
+        started = time.monotonic()
 
+        try:
             # Сохраняем DEK в storage
-            self.secret_storage.create_secret(
+            await self.secret_storage.create_secret(
                 name=enc_name_secret,
                 encrypted_data=encrypted_dek_b64,
                 nonce=dek_nonce_b64,
                 sha256=dek_sha256_b64,
             )
 
-            self.secret_storage.upload_secret_file(
-                name=enc_name,
-                file_path=encrypted_file,
-                nonce_b64=nonce_b64,
-                sha256_b64=sha256_b64,
-            )
-
-            await self.backup_logs_service.add_backup_log(
-                data=CreateBackupLogDTO(
-                    storage_file_name=enc_name,
-                    storage_encrypted_dek_name=enc_name_secret,
-                    encrypted_dek_b64=encrypted_dek_b64,
-                    dek_nonce_b64=dek_nonce_b64,
-                    size_bytes=size_bytes,
+            size_bytes, dump_size_bytes = await self._stream_backup(enc_name, dek, backup_log.backup_log_id)
+        except Exception as e:
+            self.logger.exception("Backup %s failed", enc_name)
+            await self.backup_logs_service.update_backup_log(
+                backup_log.backup_log_id,
+                UpdateBackupLogDTO(
+                    status=BackupStatus.FAILED,
+                    duration_seconds=time.monotonic() - started,
+                    finished_at=datetime.now(UTC),
+                    error=str(e)[:2000],
                 ),
                 make_commit=True
             )
+            await self._purge_quietly(enc_name, enc_name_secret)
+            return
 
+        duration = time.monotonic() - started
+        await self.backup_logs_service.update_backup_log(
+            backup_log.backup_log_id,
+            UpdateBackupLogDTO(
+                status=BackupStatus.COMPLETED,
+                size_bytes=size_bytes,
+                dump_size_bytes=dump_size_bytes,
+                duration_seconds=duration,
+                throughput_bytes_per_second=int(dump_size_bytes / duration) if duration > 0 else None,
+                finished_at=datetime.now(UTC),
+            ),
+            make_commit=True
+        )
+        self.logger.info(
+            "Backup %s completed: %s bytes dump, %s bytes encrypted, %.1f s",
+            enc_name, dump_size_bytes, size_bytes, duration
+        )
+
+
+    async def _stream_backup(self, enc_name: str, dek: bytes, backup_log_id: int) -> tuple[int, int]:
+        """
+        pg_dump stdout -> шифрование -> тело запроса загрузки. Следующая порция читается из pg_dump только после
+        отправки предыдущей: если хранилище принимает медленно, pg_dump ждёт на заполненном канале, память не растёт.
+        AES-GCM шифрует мегабайт за доли миллисекунды, поэтому шифрование идёт прямо в цикле событий.
+        :return: (размер зашифрованного файла, размер дампа)
+        """
+        process = await self.start_pg_dump(
+            db_name=self.conf.env.db_name,
+            db_user=self.conf.env.db_user,
+            db_password=self.conf.secrets.db_password,
+            db_host=self.conf.env.db_host,
+        )
+        stderr_task = asyncio.create_task(process.stderr.read())
+
+        encrypted = _EncryptedParts()
+        writer = EncryptingWriter(encrypted, dek)
+        dump_size_bytes = 0
+        dump_error: Exception | None = None
+
+        async def chunks() -> AsyncIterator[bytes]:
+            nonlocal dump_size_bytes, dump_error
+            yield encrypted.take() # заголовок
+            while data := await process.stdout.read(BACKUP_READ_SIZE):
+                writer.write(data)
+                dump_size_bytes += len(data)
+                yield encrypted.take()
+
+            if await process.wait() != 0:
+                stderr = await stderr_task
+                dump_error = RuntimeError(f"pg_dump failed: {stderr.decode(errors='replace')}")
+                raise dump_error
+
+            writer.close()
+            yield encrypted.take()
+
+        stop_progress = asyncio.Event()
+        progress = asyncio.create_task(self._report_progress(
+            backup_log_id, lambda: (encrypted.size, dump_size_bytes), stop_progress
+        ))
+        try:
+            await self.secret_storage.upload_secret_file_stream(
+                name=enc_name,
+                chunks=chunks(),
+                nonce_b64=base64.b64encode(writer.prefix).decode("ascii"),
+                sha256_b64=encrypted.sha256_b64,
+            )
+        except BaseException as e:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            if dump_error is not None and e is not dump_error:
+                raise dump_error from e # HTTP-клиент заворачивает ошибку тела запроса в ошибку соединения
+            raise
+        finally:
+            stop_progress.set()
+            # запись хода не отменяем посреди коммита, а ждём её завершения
+            await asyncio.gather(progress, stderr_task, return_exceptions=True)
+
+        return encrypted.size, dump_size_bytes
+
+
+    async def _report_progress(
+        self,
+        backup_log_id: int,
+        sizes: Callable[[], tuple[int, int]],
+        stop: asyncio.Event,
+    ) -> None:
+        """Раз в backup_progress_interval пишет (размер зашифрованного файла, размер дампа) до установки `stop`"""
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=self.conf.different.backup_progress_interval)
+                return
+            except TimeoutError:
+                pass
+
+            size_bytes, dump_size_bytes = sizes()
+            try:
+                await self.backup_logs_service.update_backup_log(
+                    backup_log_id,
+                    UpdateBackupLogDTO(size_bytes=size_bytes, dump_size_bytes=dump_size_bytes),
+                    make_commit=True
+                )
+            except Exception:
+                self.logger.warning("Failed to save progress of backup %s", backup_log_id)
 
-    async def cleanup_old_backups(self, retain_last: int = 2):
 
+    async def _purge_quietly(self, *names: str) -> None:
+        for name in names:
+            try:
+                await self.secret_storage.purge_secret(name)
+            except Exception:
+                self.logger.warning("Failed to purge %s after failed backup", name)
+
+
+    async def cleanup_old_backups(self, retain_last: int = 2):
+        """Оставит `retain_last` последних успешных бэкапов, неудачные удаляются всегда (идущие не трогаются)"""
         backups = await self.backup_logs_service.get_all_backup_logs_desc()
 
-        if backups is None or len(backups) <= retain_last:
+        if not backups:
             return
 
-        to_delete = backups[retain_last:]
+        completed = [backup for backup in backups if backup.status == BackupStatus.COMPLETED]
+        to_delete = completed[retain_last:] + [backup for backup in backups if backup.status == BackupStatus.FAILED]
 
         for backup in to_delete:
             # удалить файл бэкапа
             try:
-                self.secret_storage.purge_secret(backup.storage_file_name)
+                await self.secret_storage.purge_secret(backup.storage_file_name)
             except Exception:
                 self.logger.exception("Failed to purge backup %s", backup.storage_file_name)
 
             try:
                 # удалить зашифрованный DEK
-                self.secret_storage.purge_secret(backup.storage_encrypted_dek_name)
+                await self.secret_storage.purge_secret(backup.storage_encrypted_dek_name)
             except Exception:
                 self.logger.exception("Failed to purge dek for backup %s", backup.storage_encrypted_dek_name)
 
@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.create_models.system import CreateBackupLogDTO
 from src.models.read_models.other import BackupLogsDTO
+from src.models.update_models import UpdateBackupLogDTO
 from src.repository.database.systems import BackupLogsRepository
 
 
@@ -18,8 +19,31 @@ class BackupLogsService:
         data: CreateBackupLogDTO,
         make_commit: Optional[bool] = False,
     ) -> BackupLogsDTO:
-        values = data.model_dump()
+        values = data.model_dump(exclude={"status"})
         log = await self.backup_logs_repo.create_backup_log(**values)
+        if data.status is not None:
+            stats = await self.backup_logs_repo.create_stats(log.backup_log_id, status=data.status)
+            log = log.model_copy(update={"stats": stats})
+
+        if make_commit:
+            await self.session_db.commit()
+
+        return log
+
+    async def update_backup_log(
+        self,
+        backup_log_id: int,
+        data: UpdateBackupLogDTO,
+        make_commit: Optional[bool] = False,
+    ) -> Optional[BackupLogsDTO]:
+        values = data.model_dump(exclude_unset=True)
+        size_bytes = values.pop("size_bytes", None)
+        # размер файла в самой записи бэкапа, ход и итог в BackupLogStats
+        await self.backup_logs_repo.update_stats(backup_log_id, **values)
+        if size_bytes is not None:
+            log = await self.backup_logs_repo.update(backup_log_id, size_bytes=size_bytes)
+        else:
+            log = await self.backup_logs_repo.get_by_id(backup_log_id)
 
         if make_commit:
             await self.session_db.commit()
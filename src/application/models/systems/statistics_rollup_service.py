@@ -0,0 +1,46 @@
+from datetime import datetime, UTC, timedelta
+from typing import List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.repository.database.systems import StatisticsRollupRepository
+
+
+class StatisticsRollupService:
+    """
+    Ведёт сводную статистику по дням UTC (см. StatisticsService).
+    Продажи по категориям пишутся из событий покупки (категория есть только в событии),
+    остальное сворачивается фоновой задачей за прошедшие дни.
+    """
+
+    # закрываем день не сразу после полуночи, чтобы успели обработаться события покупок последних минут дня
+    close_delay = timedelta(minutes=15)
+
+    def __init__(
+        self,
+        statistics_rollup_repo: StatisticsRollupRepository,
+        session_db: AsyncSession,
+    ):
+        self.statistics_rollup_repo = statistics_rollup_repo
+        self.session_db = session_db
+
+    async def record_sales(self, category_id: int, purchase_ids: List[int]):
+        """Учтёт покупки в продажах категории. Коммит на вызывающей стороне (обработчик события покупки)"""
+        await self.statistics_rollup_repo.add_sales(category_id, purchase_ids)
+
+    async def close_days(self, now: Optional[datetime] = None):
+        """Свернёт все ещё не свёрнутые прошедшие дни и закоммитит"""
+        now = now or datetime.now(UTC)
+        date_to = (now - self.close_delay).date() - timedelta(days=1)
+
+        closed_until = await self.statistics_rollup_repo.get_closed_until()
+        if closed_until:
+            date_from = closed_until + timedelta(days=1)
+        else:
+            date_from = await self.statistics_rollup_repo.get_first_activity_day()
+
+        if date_from is None or date_from > date_to:
+            return
+
+        await self.statistics_rollup_repo.close_days(date_from, date_to)
+        await self.session_db.commit()
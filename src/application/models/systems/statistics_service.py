@@ -1,85 +1,159 @@
-from datetime import datetime, UTC, timedelta
+from datetime import datetime, UTC, timedelta, date
+from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import desc, func, select
+from sqlalchemy import desc, func, select, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import Config
 from src.database.models.categories import (
     Categories,
+    CategoryTranslation,
     ProductAccounts,
     ProductType,
     ProductUniversal,
-    Purchases,
 )
-from src.database.models.system import BackupLogs
+from src.database.models.system import BackupLogs, BackupLogStats, BackupStatus
 from src.database.models.users import Replenishments, Users
-from src.repository.database.systems import TypePaymentsRepository
+from src.repository.database.systems import TypePaymentsRepository, StatisticsRollupRepository
+from src.repository.database.systems.statistics_rollups import UNKNOWN_CATEGORY_ID, day_start
 from src.models.read_models.systems import (
     ReplenishmentPaymentSystem,
+    SalesCategory,
     StatisticsData,
 )
 
 
 class StatisticsService:
+    """
+    Статистика для админа по дням UTC.
+
+    Прошедшие дни берутся из сводных таблиц (StatisticsRollupService сворачивает их фоновой задачей),
+    ещё не свёрнутые дни (обычно только сегодняшний) досчитываются по индексам за этот короткий диапазон.
+    Продажи всегда читаются из сводной таблицы: по категориям они пишутся при обработке события покупки.
+    """
 
     def __init__(
         self,
         type_payments_repo: TypePaymentsRepository,
+        statistics_rollup_repo: StatisticsRollupRepository,
         session_db: AsyncSession,
+        conf: Config,
     ):
         self.type_payments_repo = type_payments_repo
+        self.statistics_rollup_repo = statistics_rollup_repo
         self.session_db = session_db
-
-    async def get_statistics(self, interval_days: int) -> StatisticsData:
-        up_to_date = datetime.now(UTC) - timedelta(days=interval_days)
-
-        result = await self.session_db.execute(
-            select(
-                func.count().filter(Users.last_used >= up_to_date).label("active"),
-                func.count().filter(Users.created_at >= up_to_date).label("new"),
-                func.count().label("total"),
+        self.conf = conf
+
+    async def get_statistics(self, interval_days: int, language: Optional[str] = None) -> StatisticsData:
+        """Статистика за последние `interval_days` дней, включая сегодняшний"""
+        today = datetime.now(UTC).date()
+        try:
+            date_from = today - timedelta(days=interval_days)
+        except OverflowError: # "за всё время"
+            date_from = date.min
+        return await self.get_statistics_for_period(date_from, today, language)
+
+    async def get_statistics_for_period(
+        self,
+        date_from: date,
+        date_to: date,
+        language: Optional[str] = None
+    ) -> StatisticsData:
+        """
+        Статистика за дни [date_from, date_to] UTC включительно.
+        :param language: язык названий категорий, по умолчанию `conf.app.default_lang`
+        """
+        closed_until = await self.statistics_rollup_repo.get_closed_until()
+
+        # дни после последнего свёрнутого считаются по исходным таблицам
+        live_from = date_from
+        if closed_until and closed_until >= date_from:
+            live_from = closed_until + timedelta(days=1)
+
+        new_users = 0
+        repl_stats: Dict[int, Tuple[int, int]] = {}
+        if closed_until and closed_until >= date_from:
+            rolled_to = min(closed_until, date_to)
+            new_users += await self.statistics_rollup_repo.get_new_users(date_from, rolled_to)
+            repl_stats = await self.statistics_rollup_repo.get_replenishments(date_from, rolled_to)
+
+        if live_from <= date_to:
+            live_start = day_start(live_from)
+            live_end = day_start(date_to + timedelta(days=1))
+
+            result = await self.session_db.execute(
+                select(func.count())
+                .where(Users.created_at >= live_start, Users.created_at < live_end)
             )
-        )
-
-        row = result.one()
-        active_users = row.active
-        new_users = row.new
-        total_users = row.total
+            new_users += result.scalar()
 
-        result = await self.session_db.execute(
-            select(
-                Purchases.product_type,
-                func.count().label("quantity"),
-                func.coalesce(func.sum(Purchases.purchase_price), 0).label("amount"),
-                func.coalesce(func.sum(Purchases.net_profit), 0).label("profit"),
+            result = await self.session_db.execute(
+                select(
+                    Replenishments.type_payment_id,
+                    func.count(Replenishments.replenishment_id).label("quantity"),
+                    func.coalesce(func.sum(Replenishments.amount), 0).label("amount"),
+                )
+                .where(Replenishments.created_at >= live_start, Replenishments.created_at < live_end)
+                .group_by(Replenishments.type_payment_id)
             )
-            .where(Purchases.purchase_date >= up_to_date)
-            .group_by(Purchases.product_type)
-        )
-
-        sales = {row.product_type: row for row in result.all()}
-
-        acc = sales.get(ProductType.ACCOUNT)
-        univ = sales.get(ProductType.UNIVERSAL)
-
-        quantity_sale_accounts = acc.quantity if acc else 0
-        amount_sale_accounts = acc.amount if acc else 0
-        total_net_profit_account = acc.profit if acc else 0
-
-        quantity_sale_universal = univ.quantity if univ else 0
-        amount_sale_universal = univ.amount if univ else 0
-        total_net_profit_universal = univ.profit if univ else 0
+            for row in result.all():
+                quantity, amount = repl_stats.get(row.type_payment_id, (0, 0))
+                repl_stats[row.type_payment_id] = (quantity + row.quantity, amount + row.amount)
 
         result = await self.session_db.execute(
-            select(
-                Replenishments.type_payment_id,
-                func.count(Replenishments.replenishment_id).label("quantity"),
-                func.coalesce(func.sum(Replenishments.amount), 0).label("amount"),
-            )
-            .group_by(Replenishments.type_payment_id)
-            .where(Replenishments.created_at >= up_to_date)
+            select(func.count())
+            .where(Users.last_used >= day_start(date_from), Users.last_used < day_start(date_to + timedelta(days=1)))
+        )
+        active_users = result.scalar()
+
+        # всего пользователей: свёрнутые дни и всё, что после них
+        total_users = 0
+        created_after = None
+        if closed_until:
+            total_users += await self.statistics_rollup_repo.get_new_users(date.min, closed_until)
+            created_after = day_start(closed_until + timedelta(days=1))
+        stmt = select(func.count()).select_from(Users)
+        if created_after:
+            stmt = stmt.where(Users.created_at >= created_after)
+        total_users += (await self.session_db.execute(stmt)).scalar()
+
+        sales = await self.statistics_rollup_repo.get_sales(date_from, date_to)
+
+        totals_by_type: Dict[str, List[int]] = {}
+        totals_by_category: Dict[int, List[int]] = {}
+        for (category_id, product_type), values in sales.items():
+            for totals in (
+                totals_by_type.setdefault(product_type, [0, 0, 0]),
+                totals_by_category.setdefault(category_id, [0, 0, 0])
+            ):
+                for index, value in enumerate(values):
+                    totals[index] += value
+
+        quantity_sale_accounts, amount_sale_accounts, total_net_profit_account = totals_by_type.get(
+            ProductType.ACCOUNT.value, (0, 0, 0)
+        )
+        quantity_sale_universal, amount_sale_universal, total_net_profit_universal = totals_by_type.get(
+            ProductType.UNIVERSAL.value, (0, 0, 0)
         )
 
-        repl_stats = {r.type_payment_id: r for r in result.all()}
+        category_names = await self._get_category_names(
+            [category_id for category_id in totals_by_category if category_id != UNKNOWN_CATEGORY_ID],
+            language or self.conf.app.default_lang,
+        )
+        sales_by_category = sorted(
+            (
+                SalesCategory(
+                    category_id=category_id,
+                    name=category_names.get(category_id, ""),
+                    quantity_sale=quantity,
+                    amount_sale=amount,
+                    total_net_profit=profit,
+                )
+                for category_id, (quantity, amount, profit) in totals_by_category.items()
+            ),
+            key=lambda item: item.amount_sale,
+            reverse=True,
+        )
 
         all_type_payments = await self.type_payments_repo.get_all()
 
@@ -88,10 +162,7 @@ class StatisticsService:
         replenishment_payment_systems = []
 
         for tp in all_type_payments:
-            stat = repl_stats.get(tp.type_payment_id)
-
-            qty = stat.quantity if stat else 0
-            amt = stat.amount if stat else 0
+            qty, amt = repl_stats.get(tp.type_payment_id, (0, 0))
 
             replenishment_payment_systems.append(
                 ReplenishmentPaymentSystem(
@@ -123,6 +194,8 @@ class StatisticsService:
 
         result_db = await self.session_db.execute(
             select(BackupLogs.created_at)
+            .outerjoin(BackupLogStats, BackupLogStats.backup_log_id == BackupLogs.backup_log_id)
+            .where(or_(BackupLogStats.status.is_(None), BackupLogStats.status == BackupStatus.COMPLETED))
             .order_by(desc(BackupLogs.created_at))
             .limit(1)
         )
@@ -142,6 +215,7 @@ class StatisticsService:
             quantity_sale_universal=quantity_sale_universal,
             amount_sale_universal=amount_sale_universal,
             total_net_profit_universal=total_net_profit_universal,
+            sales_by_category=sales_by_category,
             quantity_replenishments=quantity_replenishments,
             amount_replenishments=amount_replenishments,
             replenishment_payment_systems=replenishment_payment_systems,
@@ -150,3 +224,20 @@ class StatisticsService:
             universals_for_sale=universals_for_sale,
             last_backup=last_backup,
         )
+
+    async def _get_category_names(self, category_ids: List[int], language: str) -> Dict[int, str]:
+        """
+        :return: Dict(category_id, название на `language` или на любом другом языке). Удалённых категорий в результате нет
+        """
+        if not category_ids:
+            return {}
+
+        result = await self.session_db.execute(
+            select(CategoryTranslation.category_id, CategoryTranslation.name, CategoryTranslation.language)
+            .where(CategoryTranslation.category_id.in_(category_ids))
+        )
+        names = {}
+        for row in result.all():
+            if row.category_id not in names or row.language == language:
+                names[row.category_id] = row.name
+        return names
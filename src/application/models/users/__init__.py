@@ -2,6 +2,8 @@ from src.application.models.users.banned_account_service import BannedAccountSer
 from src.application.models.users.money_transfer_service import MoneyTransferService
 from src.application.models.users.notifications_service import NotificationSettingsService
 from src.application.models.users.replenishment_service import ReplenishmentsService
+from src.application.models.users.suppressed_recipients_service import SuppressedRecipientsService
+from src.application.models.users.user_context_service import UserContextService
 from src.application.models.users.user_log_service import UserLogService
 from src.application.models.users.user_service import UserService
 from src.application.models.users.wallet_transaction import WalletTransactionService
@@ -11,6 +13,8 @@ __all__ = [
     "MoneyTransferService",
     "NotificationSettingsService",
     "ReplenishmentsService",
+    "SuppressedRecipientsService",
+    "UserContextService",
     "UserLogService",
     "UserService",
     "WalletTransactionService",
@@ -0,0 +1,35 @@
+from typing import Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.repository.database.users import SuppressedRecipientsRepository
+
+
+class SuppressedRecipientsService:
+    """Пользователи, недоступные для рассылок (бот заблокирован или аккаунт удалён)"""
+
+    def __init__(self, suppressed_repo: SuppressedRecipientsRepository, session_db: AsyncSession):
+        self.suppressed_repo = suppressed_repo
+        self.session_db = session_db
+
+    async def suppress_many(self, reasons: Dict[int, str], make_commit: Optional[bool] = False) -> None:
+        """:param reasons: Dict(user_id, причина: 'forbidden' | 'not_found')"""
+        await self.suppressed_repo.add_many(reasons)
+        if make_commit:
+            await self.session_db.commit()
+
+    async def restore(self, user_id: int, make_commit: Optional[bool] = False) -> bool:
+        """
+        Вернёт пользователя в рассылки (например, после повторного /start)
+        :return: был ли пользователь в списке
+        """
+        restored = await self.suppressed_repo.delete(user_id)
+        if restored and make_commit:
+            await self.session_db.commit()
+        return restored
+
+    async def is_suppressed(self, user_id: int) -> bool:
+        return await self.suppressed_repo.exists(user_id)
+
+    async def get_count(self) -> int:
+        return await self.suppressed_repo.count_all()
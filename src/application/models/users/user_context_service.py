@@ -0,0 +1,40 @@
+from typing import Optional
+
+from src.application.models.systems.settings_service import SettingsService
+from src.application.models.users.user_service import UserService
+from src.models.read_models import UserContextDTO
+from src.repository.redis import UserContextCacheRepository
+
+
+class UserContextService:
+    """Собирает контекст пользователя для проверок апдейта (бан, админ, техработы) за один запрос к Redis"""
+
+    def __init__(
+        self,
+        cache_repo: UserContextCacheRepository,
+        user_service: UserService,
+        settings_service: SettingsService,
+    ):
+        self.cache_repo = cache_repo
+        self.user_service = user_service
+        self.settings_service = settings_service
+
+    async def get_context(
+        self,
+        user_id: int,
+        username: Optional[str] = False,
+    ) -> UserContextDTO:
+        """
+        В БД обращается только если пользователя или настроек нет в кэше либо расходится username.
+        :param username: Обновит username если он не сходится с имеющимся
+        """
+        context = await self.cache_repo.get(user_id)
+        update = {}
+
+        if context.user is None or (username is not False and context.user.username != username):
+            update["user"] = await self.user_service.get_user(user_id, username, update_last_used=True)
+
+        if context.settings is None:
+            update["settings"] = await self.settings_service.get_settings()
+
+        return context.model_copy(update=update) if update else context
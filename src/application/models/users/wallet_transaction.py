@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.create_models.users import CreateWalletTransactionDTO
 from src.models.read_models.other import WalletTransactionDTO
+from src.models.read_models.pagination import PageCursor
 from src.repository.database.users import WalletTransactionRepository
 
 
@@ -13,9 +14,14 @@ class WalletTransactionService:
         self,
         wallet_transaction: WalletTransactionRepository,
         session_db: AsyncSession,
+        history_repo: Optional[WalletTransactionRepository] = None,
     ):
+        """
+        :param history_repo: репозиторий на сессии реплики для страниц истории, по умолчанию `wallet_transaction`
+        """
         self.wallet_transaction = wallet_transaction
         self.session_db = session_db
+        self.history_repo = history_repo or wallet_transaction
 
     async def create_wallet_transaction(
         self,
@@ -41,10 +47,11 @@ class WalletTransactionService:
         self,
         user_id: int,
         page: Optional[int] = None,
-        page_size: Optional[int] = None
+        page_size: Optional[int] = None,
+        cursor: Optional[PageCursor] = None,
     ) -> Sequence[WalletTransactionDTO]:
-        return await self.wallet_transaction.get_page(user_id=user_id, page=page, page_size=page_size)
+        return await self.history_repo.get_page(user_id=user_id, page=page, page_size=page_size, cursor=cursor)
 
     async def get_count_wallet_transaction(self, user_id: int) -> int:
-        return await self.wallet_transaction.count_by_user(user_id=user_id)
+        return await self.history_repo.count_by_user(user_id=user_id)
 
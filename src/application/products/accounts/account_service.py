@@ -6,13 +6,12 @@ from pathlib import Path
 from typing import AsyncGenerator
 
 from src.application.crypto.crypto_context import CryptoProvider
+from src.application.crypto.crypto_service import CryptoService
 from src.application.events.publish_event_handler import PublishEventHandler
 from src.application.products.accounts.tg.dto.schemas import CreatedEncryptedArchive
 from src.database.models.categories import AccountStorage, AccountServiceType, StorageStatus
 from src.domain.crypto.decrypt import decrypt_folder
 from src.domain.crypto.encrypt import encrypt_folder, make_account_key
-from src.domain.crypto.key_ops import unwrap_dek
-from src.domain.crypto.models import CryptoContext
 from src.domain.crypto.utils import sha256_file
 from src.infrastructure.files.file_system import move_file
 from src.infrastructure.files.path_builder import PathBuilder
@@ -26,11 +25,13 @@ class AccountService:
         publish_event_handler: PublishEventHandler,
         path_builder: PathBuilder,
         crypto_provider: CryptoProvider,
+        crypto_service: CryptoService,
         logger: Logger,
     ):
         self.publish_event_handler = publish_event_handler
         self.path_builder = path_builder
         self.crypto_provider = crypto_provider
+        self.crypto_service = crypto_service
         self.logger = logger
 
     async def move_in_account(
@@ -125,7 +126,6 @@ class AccountService:
     def decryption_tg_account(
         self,
         account_storage: AccountStorage | AccountStorageDTO,
-        crypto: CryptoContext,
         status: StorageStatus,
     ):
         """
@@ -133,12 +133,8 @@ class AccountService:
         :param status: Статус аккаунта где в данный момент хранятся данные для него. Будет формировать путь используя этот статус.
         """
 
-        # Расшифровываем DEK (account_key)
-        account_key = unwrap_dek(
-            encrypted_data_b64=account_storage.encrypted_key,
-            nonce_b64=account_storage.encrypted_key_nonce,
-            kek=crypto.kek
-        )
+        # Расшифровываем DEK (account_key), при повторной расшифровке того же аккаунта берётся из кэша
+        account_key = self.crypto_service.unwrap_storage(account_storage)
 
         abs_path = self.path_builder.build_path_account(
             status=status,
@@ -155,11 +151,10 @@ class AccountService:
         Расшифрует папку с тг аккаунтом и создаст архив(zip) с tdata, после второго вызова удалит все созданные временные файлы
         :return: путь к архиву
         """
-        crypto = self.crypto_provider.get()
         folder_path = None
 
         try:
-            folder_path = self.decryption_tg_account(account_storage, crypto, account_storage.status)
+            folder_path = self.decryption_tg_account(account_storage, account_storage.status)
             dir_for_tdata = Path(folder_path) / f'{account_storage.account_storage_id}_tdata'
             dir_for_tdata.mkdir(exist_ok=True)
             result = await move_file(str(Path(folder_path) / 'tdata'), str(dir_for_tdata))
@@ -187,11 +182,10 @@ class AccountService:
         Расшифрует папку с тг аккаунтом и вернёт путь к файлу .session, после второго вызова удалит все созданные временные файлы
         :return: Путь к файлу
         """
-        crypto = self.crypto_provider.get()
         folder_path = None
 
         try:
-            folder_path = self.decryption_tg_account(account_storage, crypto, account_storage.status)
+            folder_path = self.decryption_tg_account(account_storage, account_storage.status)
             session_path = str(Path(folder_path) / 'session.session')
             if os.path.isfile(session_path):
                 yield session_path
@@ -37,6 +37,7 @@ class ImportResult(BaseModel):
 
 class CreatedEncryptedArchive(BaseModel):
     result: bool
+    storage_uuid: Optional[str] = None
     encrypted_key_b64: Optional[str] = None
     path_encrypted_acc: Optional[str] = None
     encrypted_key_nonce: Optional[str] = None
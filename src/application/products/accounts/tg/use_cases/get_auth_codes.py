@@ -5,7 +5,6 @@ from logging import Logger
 from pathlib import Path
 from typing import Tuple, List, TYPE_CHECKING
 
-from src.application.crypto.crypto_context import CryptoProvider
 from src.application.products.accounts.account_service import AccountService
 from src.models.read_models import AccountStorageDTO
 
@@ -19,12 +18,10 @@ class GetAuthCodesUseCase:
     def __init__(
         self,
         tg_client: "TelegramAccountClient",
-        crypto_provider: CryptoProvider,
         account_service: AccountService,
         logger: Logger,
     ):
         self.tg_client = tg_client
-        self.crypto_provider = crypto_provider
         self.account_service = account_service
         self.logger = logger
 
@@ -41,8 +38,7 @@ class GetAuthCodesUseCase:
         """
         temp_account_path = None
         try:
-            crypto = self.crypto_provider.get()
-            temp_account_path = self.account_service.decryption_tg_account(account_storage, crypto, account_storage.status)
+            temp_account_path = self.account_service.decryption_tg_account(account_storage, account_storage.status)
             tdata_path = Path(temp_account_path) / Path('tdata')
 
             return await self.tg_client.get_auth_codes(tdata_path, limit)
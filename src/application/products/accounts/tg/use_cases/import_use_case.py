@@ -1,54 +1,70 @@
 import asyncio
+import multiprocessing
 import shutil
 import tempfile
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
 from logging import Logger
 from pathlib import Path
-from typing import AsyncGenerator, Any, List, Tuple
+from typing import AsyncGenerator, Any, Awaitable, Callable, List, Optional, Tuple
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.crypto.crypto_context import CryptoProvider
 from src.application.models.products.accounts import AccountStorageService, AccountProductService
-from src.application.products.accounts.account_service import AccountService
 from src.application.products.accounts.tg.dto.schemas import ImportResult, BaseAccountProcessingResult, \
-    ArchivesBatchResult, ArchiveProcessingResult, DirsBatchResult
-from src.database.models.categories import AccountServiceType
+    ArchivesBatchResult, ArchiveProcessingResult, DirsBatchResult, CreatedEncryptedArchive
+from src.config import Config
+from src.database.models.categories import AccountServiceType, StorageStatus
+from src.domain.crypto.encrypt import encrypt_folder_with_new_key
 from src.exceptions import ArchiveNotFount, DirNotFount
 from src.infrastructure.files.file_system import extract_archive_to_temp, archive_if_not_empty, cleanup_used_data, \
     make_archive
 from src.infrastructure.files.path_builder import PathBuilder
 from src.infrastructure.telegram.account_client import TelegramAccountClient
-from src.models.create_models.accounts import CreateAccountStorageDTO, CreateProductAccountDTO
-from src.models.update_models import UpdateAccountStorageDTO
+from src.models.create_models.accounts import CreateAccountStorageDTO
 from src.utils.pars_number import phone_in_e164
 
 # ограничиваем число параллельных обработок
 SEM = asyncio.Semaphore(7)
 
+# (зашифровано аккаунтов, всего аккаунтов)
+ImportProgressCallback = Callable[[int, int], Awaitable[None]]
+
 class ImportTelegramAccountsUseCase:
 
     def __init__(
         self,
         account_storage_service: AccountStorageService,
-        account_service: AccountService,
         account_product_service: AccountProductService,
+        crypto_provider: CryptoProvider,
         path_builder: PathBuilder,
         tg_client: TelegramAccountClient,
+        conf: Config,
+        session_db: AsyncSession,
         logger: Logger,
     ):
         self.account_storage_service = account_storage_service
-        self.account_service = account_service
         self.account_product_service = account_product_service
+        self.crypto_provider = crypto_provider
         self.path_builder = path_builder
         self.tg_client = tg_client
+        self.conf = conf
+        self.session_db = session_db
         self.logger = logger
 
     async def import_telegram_accounts_from_archive(
         self,
         archive_path: str,
         category_id: int,
-        type_account_service: AccountServiceType
+        type_account_service: AccountServiceType,
+        on_progress: Optional[ImportProgressCallback] = None,
     ) -> AsyncGenerator[ImportResult | None, Any]:
         """
         При первом вызове интегрирует аккаунты в бота,
         при втором удалит все созданные временные файлы, так же и архивы с невалидными/дублирующими аккаунтами
+        :param on_progress: получает ход шифрования (зашифровано, всего), например для обновления сообщения админу
         """
         archive_path_del = Path(archive_path)
         dir_with_archive = archive_path_del.parent  # временная директория
@@ -89,7 +105,9 @@ class ImportTelegramAccountsUseCase:
         await self._process_inappropriate_acc(invalid_items, invalid_dir)
 
         # Грузим уникальные в БД
-        successfully_added = await self._import_in_db(unique_items, type_account_service, invalid_dir, category_id)
+        successfully_added = await self._import_in_db(
+            unique_items, type_account_service, invalid_dir, category_id, on_progress
+        )
 
         invalid_archive = await archive_if_not_empty(invalid_dir)
         duplicate_archive = await archive_if_not_empty(duplicate_dir)
@@ -123,77 +141,129 @@ class ImportTelegramAccountsUseCase:
         all_items: List[BaseAccountProcessingResult],
         type_account_service: AccountServiceType,
         invalid_dir: str,
-        category_id: int
+        category_id: int,
+        on_progress: Optional[ImportProgressCallback] = None,
     ) -> int:
         """
-        Импортирует аккаунты в БД
+        Импортирует аккаунты в БД в три этапа:
+        1. папки шифруются параллельно в пуле процессов, сразу по итоговому пути (uuid хранилища выбирается заранее);
+        2. хранилища, медиа и товары создаются пачками в одной транзакции;
+        3. кэш категории обновляется один раз.
+        Если запись в БД не удалась, зашифрованные файлы удаляются.
         :param all_items: все уникальные данные об аккаунтах
         :param type_account_service: тип сервиса куда добавляем
         :param invalid_dir: путь к директории с невалидными аккаунтами
         :param category_id: категория куда необходимо добавить
+        :param on_progress: вызывается с (зашифровано, всего) не чаще conf.different.import_progress_interval
         :return: успешное количество добавленных аккаунтов
         """
-        successfully_added = 0
-        for item in all_items:
-            if not item.valid:
-                continue
+        items = [item for item in all_items if item.valid]
+        if not items:
+            return 0
 
-            user = item.user
-            phone = user.phone
-
-            #  создаём запись в БД
-            acc = await self.account_storage_service.create_account_storage(
-                data=CreateAccountStorageDTO(
-                    is_file=True,
-                    type_account_service=type_account_service,
-                    checksum="",  # пока пусто
-                    encrypted_key="",  # пока пусто
-                    encrypted_key_nonce="",  # пока пусто
-                    phone_number=phone,
-                    tg_id=user.id
-                ),
-                make_commit=True,
-            )
+        encrypted = await self._encrypt_accounts(items, type_account_service, on_progress)
 
-            # Полный путь к будущему зашифрованному файлу
-            dest_path = self.path_builder.build_path_account(acc.status, type_account_service, acc.storage_uuid)
+        prepared: List[Tuple[BaseAccountProcessingResult, CreatedEncryptedArchive]] = []
+        for item, enc in zip(items, encrypted):
+            if enc.result:
+                prepared.append((item, enc))
+                continue
 
-            #  шифруем
-            enc = await self.account_service.encrypted_tg_account(
-                src_directory=item.dir_path,
-                dest_encrypted_path=str(dest_path)
-            )
+            # Архив битый → перемещаем в invalid
+            dst = Path(invalid_dir) / Path(item.dir_path).name
+            shutil.copytree(item.dir_path, dst)  # копируем к невалидным
+            await make_archive(str(dst), str(dst.with_suffix(".zip")))
 
-            if not enc.result:
-                # Архив битый → перемещаем в invalid
-                dst = Path(invalid_dir) / Path(item.dir_path).name
-                shutil.copytree(item.dir_path, dst)  # копируем к невалидным
-                await make_archive(str(dst), str(dst.with_suffix(".zip")))
-                continue
+        if not prepared:
+            return 0
 
-            # обновляем запись в БД после успешного шифрования
-            acc = await self.account_storage_service.update_account_storage(
-                account_storage_id=acc.account_storage_id,
-                data=UpdateAccountStorageDTO(
-                    checksum=enc.checksum,
-                    encrypted_key=enc.encrypted_key_b64,
-                    encrypted_key_nonce=enc.encrypted_key_nonce,
-                ),
-                make_commit=True,
-                filling_redis=True,
+        try:
+            storages = await self.account_storage_service.create_account_storages(
+                data=[
+                    CreateAccountStorageDTO(
+                        is_file=True,
+                        type_account_service=type_account_service,
+                        checksum=enc.checksum,
+                        encrypted_key=enc.encrypted_key_b64,
+                        encrypted_key_nonce=enc.encrypted_key_nonce,
+                        phone_number=item.user.phone,
+                        tg_id=item.user.id,
+                        storage_uuid=enc.storage_uuid,
+                    )
+                    for item, enc in prepared
+                ],
+                make_commit=False,
             )
-
-            await self.account_product_service.create_product_account(
-                data=CreateProductAccountDTO(
-                    category_id=category_id,
-                    account_storage_id=acc.account_storage_id,
-                ),
+            await self.account_product_service.create_product_accounts(
+                category_id=category_id,
+                account_storage_ids=[storage.account_storage_id for storage in storages],
                 make_commit=True,
                 filling_redis=True,
             )
-            successfully_added += 1
+        except Exception:
+            await self.session_db.rollback()
+            for _, enc in prepared:
+                shutil.rmtree(Path(enc.path_encrypted_acc).parent, ignore_errors=True)
+            raise
+
+        return len(storages)
 
-        return successfully_added
+    async def _encrypt_accounts(
+        self,
+        items: List[BaseAccountProcessingResult],
+        type_account_service: AccountServiceType,
+        on_progress: Optional[ImportProgressCallback],
+    ) -> List[CreatedEncryptedArchive]:
+        """
+        Шифрует папки аккаунтов в пуле процессов (spawn: форк процесса с потоками и открытыми соединениями небезопасен).
+        :return: Результаты в порядке `items`
+        """
+        kek = self.crypto_provider.get().kek
+        loop = asyncio.get_running_loop()
+        total = len(items)
+        done = 0
+        last_report = time.monotonic()
+
+        async def encrypt_one(item: BaseAccountProcessingResult) -> CreatedEncryptedArchive:
+            nonlocal done, last_report
+
+            storage_uuid = str(uuid.uuid4())
+            dest_path = self.path_builder.build_path_account(
+                StorageStatus.FOR_SALE, type_account_service, storage_uuid
+            )
+            try:
+                encrypted_key_b64, nonce, checksum = await loop.run_in_executor(
+                    pool, encrypt_folder_with_new_key, item.dir_path, dest_path, kek
+                )
+                result = CreatedEncryptedArchive(
+                    result=True,
+                    storage_uuid=storage_uuid,
+                    encrypted_key_b64=encrypted_key_b64,
+                    path_encrypted_acc=dest_path,
+                    encrypted_key_nonce=nonce,
+                    checksum=checksum,
+                )
+            except Exception as e:
+                self.logger.exception(f"Ошибка при шифровании аккаунта {item.dir_path}: {e}")
+                shutil.rmtree(Path(dest_path).parent, ignore_errors=True)
+                result = CreatedEncryptedArchive(result=False)
+
+            done += 1
+            now = time.monotonic()
+            if on_progress and (done == total or now - last_report >= self.conf.different.import_progress_interval):
+                last_report = now
+                try:
+                    await on_progress(done, total)
+                except Exception as e:
+                    self.logger.warning(f"[import_tg_accounts] - не удалось сообщить о ходе импорта: {e}")
+
+            return result
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.conf.different.import_encrypt_workers, total),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            return list(await asyncio.gather(*(encrypt_one(item) for item in items)))
 
     async def _split_unique_and_duplicates(
         self,
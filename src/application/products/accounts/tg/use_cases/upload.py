@@ -2,7 +2,6 @@ import os
 import shutil
 from typing import AsyncGenerator
 
-from src.application.crypto.crypto_context import CryptoProvider
 from src.application.models.products.accounts import AccountProductService
 from src.application.products.accounts.account_service import AccountService
 from src.config import Config
@@ -16,12 +15,10 @@ class UploadTGAccountsUseCase:
         conf: Config,
         account_service: AccountService,
         account_product_service: AccountProductService,
-        crypto_provider: CryptoProvider,
     ):
         self.conf = conf
         self.account_service = account_service
         self.account_product_service = account_product_service
-        self.crypto_provider = crypto_provider
 
 
     async def execute(self, category_id: int) -> AsyncGenerator[str, str]:
@@ -42,9 +39,8 @@ class UploadTGAccountsUseCase:
         )
 
         for acc in accounts:
-            crypto = self.crypto_provider.get()
             decrypted_folder = self.account_service.decryption_tg_account(
-                acc.account_storage, crypto, acc.account_storage.status
+                acc.account_storage, acc.account_storage.status
             )
             folder_size = get_dir_size(decrypted_folder)
 
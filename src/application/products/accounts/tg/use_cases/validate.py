@@ -2,7 +2,6 @@ import asyncio
 import shutil
 from logging import Logger
 
-from src.application.crypto.crypto_context import CryptoProvider
 from src.application.products.accounts.account_service import AccountService
 from src.database.models.categories import StorageStatus
 from src.database.models.categories import AccountServiceType
@@ -16,12 +15,10 @@ class ValidateTgAccount:
         self,
         logger: Logger,
         tg_client: TelegramAccountClient,
-        crypto_provider: CryptoProvider,
         account_service: AccountService,
     ):
         self.logger = logger
         self.tg_client = tg_client
-        self.crypto_provider = crypto_provider
         self.account_service = account_service
 
     async def check_account_validity(
@@ -42,8 +39,7 @@ class ValidateTgAccount:
         temp_folder = None
         try:
             # decryption heavy IO в thread
-            crypto = self.crypto_provider.get()
-            temp_folder = await asyncio.to_thread(self.account_service.decryption_tg_account, account_storage, crypto, status)
+            temp_folder = await asyncio.to_thread(self.account_service.decryption_tg_account, account_storage, status)
             # проверка уже асинхронная
             is_valid = await self.tg_client.validate(temp_folder)
             return bool(is_valid)
@@ -1,6 +1,7 @@
 from src.application.products.universals.use_cases.import_use_case import ImportUniversalProductUseCase
 from src.application.products.universals.use_cases.upload import UploadUniversalProductsUseCase
 from src.application.products.universals.use_cases.validations import ValidationsUniversalProducts
+from src.application.products.universals.use_cases.verify_integrity import VerifyUniversalIntegrityUseCase
 from src.application.products.universals.use_cases.generate_example_import import GenerateExamplUniversalProductImport
 
 __all__ = [
@@ -8,4 +9,5 @@ __all__ = [
     "ImportUniversalProductUseCase",
     "UploadUniversalProductsUseCase",
     "ValidationsUniversalProducts",
+    "VerifyUniversalIntegrityUseCase",
 ]
\ No newline at end of file
@@ -11,6 +11,7 @@ from src.application.models.products.universal import UniversalStorageService, U
     UniversalProductService
 from src.application.products.universals.dto import UniversalProductsParse, PreparedUniversalProduct, \
     get_import_universal_headers
+from src.application.products.universals.use_cases.validations import ValidationsUniversalProducts
 from src.config import Config
 from src.database.models.categories import UniversalMediaType, StorageStatus
 from src.domain.crypto.encrypt import make_account_key, encrypt_file
@@ -37,6 +38,7 @@ class ImportUniversalProductUseCase:
         universal_product_service: UniversalProductService,
         universal_translations_service: UniversalTranslationsService,
         translations_category_service: TranslationsCategoryService,
+        validations_universal_products: ValidationsUniversalProducts,
         conf: Config,
         logger: Logger,
     ):
@@ -46,6 +48,7 @@ class ImportUniversalProductUseCase:
         self.universal_product_service = universal_product_service
         self.universal_translations_service = universal_translations_service
         self.translations_category_service = translations_category_service
+        self.validations_universal_products = validations_universal_products
         self.conf = conf
         self.logger = logger
 
@@ -258,6 +261,14 @@ class ImportUniversalProductUseCase:
             filling_redis=True,
         )
 
+        # товар только что зашифрован нами, поэтому сразу попадает в индекс целостности как валидный
+        await self.validations_universal_products.record_integrity(
+            universal_storage_id=storage.universal_storage_id,
+            checksum=storage.checksum,
+            file_path=prepared.file_path,
+            make_commit=True,
+        )
+
     async def _import_in_db(
         self,
         new_products: List[UniversalProductsParse],
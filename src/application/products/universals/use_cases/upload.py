@@ -5,12 +5,11 @@ from logging import Logger
 from pathlib import Path
 from typing import List, AsyncGenerator
 
-from src.application.crypto.crypto_context import CryptoProvider
+from src.application.crypto.crypto_service import CryptoService
 from src.application.models.products.universal import UniversalTranslationsService, UniversalProductService
 from src.application.products.universals.dto import UploadUniversalProduct, get_import_universal_headers
 from src.config import Config
-from src.domain.crypto.decrypt import decrypt_file, decrypt_text
-from src.domain.crypto.key_ops import unwrap_dek
+from src.domain.crypto.decrypt import decrypt_file
 from src.exceptions import ProductNotFound
 from src.infrastructure.files.file_system import create_temp_dir, create_import_zip
 from src.infrastructure.files.path_builder import PathBuilder
@@ -21,14 +20,14 @@ class UploadUniversalProductsUseCase:
 
     def __init__(
         self,
-        crypto_provider: CryptoProvider,
+        crypto_service: CryptoService,
         path_builder: PathBuilder,
         universal_product_service: UniversalProductService,
         universal_translations_service: UniversalTranslationsService,
         conf: Config,
         logger: Logger,
     ):
-        self.crypto_provider = crypto_provider
+        self.crypto_service = crypto_service
         self.path_builder = path_builder
         self.universal_product_service = universal_product_service
         self.universal_translations_service = universal_translations_service
@@ -55,8 +54,6 @@ class UploadUniversalProductsUseCase:
         )
         if not all_products: raise ProductNotFound()
 
-        crypto = self.crypto_provider.get()
-
         headers = get_import_universal_headers(self.conf)
         parse_products: List[UploadUniversalProduct] = []
 
@@ -69,11 +66,7 @@ class UploadUniversalProductsUseCase:
         for product in all_products:
             file_name = None
             descriptions = {}
-            dek = unwrap_dek(
-                encrypted_data_b64=product.universal_storage.encrypted_key,
-                nonce_b64=product.universal_storage.encrypted_key_nonce,
-                kek=crypto.kek
-            )
+            dek = self.crypto_service.unwrap_storage(product.universal_storage)
 
             if product.universal_storage.original_filename:
                 path = self.path_builder.build_path_universal_storage(
@@ -106,10 +99,10 @@ class UploadUniversalProductsUseCase:
                 )
 
                 for translate in all_translations:
-                    descriptions[translate.language] = decrypt_text(
+                    descriptions[translate.language] = self.crypto_service.decrypt_text(
+                        product.universal_storage,
                         encrypted_data_b64=translate.encrypted_description,
                         nonce_b64=translate.encrypted_description_nonce,
-                        dek=dek
                     )
 
             parse_products.append(
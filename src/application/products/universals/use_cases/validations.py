@@ -1,24 +1,230 @@
+import asyncio
+import os
+from datetime import datetime, timezone
 from logging import Logger
+from typing import Dict, List, Optional, Tuple
 
-from src.application.crypto.crypto_context import CryptoProvider
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.crypto.crypto_service import CryptoService
+from src.config import Config
 from src.database.models.categories import StorageStatus
-from src.domain.crypto.decrypt import decrypt_file_to_bytes, decrypt_text
-from src.domain.crypto.key_ops import unwrap_dek
+from src.domain.crypto.decrypt import verify_encrypted_file
+from src.domain.crypto.utils import sha256_file
 from src.infrastructure.files.path_builder import PathBuilder
-from src.models.read_models import ProductUniversalFull
+from src.models.read_models import ProductUniversalFull, UniversalIntegrityDTO
+from src.repository.database.categories import UniversalIntegrityRepository
+
+
+SEMAPHORE_LIMIT_DECRYPT = 50
+
+# состояние записи индекса целостности
+_ACTUAL = "actual"
+_TOUCHED = "touched"
+_STALE = "stale"
 
 
 class ValidationsUniversalProducts:
 
     def __init__(
         self,
-        crypto_provider: CryptoProvider,
+        crypto_service: CryptoService,
         path_builder: PathBuilder,
+        integrity_repo: UniversalIntegrityRepository,
+        conf: Config,
         logger: Logger,
+        session_db: AsyncSession,
     ):
-        self.crypto_provider = crypto_provider
+        self.crypto_service = crypto_service
         self.path_builder = path_builder
+        self.integrity_repo = integrity_repo
+        self.conf = conf
         self.logger = logger
+        self.session_db = session_db
+
+    async def check_valid_universal_products(
+        self,
+        products: List[ProductUniversalFull],
+        status: StorageStatus,
+        stale_before: Optional[datetime] = None,
+        make_commit: bool = True,
+    ) -> List[bool]:
+        """
+        Пакетная проверка товаров по индексу целостности.
+        Товары со свежей записью в индексе проверяются без дешифрования: совпадают checksum и размер файла,
+        а файл не изменялся после проверки. Если mtime файла новее проверки, содержимое хэшируется и сверяется
+        с checksum хранилища. Полное дешифрование (и сверка хэша содержимого) выполняется для товаров
+        с устаревшей записью, без неё или с изменённым содержимым, после чего их результат записывается в индекс.
+        :param status: Статус товара в пути хранения. Будет использовать этот статус для поиска файла товара
+        :param stale_before: Записи, проверенные раньше этого момента, считаются устаревшими.
+        По умолчанию текущее время минус `universal_integrity_ttl`
+        :return: Результат проверки для каждого товара в порядке `products`
+        """
+        if not products:
+            return []
+
+        entries = await self.integrity_repo.get_by_storage_ids(
+            [p.universal_storage.universal_storage_id for p in products]
+        )
+        file_stats = await asyncio.to_thread(self._get_file_stats, products, status)
+        sizes = {storage_id: size for storage_id, (size, _) in file_stats.items()}
+        fresh_after = stale_before or datetime.now(timezone.utc) - self.conf.different.universal_integrity_ttl
+
+        results: List[Optional[bool]] = []
+        stale: List[int] = []
+        touched: List[int] = []
+        for i, product in enumerate(products):
+            entry = entries.get(product.universal_storage.universal_storage_id)
+            state = self._entry_state(product, entry, file_stats, fresh_after)
+            results.append(entry.is_valid if state == _ACTUAL else None)
+            if state == _STALE:
+                stale.append(i)
+            elif state == _TOUCHED:
+                touched.append(i)
+
+        if touched:
+            same_content = await asyncio.to_thread(
+                self._checksums_match, [products[i] for i in touched], status
+            )
+            for i, same in zip(touched, same_content):
+                if same:
+                    results[i] = entries[products[i].universal_storage.universal_storage_id].is_valid
+                else:
+                    stale.append(i)
+
+        if not stale:
+            if make_commit:
+                await self.session_db.commit()
+            return results
+
+        sem = asyncio.Semaphore(SEMAPHORE_LIMIT_DECRYPT)
+
+        async def check(product: ProductUniversalFull) -> bool:
+            async with sem:
+                ok = await self.check_valid_universal_product(product, status)
+                if ok and not (await asyncio.to_thread(self._checksums_match, [product], status))[0]:
+                    self.logger.warning(
+                        "Содержимое файла универсального товара не совпадает с checksum: universal_storage_id=%s",
+                        product.universal_storage.universal_storage_id,
+                    )
+                    return False
+                return ok
+
+        checks = await asyncio.gather(*(check(products[i]) for i in stale), return_exceptions=True)
+
+        new_entries = []
+        for i, ok in zip(stale, checks):
+            if isinstance(ok, Exception):
+                self.logger.exception("Ошибка проверки универсального товара: %s", ok)
+                ok = False
+
+            results[i] = ok
+            storage = products[i].universal_storage
+            new_entries.append({
+                "universal_storage_id": storage.universal_storage_id,
+                "checksum": storage.checksum,
+                "file_size": sizes.get(storage.universal_storage_id),
+                "is_valid": ok,
+            })
+
+        await self.integrity_repo.upsert_many(new_entries)
+        if make_commit:
+            await self.session_db.commit()
+
+        return results
+
+    async def record_integrity(
+        self,
+        universal_storage_id: int,
+        checksum: Optional[str],
+        file_path: Optional[str],
+        make_commit: bool = True,
+    ) -> None:
+        """
+        Запишет в индекс только что зашифрованный товар как валидный (используется при импорте)
+        :param file_path: Путь к зашифрованному файлу, если он есть
+        """
+        file_size = await asyncio.to_thread(os.path.getsize, file_path) if file_path else None
+        await self.integrity_repo.upsert_many([{
+            "universal_storage_id": universal_storage_id,
+            "checksum": checksum,
+            "file_size": file_size,
+            "is_valid": True,
+        }])
+        if make_commit:
+            await self.session_db.commit()
+
+    def _get_file_stats(
+        self,
+        products: List[ProductUniversalFull],
+        status: StorageStatus,
+    ) -> Dict[int, Tuple[int, datetime]]:
+        """
+        :return: Dict(universal_storage_id, (размер файла, mtime)). Товаров без файла или с отсутствующим файлом нет
+        """
+        stats = {}
+        for product in products:
+            if not product.universal_storage.original_filename:
+                continue
+
+            path = self.path_builder.build_path_universal_storage(
+                status=status,
+                uuid=product.universal_storage.storage_uuid,
+            )
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            stats[product.universal_storage.universal_storage_id] = (
+                stat.st_size, datetime.fromtimestamp(stat.st_mtime, timezone.utc)
+            )
+        return stats
+
+    def _checksums_match(self, products: List[ProductUniversalFull], status: StorageStatus) -> List[bool]:
+        """
+        Сверит SHA256 зашифрованных файлов с checksum хранилищ (блокирующее чтение файлов).
+        Товары без файла или без checksum считаются совпавшими, отсутствующий файл — нет.
+        """
+        result = []
+        for product in products:
+            storage = product.universal_storage
+            if not storage.original_filename or not storage.checksum:
+                result.append(True)
+                continue
+
+            path = self.path_builder.build_path_universal_storage(status=status, uuid=storage.storage_uuid)
+            try:
+                result.append(sha256_file(path) == storage.checksum)
+            except OSError:
+                result.append(False)
+        return result
+
+    @staticmethod
+    def _entry_state(
+        product: ProductUniversalFull,
+        entry: Optional[UniversalIntegrityDTO],
+        file_stats: Dict[int, Tuple[int, datetime]],
+        fresh_after: datetime,
+    ) -> str:
+        """
+        :return: _ACTUAL - записи можно доверять; _TOUCHED - файл изменялся после проверки при том же размере,
+        нужно сверить хэш содержимого; _STALE - нужно полное дешифрование
+        """
+        if entry is None or entry.verified_at < fresh_after:
+            return _STALE
+
+        storage = product.universal_storage
+        if entry.checksum != storage.checksum:
+            return _STALE
+
+        if not storage.original_filename:
+            return _ACTUAL
+
+        size, mtime = file_stats.get(storage.universal_storage_id, (None, None))
+        if size is None or size != entry.file_size:
+            return _STALE
+
+        return _TOUCHED if mtime > entry.verified_at else _ACTUAL
 
 
     async def check_valid_universal_product(
@@ -30,54 +236,40 @@ class ValidationsUniversalProducts:
         :param status: Статус товара в пути хранения. Будет использовать этот статус для поиска файла товара
         """
         # если есть файл проверяем, что мы можем его дешифровать
-        crypto = self.crypto_provider.get()
+        storage = product.universal_storage
 
         try:
-            if product.universal_storage.original_filename:
+            if storage.original_filename:
                 # Расшифровываем DEK (account_key)
-                key = unwrap_dek(
-                    encrypted_data_b64=product.universal_storage.encrypted_key,
-                    nonce_b64=product.universal_storage.encrypted_key_nonce,
-                    kek=crypto.kek
-                )
+                key = self.crypto_service.unwrap_storage(storage)
                 abs_path = self.path_builder.build_path_universal_storage(
                     status=status,
                     uuid=product.universal_storage.storage_uuid,
                     as_path=True
                 ).resolve()
 
-                decrypt_file_to_bytes(str(abs_path), key)  # Расшифровываем архив DEK-ом
+                verify_encrypted_file(str(abs_path), key)  # Проверяем, что архив расшифровывается DEK-ом
         except Exception as e:
             self.logger.exception(f"Ошибка дешифрования файла универсального товара: {e}")
             return False
 
         try:
-            if product.universal_storage.encrypted_tg_file_id:
-                key = unwrap_dek(
-                    encrypted_data_b64=product.universal_storage.encrypted_key,
-                    nonce_b64=product.universal_storage.encrypted_key_nonce,
-                    kek=crypto.kek
-                )
-                decrypt_text(
-                    encrypted_data_b64=product.universal_storage.encrypted_tg_file_id,
-                    nonce_b64=product.universal_storage.encrypted_tg_file_id_nonce,
-                    dek=key
+            if storage.encrypted_tg_file_id:
+                self.crypto_service.decrypt_text(
+                    storage,
+                    encrypted_data_b64=storage.encrypted_tg_file_id,
+                    nonce_b64=storage.encrypted_tg_file_id_nonce,
                 )
         except Exception as e:
             self.logger.exception(f"Ошибка дешифрования данных 1 универсального товара: {e}")
             return False
 
         try:
-            if product.universal_storage.encrypted_description:
-                key = unwrap_dek(
-                    encrypted_data_b64=product.universal_storage.encrypted_key,
-                    nonce_b64=product.universal_storage.encrypted_key_nonce,
-                    kek=crypto.kek
-                )
-                decrypt_text(
-                    encrypted_data_b64=product.universal_storage.encrypted_description,
-                    nonce_b64=product.universal_storage.encrypted_description_nonce,
-                    dek=key
+            if storage.encrypted_description:
+                self.crypto_service.decrypt_text(
+                    storage,
+                    encrypted_data_b64=storage.encrypted_description,
+                    nonce_b64=storage.encrypted_description_nonce,
                 )
         except Exception as e:
             self.logger.exception(f"Ошибка дешифрования данных 2 универсального товара: {e}")
@@ -0,0 +1,57 @@
+from datetime import datetime, timezone
+from logging import Logger
+
+from src.application.products.universals.use_cases.validations import ValidationsUniversalProducts
+from src.config import Config
+from src.database.models.categories import StorageStatus
+from src.repository.database.categories import UniversalIntegrityRepository, ProductUniversalRepository
+
+
+class VerifyUniversalIntegrityUseCase:
+    """
+    Фоновая проверка универсальных товаров на продаже.
+    Дешифрует товары с устаревшей записью в индексе целостности (или без неё) и обновляет индекс,
+    чтобы при покупке проверка выполнялась по индексу без дешифрования.
+    """
+
+    def __init__(
+        self,
+        integrity_repo: UniversalIntegrityRepository,
+        product_repo: ProductUniversalRepository,
+        validations_universal_products: ValidationsUniversalProducts,
+        conf: Config,
+        logger: Logger,
+    ):
+        self.integrity_repo = integrity_repo
+        self.product_repo = product_repo
+        self.validations_universal_products = validations_universal_products
+        self.conf = conf
+        self.logger = logger
+
+    async def execute(self) -> int:
+        """
+        :return: Число проверенных товаров
+        """
+        # обновляем записи чуть раньше истечения, чтобы покупка не застала их устаревшими
+        ttl = self.conf.different.universal_integrity_ttl
+        verified_before = datetime.now(timezone.utc) - ttl / 2
+
+        product_ids = await self.integrity_repo.get_stale_product_ids(
+            verified_before=verified_before,
+            limit=self.conf.different.universal_integrity_batch,
+        )
+        if not product_ids:
+            return 0
+
+        products = await self.product_repo.get_full_by_ids(product_ids, language=self.conf.app.default_lang)
+        results = await self.validations_universal_products.check_valid_universal_products(
+            products,
+            StorageStatus.FOR_SALE,
+            stale_before=verified_before,
+        )
+
+        invalid = [p.product_universal_id for p, ok in zip(products, results) if not ok]
+        if invalid:
+            self.logger.warning("Найдены невалидные универсальные товары на продаже: %s", invalid)
+
+        return len(products)
@@ -1,7 +1,7 @@
 from typing import Optional, Callable
 
 from src.config.base import init_env
-from src.config.db_conf import DbConnectionSettings
+from src.config.db_conf import DbConnectionSettings, DbEngineProfile
 from src.config.env_conf import EnvSettings, Mode
 from src.config.app_conf import AppConfig
 from src.config.file_keys_conf import FileKeysConf, FilePathAndKey
@@ -9,7 +9,7 @@ from src.config.message_event_conf import MessageEventConf
 from src.config.miscellaneous_conf import MiscellaneousConf
 from src.config.paths_conf import PathSettings
 from src.config.redis_conf import RedisTimeStorage
-from src.config.secrets_conf import load_secrets
+from src.config.secrets_conf import load_secrets, SECRET_NAMES
 from src.config.sizes_conf import FileLimits
 
 
@@ -20,6 +20,7 @@ class RuntimeConfig:
         init_env()
         self.env = EnvSettings.from_env()
         self.paths = PathSettings.build(self.env.use_secret_storage, self.env.cert_dir)
+        self.different = MiscellaneousConf()
 
 
 class Config:
@@ -39,7 +40,9 @@ class Config:
             db_user=self.env.db_user,
             db_password=self.secrets.db_password,
             db_host=self.env.db_host,
-            db_name=self.env.db_name
+            db_name=self.env.db_name,
+            profile=DbEngineProfile(pgbouncer=self.env.db_pgbouncer),
+            replica_host=self.env.db_replica_host,
         )
         self.file_keys = FileKeysConf(
             example_zip_for_universal_import_key=FilePathAndKey(
@@ -1,13 +1,89 @@
+from typing import Optional, Any, Dict
+from uuid import uuid4
+
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 
+from src.infrastructure.database import PoolMetrics, MeteredAsyncQueuePool
+
+
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid4()}__"
+
+
+class DbEngineProfile(BaseModel):
+    """
+    Настройки пула соединений и подготовленных запросов для engine.
+
+    asyncpg выполняет каждый запрос через prepare(), SQLAlchemy кэширует подготовленные запросы
+    на каждом соединении (`statement_cache_size`), поэтому повторные запросы не разбираются сервером заново.
+
+    В режиме `pgbouncer` (transaction pooling) одно клиентское соединение попадает на разные серверные,
+    и подготовленный на одном сервере запрос на другом не существует. Поэтому кэш подготовленных запросов
+    отключается, а имена запросов делаются уникальными, чтобы не пересекаться с чужими на том же сервере.
+    Кэш скомпилированного SQL самой SQLAlchemy при этом продолжает работать.
+    """
+    pool_size: int = 20 # постоянные соединения пула
+    max_overflow: int = 10 # временные соединения сверх pool_size под пиковую нагрузку
+    pool_timeout: float = 10 # секунды ожидания свободного соединения, после чего будет TimeoutError
+    pool_recycle: int = 1800 # секунды, после которых соединение переоткрывается (раньше idle-таймаутов сервера и прокси)
+    pool_pre_ping: bool = True # проверка соединения перед выдачей из пула, отсекает разорванные сервером
+    statement_cache_size: int = 500 # подготовленных запросов, кэшируемых на одно соединение
+    pgbouncer: bool = False # подключение через PgBouncer в режиме transaction pooling
+
+    def connect_args(self) -> Dict[str, Any]:
+        if self.pgbouncer:
+            return {
+                "statement_cache_size": 0, # кэш самого asyncpg
+                "prepared_statement_cache_size": 0, # кэш диалекта SQLAlchemy
+                "prepared_statement_name_func": _unique_statement_name,
+            }
+
+        return {
+            "statement_cache_size": 0, # диалект SQLAlchemy всегда готовит запросы сам, кэш asyncpg не используется
+            "prepared_statement_cache_size": self.statement_cache_size,
+        }
+
+    def engine_kwargs(self) -> Dict[str, Any]:
+        return {
+            "poolclass": MeteredAsyncQueuePool,
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+            "pool_pre_ping": self.pool_pre_ping,
+            "connect_args": self.connect_args(),
+        }
+
+
+def build_engine(sql_db_url: str, profile: DbEngineProfile, metrics: Optional[PoolMetrics] = None) -> AsyncEngine:
+    engine = create_async_engine(sql_db_url, **profile.engine_kwargs())
+    if metrics is not None:
+        metrics.install(engine)
+    return engine
+
+
+def _build_session_local(engine: AsyncEngine) -> sessionmaker:
+    return sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False
+    )
+
 
 class DbConnectionSettings(BaseModel):
     postgres_server_url: str
     sql_db_url: str
     engine: AsyncEngine
     session_local: sessionmaker
+    pool_metrics: PoolMetrics
+
+    # реплика только для чтения, None если не настроена (тогда всё читается с основной БД)
+    read_engine: Optional[AsyncEngine] = None
+    read_session_local: Optional[sessionmaker] = None
+    read_pool_metrics: Optional[PoolMetrics] = None
 
 
     model_config = ConfigDict(
@@ -15,21 +91,48 @@ class DbConnectionSettings(BaseModel):
     )
 
     @classmethod
-    def create(cls, db_user: str, db_password: str, db_host: str, db_name: str) -> "DbConnectionSettings":
+    def create(
+        cls,
+        db_user: str,
+        db_password: str,
+        db_host: str,
+        db_name: str,
+        profile: Optional[DbEngineProfile] = None,
+        replica_host: Optional[str] = None,
+    ) -> "DbConnectionSettings":
+        profile = profile or DbEngineProfile()
+
         # postgresql+asyncpg это означает, что БД работает в асинхронном режиме
         sql_db_url = f'postgresql+asyncpg://{db_user}:{db_password}@{db_host}/{db_name}'
-        engine = create_async_engine(sql_db_url, connect_args={"statement_cache_size": 0})
+        pool_metrics = PoolMetrics()
+        engine = build_engine(sql_db_url, profile, pool_metrics)
+
+        read_engine = None
+        read_session_local = None
+        read_pool_metrics = None
+        if replica_host:
+            read_pool_metrics = PoolMetrics()
+            read_engine = build_engine(
+                f'postgresql+asyncpg://{db_user}:{db_password}@{replica_host}/{db_name}',
+                profile,
+                read_pool_metrics,
+            )
+            read_session_local = _build_session_local(read_engine)
+
         return cls(
             # URL для подключения к серверу PostgreSQL без указания конкретной базы данных
             postgres_server_url=f'postgresql+asyncpg://{db_user}:{db_password}@{db_host}/postgres',
 
             sql_db_url=sql_db_url,
             engine=engine,
-            session_local = sessionmaker(
-                engine,
-                class_=AsyncSession,
-                expire_on_commit=False,
-                autoflush=False
-            )
-
+            session_local=_build_session_local(engine),
+            pool_metrics=pool_metrics,
+            read_engine=read_engine,
+            read_session_local=read_session_local,
+            read_pool_metrics=read_pool_metrics,
         )
+
+    async def dispose(self):
+        await self.engine.dispose()
+        if self.read_engine is not None:
+            await self.read_engine.dispose()
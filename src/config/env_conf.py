@@ -23,6 +23,8 @@ class EnvSettings(BaseModel):
     db_host: str
     db_user: str
     db_name: str
+    db_replica_host: Optional[str] = None # реплика для чтения истории и статистики
+    db_pgbouncer: bool = False # подключение к БД идёт через PgBouncer (transaction pooling)
 
     mode: Mode
 
@@ -34,6 +36,8 @@ class EnvSettings(BaseModel):
         use_secret_storage_str = os.getenv('USE_SECRET_STORAGE')
         use_secret_storage_str = use_secret_storage_str.lower() if use_secret_storage_str else False
         use_secret_storage = True if use_secret_storage_str == "true" else False
+        db_pgbouncer_str = os.getenv('DB_PGBOUNCER')
+        db_pgbouncer = True if db_pgbouncer_str and db_pgbouncer_str.lower() == "true" else False
 
         return cls(
             main_admin=int(os.environ["MAIN_ADMIN"]),
@@ -45,6 +49,8 @@ class EnvSettings(BaseModel):
             db_host=os.getenv('DB_HOST'),
             db_user=os.getenv('DB_USER'),
             db_name=os.getenv('DB_NAME'),
+            db_replica_host=os.getenv('DB_REPLICA_HOST') or None,
+            db_pgbouncer=db_pgbouncer,
             use_secret_storage=use_secret_storage,
             cert_dir=os.getenv('CERT_DIR')
         )
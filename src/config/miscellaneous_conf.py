@@ -1,4 +1,5 @@
 from asyncio import Semaphore
+from datetime import timedelta
 
 from pydantic import BaseModel, ConfigDict
 
@@ -10,8 +11,40 @@ class MiscellaneousConf(BaseModel):
     fetch_interval: int = 7200  # 2 часа (для обновления курса доллара)
     semaphore_mailing_limit: Semaphore = Semaphore(15)
     semaphore_mailing_limit_in_int: int = 15
+    mailing_batch_size: int = 100 # пользователей в одной пачке рассылки, после каждой пачки сохраняется курсор
+    mailing_retry_attempts: int = 3 # повторные отправки пользователю после RetryAfter от Telegram
+    suppression_flush_window: float = 1.0 # секунды, за которые копятся пользователи, заблокировавшие бота, перед записью в БД
     rate_send_msg_limit: int = 25
+    rate_send_log_limit: int = 20 # сообщений в минуту в канал логов (отдельный бюджет бота логов)
+    rate_send_chat_limit: float = 1.0 # сообщений в секунду в один личный чат
+    rate_send_chat_burst: int = 3 # сообщений подряд в один чат без ожидания
+    rate_send_group_limit: int = 20 # сообщений в минуту в одну группу или канал (в том числе канал логов)
+    log_aggregate_window: float = 2.0 # секунды, за которые логи для канала собираются в одно сообщение
     page_size: int = 6
     backup_retention_count: int = 14
+    backup_progress_interval: float = 30 # секунды между записями хода бэкапа в BackupLogs
+    local_cache_max_items: int = 4096 # максимум объектов в L1-кэше процесса
+    file_io_workers: int = 8 # потоки под перемещение файлов при финализации покупок
+    cache_refresh_window: float = 0.5 # секунды, за которые схлопываются обновления кэша товаров после покупок
+    universal_integrity_ttl: timedelta = timedelta(hours=6) # сколько доверяем индексу целостности без повторного дешифрования
+    universal_integrity_batch: int = 200 # товаров за один проход фоновой проверки целостности
+    warmup_pipeline_size: int = 1000 # максимум команд в одном pipeline при прогреве кэша
+    cache_warmup_lock_ttl: int = 900 # секунды, на которые реплика занимает прогрев кэша
+    rabbit_prefetch_count: int = 64 # максимум неподтверждённых сообщений RabbitMQ на consumer
+    rabbit_workers: int = 16 # параллельные обработчики событий
+    rabbit_message_workers: int = 4 # отдельные обработчики событий message.* (отправка логов в Telegram)
+    rabbit_stats_interval: float = 60 # секунды между записями статистики consumer в лог
+    rabbit_publish_buffer: int = 10000 # максимум событий в буфере producer, сверх него события пишутся в файл
+    rabbit_publish_batch: int = 200 # событий в одной пачке с подтверждением брокера
+    rabbit_publish_interval: float = 0.05 # секунды накопления пачки событий
+    db_pool_stats_interval: float = 60 # секунды между записями статистики пула соединений БД в лог
+    discount_expiry_batch: int = 1000 # промокодов/ваучеров, деактивируемых одним запросом
+    discount_expiry_lock_ttl: int = 300 # секунды, на которые реплика занимает деактивацию истёкших скидок
+    secrets_fetch_concurrency: int = 8 # одновременных запросов к сервису хранения при загрузке пачки секретов
+    dek_cache_max_items: int = 1024 # расшифрованных DEK товаров в памяти процесса
+    dek_cache_ttl: float = 300 # секунды жизни расшифрованного DEK товара в кэше
+    import_encrypt_workers: int = 4 # процессов для шифрования аккаунтов при массовом импорте
+    import_progress_interval: float = 3 # секунды между сообщениями админу о ходе импорта
+    secrets_cache_ttl: int = 3600 # секунды, которые секреты запуска берутся из локального кэша (0 отключает кэш)
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -13,6 +13,8 @@ class PathSettings(BaseModel):
 
     log_dir: Path
     log_file: Path
+    rabbit_spill_file: Path
+    secrets_cache_file: Path
 
     files_dir: Path
 
@@ -63,6 +65,8 @@ class PathSettings(BaseModel):
             media_dir=media,
             log_dir=media / Path("logs"),
             log_file=media / Path("logs") / Path("auto_shop_bot.log"),
+            rabbit_spill_file=media / Path("spill") / Path("rabbit_events.jsonl"),
+            secrets_cache_file=media / Path("cache") / Path("secrets.enc"),
             files_dir=files_dir,
             products_dir=products,
             accounts_dir=products / Path("accounts"),
@@ -11,6 +11,7 @@ class RedisTimeStorage(BaseModel):
     sold_universal_account_product_by_owner: timedelta
     sold_universal_product_by_product: timedelta
     all_voucher: timedelta
+    local_cache: timedelta  # время жизни объекта в L1-кэше процесса
 
     @classmethod
     def build(cls) -> "RedisTimeStorage":
@@ -21,5 +22,6 @@ class RedisTimeStorage(BaseModel):
             sold_account_by_account = timedelta(hours=6),
             sold_universal_account_product_by_owner = timedelta(hours=6),
             sold_universal_product_by_product = timedelta(hours=6),
-            all_voucher = timedelta(hours=10)
+            all_voucher = timedelta(hours=10),
+            local_cache = timedelta(minutes=5),
         )
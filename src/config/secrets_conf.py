@@ -9,11 +9,14 @@ class SecretSettings(BaseModel):
     db_password: str
 
 
+# имена в сервисе хранения (и в .env без него), загружаются при запуске одной пачкой
+SECRET_NAMES = {
+    "token_bot": "TOKEN_BOT",
+    "token_logger_bot": "TOKEN_LOGGER_BOT",
+    "token_crypto_bot": "TOKEN_CRYPTO_BOT",
+    "db_password": "DB_PASSWORD",
+}
+
 
 def load_secrets(get_secret: Callable[[str], str]) -> SecretSettings:
-    return SecretSettings(
-        token_bot=get_secret("TOKEN_BOT"),
-        token_logger_bot=get_secret("TOKEN_LOGGER_BOT"),
-        token_crypto_bot=get_secret("TOKEN_CRYPTO_BOT"),
-        db_password=get_secret("DB_PASSWORD"),
-    )
\ No newline at end of file
+    return SecretSettings(**{field: get_secret(name) for field, name in SECRET_NAMES.items()})
\ No newline at end of file
@@ -1,20 +1,28 @@
-from typing import Callable, AsyncGenerator
+import asyncio
+from contextlib import asynccontextmanager
+from logging import Logger
+from typing import Callable, AsyncGenerator, AsyncIterator, Dict, List, Optional, Set
 
 import aiohttp
 
+from src.application.bot.log_aggregator import LogAggregator
+from src.application.bot.suppression_recorder import SuppressionRecorder
+from src.application.cache_warmup import CacheRefreshScheduler
 from src.application.crypto.crypto_context import CryptoProvider, InitCryptoContext
-from src.application.crypto.secrets_storage import GetSecret
+from src.application.crypto.crypto_service import CryptoService
+from src.application.crypto.secrets_storage import GetSecret, PrefetchSecrets
 from src.config import init_config
 from src.config import RuntimeConfig
 from src.containers import RequestContainer, init_request_container
 from src.infrastructure.crypto.key_store import KeyStore
-from src.infrastructure.crypto.secret_storage.client import SecretsStorageClient
-from src.infrastructure.crypto.secret_storage.http_secrets_storage import HttpSecretsStorage
-from src.infrastructure.crypto.secret_storage.secrets_storage import SecretsStorage
+from src.infrastructure.crypto.secret_storage.cached_secrets_storage import CachedSecretsStorage, \
+    EncryptedSecretsCache
+from src.infrastructure.crypto.secret_storage.factory import build_async_secrets_storage
+from src.infrastructure.crypto.secret_storage.secrets_storage import SecretsStorage, AsyncSecretsStorage
 from src.infrastructure.crypto_bot.core import init_crypto_bot_provider
 from src.infrastructure.rabbit_mq.consumer import RabbitMQConsumer
 from src.infrastructure.rabbit_mq.producer import RabbitMQProducer
-from src.infrastructure.redis import init_redis, close_redis
+from src.infrastructure.redis import init_redis, close_redis, LocalCache
 from src.infrastructure.telegram.account_client import TelegramAccountClient
 from src.infrastructure.telegram.bot_instance import init_bot, init_bot_logger, init_dispatcher
 from src.infrastructure.telegram.bot_client import TelegramClient
@@ -25,23 +33,22 @@ from src.infrastructure.logger.core_logger import setup_logging
 
 class AppContainer:
 
-    def __init__(self):
-
-        runtime_conf = RuntimeConfig()
-        secret_client = SecretsStorageClient(
-            base_url=runtime_conf.env.storage_server_url,
-            cert=(
-                str(runtime_conf.paths.ssl_client_cert_file),
-                str(runtime_conf.paths.ssl_client_key_file),
-            ),
-            ca=runtime_conf.paths.ssl_ca_file,
-        )
-        self.secret_storage: SecretsStorage = HttpSecretsStorage(secret_client) # используется адаптер
-        self.logger = setup_logging(runtime_conf.paths.log_file)
+    def __init__(
+        self,
+        runtime_conf: RuntimeConfig,
+        logger: Logger,
+        http_session: aiohttp.ClientSession,
+        secret_storage: AsyncSecretsStorage,
+        startup_secrets: SecretsStorage,
+    ):
+        """Создавать через AppContainer.create(): секреты запуска загружаются заранее и асинхронно"""
+        self.http_session = http_session
+        self.secret_storage = secret_storage
+        self.logger = logger
         self.crypto_provider = CryptoProvider()
 
         init_crypto_context = InitCryptoContext(
-            storage=self.secret_storage,
+            storage=startup_secrets,
             keystore=KeyStore(),
             logger=self.logger,
             runtime_conf=runtime_conf
@@ -50,14 +57,25 @@ class AppContainer:
         self.crypto_provider.set(self._crypto_context)  # ИСПОЛЬЗОВАТЬ ТОЛЬКО ЕГО ДЛЯ ШИФРОВАНИЯ И ДЕШИФРОВАНИЯ
 
         get_secret = GetSecret(
-            storage=self.secret_storage,
+            storage=startup_secrets,
             crypto_provider=self.crypto_provider,
             logger=self.logger,
             runtime_conf=runtime_conf
         )
 
         self.conf = init_config(get_secret.execute)
+        self.crypto_service = CryptoService(
+            self.crypto_provider,
+            max_items=self.conf.different.dek_cache_max_items,
+            ttl=self.conf.different.dek_cache_ttl,
+        )
         self.redis = init_redis(self.conf)
+        self.local_cache = LocalCache(
+            redis_session=self.redis,
+            max_items=self.conf.different.local_cache_max_items,
+            ttl=self.conf.redis_time_storage.local_cache.total_seconds(),
+            logger=self.logger,
+        )
         self.crypto_bot_provider = init_crypto_bot_provider(self.conf.secrets.token_crypto_bot)
 
         self.bot = init_bot(self.conf)
@@ -66,38 +84,133 @@ class AppContainer:
         self.dp_bot = init_dispatcher()
         self.dp_bot_logger = init_dispatcher()
 
-        self.telegram_bot_client = TelegramClient(bot=self.bot)
-        self.telegram_bot_logger_client = TelegramClient(bot=self.bot_logger)
+        # у каждого бота свой лимит Telegram, поэтому и свой лимитер.
+        # Бот логов отправляет по своему бюджету в минуту и не занимает лимит сообщений пользователям
+        self.rate_limiter = self._init_rate_limiter(self.conf.different.rate_send_msg_limit, period=1.0)
+        self.log_rate_limiter = self._init_rate_limiter(self.conf.different.rate_send_log_limit, period=60.0)
+
+        self.suppression_recorder = SuppressionRecorder(
+            save=self._save_suppressed_recipients,
+            logger=self.logger,
+            window=self.conf.different.suppression_flush_window,
+        )
+
+        self.telegram_bot_client = TelegramClient(
+            bot=self.bot,
+            on_retry_after=lambda seconds, chat_id: self.rate_limiter.pause(seconds, chat_id=chat_id),
+            on_unreachable=self.suppression_recorder.mark,
+        )
+        self.telegram_bot_logger_client = TelegramClient(
+            bot=self.bot_logger,
+            on_retry_after=lambda seconds, chat_id: self.log_rate_limiter.pause(seconds, chat_id=chat_id),
+        )
         self.telegram_account_client = TelegramAccountClient(self.logger)
 
         self.consumer = RabbitMQConsumer(self.handle_event, conf=self.conf, logger=self.logger)
         self.rabbit_producer = RabbitMQProducer(
             url=self.conf.env.rabbitmq_url,
             logger=self.logger,
+            buffer_size=self.conf.different.rabbit_publish_buffer,
+            batch_size=self.conf.different.rabbit_publish_batch,
+            flush_interval=self.conf.different.rabbit_publish_interval,
+            spill_file=self.conf.paths.rabbit_spill_file,
         )
 
-        self.http_session = aiohttp.ClientSession()
+        self.log_aggregator = LogAggregator(
+            deliver=self._deliver_logs,
+            logger=self.logger,
+            window=self.conf.different.log_aggregate_window,
+        )
 
-        self.rate_limiter = RateLimiter(
-            max_calls=self.conf.different.rate_send_msg_limit,
-            period=1.0,
+        self.cache_refresh_scheduler = CacheRefreshScheduler(
+            refresh=self._refresh_products_cache,
+            logger=self.logger,
+            window=self.conf.different.cache_refresh_window,
+        )
+        self._resume_mailing_task: Optional[asyncio.Task] = None
+        self._pool_stats_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    async def create(cls) -> "AppContainer":
+        """
+        Глобальный DEK и секреты конфига загружаются из сервиса хранения одной параллельной пачкой,
+        а при свежем локальном кэше (зашифрован KEK) без запросов вовсе.
+        """
+        runtime_conf = RuntimeConfig()
+        logger = setup_logging(runtime_conf.paths.log_file)
+        http_session = aiohttp.ClientSession()
+
+        secret_storage = build_async_secrets_storage(
+            runtime_conf.env.storage_server_url,
+            runtime_conf.paths,
+            http_session,
+            max_concurrency=runtime_conf.different.secrets_fetch_concurrency,
+        )
+        startup_storage = secret_storage
+        if runtime_conf.env.use_secret_storage and runtime_conf.different.secrets_cache_ttl > 0:
+            startup_storage = CachedSecretsStorage(
+                secret_storage,
+                EncryptedSecretsCache(
+                    path=runtime_conf.paths.secrets_cache_file,
+                    kek=KeyStore().load_kek(),
+                    ttl=runtime_conf.different.secrets_cache_ttl,
+                    logger=logger,
+                ),
+            )
+
+        try:
+            startup_secrets = await PrefetchSecrets(startup_storage, logger, runtime_conf).execute()
+        except BaseException:
+            await http_session.close()
+            raise
+
+        return cls(runtime_conf, logger, http_session, secret_storage, startup_secrets)
+
+    def _init_rate_limiter(self, max_calls: int, period: float) -> RateLimiter:
+        return RateLimiter(
+            max_calls=max_calls,
+            period=period,
+            chat_rate=self.conf.different.rate_send_chat_limit,
+            chat_burst=self.conf.different.rate_send_chat_burst,
+            group_rate_per_minute=self.conf.different.rate_send_group_limit,
         )
 
     async def start(self):
+        self.local_cache.start_listener()
         await self.rabbit_producer.connect()
         await self.consumer.start()
+        self._resume_mailing_task = asyncio.create_task(self._resume_mass_mailings())
+        self._pool_stats_task = asyncio.create_task(self._log_pool_stats_loop())
 
     async def shutdown(self):
+        # курсор рассылки сохранён после последней пачки, она продолжится при следующем запуске
+        for task in (self._resume_mailing_task, self._pool_stats_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
         await self.consumer.stop()
+        await self.cache_refresh_scheduler.stop()
+        await self.log_aggregator.stop()
+        await self.suppression_recorder.stop()
+        await self.rabbit_producer.close()
+        await self.local_cache.stop_listener()
         await close_redis(self.redis)
 
         if self.http_session:
             await self.http_session.close()
 
+        self._log_pool_stats()
+        await self.conf.db_connection.dispose()
+
 
-    def get_request_container(self, session_db) -> RequestContainer:
+    def get_request_container(self, session_db, read_session_db=None) -> RequestContainer:
         return init_request_container(
             session_db=session_db,
+            read_session_db=read_session_db,
             session_redis=self.redis,
             config=self.conf,
             logger=self.logger,
@@ -110,18 +223,106 @@ class AppContainer:
             producer=self.rabbit_producer,
             rate_limiter=self.rate_limiter,
             support_kb_builder=support_kb,
-            telegram_account_client=self.telegram_account_client
+            telegram_account_client=self.telegram_account_client,
+            local_cache=self.local_cache,
+            cache_refresh_scheduler=self.cache_refresh_scheduler,
+            log_rate_limiter=self.log_rate_limiter,
+            log_aggregator=self.log_aggregator,
+            crypto_service=self.crypto_service,
         )
 
+    @asynccontextmanager
+    async def request_scope(self) -> AsyncIterator[RequestContainer]:
+        """
+        Сессии БД и RequestContainer на один апдейт или запрос.
+        Сессия реплики открывается только если реплика настроена, соединение она берёт лишь при первом запросе.
+        """
+        db_connection = self.conf.db_connection
+
+        async with db_connection.session_local() as session_db:
+            if db_connection.read_session_local is None:
+                yield self.get_request_container(session_db)
+                return
+
+            async with db_connection.read_session_local() as read_session_db:
+                yield self.get_request_container(session_db, read_session_db)
+
     def get_request_container_factory(self) -> Callable[[], AsyncGenerator[RequestContainer, None]]:
-        async_session_factory = self.conf.db_connection.session_local
 
         async def factory() -> AsyncGenerator[RequestContainer, None]:
-            async with async_session_factory() as session_db:
-                yield self.get_request_container(session_db)
+            async with self.request_scope() as container:
+                yield container
 
         return factory
 
+    async def _refresh_products_cache(self, category_ids: Set[int], product_universal_ids: Set[int]):
+        async with self.request_scope() as container:
+            await container.refresh_products_cache(category_ids, product_universal_ids)
+
+    async def _deliver_logs(self, messages: List[str]):
+        async with self.request_scope() as container:
+            await container.get_message_service().send_log.deliver(messages)
+
+    async def _save_suppressed_recipients(self, reasons: Dict[int, str]):
+        async with self.request_scope() as container:
+            await container.suppressed_recipients_service.suppress_many(reasons, make_commit=True)
+
+    async def _resume_mass_mailings(self):
+        try:
+            async with self.request_scope() as container:
+                await container.get_message_service().mass_tg_mailing.resume_broadcasts()
+        except Exception as e:
+            self.logger.exception(f"Ошибка при продолжении прерванных рассылок: {str(e)}")
+
+    def _log_pool_stats(self):
+        db_connection = self.conf.db_connection
+        pools = [("primary", db_connection.pool_metrics), ("replica", db_connection.read_pool_metrics)]
+
+        for name, metrics in pools:
+            if metrics is None:
+                continue
+
+            stats = metrics.stats()
+            self.logger.info(
+                "[DbPool] %s: checkouts=%d in_use=%d max_in_use=%d timeouts=%d "
+                "wait avg=%.2f ms p99=%.2f ms max=%.2f ms hold avg=%.2f ms",
+                name,
+                stats.checkouts,
+                stats.in_use,
+                stats.max_in_use,
+                stats.timeouts,
+                stats.avg_wait_ms,
+                stats.p99_wait_ms,
+                stats.max_wait_ms,
+                stats.avg_hold_ms,
+            )
+
+        cache_stats = self.local_cache.stats()
+        self.logger.info(
+            "[LocalCache] hits=%d misses=%d evictions=%d stale_puts=%d size=%d",
+            cache_stats.hits,
+            cache_stats.misses,
+            cache_stats.evictions,
+            cache_stats.stale_puts,
+            cache_stats.size,
+        )
+
+        producer_stats = self.rabbit_producer.stats()
+        self.logger.info(
+            "[RabbitProducer] published=%d buffered=%d max_buffered=%d overflows=%d spilled=%d replayed=%d",
+            producer_stats.published,
+            producer_stats.buffered,
+            producer_stats.max_buffered,
+            producer_stats.overflows,
+            producer_stats.spilled,
+            producer_stats.replayed,
+        )
+
+    async def _log_pool_stats_loop(self):
+        while True:
+            await asyncio.sleep(self.conf.different.db_pool_stats_interval)
+            self._log_pool_stats()
+
     def _create_event_handler(self, session):
         container = self.get_request_container(session)
         return container.get_event_handler()
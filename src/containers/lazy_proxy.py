@@ -0,0 +1,34 @@
+from typing import Callable, Generic, TypeVar
+
+
+T = TypeVar("T")
+
+
+class LazyProxy(Generic[T]):
+    """
+    Откладывает создание объекта до первого обращения к его атрибуту.
+    Используется в middleware, чтобы модули, не нужные обработчику, не собирались вовсе.
+    """
+
+    __slots__ = ("_factory", "_instance")
+
+    def __init__(self, factory: Callable[[], T]):
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_instance", None)
+
+    def resolve(self) -> T:
+        instance = object.__getattribute__(self, "_instance")
+        if instance is None:
+            instance = object.__getattribute__(self, "_factory")()
+            object.__setattr__(self, "_instance", instance)
+        return instance
+
+    @property
+    def is_resolved(self) -> bool:
+        return object.__getattribute__(self, "_instance") is not None
+
+    def __getattr__(self, name: str):
+        return getattr(self.resolve(), name)
+
+    def __setattr__(self, name: str, value) -> None:
+        setattr(self.resolve(), name, value)
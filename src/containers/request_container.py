@@ -1,11 +1,13 @@
+from functools import cached_property
 from logging import Logger
-from typing import TYPE_CHECKING, Optional, Callable, Awaitable, Any
+from typing import TYPE_CHECKING, Optional, Callable, Awaitable, Any, Set
 
 from aiohttp import ClientSession
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.crypto.crypto_context import CryptoProvider
+from src.application.crypto.crypto_service import CryptoService
 from src.application.currenccy.update_dollare_rate import UpdateDollarRateUseCase
 from src.application.events.event_handlers.voucher import VoucherEventHandler
 from src.application.models.discounts.remove_invalid import RemoveInvalidDiscountsUseCase
@@ -21,10 +23,11 @@ from src.application.products.accounts.tg.use_cases.get_auth_codes import GetAut
 from src.application.products.accounts.tg.use_cases.validate import ValidateTgAccount
 from src.application.products.universals.universal_products import UniversalProduct
 from src.application.products.universals.use_cases import ValidationsUniversalProducts, \
-    GenerateExamplUniversalProductImport, UploadUniversalProductsUseCase, ImportUniversalProductUseCase
+    GenerateExamplUniversalProductImport, UploadUniversalProductsUseCase, ImportUniversalProductUseCase, \
+    VerifyUniversalIntegrityUseCase
 from src.application.utils.date_time_formatter import DateTimeFormatter
 from src.config import Config
-from src.infrastructure.crypto.secret_storage.secrets_storage import SecretsStorage
+from src.infrastructure.crypto.secret_storage.secrets_storage import AsyncSecretsStorage
 from src.infrastructure.crypto_bot.core import CryptoBotProvider
 from src.infrastructure.currency.cbr_client import CBRClient
 from src.infrastructure.currency.moex_client import MoexClient
@@ -32,13 +35,14 @@ from src.infrastructure.files.excel_reports import ExcelReportExporter
 from src.infrastructure.files.file_system import FileStorage
 from src.infrastructure.files.path_builder import PathBuilder
 from src.infrastructure.rabbit_mq.producer import RabbitMQProducer
+from src.infrastructure.redis import LocalCache
 from src.infrastructure.telegram.account_client import TelegramAccountClient
 from src.infrastructure.telegram.rate_limit import RateLimiter
 from src.repository.database.discount import VouchersRepository, VoucherActivationsRepository, PromoCodeRepository, \
     ActivatedPromoCodeRepository
 from src.repository.database.referrals import ReferralsRepository, ReferralIncomeRepository, ReferralLevelsRepository
 from src.repository.database.replanishments import ReplenishmentsRepository
-from src.application.cache_warmup import CacheWarmupService
+from src.application.cache_warmup import CacheWarmupService, CacheRefreshScheduler
 from src.application.events.event_handlers.file_system import FileSystemEventHandler
 from src.application.events.event_handlers.main_event_handler import EventHandler
 from src.application.events.event_handlers.message import MessageEventHandler
@@ -61,7 +65,7 @@ from src.application.models.modules import ProfileModule, AccountsModuls, Univer
 from src.repository.database.admins import (
     AdminActionsRepository,
     AdminsRepository,
-    MessageForSendingRepository, SentMasMessagesRepository,
+    MessageForSendingRepository, SentMasMessagesRepository, MassMailingJobsRepository,
 )
 from src.repository.database.base import DatabaseBase
 from src.repository.database.categories import (
@@ -76,6 +80,7 @@ from src.repository.database.categories import (
     DeletedUniversalRepository,
     ProductUniversalRepository,
     SoldUniversalRepository,
+    UniversalIntegrityRepository,
     UniversalStorageRepository,
     UniversalTranslationRepository,
     PurchaseRequestsRepository,
@@ -86,11 +91,13 @@ from src.repository.database.categories import (
 from src.repository.database.systems import (
     StickersRepository,
     UiImagesRepository, FilesRepository, SettingsRepository, TypePaymentsRepository, BackupLogsRepository,
+    StatisticsRollupRepository,
 )
 from src.repository.database.users import (
     BannedAccountsRepository,
     BalanceHolderRepository,
     NotificationSettingsRepository,
+    SuppressedRecipientsRepository,
     UserAuditLogsRepository,
     UsersRepository, TransferMoneysRepository, WalletTransactionRepository,
 )
@@ -100,7 +107,7 @@ from src.repository.redis import (
     StickersCacheRepository,
     SubscriptionCacheRepository,
     UiImagesCacheRepository,
-    UsersCacheRepository, SettingsCacheRepository, VouchersCacheRepository, PromoCodesCacheRepository,
+    UsersCacheRepository, UserContextCacheRepository, SettingsCacheRepository, VouchersCacheRepository, PromoCodesCacheRepository,
     ReferralLevelsCacheRepository, TypePaymentsCacheRepository, DollarRateCacheRepository,
     AccountsCacheRepository,
     CategoriesCacheRepository,
@@ -110,21 +117,23 @@ from src.repository.redis import (
     SoldUniversalSingleCacheRepository,
 )
 from src.application.bot import Messages, MassTgMailingService, SendFileService, SendLogs
+from src.application.bot.log_aggregator import LogAggregator
 from src.application.bot.edit_message import EditMessageService
 from src.application.bot.send_message import SendMessageService
 from src.application.bot.sticker_sender import StickerSender
 from src.application.events.publish_event_handler import PublishEventHandler
 from src.application.models.admins import AdminActionsService, AdminsService, MessageForSendingService, \
-    SentMassMessagesService
+    SentMassMessagesService, MassMailingJobsService
 from src.application.models.payment_services import PaymentService
 from src.application.models.referrals import ReferralService, ReferralIncomeService, ReferralLevelsService
 from src.application.models.systems import StickersService, UiImagesService, FilesService, SettingsService, \
-    TypesPaymentsService, BackupLogsService, StatisticsService, EventMessageService
+    TypesPaymentsService, BackupLogsService, StatisticsService, StatisticsRollupService, EventMessageService
 from src.application.models.users import (
     BannedAccountService,
     UserLogService,
+    UserContextService,
     UserService,
-    WalletTransactionService, MoneyTransferService, ReplenishmentsService,
+    WalletTransactionService, MoneyTransferService, ReplenishmentsService, SuppressedRecipientsService,
 )
 from src.application.models.users.notifications_service import NotificationSettingsService
 from src.application.models.users.permission_service import PermissionService
@@ -155,6 +164,10 @@ if TYPE_CHECKING:
 class RequestContainer:
     """
     Контейнер для сборки сервисного слоя. Вызывается строго только в middleware!
+
+    Зависимости создаются лениво при первом обращении к атрибуту и запоминаются
+    до конца жизни контейнера (одного апдейта), поэтому апдейт собирает только
+    ту часть графа, которая реально используется обработчиком.
     """
 
     def __init__(
@@ -168,13 +181,21 @@ class RequestContainer:
         telegram_logger_client: "TelegramClient",
         crypto_bot_provider: CryptoBotProvider,
         crypto_provider: CryptoProvider,
-        secret_storage: SecretsStorage,
+        secret_storage: AsyncSecretsStorage,
         producer: RabbitMQProducer,
         rate_limiter: RateLimiter,
         support_kb_builder: Callable[[str, str], Awaitable[Any]],
         telegram_account_client: TelegramAccountClient,
+        local_cache: Optional[LocalCache] = None,
+        cache_refresh_scheduler: Optional[CacheRefreshScheduler] = None,
+        log_rate_limiter: Optional[RateLimiter] = None,
+        log_aggregator: Optional[LogAggregator] = None,
+        read_session_db: Optional[AsyncSession] = None,
+        crypto_service: Optional[CryptoService] = None,
     ):
         self.session_db = session_db
+        # сессия реплики для чтения, где допустимо небольшое отставание; без реплики это та же основная сессия
+        self.read_session_db = read_session_db or session_db
         self.session_redis = session_redis
         self.config = config
         self.logger = logger
@@ -185,193 +206,351 @@ class RequestContainer:
         self.rate_limiter = rate_limiter
 
         self.crypto_provider = crypto_provider
+        # кэш расшифрованных ключей общий на процесс, без него (тесты, утилиты) свой на контейнер
+        self.crypto_service = crypto_service or CryptoService(
+            crypto_provider,
+            max_items=config.different.dek_cache_max_items,
+            ttl=config.different.dek_cache_ttl,
+        )
         self.secret_storage = secret_storage
         self.support_kb_builder = support_kb_builder
         self.telegram_account_client = telegram_account_client
+        self.crypto_bot_provider = crypto_bot_provider
+        self.local_cache = local_cache
+        self.app_cache_refresh_scheduler = cache_refresh_scheduler
+        self.log_rate_limiter = log_rate_limiter
+        self.log_aggregator = log_aggregator
 
-        self.dt_formatter = DateTimeFormatter(conf=self.config)
+    @cached_property
+    def dt_formatter(self) -> DateTimeFormatter:
+        return DateTimeFormatter(conf=self.config)
 
-        self.account_sold_service: Optional[AccountSoldService] = None
-
-        self.database_base = DatabaseBase(
-            session_db=session_db,
+    @cached_property
+    def database_base(self) -> DatabaseBase:
+        return DatabaseBase(
+            session_db=self.session_db,
             config=self.config,
         )
-        self.publish_event_handler = PublishEventHandler(
+
+    @cached_property
+    def publish_event_handler(self) -> PublishEventHandler:
+        return PublishEventHandler(
             producer=self.producer
         )
-        self.path_builder = PathBuilder(self.config)
-        self.file_storage = FileStorage()
 
-        self.wallet_transaction_repo = WalletTransactionRepository(
-            session_db=session_db,
+    @cached_property
+    def path_builder(self) -> PathBuilder:
+        return PathBuilder(self.config)
+
+    @cached_property
+    def file_storage(self) -> FileStorage:
+        return FileStorage()
+
+    @cached_property
+    def wallet_transaction_repo(self) -> WalletTransactionRepository:
+        return WalletTransactionRepository(
+            session_db=self.session_db,
+            config=self.config,
+        )
+
+    @cached_property
+    def wallet_transaction_read_repo(self) -> WalletTransactionRepository:
+        return WalletTransactionRepository(
+            session_db=self.read_session_db,
             config=self.config,
         )
-        self.wallet_transaction_service = WalletTransactionService(
+
+    @cached_property
+    def wallet_transaction_service(self) -> WalletTransactionService:
+        return WalletTransactionService(
             wallet_transaction=self.wallet_transaction_repo,
-            session_db=session_db,
+            session_db=self.session_db,
+            history_repo=self.wallet_transaction_read_repo,
         )
 
-        self.settings_repo = SettingsRepository(
-            session_db=session_db,
+    @cached_property
+    def settings_repo(self) -> SettingsRepository:
+        return SettingsRepository(
+            session_db=self.session_db,
             config=self.config,
         )
-        self.settings_cache_repo = SettingsCacheRepository(
+
+    @cached_property
+    def settings_cache_repo(self) -> SettingsCacheRepository:
+        return SettingsCacheRepository(
             redis_session=self.session_redis,
             config=self.config,
+            local_cache=self.local_cache,
         )
-        self.settings_service = SettingsService(
+
+    @cached_property
+    def settings_service(self) -> SettingsService:
+        return SettingsService(
             settings_repo=self.settings_repo,
             cache_repo=self.settings_cache_repo,
             conf=self.config,
-            session_db=session_db
+            session_db=self.session_db
         )
 
-        self.users_repo = UsersRepository(
-            session_db=session_db,
+    @cached_property
+    def users_repo(self) -> UsersRepository:
+        return UsersRepository(
+            session_db=self.session_db,
             config=self.config,
         )
-        self.user_log_repo = UserAuditLogsRepository(
-            session_db=session_db,
+
+    @cached_property
+    def user_log_repo(self) -> UserAuditLogsRepository:
+        return UserAuditLogsRepository(
+            session_db=self.session_db,
             config=self.config,
         )
-        self.notification_repo = NotificationSettingsRepository(
-            session_db=session_db,
+
+    @cached_property
+    def notification_repo(self) -> NotificationSettingsRepository:
+        return NotificationSettingsRepository(
+            session_db=self.session_db,
             config=self.config,
         )
-        self.banned_accounts_repo = BannedAccountsRepository(
-            session_db=session_db,
+
+    @cached_property
+    def banned_accounts_repo(self) -> BannedAccountsRepository:
+        return BannedAccountsRepository(
+            session_db=self.session_db,
             config=self.config,
         )
-        self.ui_image_repo = UiImagesRepository(
-            session_db=session_db,
+
+    @cached_property
+    def ui_image_repo(self) -> UiImagesRepository:
+        return UiImagesRepository(
+            session_db=self.session_db,
             config=self.config,
         )
 
-        self.stickers_repo = StickersRepository(
-            session_db=session_db,
+    @cached_property
+    def stickers_repo(self) -> StickersRepository:
+        return StickersRepository(
+            session_db=self.session_db,
             config=self.config,
         )
 
-        self.users_cache_repo = UsersCacheRepository(
+    @cached_property
+    def users_cache_repo(self) -> UsersCacheRepository:
+        return UsersCacheRepository(
             redis_session=self.session_redis,
             config=self.config,
         )
-        self.subscription_cache_repo = SubscriptionCacheRepository(
+
+    @cached_property
+    def subscription_cache_repo(self) -> SubscriptionCacheRepository:
+        return SubscriptionCacheRepository(
             redis_session=self.session_redis,
             config=self.config,
         )
-        self.banned_accounts_cache_repo = BannedAccountsCacheRepository(
+
+    @cached_property
+    def banned_accounts_cache_repo(self) -> BannedAccountsCacheRepository:
+        return BannedAccountsCacheRepository(
             redis_session=self.session_redis,
             config=self.config,
         )
-        self.ui_images_cache_repo = UiImagesCacheRepository(
+
+    @cached_property
+    def ui_images_cache_repo(self) -> UiImagesCacheRepository:
+        return UiImagesCacheRepository(
             redis_session=self.session_redis,
             config=self.config,
+            local_cache=self.local_cache,
         )
-        self.stickers_cache_repo = StickersCacheRepository(
+
+    @cached_property
+    def stickers_cache_repo(self) -> StickersCacheRepository:
+        return StickersCacheRepository(
             redis_session=self.session_redis,
             config=self.config,
+            local_cache=self.local_cache,
         )
 
-        self.admin_actions_repo = AdminActionsRepository(
-            session_db=session_db,
+    @cached_property
+    def admin_actions_repo(self) -> AdminActionsRepository:
+        return AdminActionsRepository(
+            session_db=self.session_db,
             config=self.config,
         )
-        self.message_for_sending_repo = MessageForSendingRepository(
-            session_db=session_db,
+
+    @cached_property
+    def message_for_sending_repo(self) -> MessageForSendingRepository:
+        return MessageForSendingRepository(
+            session_db=self.session_db,
             config=self.config,
         )
 
-        self.ui_images_service = UiImagesService(
+    @cached_property
+    def ui_images_service(self) -> UiImagesService:
+        return UiImagesService(
             ui_image_repo=self.ui_image_repo,
             cache_repo=self.ui_images_cache_repo,
             path_builder=self.path_builder,
-            session_db=session_db,
+            session_db=self.session_db,
         )
-        self.sent_mass_message_service = SentMassMessagesService(
+
+    @cached_property
+    def sent_mass_message_service(self) -> SentMassMessagesService:
+        return SentMassMessagesService(
             sent_msg_repo=SentMasMessagesRepository(
-                session_db=session_db,
+                session_db=self.session_db,
                 config=self.config,
             ),
-            session_db=session_db
+            session_db=self.session_db
         )
-        self.files_service = FilesService(
+
+    @cached_property
+    def mass_mailing_jobs_service(self) -> MassMailingJobsService:
+        return MassMailingJobsService(
+            jobs_repo=MassMailingJobsRepository(
+                session_db=self.session_db,
+                config=self.config,
+            ),
+            session_db=self.session_db
+        )
+
+    @cached_property
+    def files_service(self) -> FilesService:
+        return FilesService(
             files_repo=FilesRepository(
-                session_db=session_db,
+                session_db=self.session_db,
                 config=self.config,
             ),
-            session_db=session_db
+            session_db=self.session_db
         )
 
-        self.stickers_service = StickersService(
+    @cached_property
+    def stickers_service(self) -> StickersService:
+        return StickersService(
             sticker_repo=self.stickers_repo,
             cache_repo=self.stickers_cache_repo,
             conf=self.config,
-            session_db=session_db,
+            session_db=self.session_db,
         )
 
-        self.user_log_service = UserLogService(
+    @cached_property
+    def user_log_service(self) -> UserLogService:
+        return UserLogService(
             log_repo=self.user_log_repo,
-            session_db=session_db,
+            session_db=self.session_db,
         )
 
-        self.notification_service = NotificationSettingsService(
+    @cached_property
+    def notification_service(self) -> NotificationSettingsService:
+        return NotificationSettingsService(
             notif_repo=self.notification_repo,
-            session_db=session_db,
+            session_db=self.session_db,
         )
 
-        self.deleted_universal_repo = DeletedUniversalRepository(
+    @cached_property
+    def suppressed_recipients_service(self) -> SuppressedRecipientsService:
+        return SuppressedRecipientsService(
+            suppressed_repo=SuppressedRecipientsRepository(
+                session_db=self.session_db,
+                config=self.config,
+            ),
+            session_db=self.session_db,
+        )
+
+    @cached_property
+    def deleted_universal_repo(self) -> DeletedUniversalRepository:
+        return DeletedUniversalRepository(
             session_db=self.session_db,
             config=self.config,
         )
-        self.product_universal_repo = ProductUniversalRepository(
+
+    @cached_property
+    def product_universal_repo(self) -> ProductUniversalRepository:
+        return ProductUniversalRepository(
             session_db=self.session_db,
             config=self.config,
         )
-        self.sold_universal_repo = SoldUniversalRepository(
+
+    @cached_property
+    def sold_universal_repo(self) -> SoldUniversalRepository:
+        return SoldUniversalRepository(
+            session_db=self.session_db,
+            config=self.config,
+        )
+
+    @cached_property
+    def universal_storage_repo(self) -> UniversalStorageRepository:
+        return UniversalStorageRepository(
             session_db=self.session_db,
             config=self.config,
         )
-        self.universal_storage_repo = UniversalStorageRepository(
+
+    @cached_property
+    def universal_integrity_repo(self) -> UniversalIntegrityRepository:
+        return UniversalIntegrityRepository(
             session_db=self.session_db,
             config=self.config,
         )
-        self.universal_translation_repo = UniversalTranslationRepository(
+
+    @cached_property
+    def universal_translation_repo(self) -> UniversalTranslationRepository:
+        return UniversalTranslationRepository(
             session_db=self.session_db,
             config=self.config,
         )
 
-        self.accounts_cache_repo = AccountsCacheRepository(
+    @cached_property
+    def accounts_cache_repo(self) -> AccountsCacheRepository:
+        return AccountsCacheRepository(
             redis_session=self.session_redis,
             config=self.config,
         )
-        self.product_accounts_repo = ProductAccountsRepository(
+
+    @cached_property
+    def product_accounts_repo(self) -> ProductAccountsRepository:
+        return ProductAccountsRepository(
             session_db=self.session_db,
             config=self.config,
         )
-        self.account_storage_repo = AccountStorageRepository(
+
+    @cached_property
+    def account_storage_repo(self) -> AccountStorageRepository:
+        return AccountStorageRepository(
             session_db=self.session_db,
             config=self.config,
         )
-        self.sold_accounts_repo = SoldAccountsRepository(
+
+    @cached_property
+    def sold_accounts_repo(self) -> SoldAccountsRepository:
+        return SoldAccountsRepository(
             session_db=self.session_db,
             config=self.config,
         )
-        self.sold_accounts_translation_repo = SoldAccountsTranslationRepository(
+
+    @cached_property
+    def sold_accounts_translation_repo(self) -> SoldAccountsTranslationRepository:
+        return SoldAccountsTranslationRepository(
             session_db=self.session_db,
             config=self.config,
         )
-        self.tg_account_media_repo = TgAccountMediaRepository(
+
+    @cached_property
+    def tg_account_media_repo(self) -> TgAccountMediaRepository:
+        return TgAccountMediaRepository(
             session_db=self.session_db,
             config=self.config,
         )
-        self.deleted_accounts_repo = DeletedAccountsRepository(
+
+    @cached_property
+    def deleted_accounts_repo(self) -> DeletedAccountsRepository:
+        return DeletedAccountsRepository(
             session_db=self.session_db,
             config=self.config,
         )
 
-        self.user_service = UserService(
+    @cached_property
+    def user_service(self) -> UserService:
+        return UserService(
             user_repo=self.users_repo,
             cache_user_repo=self.users_cache_repo,
             cache_subscription_repo=self.subscription_cache_repo,
@@ -381,35 +560,64 @@ class RequestContainer:
             sold_accounts_repo=self.sold_accounts_repo,
             publish_event_handler=self.publish_event_handler,
             conf=self.config,
-            session_db=session_db,
+            session_db=self.session_db,
         )
 
-        self.banned_account_service = BannedAccountService(
+    @cached_property
+    def banned_account_service(self) -> BannedAccountService:
+        return BannedAccountService(
             banned_repo=self.banned_accounts_repo,
             cache_repo=self.banned_accounts_cache_repo,
-            session_db=session_db,
+            session_db=self.session_db,
+        )
+
+    @cached_property
+    def user_context_cache_repo(self) -> UserContextCacheRepository:
+        return UserContextCacheRepository(
+            redis_session=self.session_redis,
+            config=self.config,
         )
 
-        self.admin_actions_service = AdminActionsService(
+    @cached_property
+    def user_context_service(self) -> UserContextService:
+        return UserContextService(
+            cache_repo=self.user_context_cache_repo,
+            user_service=self.user_service,
+            settings_service=self.settings_service,
+        )
+
+    @cached_property
+    def admin_actions_service(self) -> AdminActionsService:
+        return AdminActionsService(
             admin_actions_repo=self.admin_actions_repo,
-            session_db=session_db,
+            session_db=self.session_db,
         )
 
-        self.msg_for_sending_service = MessageForSendingService(
+    @cached_property
+    def msg_for_sending_service(self) -> MessageForSendingService:
+        return MessageForSendingService(
             msg_for_sending_repo=self.message_for_sending_repo,
-            session_db=session_db,
+            session_db=self.session_db,
             ui_image_service=self.ui_images_service,
         )
 
-        self.admin_repo = AdminsRepository(
-            session_db=session_db,
+    @cached_property
+    def admin_repo(self) -> AdminsRepository:
+        return AdminsRepository(
+            session_db=self.session_db,
             config=self.config,
         )
-        self.admin_cache_repo = AdminsCacheRepository(
+
+    @cached_property
+    def admin_cache_repo(self) -> AdminsCacheRepository:
+        return AdminsCacheRepository(
             redis_session=self.session_redis,
             config=self.config,
         )
-        self.admin_service = AdminsService(
+
+    @cached_property
+    def admin_service(self) -> AdminsService:
+        return AdminsService(
             admin_repo=self.admin_repo,
             cache_repo=self.admin_cache_repo,
             wallet_transaction_repo=self.wallet_transaction_service,
@@ -421,35 +629,72 @@ class RequestContainer:
             log_service=self.user_log_service,
             publish_event=self.publish_event_handler,
             conf=self.config,
-            session_db=session_db,
+            session_db=self.session_db,
         )
-        self.permission_service = PermissionService(admin_service=self.admin_service)
 
-        self.categories_repo = CategoriesRepository(
+    @cached_property
+    def permission_service(self) -> PermissionService:
+        return PermissionService(admin_service=self.admin_service)
+
+    @cached_property
+    def categories_repo(self) -> CategoriesRepository:
+        return CategoriesRepository(
             session_db=self.session_db,
             config=self.config,
         )
-        self.categories_cache_repo = CategoriesCacheRepository(
+
+    @cached_property
+    def categories_cache_repo(self) -> CategoriesCacheRepository:
+        return CategoriesCacheRepository(
             redis_session=self.session_redis,
             config=self.config,
+            local_cache=self.local_cache,
         )
-        self.categories_cache_filler_service = CategoriesCacheFillerService(
+
+    @cached_property
+    def categories_cache_filler_service(self) -> CategoriesCacheFillerService:
+        return CategoriesCacheFillerService(
             category_repo=self.categories_repo,
             category_cache_repo=self.categories_cache_repo,
             logger=self.logger,
         )
-        self.category_translations_repo = CategoryTranslationsRepository(
+
+    @cached_property
+    def cache_refresh_scheduler(self) -> CacheRefreshScheduler:
+        """
+        Общий планировщик процесса. Без него (тесты, утилиты) кэш обновляется сразу в рамках текущего запроса
+        """
+        if self.app_cache_refresh_scheduler is not None:
+            return self.app_cache_refresh_scheduler
+
+        return CacheRefreshScheduler(refresh=self.refresh_products_cache, logger=self.logger)
+
+    async def refresh_products_cache(self, category_ids: Set[int], product_universal_ids: Set[int]) -> None:
+        """Пакетно обновит кэш универсальных товаров и категорий"""
+        await self.universal_cache_filler_service.fill_product_universal_batch(category_ids, product_universal_ids)
+        if category_ids:
+            await self.categories_cache_filler_service.fill_need_category(list(category_ids))
+
+    @cached_property
+    def category_translations_repo(self) -> CategoryTranslationsRepository:
+        return CategoryTranslationsRepository(
             session_db=self.session_db,
             config=self.config,
         )
-        self.translations_category_service = TranslationsCategoryService(
+
+    @cached_property
+    def translations_category_service(self) -> TranslationsCategoryService:
+        return TranslationsCategoryService(
             category_translations_repo=self.category_translations_repo,
             category_repo=self.categories_repo,
             category_cache_repo=self.categories_cache_repo,
             category_filler_service=self.categories_cache_filler_service,
             session_db=self.session_db,
         )
-        self.category_service = CategoryService(
+
+    @cached_property
+    def category_service(self) -> CategoryService:
+        return CategoryService(
             category_repo=self.categories_repo,
             category_cache_repo=self.categories_cache_repo,
             product_accounts_repository=self.product_accounts_repo,
@@ -460,13 +705,17 @@ class RequestContainer:
             session_db=self.session_db,
         )
 
-        self.accounts_cache_filler_service = AccountsCacheFillerService(
+    @cached_property
+    def accounts_cache_filler_service(self) -> AccountsCacheFillerService:
+        return AccountsCacheFillerService(
             product_repo=self.product_accounts_repo,
             sold_repo=self.sold_accounts_repo,
             cache_repo=self.accounts_cache_repo,
         )
 
-        self.account_storage_service = AccountStorageService(
+    @cached_property
+    def account_storage_service(self) -> AccountStorageService:
+        return AccountStorageService(
             storage_repo=self.account_storage_repo,
             product_repo=self.product_accounts_repo,
             sold_repo=self.sold_accounts_repo,
@@ -474,7 +723,10 @@ class RequestContainer:
             accounts_cache_filler=self.accounts_cache_filler_service,
             session_db=self.session_db,
         )
-        self.account_product_service = AccountProductService(
+
+    @cached_property
+    def account_product_service(self) -> AccountProductService:
+        return AccountProductService(
             product_repo=self.product_accounts_repo,
             category_repo=self.categories_repo,
             storage_repo=self.account_storage_repo,
@@ -484,15 +736,24 @@ class RequestContainer:
             session_db=self.session_db,
             path_builder=self.path_builder,
         )
-        self.account_deleted_service = AccountDeletedService(
+
+    @cached_property
+    def account_deleted_service(self) -> AccountDeletedService:
+        return AccountDeletedService(
             deleted_repo=self.deleted_accounts_repo,
             session_db=self.session_db,
         )
-        self.account_tg_media_service = AccountTgMediaService(
+
+    @cached_property
+    def account_tg_media_service(self) -> AccountTgMediaService:
+        return AccountTgMediaService(
             tg_media_repo=self.tg_account_media_repo,
             session_db=self.session_db,
         )
-        self.account_sold_service = AccountSoldService(
+
+    @cached_property
+    def account_sold_service(self) -> AccountSoldService:
+        return AccountSoldService(
             sold_repo=self.sold_accounts_repo,
             translations_repo=self.sold_accounts_translation_repo,
             user_repo=self.users_repo,
@@ -501,31 +762,47 @@ class RequestContainer:
             conf=self.config,
             session_db=self.session_db,
         )
-        self.account_translations_service = AccountTranslationsService(
+
+    @cached_property
+    def account_translations_service(self) -> AccountTranslationsService:
+        return AccountTranslationsService(
             sold_repo=self.sold_accounts_repo,
             translations_repo=self.sold_accounts_translation_repo,
             accounts_cache_filler=self.accounts_cache_filler_service,
             session_db=self.session_db,
         )
 
-        self.product_universal_cache_repo = ProductUniversalCacheRepository(
+    @cached_property
+    def product_universal_cache_repo(self) -> ProductUniversalCacheRepository:
+        return ProductUniversalCacheRepository(
             redis_session=self.session_redis,
             config=self.config,
         )
-        self.product_universal_single_cache_repo = ProductUniversalSingleCacheRepository(
+
+    @cached_property
+    def product_universal_single_cache_repo(self) -> ProductUniversalSingleCacheRepository:
+        return ProductUniversalSingleCacheRepository(
             redis_session=self.session_redis,
             config=self.config,
         )
-        self.sold_universal_cache_repo = SoldUniversalCacheRepository(
+
+    @cached_property
+    def sold_universal_cache_repo(self) -> SoldUniversalCacheRepository:
+        return SoldUniversalCacheRepository(
             redis_session=self.session_redis,
             config=self.config,
         )
-        self.sold_universal_single_cache_repo = SoldUniversalSingleCacheRepository(
+
+    @cached_property
+    def sold_universal_single_cache_repo(self) -> SoldUniversalSingleCacheRepository:
+        return SoldUniversalSingleCacheRepository(
             redis_session=self.session_redis,
             config=self.config,
         )
 
-        self.universal_cache_filler_service = UniversalCacheFillerService(
+    @cached_property
+    def universal_cache_filler_service(self) -> UniversalCacheFillerService:
+        return UniversalCacheFillerService(
             product_repo=self.product_universal_repo,
             sold_repo=self.sold_universal_repo,
             product_cache_repo=self.product_universal_cache_repo,
@@ -534,11 +811,17 @@ class RequestContainer:
             sold_single_cache_repo=self.sold_universal_single_cache_repo,
             conf=self.config,
         )
-        self.universal_deleted_service = UniversalDeletedService(
+
+    @cached_property
+    def universal_deleted_service(self) -> UniversalDeletedService:
+        return UniversalDeletedService(
             deleted_repo=self.deleted_universal_repo,
             session_db=self.session_db,
         )
-        self.universal_product_service = UniversalProductService(
+
+    @cached_property
+    def universal_product_service(self) -> UniversalProductService:
+        return UniversalProductService(
             product_repo=self.product_universal_repo,
             storage_repo=self.universal_storage_repo,
             category_repo=self.categories_repo,
@@ -550,14 +833,20 @@ class RequestContainer:
             conf=self.config,
             session_db=self.session_db,
         )
-        self.universal_storage_service = UniversalStorageService(
+
+    @cached_property
+    def universal_storage_service(self) -> UniversalStorageService:
+        return UniversalStorageService(
             storage_repo=self.universal_storage_repo,
             translation_repo=self.universal_translation_repo,
             cache_filler=self.universal_cache_filler_service,
             conf=self.config,
             session_db=self.session_db,
         )
-        self.universal_sold_service = UniversalSoldService(
+
+    @cached_property
+    def universal_sold_service(self) -> UniversalSoldService:
+        return UniversalSoldService(
             sold_repo=self.sold_universal_repo,
             storage_repo=self.universal_storage_repo,
             user_repo=self.users_repo,
@@ -567,52 +856,78 @@ class RequestContainer:
             conf=self.config,
             session_db=self.session_db,
         )
-        self.universal_translations_service = UniversalTranslationsService(
+
+    @cached_property
+    def universal_translations_service(self) -> UniversalTranslationsService:
+        return UniversalTranslationsService(
             storage_repo=self.universal_storage_repo,
             translation_repo=self.universal_translation_repo,
             cache_filler=self.universal_cache_filler_service,
             session_db=self.session_db,
         )
 
-        self.transfer_moneys_repo = TransferMoneysRepository(
-            session_db=session_db,
+    @cached_property
+    def transfer_moneys_repo(self) -> TransferMoneysRepository:
+        return TransferMoneysRepository(
+            session_db=self.session_db,
             config=self.config,
         )
-        self.money_transfer_service = MoneyTransferService(
+
+    @cached_property
+    def money_transfer_service(self) -> MoneyTransferService:
+        return MoneyTransferService(
             transfer_repo=self.transfer_moneys_repo,
             user_log_service=self.user_log_service,
             user_service=self.user_service,
             user_cache_repo=self.users_cache_repo,
             wallet_trans_service=self.wallet_transaction_service,
             publish_event_handler=self.publish_event_handler,
-            session_db=session_db,
+            session_db=self.session_db,
             conf=self.config,
             logger=self.logger,
         )
-        self.replenishment_repo = ReplenishmentsRepository(
-            session_db=session_db,
+
+    @cached_property
+    def replenishment_repo(self) -> ReplenishmentsRepository:
+        return ReplenishmentsRepository(
+            session_db=self.session_db,
             config=self.config,
         )
-        self.replenishment_service = ReplenishmentsService(
+
+    @cached_property
+    def replenishment_service(self) -> ReplenishmentsService:
+        return ReplenishmentsService(
             replenishment_repo=self.replenishment_repo,
             user_service=self.user_service,
             user_log_service=self.user_log_service,
             wallet_transaction_service=self.wallet_transaction_service,
             session_db=self.session_db,
         )
-        self.voucher_activations_repo = VoucherActivationsRepository(
-            session_db=session_db,
+
+    @cached_property
+    def voucher_activations_repo(self) -> VoucherActivationsRepository:
+        return VoucherActivationsRepository(
+            session_db=self.session_db,
             config=self.config,
         )
-        self.vouchers_cache__repo = VouchersCacheRepository(
+
+    @cached_property
+    def vouchers_cache__repo(self) -> VouchersCacheRepository:
+        return VouchersCacheRepository(
             redis_session=self.session_redis,
             config=self.config,
         )
-        self.vouchers_repo = VouchersRepository(
-            session_db=session_db,
+
+    @cached_property
+    def vouchers_repo(self) -> VouchersRepository:
+        return VouchersRepository(
+            session_db=self.session_db,
             config=self.config,
         )
-        self.voucher_service = VoucherService(
+
+    @cached_property
+    def voucher_service(self) -> VoucherService:
+        return VoucherService(
             vouchers_repo=self.vouchers_repo,
             voucher_activations_repo=self.voucher_activations_repo,
             users_repo=self.users_repo,
@@ -627,21 +942,34 @@ class RequestContainer:
             session_db=self.session_db,
         )
 
-        self.promo_code_repo = PromoCodeRepository(
+    @cached_property
+    def promo_code_repo(self) -> PromoCodeRepository:
+        return PromoCodeRepository(
             session_db=self.session_db,
             config=self.config,
         )
-        self.promo_code_cache_repo = PromoCodesCacheRepository(
+
+    @cached_property
+    def promo_code_cache_repo(self) -> PromoCodesCacheRepository:
+        return PromoCodesCacheRepository(
             redis_session=self.session_redis,
             config=self.config,
         )
-        self.activated_promo_code_repo = ActivatedPromoCodeRepository(
+
+    @cached_property
+    def activated_promo_code_repo(self) -> ActivatedPromoCodeRepository:
+        return ActivatedPromoCodeRepository(
             session_db=self.session_db,
             config=self.config,
         )
-        self.activated_service = ActivatedPromoCodesService(activated_repo=self.activated_promo_code_repo)
 
-        self.promo_code_service = PromoCodeService(
+    @cached_property
+    def activated_service(self) -> ActivatedPromoCodesService:
+        return ActivatedPromoCodesService(activated_repo=self.activated_promo_code_repo)
+
+    @cached_property
+    def promo_code_service(self) -> PromoCodeService:
+        return PromoCodeService(
             promo_repo=self.promo_code_repo,
             admin_actions_repo=self.admin_actions_repo,
             cache_repo=self.promo_code_cache_repo,
@@ -652,51 +980,79 @@ class RequestContainer:
             session_db=self.session_db,
         )
 
-        self.account_service = AccountService(
+    @cached_property
+    def account_service(self) -> AccountService:
+        return AccountService(
             publish_event_handler=self.publish_event_handler,
             path_builder=self.path_builder,
             crypto_provider=self.crypto_provider,
+            crypto_service=self.crypto_service,
             logger=self.logger,
         )
 
-        self.purchase_requests_repo = PurchaseRequestsRepository(
+    @cached_property
+    def purchase_requests_repo(self) -> PurchaseRequestsRepository:
+        return PurchaseRequestsRepository(
             session_db=self.session_db,
             config=self.config,
         )
-        self.balance_holder_repo = BalanceHolderRepository(
+
+    @cached_property
+    def balance_holder_repo(self) -> BalanceHolderRepository:
+        return BalanceHolderRepository(
             session_db=self.session_db,
             config=self.config,
         )
-        self.purchase_request_service = PurchaseRequestService(
+
+    @cached_property
+    def purchase_request_service(self) -> PurchaseRequestService:
+        return PurchaseRequestService(
             purchase_request_repo=self.purchase_requests_repo,
             balance_holder_repo=self.balance_holder_repo,
             users_repo=self.users_repo,
         )
-        self.purchase_cancel_service = PurchaseCancelService(
+
+    @cached_property
+    def purchase_cancel_service(self) -> PurchaseCancelService:
+        return PurchaseCancelService(
             purchase_request_service=self.purchase_request_service,
             logger=self.logger,
         )
-        self.purchase_validation_service = PurchaseValidationService(
+
+    @cached_property
+    def purchase_validation_service(self) -> PurchaseValidationService:
+        return PurchaseValidationService(
             categories_repo=self.categories_repo,
             users_repo=self.users_repo,
             promo_code_service=self.promo_code_service,
             conf=self.config,
         )
-        self.validate_tg_account = ValidateTgAccount(
+
+    @cached_property
+    def validate_tg_account(self) -> ValidateTgAccount:
+        return ValidateTgAccount(
             logger=self.logger,
             tg_client=self.telegram_account_client,
-            crypto_provider=self.crypto_provider,
             account_service=self.account_service,
         )
-        self.validate_other_account = ValidateOtherAccountsUseCase(
+
+    @cached_property
+    def validate_other_account(self) -> ValidateOtherAccountsUseCase:
+        return ValidateOtherAccountsUseCase(
             logger=self.logger,
-            crypto_provider=self.crypto_provider,
+            crypto_service=self.crypto_service,
         )
-        self.purchases_repo = PurchasesRepository(
-                session_db=self.session_db,
-                config=self.config,
-            )
-        self.account_purchase_service = AccountPurchaseService(
+
+    @cached_property
+    def purchases_repo(self) -> PurchasesRepository:
+        return PurchasesRepository(
+            session_db=self.session_db,
+            config=self.config,
+        )
+
+    @cached_property
+    def account_purchase_service(self) -> AccountPurchaseService:
+        return AccountPurchaseService(
             validation_service=self.purchase_validation_service,
             purchase_request_service=self.purchase_request_service,
             purchase_cancel_service=self.purchase_cancel_service,
@@ -723,18 +1079,40 @@ class RequestContainer:
             validate_tg_account=self.validate_tg_account,
             validate_other_account=self.validate_other_account,
         )
-        self.validations_universal_products = ValidationsUniversalProducts(
-            crypto_provider=self.crypto_provider,
+
+    @cached_property
+    def validations_universal_products(self) -> ValidationsUniversalProducts:
+        return ValidationsUniversalProducts(
+            crypto_service=self.crypto_service,
             path_builder=self.path_builder,
+            integrity_repo=self.universal_integrity_repo,
+            conf=self.config,
+            logger=self.logger,
+            session_db=self.session_db,
+        )
+
+    @cached_property
+    def verify_universal_integrity_use_case(self) -> VerifyUniversalIntegrityUseCase:
+        return VerifyUniversalIntegrityUseCase(
+            integrity_repo=self.universal_integrity_repo,
+            product_repo=self.product_universal_repo,
+            validations_universal_products=self.validations_universal_products,
+            conf=self.config,
             logger=self.logger,
         )
-        self.universal_product = UniversalProduct(
+
+    @cached_property
+    def universal_product(self) -> UniversalProduct:
+        return UniversalProduct(
             crypto_provider=self.crypto_provider,
             path_builder=self.path_builder,
             publish_event_handler=self.publish_event_handler,
             logger=self.logger,
         )
-        self.universal_purchase_service = UniversalPurchaseService(
+
+    @cached_property
+    def universal_purchase_service(self) -> UniversalPurchaseService:
+        return UniversalPurchaseService(
             validation_service=self.purchase_validation_service,
             purchase_request_service=self.purchase_request_service,
             purchase_cancel_service=self.purchase_cancel_service,
@@ -750,7 +1128,7 @@ class RequestContainer:
             deleted_service=self.universal_deleted_service,
             category_service=self.category_service,
             cache_filler=self.universal_cache_filler_service,
-            categories_cache_filler=self.categories_cache_filler_service,
+            cache_refresh_scheduler=self.cache_refresh_scheduler,
             user_cache_repo=self.users_cache_repo,
             publish_event_handler=self.publish_event_handler,
             path_builder=self.path_builder,
@@ -761,43 +1139,76 @@ class RequestContainer:
             logger=self.logger,
             session_db=self.session_db,
         )
-        self.subscription_service = SubscriptionService(
+
+    @cached_property
+    def subscription_service(self) -> SubscriptionService:
+        return SubscriptionService(
             subscription_cache_repo=self.subscription_cache_repo,
             conf=self.config,
         )
-        self.purchase_service = PurchaseService(
+
+    @cached_property
+    def purchase_service(self) -> PurchaseService:
+        return PurchaseService(
             account_purchase_service=self.account_purchase_service,
             universal_purchase_service=self.universal_purchase_service,
             categories_cache_filler=self.categories_cache_filler_service,
         )
 
-        self.referral_income_repo = ReferralIncomeRepository(
+    @cached_property
+    def referral_income_repo(self) -> ReferralIncomeRepository:
+        return ReferralIncomeRepository(
             session_db=self.session_db,
             config=self.config,
         )
-        self.referral_income_service = ReferralIncomeService(
+
+    @cached_property
+    def referral_income_read_repo(self) -> ReferralIncomeRepository:
+        return ReferralIncomeRepository(
+            session_db=self.read_session_db,
+            config=self.config,
+        )
+
+    @cached_property
+    def referral_income_service(self) -> ReferralIncomeService:
+        return ReferralIncomeService(
             income_repo=self.referral_income_repo,
+            history_repo=self.referral_income_read_repo,
         )
 
-        self.referral_levels_repo = ReferralLevelsRepository(
+    @cached_property
+    def referral_levels_repo(self) -> ReferralLevelsRepository:
+        return ReferralLevelsRepository(
             session_db=self.session_db,
             config=self.config,
         )
-        self.referral_levels_cache_repo = ReferralLevelsCacheRepository(
+
+    @cached_property
+    def referral_levels_cache_repo(self) -> ReferralLevelsCacheRepository:
+        return ReferralLevelsCacheRepository(
             redis_session=self.session_redis,
             config=self.config,
+            local_cache=self.local_cache,
         )
-        self.referral_levels_service = ReferralLevelsService(
+
+    @cached_property
+    def referral_levels_service(self) -> ReferralLevelsService:
+        return ReferralLevelsService(
             referral_lvl_repo=self.referral_levels_repo,
             cache_repo=self.referral_levels_cache_repo,
             session_db=self.session_db
         )
 
-        self.referrals_repository = ReferralsRepository(
+    @cached_property
+    def referrals_repository(self) -> ReferralsRepository:
+        return ReferralsRepository(
             session_db=self.session_db,
             config=self.config,
         )
-        self.referral_service = ReferralService(
+
+    @cached_property
+    def referral_service(self) -> ReferralService:
+        return ReferralService(
             referral_repo=self.referrals_repository,
             referral_income_service=self.referral_income_service,
             referral_lvls_service=self.referral_levels_service,
@@ -807,130 +1218,222 @@ class RequestContainer:
             session_db=self.session_db
         )
 
-        self.excel_report_exporter = ExcelReportExporter(
+    @cached_property
+    def excel_report_exporter(self) -> ExcelReportExporter:
+        return ExcelReportExporter(
             get_text=get_text,
             dt_formatter=self.dt_formatter,
         )
 
-        self.type_payment_repo = TypePaymentsRepository(
+    @cached_property
+    def type_payment_repo(self) -> TypePaymentsRepository:
+        return TypePaymentsRepository(
             session_db=self.session_db,
             config=self.config,
         )
-        self.type_payment_cache_repo = TypePaymentsCacheRepository(
+
+    @cached_property
+    def type_payment_cache_repo(self) -> TypePaymentsCacheRepository:
+        return TypePaymentsCacheRepository(
             redis_session=self.session_redis,
             config=self.config,
+            local_cache=self.local_cache,
         )
-        self.type_payments_service = TypesPaymentsService(
+
+    @cached_property
+    def type_payments_service(self) -> TypesPaymentsService:
+        return TypesPaymentsService(
             type_payment_repo=self.type_payment_repo,
             cache_repo=self.type_payment_cache_repo,
             session_db=self.session_db
         )
 
-        self.dollar_rate_repo = DollarRateCacheRepository(
+    @cached_property
+    def dollar_rate_repo(self) -> DollarRateCacheRepository:
+        return DollarRateCacheRepository(
             redis_session=self.session_redis,
             config=self.config,
         )
-        self.payment_service = PaymentService(
+
+    @cached_property
+    def payment_service(self) -> PaymentService:
+        return PaymentService(
             replenishments_service=self.replenishment_service,
             publish_event_handler=self.publish_event_handler,
             types_payments_service=self.type_payments_service,
             user_service=self.user_service,
             dollar_rate_repo=self.dollar_rate_repo,
-            crypto_provider=crypto_bot_provider,
+            crypto_provider=self.crypto_bot_provider,
             conf=self.config,
             logger=self.logger,
         )
 
-        self.backup_logs_repository = BackupLogsRepository(
+    @cached_property
+    def backup_logs_repository(self) -> BackupLogsRepository:
+        return BackupLogsRepository(
             session_db=self.session_db,
             config=self.config,
         )
 
-        self.backup_logs_service = BackupLogsService(
+    @cached_property
+    def backup_logs_service(self) -> BackupLogsService:
+        return BackupLogsService(
             backup_logs_repo=self.backup_logs_repository,
             session_db=self.session_db
         )
-        self.import_tg_account_use_case = ImportTelegramAccountsUseCase(
+
+    @cached_property
+    def import_tg_account_use_case(self) -> ImportTelegramAccountsUseCase:
+        return ImportTelegramAccountsUseCase(
             account_storage_service=self.account_storage_service,
-            account_service=self.account_service,
             account_product_service=self.account_product_service,
+            crypto_provider=self.crypto_provider,
             path_builder=self.path_builder,
             tg_client=self.telegram_account_client,
+            conf=self.config,
+            session_db=self.session_db,
             logger=self.logger
         )
-        self.upload_tg_account_use_case = UploadTGAccountsUseCase(
+
+    @cached_property
+    def upload_tg_account_use_case(self) -> UploadTGAccountsUseCase:
+        return UploadTGAccountsUseCase(
             account_service=self.account_service,
             account_product_service=self.account_product_service,
             conf=self.config,
-            crypto_provider=self.crypto_provider,
         )
-        self.import_other_account_use_case = ImportOtherAccountsUseCase(
+
+    @cached_property
+    def import_other_account_use_case(self) -> ImportOtherAccountsUseCase:
+        return ImportOtherAccountsUseCase(
             account_storage_service=self.account_storage_service,
             account_product_service=self.account_product_service,
             crypto_provider=self.crypto_provider,
             publish_event_handler=self.publish_event_handler,
             logger=self.logger,
         )
-        self.upload_other_accounts_use_case = UploadOtherAccountsUseCase(
+
+    @cached_property
+    def upload_other_accounts_use_case(self) -> UploadOtherAccountsUseCase:
+        return UploadOtherAccountsUseCase(
             account_product_service=self.account_product_service,
             logger=self.logger,
-            crypto_provider=self.crypto_provider,
+            crypto_service=self.crypto_service,
             publish_event_handler=self.publish_event_handler,
         )
-        self.generate_exampl_universal_product_import = GenerateExamplUniversalProductImport(
+
+    @cached_property
+    def generate_exampl_universal_product_import(self) -> GenerateExamplUniversalProductImport:
+        return GenerateExamplUniversalProductImport(
             conf=self.config,
         )
-        self.upload_universal_products_use_case = UploadUniversalProductsUseCase(
+
+    @cached_property
+    def upload_universal_products_use_case(self) -> UploadUniversalProductsUseCase:
+        return UploadUniversalProductsUseCase(
             path_builder=self.path_builder,
-            crypto_provider=self.crypto_provider,
+            crypto_service=self.crypto_service,
             universal_product_service=self.universal_product_service,
             universal_translations_service=self.universal_translations_service,
             logger=self.logger,
             conf=self.config,
         )
-        self.import_universal_product_use_case = ImportUniversalProductUseCase(
+
+    @cached_property
+    def import_universal_product_use_case(self) -> ImportUniversalProductUseCase:
+        return ImportUniversalProductUseCase(
             path_builder=self.path_builder,
             crypto_provider=self.crypto_provider,
             universal_product_service=self.universal_product_service,
             universal_translations_service=self.universal_translations_service,
             universal_storage_service=self.universal_storage_service,
             translations_category_service=self.translations_category_service,
+            validations_universal_products=self.validations_universal_products,
             logger=self.logger,
             conf=self.config,
         )
-        self.statistics_service = StatisticsService(
-            type_payments_repo=self.type_payment_repo,
+
+    @cached_property
+    def statistics_rollup_repo(self) -> StatisticsRollupRepository:
+        return StatisticsRollupRepository(
             session_db=self.session_db,
+            config=self.config,
+        )
+
+    @cached_property
+    def statistics_rollup_read_repo(self) -> StatisticsRollupRepository:
+        return StatisticsRollupRepository(
+            session_db=self.read_session_db,
+            config=self.config,
+        )
+
+    @cached_property
+    def statistics_rollup_service(self) -> StatisticsRollupService:
+        return StatisticsRollupService(
+            statistics_rollup_repo=self.statistics_rollup_repo,
+            session_db=self.session_db,
+        )
+
+    @cached_property
+    def statistics_service(self) -> StatisticsService:
+        return StatisticsService(
+            type_payments_repo=self.type_payment_repo,
+            statistics_rollup_repo=self.statistics_rollup_read_repo,
+            session_db=self.read_session_db,
+            conf=self.config,
         )
-        self.voucher_activations_service = VoucherActivationsService(
+
+    @cached_property
+    def voucher_activations_service(self) -> VoucherActivationsService:
+        return VoucherActivationsService(
             activations_repo=self.voucher_activations_repo
         )
-        self.activated_promo_codes_service = ActivatedPromoCodesService(
+
+    @cached_property
+    def activated_promo_codes_service(self) -> ActivatedPromoCodesService:
+        return ActivatedPromoCodesService(
             activated_repo=self.activated_promo_code_repo
         )
-        self.generate_user_audit_log_use_case = GenerateUserAuditLogUseCase(
+
+    @cached_property
+    def generate_user_audit_log_use_case(self) -> GenerateUserAuditLogUseCase:
+        return GenerateUserAuditLogUseCase(
             conf=self.config,
             user_log_service=self.user_log_service,
             dt_formatter=self.dt_formatter,
         )
-        self.generate_example_import_account = GenerateExamplImportAccount(
+
+    @cached_property
+    def generate_example_import_account(self) -> GenerateExamplImportAccount:
+        return GenerateExamplImportAccount(
             conf=self.config,
         )
-        self. event_message_service = EventMessageService(
+
+    @cached_property
+    def event_message_service(self) -> EventMessageService:
+        return EventMessageService(
             conf=self.config,
         )
-        self.get_auth_codes_use_case = GetAuthCodesUseCase(
+
+    @cached_property
+    def get_auth_codes_use_case(self) -> GetAuthCodesUseCase:
+        return GetAuthCodesUseCase(
             tg_client=self.telegram_account_client,
-            crypto_provider=self.crypto_provider,
             account_service=self.account_service,
             logger=self.logger,
         )
-        self.process_crypto_webhook_use_case = ProcessCryptoWebhookUseCase(
+
+    @cached_property
+    def process_crypto_webhook_use_case(self) -> ProcessCryptoWebhookUseCase:
+        return ProcessCryptoWebhookUseCase(
             replenishment_service=self.replenishment_service,
             publish_event_handler=self.publish_event_handler,
             logger=self.logger,
         )
-        self.update_dollar_rate_use_case = UpdateDollarRateUseCase(
+
+    @cached_property
+    def update_dollar_rate_use_case(self) -> UpdateDollarRateUseCase:
+        return UpdateDollarRateUseCase(
             moex_client=MoexClient(
                 session=self.http_session,
                 logger=self.logger,
@@ -956,7 +1459,11 @@ class RequestContainer:
             dt_formatter=self.dt_formatter,
         )
 
-    def get_message_service(self,) -> Messages:
+    def get_message_service(self) -> Messages:
+        return self.messages
+
+    @cached_property
+    def messages(self) -> Messages:
         sticker_sender = StickerSender(
             tg_client=self.telegram_client,
             sticker_service=self.stickers_service,
@@ -990,6 +1497,8 @@ class RequestContainer:
             limiter=self.rate_limiter,
             users_repo=self.users_repo,
             sent_mass_msg_service=self.sent_mass_message_service,
+            mailing_jobs_service=self.mass_mailing_jobs_service,
+            suppressed_recipients_service=self.suppressed_recipients_service,
             conf=self.config,
             logger=self.logger,
         )
@@ -1005,10 +1514,11 @@ class RequestContainer:
         )
         send_log_service = SendLogs(
             tg_logger_client=self.telegram_logger_client,
-            limiter=self.rate_limiter,
+            limiter=self.log_rate_limiter or self.rate_limiter,
             settings_service=self.settings_service,
             conf=self.config,
             logger=self.logger,
+            log_aggregator=self.log_aggregator,
         )
         return Messages(
             send_msg=send_msg_service,
@@ -1019,7 +1529,11 @@ class RequestContainer:
             sticker_sender=sticker_sender,
         )
 
-    def get_profile_modul(self,) -> ProfileModule:
+    def get_profile_modul(self) -> ProfileModule:
+        return self.profile_module
+
+    @cached_property
+    def profile_module(self) -> ProfileModule:
         return ProfileModule(
             conf=self.config,
             logger=self.logger,
@@ -1028,6 +1542,7 @@ class RequestContainer:
             wallet_transaction_service=self.wallet_transaction_service,
             money_transfer_service=self.money_transfer_service,
             notification_service=self.notification_service,
+            suppressed_recipients_service=self.suppressed_recipients_service,
             voucher_service=self.voucher_service,
             referral_income_service=self.referral_income_service,
             referral_levels_service=self.referral_levels_service,
@@ -1040,6 +1555,7 @@ class RequestContainer:
             universal_moduls=self.get_universal_product_modul(),
             account_service=self.account_service,
             crypto_provider=self.crypto_provider,
+            crypto_service=self.crypto_service,
             path_builder=self.path_builder,
             get_auth_codes_use_case=self.get_auth_codes_use_case,
             validate_tg_account=self.validate_tg_account,
@@ -1047,6 +1563,10 @@ class RequestContainer:
         )
 
     def get_catalog_modul(self) -> CatalogModule:
+        return self.catalog_module
+
+    @cached_property
+    def catalog_module(self) -> CatalogModule:
         return CatalogModule(
             conf=self.config,
             logger=self.logger,
@@ -1062,6 +1582,10 @@ class RequestContainer:
         )
 
     def get_admin_module(self) -> AdminModule:
+        return self.admin_module
+
+    @cached_property
+    def admin_module(self) -> AdminModule:
         return AdminModule(
             conf=self.config,
             logger=self.logger,
@@ -1087,6 +1611,7 @@ class RequestContainer:
             admin_service=self.admin_service,
             banned_account_service=self.banned_account_service,
             crypto_provider=self.crypto_provider,
+            crypto_service=self.crypto_service,
             publish_event_handler=self.publish_event_handler,
             cache_warmup_service=self.get_cache_warmup_service(),
             statistics_service=self.statistics_service,
@@ -1113,6 +1638,10 @@ class RequestContainer:
         )
 
     def get_account_modul(self) -> AccountsModuls:
+        return self.account_module
+
+    @cached_property
+    def account_module(self) -> AccountsModuls:
         return AccountsModuls(
             deleted_service=self.account_deleted_service,
             product_service=self.account_product_service,
@@ -1126,6 +1655,10 @@ class RequestContainer:
         )
 
     def get_universal_product_modul(self) -> UniversalModuls:
+        return self.universal_module
+
+    @cached_property
+    def universal_module(self) -> UniversalModuls:
         return UniversalModuls(
             universal_product=self.universal_product,
             deleted_service=self.universal_deleted_service,
@@ -1139,6 +1672,10 @@ class RequestContainer:
         )
 
     def get_cache_warmup_service(self) -> CacheWarmupService:
+        return self.cache_warmup_service
+
+    @cached_property
+    def cache_warmup_service(self) -> CacheWarmupService:
         return CacheWarmupService(
             settings_repo=self.settings_repo,
             stickers_repo=self.stickers_repo,
@@ -1176,6 +1713,7 @@ class RequestContainer:
             logger=self.logger,
             session_redis=self.session_redis,
             conf=self.config,
+            local_cache=self.local_cache,
         )
 
     def get_event_handler(self) -> EventHandler:
@@ -1217,6 +1755,7 @@ class RequestContainer:
                 publish_event=self.publish_event_handler,
                 user_log_service=self.user_log_service,
                 wallet_trans_service=self.wallet_transaction_service,
+                statistics_rollup_service=self.statistics_rollup_service,
                 session_db=self.session_db,
                 logger=self.logger,
                 category_service=self.category_service,
@@ -1228,19 +1767,25 @@ class RequestContainer:
             ),
             message_ev_hand=MessageEventHandler(
                 send_log=messages.send_log,
+                send_msg=messages.send_msg,
             ),
             logger=self.logger,
         )
 
     def get_remove_invalid_discount_use_case(self) -> RemoveInvalidDiscountsUseCase:
         return RemoveInvalidDiscountsUseCase(
-            user_service=self.user_service,
             promo_code_repo=self.promo_code_repo,
-            promo_code_service=self.promo_code_service,
             voucher_repo=self.vouchers_repo,
-            voucher_service=self.voucher_service,
+            users_repo=self.users_repo,
+            wallet_transaction_repo=self.wallet_transaction_repo,
+            user_log_repo=self.user_log_repo,
+            promo_code_cache_repo=self.promo_code_cache_repo,
+            vouchers_cache_repo=self.vouchers_cache__repo,
+            users_cache_repo=self.users_cache_repo,
             publish_event_handler=self.publish_event_handler,
-            tg_client=self.get_tg_client(),
+            session_db=self.session_db,
+            session_redis=self.session_redis,
+            conf=self.config,
             logger=self.logger,
         )
 
@@ -1261,11 +1806,17 @@ def init_request_container(
     telegram_logger_client: "TelegramClient",
     crypto_bot_provider: CryptoBotProvider,
     crypto_provider: CryptoProvider,
-    secret_storage: SecretsStorage,
+    secret_storage: AsyncSecretsStorage,
     producer: RabbitMQProducer,
     rate_limiter: RateLimiter,
     support_kb_builder: Callable[[str, str], Awaitable[Any]],
     telegram_account_client: TelegramAccountClient,
+    local_cache: Optional[LocalCache] = None,
+    cache_refresh_scheduler: Optional[CacheRefreshScheduler] = None,
+    log_rate_limiter: Optional[RateLimiter] = None,
+    log_aggregator: Optional[LogAggregator] = None,
+    read_session_db: Optional[AsyncSession] = None,
+    crypto_service: Optional[CryptoService] = None,
 ) -> RequestContainer:
     return RequestContainer(
         session_db=session_db,
@@ -1282,4 +1833,10 @@ def init_request_container(
         rate_limiter=rate_limiter,
         support_kb_builder=support_kb_builder,
         telegram_account_client=telegram_account_client,
+        local_cache=local_cache,
+        cache_refresh_scheduler=cache_refresh_scheduler,
+        log_rate_limiter=log_rate_limiter,
+        log_aggregator=log_aggregator,
+        read_session_db=read_session_db,
+        crypto_service=crypto_service,
     )
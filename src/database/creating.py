@@ -6,6 +6,21 @@ from src.config import Config
 from src.database import Base
 
 
+def _create_missing_indexes(sync_conn):
+    """
+    create_all не трогает уже существующие таблицы, поэтому индексы, добавленные в модели позже,
+    в рабочей БД сами не появятся. Создаёт недостающие индексы всех таблиц.
+    """
+    existing = set(sync_conn.execute(
+        text("SELECT indexname FROM pg_indexes WHERE schemaname = current_schema()")
+    ).scalars())
+
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(sync_conn)
+
+
 async def create_database(conf: Config):
     """Создает базу данных и все таблицы в ней (если существует, то ничего не произойдёт) """
     # Сначала подключаемся к серверу PostgreSQL без указания конкретной базы
@@ -37,6 +52,7 @@ async def create_database(conf: Config):
         async with engine.begin() as conn:
             logging.info("Creating _database tables...")
             await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(_create_missing_indexes)
             logging.info("Database tables created successfully")
     except Exception as e:
         logging.exception(f"Error creating tables: {e}")
@@ -52,6 +68,7 @@ async def create_table(conf: Config):
         async with engine.begin() as conn:
             logging.info("Creating core tables...")
             await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(_create_missing_indexes)
             logging.info("Database tables created successfully")
     except Exception as e:
         logging.exception(f"Error creating tables: {e}")
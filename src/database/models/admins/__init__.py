@@ -1,9 +1,13 @@
 from src.database.models.admins.models_admin import Admins, AdminActions
-from src.database.models.admins.models_messages import MessageForSending, SentMasMessages
+from src.database.models.admins.models_messages import (
+    MessageForSending, SentMasMessages, MassMailingJobs, MassMailingBatches
+)
 
 __all__ = [
     'Admins',
     'AdminActions',
     'MessageForSending',
-    'SentMasMessages'
+    'SentMasMessages',
+    'MassMailingJobs',
+    'MassMailingBatches',
 ]
\ No newline at end of file
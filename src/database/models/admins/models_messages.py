@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, BigInteger
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, BigInteger, Enum, Float, Index, JSON
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -18,6 +18,9 @@ class MessageForSending(Base):
 
 class SentMasMessages(Base):
     __tablename__ = "sent_mas_messages"
+    __table_args__ = (
+        Index('ix_sent_mas_messages_created', 'created_at', 'message_id'),
+    )
 
     message_id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(BigInteger, ForeignKey("users.user_id"), nullable=False) # это id админа (напрямую не надо т.к. админ может удалиться)
@@ -29,4 +32,46 @@ class SentMasMessages(Base):
     number_sent = Column(Integer, nullable=False) # число отправленных сообщений
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
-    user = relationship("Users", back_populates="sent_mas_messages")
\ No newline at end of file
+    user = relationship("Users", back_populates="sent_mas_messages")
+
+
+class MassMailingJobs(Base):
+    """Состояние рассылки: курсор по пользователям и накопленные итоги, что бы продолжить рассылку после перезапуска"""
+    __tablename__ = "mass_mailing_jobs"
+
+    job_id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(BigInteger, ForeignKey("users.user_id"), nullable=False) # id админа, запустившего рассылку
+    status = Column(Enum('running', 'completed', 'cancelled', name='mass_mailing_status'), nullable=False, server_default='running')
+    content = Column(Text, nullable=False)
+    photo_path = Column(String(700), nullable=True)
+    photo_id = Column(String(700), nullable=True)
+    button_url = Column(String(500), nullable=True)
+    segment = Column(JSON, nullable=True) # BroadcastSegment, NULL - все пользователи
+    cursor_user_id = Column(BigInteger, nullable=True) # последний обработанный user_id (пользователи идут по возрастанию), NULL - рассылка ещё не начата
+    total_users = Column(Integer, nullable=False, server_default="0") # пользователей на момент запуска
+    number_received = Column(Integer, nullable=False, server_default="0") # дошли до пользователя
+    number_sent = Column(Integer, nullable=False, server_default="0") # обработано всего (успешные + ошибки)
+    number_retried = Column(Integer, nullable=False, server_default="0") # повторных отправок после RetryAfter
+    sent_message_id = Column(Integer, ForeignKey("sent_mas_messages.message_id"), nullable=True) # итоговая запись после завершения
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_mass_mailing_jobs_status", "status"),
+    )
+
+
+class MassMailingBatches(Base):
+    """Итог одной пачки рассылки"""
+    __tablename__ = "mass_mailing_batches"
+
+    batch_id = Column(Integer, primary_key=True, autoincrement=True)
+    job_id = Column(Integer, ForeignKey("mass_mailing_jobs.job_id", ondelete="CASCADE"), nullable=False, index=True)
+    first_user_id = Column(BigInteger, nullable=False)
+    last_user_id = Column(BigInteger, nullable=False)
+    number_received = Column(Integer, nullable=False)
+    number_sent = Column(Integer, nullable=False)
+    number_retried = Column(Integer, nullable=False)
+    duration = Column(Float, nullable=False) # секунды на отправку пачки
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -4,7 +4,7 @@ from src.database.models.categories.main_category_and_product import (
 from src.database.models.categories.product_account import ProductAccounts, SoldAccountsTranslation, \
     SoldAccounts, DeletedAccounts, PurchaseRequestAccount, AccountStorage, TgAccountMedia
 from src.database.models.categories.product_universal import ProductUniversal, UniversalMediaType, \
-    UniversalStorage, UniversalStorageTranslation, SoldUniversal, DeletedUniversal, PurchaseRequestUniversal
+    UniversalStorage, UniversalStorageTranslation, SoldUniversal, DeletedUniversal, PurchaseRequestUniversal, UniversalIntegrity
 
 
 __all__ = [
@@ -32,5 +32,6 @@ __all__ = [
     "SoldUniversal",
     "DeletedUniversal",
     "PurchaseRequestUniversal",
+    "UniversalIntegrity",
 ]
 
@@ -167,6 +167,7 @@ class Purchases(Base):
     __tablename__ = "purchases"
     __table_args__ = (
         Index('ix_purchase_date', 'user_id', 'purchase_date'),
+        Index('ix_purchases_purchase_date', 'purchase_date'), # для статистики за период
     )
 
     purchase_id = Column(Integer, primary_key=True, autoincrement=True)
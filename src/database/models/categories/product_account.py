@@ -107,6 +107,8 @@ class SoldAccounts(Base):
     __tablename__ = "sold_accounts"
     __table_args__ = (
         Index('ix_sold_accounts_owner', 'owner_id'),
+        # совпадает с сортировкой постраничного вывода купленных аккаунтов
+        Index('ix_sold_accounts_owner_sold_at', 'owner_id', 'sold_at', 'sold_account_id'),
     )
 
     sold_account_id = Column(Integer, primary_key=True, autoincrement=True)
@@ -1,7 +1,8 @@
 import uuid
 from typing import Callable, Any, Tuple
 
-from sqlalchemy import Column, String, ForeignKey, Integer, Boolean, text, Text, DateTime, func, BigInteger, Enum
+from sqlalchemy import Column, String, ForeignKey, Integer, Boolean, text, Text, DateTime, func, BigInteger, Enum, \
+    Index
 from sqlalchemy.orm import relationship
 
 from src.database.models.categories import StorageStatus
@@ -131,6 +132,10 @@ class UniversalStorageTranslation(Base):
 
 class SoldUniversal(Base):
     __tablename__ = "sold_universal"
+    __table_args__ = (
+        # совпадает с сортировкой постраничного вывода купленных товаров
+        Index('ix_sold_universal_owner_sold_at', 'owner_id', 'sold_at', 'sold_universal_id'),
+    )
 
     sold_universal_id = Column(Integer, primary_key=True, autoincrement=True)
     owner_id = Column(BigInteger, ForeignKey("users.user_id"), nullable=False)
@@ -156,6 +161,26 @@ class DeletedUniversal(Base):
     storage = relationship("UniversalStorage", back_populates="deleted")
 
 
+class UniversalIntegrity(Base):
+    """
+    Индекс целостности универсальных товаров: результат последней полной проверки (дешифрования).
+    Заполняется при импорте и фоновой проверкой, при покупке используется вместо дешифрования каждого товара.
+    """
+    __tablename__ = "universal_integrity"
+
+    universal_storage_id = Column(
+        Integer,
+        ForeignKey("universal_storage.universal_storage_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+
+    checksum = Column(String(64), nullable=True) # checksum хранилища на момент проверки
+    file_size = Column(BigInteger, nullable=True) # размер зашифрованного файла на момент проверки
+    is_valid = Column(Boolean, nullable=False)
+
+    verified_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
 class PurchaseRequestUniversal(Base):
     __tablename__ = "purchase_request_universal"
 
@@ -9,6 +9,9 @@ class PromoCodes(Base):
     __tablename__ = "promo_codes"
     __table_args__ = (
         Index('ix_promo_code_activation', 'activation_code', 'is_valid'),
+        Index('ix_promo_codes_start_at', 'start_at', 'promo_code_id'),
+        # для фоновой деактивации истёкших: в индексе только действующие
+        Index('ix_promo_codes_expire_valid', 'expire_at', postgresql_where=text('is_valid')),
         CheckConstraint('amount IS NOT NULL OR discount_percentage IS NOT NULL'),
         CheckConstraint('discount_percentage BETWEEN 0 AND 100', name='chk_discount_percentage') # процент скидки
     )
@@ -45,6 +48,9 @@ class Vouchers(Base):
     __tablename__ = "vouchers"
     __table_args__ = (
         Index('ix_vouchers_activation_code', 'activation_code', 'is_valid'),
+        Index('ix_vouchers_start_at', 'start_at', 'voucher_id'),
+        # для фоновой деактивации истёкших: в индексе только действующие
+        Index('ix_vouchers_expire_valid', 'expire_at', postgresql_where=text('is_valid')),
     )
 
     voucher_id = Column(Integer, primary_key=True, autoincrement=True)
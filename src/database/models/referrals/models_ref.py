@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, BigInteger, Float
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, BigInteger, Float, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -27,6 +27,10 @@ class ReferralLevels(Base):
 
 class IncomeFromReferrals(Base):
     __tablename__ = "income_from_referrals"
+    __table_args__ = (
+        # совпадает с сортировкой постраничного вывода начислений владельца
+        Index('ix_income_from_referrals_owner_created', 'owner_user_id', 'created_at', 'income_from_referral_id'),
+    )
 
     income_from_referral_id = Column(Integer, primary_key=True, autoincrement=True)
     replenishment_id = Column(Integer, ForeignKey("replenishments.replenishment_id"), nullable=False)
@@ -1,8 +1,14 @@
-from src.database.models.system.models import Settings, TypePayments, BackupLogs, UiImages
+from src.database.models.system.models import Settings, TypePayments, BackupLogs, BackupLogStats, BackupStatus, \
+    UiImages, StatisticsDailyUsers, StatisticsDailySales, StatisticsDailyReplenishments
 
 __all__ = [
     'Settings',
     'TypePayments',
     'BackupLogs',
-    'UiImages'
+    'BackupLogStats',
+    'BackupStatus',
+    'UiImages',
+    'StatisticsDailyUsers',
+    'StatisticsDailySales',
+    'StatisticsDailyReplenishments',
 ]
\ No newline at end of file
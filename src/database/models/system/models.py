@@ -1,6 +1,7 @@
 import enum
 
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, JSON, BigInteger, text, Float, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, JSON, BigInteger, text, Float, Enum, Date, \
+    ForeignKey
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -11,6 +12,12 @@ class ReplenishmentService(enum.Enum):
     CRYPTO_BOT = "crypto_bot"
 
 
+class BackupStatus(enum.Enum):
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
 class Settings(Base):
     __tablename__ = "settings"
 
@@ -96,5 +103,71 @@ class BackupLogs(Base):
     encrypted_dek_b64 = Column(Text, nullable=False)
     dek_nonce_b64 = Column(String(64), nullable=False)
 
-    size_bytes = Column(BigInteger, nullable=False)
+    size_bytes = Column(BigInteger, nullable=False)              # зашифрованный файл, во время бэкапа растёт по мере загрузки
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class BackupLogStats(Base):
+    """
+    Ход и итог бэкапа. Отдельная таблица, потому что схема создаётся create_all, который не добавляет колонки
+    в уже существующую backup_logs. Бэкапы без записи здесь сделаны до её появления и считаются успешными.
+    """
+    __tablename__ = "backup_log_stats"
+
+    backup_log_id = Column(
+        Integer,
+        ForeignKey("backup_logs.backup_log_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    status = Column(
+        Enum(
+            BackupStatus,
+            values_callable=lambda x: [e.value for e in x],
+            name="backup_status"
+        ),
+        nullable=False,
+        server_default=BackupStatus.IN_PROGRESS.value,
+    )
+    dump_size_bytes = Column(BigInteger, nullable=False, server_default=text("0"))  # вывод pg_dump до шифрования
+    duration_seconds = Column(Float, nullable=True)
+    throughput_bytes_per_second = Column(BigInteger, nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    error = Column(Text, nullable=True)
+
+
+class StatisticsDailyUsers(Base):
+    """
+    Сводная статистика по пользователям за закрытый (прошедший) день UTC.
+    Запись есть для каждого закрытого дня, даже без новых пользователей: максимальный `day`
+    показывает, до какого дня статистика свёрнута.
+    """
+    __tablename__ = "statistics_daily_users"
+
+    day = Column(Date, primary_key=True)
+    new_users = Column(Integer, nullable=False, server_default=text("0"))
+
+
+class StatisticsDailySales(Base):
+    """
+    Продажи за день UTC по категории и типу товара. Пополняется обработчиком события покупки.
+    category_id = 0 это продажи без известной категории (до появления сводной статистики или потерянные события)
+    """
+    __tablename__ = "statistics_daily_sales"
+
+    day = Column(Date, primary_key=True)
+    category_id = Column(Integer, primary_key=True) # без FK: статистика остаётся после удаления категории
+    product_type = Column(String(32), primary_key=True) # ProductType.value
+    quantity = Column(Integer, nullable=False, server_default=text("0"))
+    amount = Column(BigInteger, nullable=False, server_default=text("0"))
+    profit = Column(BigInteger, nullable=False, server_default=text("0"))
+
+
+class StatisticsDailyReplenishments(Base):
+    """Пополнения за закрытый день UTC по платёжной системе"""
+    __tablename__ = "statistics_daily_replenishments"
+
+    day = Column(Date, primary_key=True)
+    type_payment_id = Column(Integer, primary_key=True)
+    quantity = Column(Integer, nullable=False, server_default=text("0"))
+    amount = Column(BigInteger, nullable=False, server_default=text("0"))
@@ -1,10 +1,11 @@
 from src.database.models.users.models_users import Users, NotificationSettings, BannedAccounts, \
-    Replenishments, TransferMoneys, UserAuditLogs, WalletTransaction, BalanceHolder
+    SuppressedRecipients, Replenishments, TransferMoneys, UserAuditLogs, WalletTransaction, BalanceHolder
 
 __all__ = [
     'Users',
     'NotificationSettings',
     'BannedAccounts',
+    'SuppressedRecipients',
     'BalanceHolder',
     'TransferMoneys',
     'UserAuditLogs',
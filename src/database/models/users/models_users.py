@@ -11,6 +11,9 @@ class Users(Base):
     __tablename__ = "users"
     __table_args__ = (
         Index('ix_users_referral_code', 'unique_referral_code'),
+        # для статистики: новые и активные пользователи за период
+        Index('ix_users_created_at', 'created_at'),
+        Index('ix_users_last_used', 'last_used'),
     )
 
     user_id = Column(BigInteger, primary_key=True, index=True, autoincrement=False) # одновременно telegram_id
@@ -98,8 +101,23 @@ class BannedAccounts(Base):
 
     user = relationship("Users", back_populates="banned_accounts")
 
+
+class SuppressedRecipients(Base):
+    """
+    Пользователи, до которых бот не может доставить сообщение (заблокировали бота или удалили аккаунт).
+    Исключаются из рассылок, пока пользователь снова не запустит бота.
+    """
+    __tablename__ = "suppressed_recipients"
+
+    user_id = Column(BigInteger, primary_key=True, autoincrement=False) # без ForeignKey: отметка может прийти раньше регистрации
+    reason = Column(Enum('forbidden', 'not_found', name='suppression_reason'), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
 class Replenishments(Base):
     __tablename__ = "replenishments"
+    __table_args__ = (
+        Index('ix_replenishments_created_at', 'created_at'), # для статистики за период
+    )
 
     replenishment_id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(BigInteger, ForeignKey("users.user_id"), nullable=False)
@@ -155,6 +173,10 @@ class UserAuditLogs(Base):
 
 class WalletTransaction(Base):
     __tablename__ = "wallet_transactions"
+    __table_args__ = (
+        # совпадает с сортировкой постраничного вывода истории транзакций
+        Index('ix_wallet_transactions_user_created', 'user_id', 'created_at', 'wallet_transaction_id'),
+    )
 
     wallet_transaction_id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(BigInteger, ForeignKey("users.user_id"), nullable=False)
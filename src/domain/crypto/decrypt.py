@@ -1,10 +1,15 @@
+import io
 import os
 import base64
 import tempfile
 import zipfile
+from typing import AsyncIterable, AsyncIterator, BinaryIO, Optional
 
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
+from src.domain.crypto.stream import MAGIC, CHUNK_SIZE, DecryptingReader, DecryptingWriter, is_stream_format, \
+    read_exact
+
 
 def decrypt_bytes(nonce_and_ct: bytes, dek: bytes) -> bytes:
     """
@@ -31,28 +36,118 @@ def decrypt_text(
     return plaintext.decode("utf-8")
 
 
+class _DiscardWriter(io.RawIOBase):
+    """Поток, который отбрасывает записанные данные (только для проверки расшифровки)"""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        return len(data)
+
+
+def open_decrypted(src: BinaryIO, dek: bytes) -> BinaryIO:
+    """
+    Вернёт файловый объект с расшифрованными данными (чтение и seek).
+    Потоковый формат расшифровывается по частям при чтении, старый (nonce + шифротекст) расшифровывается целиком.
+    """
+    src.seek(0)
+    head = src.read(len(MAGIC))
+    if is_stream_format(head):
+        return DecryptingReader(src, dek)
+
+    return io.BytesIO(decrypt_bytes(head + src.read(), dek))
+
+
+def decrypt_to_stream(src: BinaryIO, dst: BinaryIO, dek: bytes):
+    """
+    Расшифрует `src` в `dst`, для потокового формата по одной части.
+    `src` читается последовательно с текущей позиции, seek не нужен (подходит для скачивания по сети)
+    """
+    head = read_exact(src, len(MAGIC))
+    if is_stream_format(head):
+        writer = DecryptingWriter(dst, dek)
+        writer.write(head)
+        for data in iter(lambda: src.read(CHUNK_SIZE), b""):
+            writer.write(data)
+        writer.close()
+        return
+
+    dst.write(decrypt_bytes(head + src.read(), dek))
+
+
+class _PartsWriter:
+    """Копит расшифрованные части между выдачами decrypt_chunks"""
+
+    def __init__(self):
+        self.parts: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self.parts.append(data)
+        return len(data)
+
+    def take(self) -> list[bytes]:
+        parts, self.parts = self.parts, []
+        return parts
+
+
+async def decrypt_chunks(chunks: AsyncIterable[bytes], dek: bytes) -> AsyncIterator[bytes]:
+    """
+    Асинхронный вариант decrypt_to_stream: расшифрует части по мере их поступления (например, при скачивании).
+    Старый формат расшифровывается только целиком, поэтому накапливается в памяти.
+    :except StreamFormatError | InvalidTag: файл повреждён или ключ не подходит
+    """
+    sink = _PartsWriter()
+    writer: Optional[DecryptingWriter] = None
+    pending = bytearray() # начало файла, пока формат не известен (для старого формата весь файл)
+
+    async for chunk in chunks:
+        if writer is None:
+            pending += chunk
+            if len(pending) < len(MAGIC) or not is_stream_format(pending):
+                continue
+            writer = DecryptingWriter(sink, dek)
+            chunk = bytes(pending)
+            pending.clear()
+
+        writer.write(chunk)
+        for part in sink.take():
+            yield part
+
+    if writer is None:
+        yield decrypt_bytes(bytes(pending), dek)
+        return
+
+    writer.close()
+    for part in sink.take():
+        yield part
+
+
+def verify_encrypted_file(src_path: str, dek: bytes):
+    """
+    Проверит, что файл расшифровывается ключом и не повреждён, не сохраняя расшифрованные данные.
+    :except InvalidTag | StreamFormatError: файл повреждён или ключ не подходит
+    """
+    with open(src_path, "rb") as f:
+        decrypt_to_stream(f, _DiscardWriter(), dek)
+
+
 def decrypt_file_to_bytes(src_path: str, dek: bytes) -> bytes:
+    """Расшифрует файл в память. Для больших файлов использовать decrypt_file / open_decrypted"""
     with open(src_path, "rb") as f:
-        wrapped = f.read()
-    return decrypt_bytes(wrapped, dek)
+        decrypted = io.BytesIO()
+        decrypt_to_stream(f, decrypted, dek)
+    return decrypted.getvalue()
 
 
 def decrypt_folder(encrypted_path: str, dek: bytes) -> str:
     """Расшифровывает зашифрованный архив во временную папку и возвращает путь к ней."""
-    with open(encrypted_path, "rb") as f:
-        encrypted_data = f.read()
-
-    decrypted_data = decrypt_bytes(encrypted_data, dek)
-
-    tmp_zip = tempfile.NamedTemporaryFile(delete=False, suffix=".zip")
-    tmp_zip.write(decrypted_data)
-    tmp_zip.close()
-
     extract_dir = tempfile.mkdtemp()
-    with zipfile.ZipFile(tmp_zip.name, "r") as zf:
-        zf.extractall(extract_dir)
+    with open(encrypted_path, "rb") as f:
+        # zipfile читает расшифрованные части по мере надобности, промежуточный архив не создаётся
+        with zipfile.ZipFile(open_decrypted(f, dek), "r") as zf:
+            zf.extractall(extract_dir)
 
-    os.remove(tmp_zip.name)
     return extract_dir
 
 
@@ -62,19 +157,14 @@ def decrypt_file(
     decrypted_path: str,
 ):
     """
-    Дешифрует файл. Открывает файл полностью!
+    Дешифрует файл. Файлы потокового формата расшифровываются по частям
     :param encrypted_path: Путь к зашифрованному файлу
     :param decrypted_path: Путь к файлу который будет создан после дешифрации
     :return:
     """
-    with open(encrypted_path, "rb") as f:
-        encrypted_data = f.read()
-
-    decrypted_data = decrypt_bytes(encrypted_data, dek)
-
     decrypted_dir = os.path.dirname(decrypted_path)
     if decrypted_dir:  # Проверяем, что путь содержит директорию
         os.makedirs(decrypted_dir, exist_ok=True)
 
-    with open(decrypted_path, "wb") as f:
-        f.write(decrypted_data)
+    with open(encrypted_path, "rb") as src, open(decrypted_path, "wb") as dst:
+        decrypt_to_stream(src, dst, dek)
@@ -1,11 +1,13 @@
 import hashlib
 import os
 import base64
-import shutil
-import tempfile
+import zipfile
 
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
+from src.domain.crypto.stream import EncryptingWriter, encrypt_stream
+from src.domain.crypto.utils import sha256_file
+
 
 
 def encrypt_bytes(plaintext: bytes, dek: bytes) -> bytes:
@@ -60,27 +62,31 @@ def make_account_key(kek: bytes) -> tuple[str, bytes, str]:
 
 
 def encrypt_folder(folder_path: str, encrypted_path: str, dek: bytes):
-    """Архивирует папку и шифрует архив. Удалит folder_path"""
-    # создаём имя временного файла, но не открываем его
-    with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as tmp:
-        tmp_zip_path = tmp.name
-
-    # архивируем
-    shutil.make_archive(tmp_zip_path.replace(".zip", ""), 'zip', folder_path)
+    """
+    Архивирует папку и шифрует архив потоково (см. src/domain/crypto/stream.py):
+    zip пишется сразу в шифрующий поток, без временного архива и без чтения целиком.
+    """
+    with open(encrypted_path, "wb") as f, EncryptingWriter(f, dek) as writer:
+        with zipfile.ZipFile(writer, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            for root, dirs, files in os.walk(folder_path):
+                dirs.sort()
+                for name in dirs + sorted(files):
+                    path = os.path.join(root, name)
+                    zf.write(path, os.path.relpath(path, folder_path))
 
-    # читаем данные архива
-    with open(tmp_zip_path, "rb") as f:
-        data = f.read()
 
-    # шифруем
-    encrypted = encrypt_bytes(data, dek)
+def encrypt_folder_with_new_key(folder_path: str, encrypted_path: str, kek: bytes) -> tuple[str, str, str]:
+    """
+    Создаёт DEK аккаунта и шифрует им папку (encrypt_folder). Функция верхнего уровня без состояния:
+    вызывается и в пуле процессов при массовом импорте.
+    :return: Tuple[encrypted_dek_b64, nonce_b64, checksum зашифрованного файла]
+    """
+    encrypted_key_b64, account_key, nonce_b64 = make_account_key(kek)
 
-    # записываем зашифрованный файл
-    with open(encrypted_path, "wb") as f:
-        f.write(encrypted)
+    os.makedirs(os.path.dirname(encrypted_path), exist_ok=True)
+    encrypt_folder(folder_path, encrypted_path, account_key)
 
-    # очищаем
-    os.remove(tmp_zip_path)
+    return encrypted_key_b64, nonce_b64, sha256_file(encrypted_path)
 
 
 def encrypt_file(
@@ -89,19 +95,14 @@ def encrypt_file(
     dek: bytes,
 ):
     """
-    Открывает файл полностью!!! Использовать только для небольших файлов
+    Шифрует файл потоково частями, память не зависит от размера файла
     :param file_path: Путь к незашифрованному файлу
     :param encrypted_path: новый путь к зашифрованному файлу
     :return:
     """
-    with open(file_path, "rb") as f:
-        data = f.read()
-
     encrypted_dir = os.path.dirname(encrypted_path)
     if encrypted_dir:  # Проверяем, что путь содержит директорию
         os.makedirs(encrypted_dir, exist_ok=True)
 
-    encrypted = encrypt_bytes(data, dek)
-
-    with open(encrypted_path, "wb") as f:
-        f.write(encrypted)
+    with open(file_path, "rb") as src, open(encrypted_path, "wb") as dst:
+        encrypt_stream(src, dst, dek)
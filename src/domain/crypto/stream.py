@@ -0,0 +1,280 @@
+"""
+Потоковый формат шифрования файлов (AES-256-GCM по частям).
+
+Файл: заголовок + части.
+    заголовок: MAGIC (7 байт) | VERSION (1 байт) | размер части (4 байта, big-endian) | префикс nonce (7 байт)
+    часть:     AES-GCM(открытые данные части) + тег 16 байт
+
+Nonce части = префикс nonce (7) | номер части (4, big-endian) | флаг последней части (1),
+весь заголовок передаётся как associated data в каждую часть. Поэтому части нельзя переставить, подменить
+заголовок или отрезать хвост файла: последняя часть всегда короче полной (при кратной длине она пустая)
+и зашифрована с флагом последней.
+
+Файлы старого формата (nonce 12 байт + шифротекст целиком) не начинаются с MAGIC и читаются как раньше.
+"""
+import io
+import os
+import struct
+from typing import BinaryIO, Optional
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+
+MAGIC = b"\x00ENCSTR"
+VERSION = 1
+CHUNK_SIZE = 64 * 1024
+TAG_SIZE = 16
+NONCE_PREFIX_SIZE = 7
+
+_HEADER = struct.Struct(f">{len(MAGIC)}sBI{NONCE_PREFIX_SIZE}s")
+HEADER_SIZE = _HEADER.size
+
+
+class StreamFormatError(ValueError):
+    """Файл повреждён, обрезан или зашифрован другим ключом"""
+
+
+def _nonce(prefix: bytes, index: int, last: bool) -> bytes:
+    return prefix + struct.pack(">IB", index, 1 if last else 0)
+
+
+def read_exact(src: BinaryIO, size: int) -> bytes:
+    """Прочитает `size` байт или меньше только в конце потока (сырые потоки могут возвращать меньше)"""
+    data = src.read(size)
+    if len(data) in (0, size):
+        return data
+
+    parts = [data]
+    received = len(data)
+    while received < size:
+        data = src.read(size - received)
+        if not data:
+            break
+        parts.append(data)
+        received += len(data)
+    return b"".join(parts)
+
+
+def is_stream_format(head: bytes) -> bool:
+    """:param head: первые байты файла (не меньше len(MAGIC))"""
+    return head[:len(MAGIC)] == MAGIC
+
+
+def parse_header(header: bytes) -> tuple[int, bytes]:
+    """:return: (размер части, префикс nonce)"""
+    if len(header) < HEADER_SIZE:
+        raise StreamFormatError("Заголовок зашифрованного файла обрезан")
+
+    magic, version, chunk_size, prefix = _HEADER.unpack(header[:HEADER_SIZE])
+    if magic != MAGIC:
+        raise StreamFormatError("Файл не в потоковом формате")
+    if version != VERSION:
+        raise StreamFormatError(f"Неизвестная версия формата шифрования: {version}")
+    if chunk_size <= 0:
+        raise StreamFormatError("Некорректный размер части")
+    return chunk_size, prefix
+
+
+class EncryptingWriter(io.RawIOBase):
+    """
+    Файловый объект только для записи: шифрует записываемые данные частями и пишет их в `dst`.
+    В памяти держит не больше одной части. `close()` дописывает последнюю часть, `dst` не закрывает.
+    """
+
+    def __init__(self, dst: BinaryIO, dek: bytes, chunk_size: int = CHUNK_SIZE):
+        super().__init__()
+        self.dst = dst
+        self.aesgcm = AESGCM(dek)
+        self.chunk_size = chunk_size
+        self.prefix = os.urandom(NONCE_PREFIX_SIZE)
+        self.header = _HEADER.pack(MAGIC, VERSION, chunk_size, self.prefix)
+        self.index = 0
+        self.buffer = bytearray()
+        self.dst.write(self.header)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        if self.closed:
+            raise ValueError("Запись в закрытый поток")
+
+        self.buffer += data
+        # полная часть уходит только когда после неё есть ещё данные: последняя часть всегда неполная
+        while len(self.buffer) > self.chunk_size:
+            self._write_chunk(bytes(self.buffer[:self.chunk_size]), last=False)
+            del self.buffer[:self.chunk_size]
+        return len(data)
+
+    def _write_chunk(self, plaintext: bytes, last: bool) -> None:
+        nonce = _nonce(self.prefix, self.index, last)
+        self.dst.write(self.aesgcm.encrypt(nonce, plaintext, self.header))
+        self.index += 1
+
+    def close(self) -> None:
+        if self.closed:
+            return
+
+        if len(self.buffer) == self.chunk_size:
+            self._write_chunk(bytes(self.buffer), last=False)
+            self.buffer.clear()
+        self._write_chunk(bytes(self.buffer), last=True)
+        self.buffer.clear()
+        super().close()
+
+
+class DecryptingReader(io.RawIOBase):
+    """
+    Файловый объект только для чтения с произвольным доступом (seek) к расшифрованным данным.
+    Расшифровывает только нужные части, держит в памяти одну часть.
+    Последняя часть проверяется при открытии, поэтому обрезанный файл сразу вызывает StreamFormatError.
+    Подходит для zipfile.ZipFile без промежуточного расшифрованного архива.
+    """
+
+    def __init__(self, src: BinaryIO, dek: bytes):
+        super().__init__()
+        self.src = src
+        self.aesgcm = AESGCM(dek)
+
+        src.seek(0)
+        self.header = src.read(HEADER_SIZE)
+        self.chunk_size, self.prefix = parse_header(self.header)
+        self.block_size = self.chunk_size + TAG_SIZE
+
+        payload = src.seek(0, io.SEEK_END) - HEADER_SIZE
+        self.chunks = max((payload + self.block_size - 1) // self.block_size, 1)
+        last_block = payload - (self.chunks - 1) * self.block_size
+        if not TAG_SIZE <= last_block < self.block_size:
+            raise StreamFormatError("Зашифрованный файл обрезан")
+
+        self.size = (self.chunks - 1) * self.chunk_size + last_block - TAG_SIZE
+        self.position = 0
+        self._cached_index: Optional[int] = None
+        self._cached: bytes = b""
+        self._chunk(self.chunks - 1)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self.position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"Некорректный whence: {whence}")
+
+        if position < 0:
+            raise ValueError("Отрицательная позиция")
+        self.position = position
+        return position
+
+    def _chunk(self, index: int) -> bytes:
+        if index != self._cached_index:
+            last = index == self.chunks - 1
+            self.src.seek(HEADER_SIZE + index * self.block_size)
+            block = self.src.read(self.block_size)
+            try:
+                self._cached = self.aesgcm.decrypt(_nonce(self.prefix, index, last), block, self.header)
+            except InvalidTag:
+                raise StreamFormatError(f"Часть {index} зашифрованного файла не прошла проверку") from None
+            self._cached_index = index
+        return self._cached
+
+    def readinto(self, buffer) -> int:
+        # читаем через границы частей: zipfile ожидает полного чтения записей архива
+        done = 0
+        while done < len(buffer) and self.position < self.size:
+            index, offset = divmod(self.position, self.chunk_size)
+            data = self._chunk(index)[offset:offset + len(buffer) - done]
+            buffer[done:done + len(data)] = data
+            done += len(data)
+            self.position += len(data)
+        return done
+
+
+def encrypt_stream(src: BinaryIO, dst: BinaryIO, dek: bytes, chunk_size: int = CHUNK_SIZE) -> None:
+    """Зашифрует `src` в `dst` частями по `chunk_size`"""
+    with EncryptingWriter(dst, dek, chunk_size) as writer:
+        for data in iter(lambda: src.read(chunk_size), b""):
+            writer.write(data)
+
+
+class DecryptingWriter:
+    """
+    Расшифровка потокового формата в режиме записи: зашифрованные данные подаются через `write` частями любого
+    размера (например, по мере скачивания), расшифрованные части пишутся в `dst`. В памяти не больше одной части.
+    `close()` проверяет последнюю часть. Не закрывается сам при ошибке: после исключения объект бросают.
+    :except StreamFormatError: файл повреждён, обрезан или ключ не подходит
+    """
+
+    def __init__(self, dst: BinaryIO, dek: bytes):
+        self.dst = dst
+        self.dek = dek
+        self.aesgcm: Optional[AESGCM] = None
+        self.header = b""
+        self.prefix = b""
+        self.block_size = 0
+        self.index = 0
+        self.buffer = bytearray()
+        self.closed = False
+
+    def write(self, data) -> int:
+        if self.closed:
+            raise ValueError("Запись в закрытый поток")
+
+        self.buffer += data
+        if self.aesgcm is None:
+            if len(self.buffer) < HEADER_SIZE:
+                return len(data)
+            self.header = bytes(self.buffer[:HEADER_SIZE])
+            chunk_size, self.prefix = parse_header(self.header)
+            self.block_size = chunk_size + TAG_SIZE
+            self.aesgcm = AESGCM(self.dek)
+            del self.buffer[:HEADER_SIZE]
+
+        # полная часть не последняя, только если за ней есть ещё данные
+        while len(self.buffer) > self.block_size:
+            self._decrypt_block(bytes(self.buffer[:self.block_size]), last=False)
+            del self.buffer[:self.block_size]
+        return len(data)
+
+    def _decrypt_block(self, block: bytes, last: bool) -> None:
+        try:
+            self.dst.write(self.aesgcm.decrypt(_nonce(self.prefix, self.index, last), block, self.header))
+        except InvalidTag:
+            raise StreamFormatError(f"Часть {self.index} зашифрованного файла не прошла проверку") from None
+        self.index += 1
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        if self.aesgcm is None:
+            parse_header(bytes(self.buffer))  # сообщит, что заголовок обрезан
+        if not self.buffer or len(self.buffer) >= self.block_size:
+            raise StreamFormatError("Зашифрованный файл обрезан")
+
+        self._decrypt_block(bytes(self.buffer), last=True)
+        self.buffer.clear()
+        self.closed = True
+
+
+def decrypt_stream(src: BinaryIO, dst: BinaryIO, dek: bytes) -> None:
+    """
+    Расшифрует `src` в `dst` последовательно, по одной части.
+    Каждая часть проверяется до записи, но при ошибке в середине `dst` уже содержит предыдущие части.
+    :except StreamFormatError: файл повреждён, обрезан или ключ не подходит
+    """
+    writer = DecryptingWriter(dst, dek)
+    for data in iter(lambda: src.read(CHUNK_SIZE), b""):
+        writer.write(data)
+    writer.close()
@@ -4,6 +4,8 @@ import os
 from pathlib import Path
 from argon2.low_level import hash_secret_raw, Type
 
+from src.domain.crypto.stream import HEADER_SIZE, is_stream_format, parse_header
+
 
 SALT = b"autoservice.master.kek.v1"
 
@@ -49,8 +51,17 @@ def sha256_file(file_path: str | Path) -> str:
 
 
 def extract_nonce_b64(encrypted_file: Path) -> str:
+    """
+    Nonce файла для метаданных: для потокового формата это префикс nonce из заголовка,
+    для старого формата первые 12 байт
+    """
     with encrypted_file.open("rb") as f:
-        nonce = f.read(12)
+        head = f.read(HEADER_SIZE)
+
+    if is_stream_format(head):
+        _, nonce = parse_header(head)
+    else:
+        nonce = head[:12]
 
     return base64.b64encode(nonce).decode("ascii")
 
@@ -16,7 +16,9 @@ class TelegramNotFoundService(TelegramException):
     pass
 
 class TelegramRetryAfterService(TelegramException):
-    pass
+    def __init__(self, message: str, retry_after: float = 0):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 class TelegramForbiddenErrorService(TelegramException):
     pass
\ No newline at end of file
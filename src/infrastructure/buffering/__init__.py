@@ -0,0 +1,5 @@
+from src.infrastructure.buffering.coalescing_buffer import CoalescingBuffer
+
+__all__ = [
+    "CoalescingBuffer",
+]
@@ -0,0 +1,79 @@
+import asyncio
+from logging import Logger
+from typing import Awaitable, Callable, Generic, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+
+class CoalescingBuffer(Generic[T]):
+    """
+    Копит изменения `window` секунд и передаёт накопленное в `handle` одним вызовом.
+
+    Что именно копится, решает владелец: `factory` создаёт пустое накопление (set, dict, ...),
+    владелец изменяет `pending` и вызывает `schedule()`/`touch()`. Накопление, пришедшее во время
+    `handle`, уходит следующим окном. Ошибка `handle` логируется, накопленное за окно теряется.
+
+    Если `window` не задан, `touch()` передаёт накопленное сразу (используется без AppContainer).
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], T],
+        handle: Callable[[T], Awaitable[None]],
+        logger: Logger,
+        name: str,
+        window: Optional[float] = None,
+    ):
+        """
+        :param factory: создаёт пустое накопление, пустое должно приводиться к False
+        :param handle: корутина, обрабатывающая накопленное за окно
+        :param name: имя владельца для логов
+        """
+        self.factory = factory
+        self.handle = handle
+        self.logger = logger
+        self.name = name
+        self.window = window
+
+        self.pending: T = factory()
+        self._task: Optional[asyncio.Task] = None
+
+    def schedule(self) -> None:
+        """Запланирует обработку через `window` секунд, если она ещё не запланирована"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush_later())
+
+    async def touch(self) -> None:
+        """Как `schedule`, но без `window` обработает накопленное сразу"""
+        if self.window is None:
+            await self.flush()
+        else:
+            self.schedule()
+
+    async def _flush_later(self) -> None:
+        while self.pending:
+            await asyncio.sleep(self.window)
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Обработает всё накопленное"""
+        pending, self.pending = self.pending, self.factory()
+        if not pending:
+            return
+
+        try:
+            await self.handle(pending)
+        except Exception as e:
+            self.logger.exception(f"[{self.name}] Ошибка при обработке накопленного: {str(e)}")
+
+    async def stop(self) -> None:
+        """Отменит ожидание окна и сразу обработает накопленное"""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        await self.flush()
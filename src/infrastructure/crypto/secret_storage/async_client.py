@@ -0,0 +1,249 @@
+import asyncio
+import ssl
+import uuid
+from contextlib import asynccontextmanager
+from functools import cached_property
+from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, Callable, Iterable
+
+import aiohttp
+
+from src.exceptions import StorageSSLError, StorageResponseError, StorageConnectionError, \
+    StorageNotFound, StorageGone, StorageConflict
+
+
+async def _multipart_stream(
+    boundary: str,
+    fields: dict,
+    file_field: str,
+    chunks: AsyncIterable[bytes],
+    trailing_fields: Callable[[], dict],
+) -> AsyncIterator[bytes]:
+    """
+    Тело multipart/form-data по частям: поля, файл из `chunks`, затем поля, известные только после файла
+    (например sha256). Сервер хранения разбирает форму целиком, поэтому порядок полей не важен.
+    """
+    def field(name: str, value: str) -> bytes:
+        return (
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'
+        ).encode("utf-8")
+
+    for name, value in fields.items():
+        yield field(name, value)
+
+    yield (
+        f'--{boundary}\r\nContent-Disposition: form-data; name="{file_field}"; filename="{fields["name"]}"\r\n'
+        f'Content-Type: application/octet-stream\r\n\r\n'
+    ).encode("utf-8")
+    async for chunk in chunks:
+        if chunk:
+            yield chunk
+    yield b"\r\n"
+
+    for name, value in trailing_fields().items():
+        yield field(name, value)
+    yield f"--{boundary}--\r\n".encode("utf-8")
+
+
+class AsyncSecretsStorageClient:
+    """
+    Асинхронный клиент сервиса хранения поверх общей aiohttp.ClientSession приложения.
+    mTLS задаётся одним SSL-контекстом на клиент: пул сессии переиспользует TLS-соединения с хранилищем
+    (ключ пула включает SSL-контекст), поэтому повторные запросы не проходят рукопожатие заново.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        cert: tuple[str, str],
+        ca: str,
+        http_session: aiohttp.ClientSession,
+        timeout: int = 10,
+        max_concurrency: int = 8,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.cert = cert
+        self.ca = ca
+        self.http_session = http_session
+        self.max_concurrency = max_concurrency
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        # загрузка и скачивание файлов длятся сколько угодно, ограничиваем только паузы
+        self.stream_timeout = aiohttp.ClientTimeout(total=None, sock_connect=timeout, sock_read=timeout)
+
+    @cached_property
+    def ssl_context(self) -> ssl.SSLContext:
+        context = ssl.create_default_context(cafile=self.ca)
+        context.load_cert_chain(*self.cert)
+        return context
+
+    @asynccontextmanager
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: dict | None = None,
+        data=None,
+        headers: dict | None = None,
+        stream: bool = False,
+        expected_status: tuple[int, ...],
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        try:
+            async with self.http_session.request(
+                method,
+                f"{self.base_url}{path}",
+                json=json,
+                data=data,
+                headers=headers,
+                ssl=self.ssl_context,
+                timeout=self.stream_timeout if stream else self.timeout,
+            ) as response:
+                if response.status not in expected_status:
+                    if response.status == 404:
+                        raise StorageNotFound()
+                    if response.status == 409:
+                        raise StorageConflict()
+                    if response.status == 410:
+                        raise StorageGone()
+                    raise StorageResponseError(response.status, await response.text())
+
+                yield response
+
+        except (aiohttp.ClientSSLError, ssl.SSLError) as e:
+            raise StorageSSLError(
+                "Ошибка mTLS: неверный клиентский сертификат или CA"
+            ) from e
+        except (aiohttp.ClientConnectionError, TimeoutError) as e:
+            raise StorageConnectionError("Storage недоступен") from e
+
+
+    async def get_secret_string(self, name: str, version: int | None = None) -> dict:
+        params = f"?version={version}" if version is not None else ""
+
+        async with self._request(
+            "GET",
+            f"/secret_string/{name}{params}",
+            expected_status=(200,),
+        ) as response:
+            return await response.json()
+
+
+    async def get_secret_strings(self, names: Iterable[str]) -> dict[str, dict]:
+        """
+        Получит несколько строковых секретов параллельно (не больше max_concurrency запросов одновременно).
+        Любая ошибка прерывает всю пачку.
+        """
+        names = list(dict.fromkeys(names))
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(name: str) -> dict:
+            async with semaphore:
+                return await self.get_secret_string(name)
+
+        payloads = await asyncio.gather(*(fetch(name) for name in names))
+        return dict(zip(names, payloads))
+
+
+    async def create_secret_string(
+        self,
+        name: str,
+        encrypted_data: str,
+        nonce: str,
+        sha256: str,
+    ) -> None:
+        async with self._request(
+            "POST",
+            "/secrets_strings/create_string",
+            json={
+                "name": name,
+                "encrypted_data": encrypted_data,
+                "nonce": nonce,
+                "sha256": sha256,
+            },
+            expected_status=(201,),
+        ):
+            pass
+
+
+    async def get_secret_file_meta(self, name: str, version: int | None = None) -> dict:
+        params = f"?version={version}" if version is not None else ""
+
+        async with self._request(
+            "GET",
+            f"/secrets/files/{name}{params}",
+            expected_status=(200, 404),
+        ) as response:
+            return await response.json()
+
+
+    async def upload_secret_file_stream(
+        self,
+        name: str,
+        chunks: AsyncIterable[bytes],
+        nonce_b64: str,
+        sha256_b64: Callable[[], str],
+    ) -> None:
+        """
+        Загрузит файл из асинхронного итератора частей (chunked transfer encoding),
+        не держа файл целиком ни в памяти, ни на диске.
+        :param sha256_b64: Вызывается после того как `chunks` исчерпан, sha256 уходит последним полем формы
+        """
+        boundary = uuid.uuid4().hex
+        async with self._request(
+            "POST",
+            "/secrets_files/create_files",
+            data=_multipart_stream(
+                boundary=boundary,
+                fields={"name": name, "nonce": nonce_b64},
+                file_field="file",
+                chunks=chunks,
+                trailing_fields=lambda: {"sha256": sha256_b64()},
+            ),
+            headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+            stream=True,
+            expected_status=(201,),
+        ):
+            pass
+
+
+    async def iter_secret_file(
+        self,
+        name: str,
+        version: int | None = None,
+        chunk_size: int = 64 * 1024,
+    ) -> AsyncIterator[bytes]:
+        """Скачает файл по частям, не сохраняя его на диск"""
+        params = f"?version={version}" if version is not None else ""
+
+        async with self._request(
+            "GET",
+            f"/secrets/files/{name}/download{params}",
+            stream=True,
+            expected_status=(200,),
+        ) as response:
+            async for chunk in response.content.iter_chunked(chunk_size):
+                yield chunk
+
+
+    async def download_secret_file(
+        self,
+        name: str,
+        dst_path: Path,
+        version: int | None = None,
+    ) -> None:
+        with dst_path.open("wb") as f:
+            async for chunk in self.iter_secret_file(name, version):
+                f.write(chunk)
+
+
+    async def purge_secret(
+        self,
+        name: str
+    ) -> None:
+        """Удалит любой секрет не важно какой он по типу (HARD)"""
+        async with self._request(
+            "DELETE",
+            f"/secrets/{name}/purge",
+            expected_status=(202,),
+        ):
+            pass
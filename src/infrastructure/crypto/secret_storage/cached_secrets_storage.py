@@ -0,0 +1,130 @@
+import json
+import os
+import time
+from logging import Logger
+from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, Callable, Iterable
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from src.infrastructure.crypto.secret_storage.secrets_storage import AsyncSecretsStorage
+
+_CACHE_AAD = b"secrets_cache:v1"
+_NONCE_SIZE = 12
+
+
+class EncryptedSecretsCache:
+    """
+    Файл с ответами сервиса хранения, зашифрованный KEK (AES-GCM).
+    Сами секреты в ответах уже зашифрованы DEK, KEK защищает ещё и имена и метаданные.
+    Повреждённый файл или файл под другим KEK считается пустым кэшем.
+    """
+
+    def __init__(self, path: Path, kek: bytes, ttl: float, logger: Logger):
+        self.path = path
+        self.aesgcm = AESGCM(kek)
+        self.ttl = ttl
+        self.logger = logger
+
+    def load(self) -> dict[str, dict]:
+        """:return: {имя: ответ хранилища} только для записей моложе ttl"""
+        return {name: entry["payload"] for name, entry in self._fresh_entries().items()}
+
+    def save(self, payloads: dict[str, dict]) -> None:
+        """Допишет `payloads` с текущим временем к свежим записям кэша"""
+        now = time.time()
+        entries = {name: {"payload": payload, "fetched_at": now} for name, payload in payloads.items()}
+        self._write({**self._fresh_entries(), **entries})
+
+    def drop(self, name: str) -> None:
+        entries = self._fresh_entries()
+        if entries.pop(name, None) is not None:
+            self._write(entries)
+
+    def _fresh_entries(self) -> dict[str, dict]:
+        try:
+            raw = self.path.read_bytes()
+        except FileNotFoundError:
+            return {}
+
+        try:
+            entries = json.loads(self.aesgcm.decrypt(raw[:_NONCE_SIZE], raw[_NONCE_SIZE:], _CACHE_AAD))
+        except (InvalidTag, ValueError):
+            self.logger.warning("Secrets cache %s is unreadable, ignoring it", self.path)
+            return {}
+
+        now = time.time()
+        return {name: entry for name, entry in entries.items() if now - entry["fetched_at"] < self.ttl}
+
+    def _write(self, entries: dict[str, dict]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        nonce = os.urandom(_NONCE_SIZE)
+        data = nonce + self.aesgcm.encrypt(nonce, json.dumps(entries).encode("utf-8"), _CACHE_AAD)
+
+        # запись во временный файл и замена: при падении на середине остаётся старый кэш
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, self.path)
+
+
+class CachedSecretsStorage(AsyncSecretsStorage):
+    """
+    Строковые секреты читаются из локального зашифрованного кэша, недостающие загружаются из хранилища
+    одной параллельной пачкой и дописываются в кэш. Запросы конкретной версии и файлы идут мимо кэша.
+    """
+
+    def __init__(self, storage: AsyncSecretsStorage, cache: EncryptedSecretsCache):
+        self._storage = storage
+        self._cache = cache
+
+    # --- strings ---
+    async def get_secret(self, name: str, version: int | None = None) -> dict:
+        if version is not None:
+            return await self._storage.get_secret(name, version)
+        return (await self.get_secrets([name]))[name]
+
+    async def get_secrets(self, names: Iterable[str]) -> dict[str, dict]:
+        names = list(dict.fromkeys(names))
+        cached = self._cache.load()
+
+        missing = [name for name in names if name not in cached]
+        if missing:
+            fetched = await self._storage.get_secrets(missing)
+            self._cache.save(fetched)
+            cached.update(fetched)
+
+        return {name: cached[name] for name in names}
+
+    async def create_secret(
+        self,
+        name: str,
+        encrypted_data: str,
+        nonce: str,
+        sha256: str,
+    ) -> None:
+        await self._storage.create_secret(name, encrypted_data, nonce, sha256)
+        self._cache.drop(name)
+
+    # --- files ---
+    async def get_secret_file_meta(self, name: str, version: int | None = None) -> dict:
+        return await self._storage.get_secret_file_meta(name, version)
+
+    async def upload_secret_file_stream(
+        self,
+        name: str,
+        chunks: AsyncIterable[bytes],
+        nonce_b64: str,
+        sha256_b64: Callable[[], str],
+    ) -> None:
+        await self._storage.upload_secret_file_stream(name, chunks, nonce_b64, sha256_b64)
+
+    def iter_secret_file(self, name: str, version: int | None = None) -> AsyncIterator[bytes]:
+        return self._storage.iter_secret_file(name, version)
+
+    # --- delete ---
+    async def purge_secret(self, name: str) -> None:
+        await self._storage.purge_secret(name)
+        self._cache.drop(name)
@@ -0,0 +1,39 @@
+import aiohttp
+
+from src.config import PathSettings
+from src.infrastructure.crypto.secret_storage.async_client import AsyncSecretsStorageClient
+from src.infrastructure.crypto.secret_storage.client import SecretsStorageClient
+from src.infrastructure.crypto.secret_storage.http_secrets_storage import HttpSecretsStorage, \
+    AsyncHttpSecretsStorage
+from src.infrastructure.crypto.secret_storage.secrets_storage import SecretsStorage, AsyncSecretsStorage
+
+
+def _client_cert(paths: PathSettings) -> tuple[str, str]:
+    return str(paths.ssl_client_cert_file), str(paths.ssl_client_key_file)
+
+
+def build_secrets_storage(base_url: str, paths: PathSettings) -> SecretsStorage:
+    """Блокирующее хранилище для консольных утилит, где нет цикла событий"""
+    client = SecretsStorageClient(
+        base_url=base_url,
+        cert=_client_cert(paths),
+        ca=str(paths.ssl_ca_file),
+    )
+    return HttpSecretsStorage(client)
+
+
+def build_async_secrets_storage(
+    base_url: str,
+    paths: PathSettings,
+    http_session: aiohttp.ClientSession,
+    max_concurrency: int = 8,
+) -> AsyncSecretsStorage:
+    """Асинхронное хранилище поверх переданной aiohttp-сессии (её пул соединений общий с остальным кодом)"""
+    client = AsyncSecretsStorageClient(
+        base_url=base_url,
+        cert=_client_cert(paths),
+        ca=str(paths.ssl_ca_file),
+        http_session=http_session,
+        max_concurrency=max_concurrency,
+    )
+    return AsyncHttpSecretsStorage(client)
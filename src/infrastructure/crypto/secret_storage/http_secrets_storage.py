@@ -1,7 +1,9 @@
 from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, Callable, Iterable
 
+from src.infrastructure.crypto.secret_storage.async_client import AsyncSecretsStorageClient
 from src.infrastructure.crypto.secret_storage.client import SecretsStorageClient
-from src.infrastructure.crypto.secret_storage.secrets_storage import SecretsStorage
+from src.infrastructure.crypto.secret_storage.secrets_storage import SecretsStorage, AsyncSecretsStorage
 
 
 class HttpSecretsStorage(SecretsStorage):
@@ -90,4 +92,55 @@ class HttpSecretsStorage(SecretsStorage):
 
     # --- delete ---
     def purge_secret(self, name: str) -> None:
-        self._client.purge_secret(name=name)
\ No newline at end of file
+        self._client.purge_secret(name=name)
+
+
+class AsyncHttpSecretsStorage(AsyncSecretsStorage):
+    def __init__(self, client: AsyncSecretsStorageClient):
+        self._client = client
+
+    # --- strings ---
+    async def get_secret(self, name: str, version: int | None = None) -> dict:
+        return await self._client.get_secret_string(name=name, version=version)
+
+    async def get_secrets(self, names: Iterable[str]) -> dict[str, dict]:
+        return await self._client.get_secret_strings(names)
+
+    async def create_secret(
+        self,
+        name: str,
+        encrypted_data: str,
+        nonce: str,
+        sha256: str,
+    ) -> None:
+        await self._client.create_secret_string(
+            name=name,
+            encrypted_data=encrypted_data,
+            nonce=nonce,
+            sha256=sha256,
+        )
+
+    # --- files ---
+    async def get_secret_file_meta(self, name: str, version: int | None = None) -> dict:
+        return await self._client.get_secret_file_meta(name=name, version=version)
+
+    async def upload_secret_file_stream(
+        self,
+        name: str,
+        chunks: AsyncIterable[bytes],
+        nonce_b64: str,
+        sha256_b64: Callable[[], str],
+    ) -> None:
+        await self._client.upload_secret_file_stream(
+            name=name,
+            chunks=chunks,
+            nonce_b64=nonce_b64,
+            sha256_b64=sha256_b64,
+        )
+
+    def iter_secret_file(self, name: str, version: int | None = None) -> AsyncIterator[bytes]:
+        return self._client.iter_secret_file(name=name, version=version)
+
+    # --- delete ---
+    async def purge_secret(self, name: str) -> None:
+        await self._client.purge_secret(name=name)
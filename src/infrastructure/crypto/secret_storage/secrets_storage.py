@@ -1,4 +1,4 @@
-from typing import Protocol
+from typing import AsyncIterable, AsyncIterator, Callable, Iterable, Protocol
 from pathlib import Path
 
 
@@ -52,4 +52,37 @@ class SecretsStorage(Protocol):
     ) -> None: ...
 
     # --- delete ---
-    def purge_secret(self, name: str) -> None: ...
\ No newline at end of file
+    def purge_secret(self, name: str) -> None: ...
+
+
+class AsyncSecretsStorage(Protocol):
+    """Асинхронный вариант SecretsStorage для кода, работающего в цикле событий"""
+
+    # --- strings ---
+    async def get_secret(self, name: str, version: int | None = None) -> dict: ...
+
+    async def get_secrets(self, names: Iterable[str]) -> dict[str, dict]: ...
+
+    async def create_secret(
+        self,
+        name: str,
+        encrypted_data: str,
+        nonce: str,
+        sha256: str,
+    ) -> None: ...
+
+    # --- files ---
+    async def get_secret_file_meta(self, name: str, version: int | None = None) -> dict: ...
+
+    async def upload_secret_file_stream(
+        self,
+        name: str,
+        chunks: AsyncIterable[bytes],
+        nonce_b64: str,
+        sha256_b64: Callable[[], str],
+    ) -> None: ...
+
+    def iter_secret_file(self, name: str, version: int | None = None) -> AsyncIterator[bytes]: ...
+
+    # --- delete ---
+    async def purge_secret(self, name: str) -> None: ...
@@ -0,0 +1,7 @@
+from src.infrastructure.database.pool_metrics import PoolMetrics, PoolStats, MeteredAsyncQueuePool
+
+__all__ = [
+    "PoolMetrics",
+    "PoolStats",
+    "MeteredAsyncQueuePool",
+]
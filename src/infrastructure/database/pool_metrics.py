@@ -0,0 +1,116 @@
+import time
+from collections import deque
+from typing import Deque, Optional
+
+from pydantic import BaseModel
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class PoolStats(BaseModel):
+    checkouts: int
+    timeouts: int
+    in_use: int
+    max_in_use: int
+    avg_wait_ms: float
+    p99_wait_ms: float
+    max_wait_ms: float
+    avg_hold_ms: float
+
+
+class MeteredAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Пул соединений, замеряющий время ожидания соединения.
+    Ожидание включает очередь за свободным соединением, открытие нового и pre-ping.
+    """
+
+    metrics: Optional["PoolMetrics"] = None
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.observe_timeout()
+            raise
+
+        if self.metrics is not None:
+            self.metrics.observe_wait(time.perf_counter() - started)
+        return connection
+
+    def recreate(self) -> "MeteredAsyncQueuePool":
+        # engine.dispose() пересоздаёт пул, метрики должны остаться прежними
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class PoolMetrics:
+    """
+    Метрики пула соединений одного engine: выдачи соединений, время ожидания и удержания.
+    Перцентиль ожидания считается по последним `window` выдачам.
+    """
+
+    def __init__(self, window: int = 2048):
+        self._waits: Deque[float] = deque(maxlen=window)
+        self.reset()
+
+    def reset(self) -> None:
+        self._waits.clear()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.in_use = 0
+        self.max_in_use = 0
+        self.waits = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.total_hold = 0.0
+        self.checkins = 0
+
+    def install(self, engine: AsyncEngine) -> None:
+        sync_engine = engine.sync_engine
+        if isinstance(sync_engine.pool, MeteredAsyncQueuePool):
+            sync_engine.pool.metrics = self
+
+        event.listen(sync_engine, "checkout", self._on_checkout)
+        event.listen(sync_engine, "checkin", self._on_checkin)
+
+    def observe_wait(self, seconds: float) -> None:
+        self._waits.append(seconds)
+        self.waits += 1
+        self.total_wait += seconds
+        self.max_wait = max(self.max_wait, seconds)
+
+    def observe_timeout(self) -> None:
+        self.timeouts += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        connection_record.info["checkout_at"] = time.perf_counter()
+        self.checkouts += 1
+        self.in_use += 1
+        self.max_in_use = max(self.max_in_use, self.in_use)
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        checkout_at = connection_record.info.pop("checkout_at", None)
+        if checkout_at is None:
+            return
+
+        self.in_use -= 1
+        self.checkins += 1
+        self.total_hold += time.perf_counter() - checkout_at
+
+    def stats(self) -> PoolStats:
+        waits = sorted(self._waits)
+        p99 = waits[min(len(waits) - 1, int(len(waits) * 0.99))] if waits else 0.0
+        return PoolStats(
+            checkouts=self.checkouts,
+            timeouts=self.timeouts,
+            in_use=self.in_use,
+            max_in_use=self.max_in_use,
+            avg_wait_ms=self.total_wait / self.waits * 1000 if self.waits else 0.0,
+            p99_wait_ms=p99 * 1000,
+            max_wait_ms=self.max_wait * 1000,
+            avg_hold_ms=self.total_hold / self.checkins * 1000 if self.checkins else 0.0,
+        )
@@ -0,0 +1,142 @@
+import asyncio
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from logging import Logger
+from pathlib import Path
+from typing import List, Tuple, Optional, Callable, Any
+
+from src.infrastructure.files.file_system import move_file_sync, rename_sync
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_file_executor(max_workers: int) -> ThreadPoolExecutor:
+    """
+    Общий для процесса пул потоков под файловые операции покупок.
+    Отделён от пула по умолчанию, чтобы крупный заказ не занимал потоки, нужные остальным `asyncio.to_thread`.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="file_tx")
+    return _executor
+
+
+def stage_file_sync(orig: str, temp: str) -> bool:
+    """Переместит файл во временный путь и удалит его исходную директорию"""
+    if not move_file_sync(orig, temp):
+        return False
+    shutil.rmtree(str(Path(orig).parent), ignore_errors=True)
+    return True
+
+
+def restore_file_sync(orig: str, temp: str, final: str) -> bool:
+    """
+    Вернёт файл на исходное место из `temp` и/или `final` (смотря где он сейчас).
+    Если файл есть в обоих местах, на исходном месте останется `final`.
+    """
+    restored = False
+    for src in (temp, final):
+        if src and os.path.exists(src):
+            os.makedirs(os.path.dirname(orig), exist_ok=True)
+            shutil.move(src, orig)
+            restored = True
+    return restored
+
+
+class FileTransaction:
+    """
+    Пакетное перемещение файлов при финализации покупки по принципу "всё или ничего".
+
+    `stage()` параллельно переносит файлы из `orig` во временный `final + ".part"`,
+    `commit()` переименовывает их в `final`, `rollback()` возвращает всё на место.
+    Все операции с диском выполняются в отдельном ограниченном пуле потоков, event loop не блокируется.
+    """
+
+    def __init__(self, logger: Logger, max_workers: int):
+        self.logger = logger
+        self.executor = get_file_executor(max_workers)
+        self._entries: List[Tuple[str, str, str]] = []
+        self._staged: List[Tuple[str, str, str]] = []
+
+    @property
+    def mapping(self) -> List[Tuple[str, str, str]]:
+        """:return: Перемещённые файлы List(orig_path, temp_path, final_path)"""
+        return list(self._staged)
+
+    def add(self, orig: str, final: str) -> None:
+        self._entries.append((orig, final + ".part", final))
+
+    async def _run(self, func: Callable[..., Any], *args) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    async def stage(self) -> bool:
+        """
+        Переместит все добавленные файлы во временные пути.
+        При ошибке хотя бы одного перемещения откатит уже перемещённые.
+        :return: True если перемещены все файлы
+        """
+        results = await asyncio.gather(
+            *(self._run(stage_file_sync, orig, temp) for orig, temp, _ in self._entries),
+            return_exceptions=True,
+        )
+
+        failed = []
+        for entry, result in zip(self._entries, results):
+            if result is True:
+                self._staged.append(entry)
+            else:
+                failed.append(entry[0])
+
+        if failed:
+            self.logger.error("Failed to stage %d files, first: %s", len(failed), failed[0])
+            await self.rollback()
+            return False
+
+        return True
+
+    async def commit(self) -> bool:
+        """
+        Переименует временные файлы в итоговые.
+        При ошибке откатит весь пакет.
+        :return: True если все файлы на итоговых местах
+        """
+        results = await asyncio.gather(
+            *(self._run(rename_sync, temp, final) for _, temp, final in self._staged),
+            return_exceptions=True,
+        )
+
+        failed = [entry for entry, result in zip(self._staged, results) if result is not True]
+        if failed:
+            self.logger.error("Failed to rename %d temp files, first: %s", len(failed), failed[0][1])
+            await self.rollback()
+            return False
+
+        return True
+
+    async def rollback(self) -> None:
+        """Вернёт все перемещённые файлы на исходные места"""
+        await restore_files(self._staged, self.logger, self.executor)
+        self._staged.clear()
+
+
+async def restore_files(
+    mapping: List[Tuple[str, str, str]],
+    logger: Logger,
+    executor: Optional[ThreadPoolExecutor] = None,
+) -> None:
+    """
+    Параллельно вернёт файлы на исходные места.
+    :param mapping: List(orig_path, temp_path, final_path)
+    """
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(
+        *(loop.run_in_executor(executor, restore_file_sync, *entry) for entry in mapping),
+        return_exceptions=True,
+    )
+
+    for (orig, _, _), result in zip(mapping, results):
+        if isinstance(result, Exception):
+            logger.error("Failed to restore file for %s: %s", orig, result)
@@ -1,13 +1,14 @@
 import asyncio
 from contextlib import suppress
 from logging import Logger
-from typing import Optional, Callable, Awaitable
+from typing import Optional, Callable, Awaitable, Dict, Hashable, Tuple
 
 import aio_pika
 import aiormq
 from orjson import orjson
 
 from src.config import Config
+from src.infrastructure.rabbit_mq.worker_pool import EventWorkerPool, RoutingKeyStats
 
 
 ROUTING_KEYS = [
@@ -21,6 +22,20 @@ ROUTING_KEYS = [
     "message.*"
 ]
 
+# путь в payload до id пользователя, которого касается событие: события одного пользователя
+# обрабатываются по порядку. События без ключа партиции распределяются по воркерам по очереди
+PARTITION_KEYS: Dict[str, Tuple[str, ...]] = {
+    "promo_code.activated": ("user_id",),
+    "voucher.activated": ("voucher", "creator_id"),
+    "purchase.account": ("user_id",),
+    "purchase.universal": ("user_id",),
+    "replenishment.new_replenishment": ("user_id",),
+    "message.send_user": ("user_id",),
+}
+
+# события с этими префиксами обрабатываются отдельной группой воркеров
+MESSAGE_LANE = "message"
+
 
 class RabbitMQConsumer:
     def __init__(
@@ -37,6 +52,7 @@ class RabbitMQConsumer:
         self._consumer_task: Optional[asyncio.Task] = None
         self._consumer_start_event: Optional[asyncio.Event] = None
         self._consumer_stop_event: Optional[asyncio.Event] = None
+        self._pool: Optional[EventWorkerPool] = None
 
         self.logger = logger
         self.conf = conf
@@ -82,6 +98,22 @@ class RabbitMQConsumer:
 
         self.logger.info("Consumer stopped cleanly")
 
+    def stats(self) -> Dict[str, RoutingKeyStats]:
+        """:return: Dict[routing key, задержка и количество сообщений в обработке]"""
+        return self._pool.stats() if self._pool else {}
+
+    def _log_stats(self):
+        for routing_key, stats in sorted(self.stats().items()):
+            self.logger.info(
+                "[Consumer] %s: in_flight=%d processed=%d failed=%d avg=%.1f ms max=%.1f ms",
+                routing_key,
+                stats.in_flight,
+                stats.processed,
+                stats.failed,
+                stats.avg_latency_ms,
+                stats.max_latency_ms,
+            )
+
     def _on_done(self, task: asyncio.Task):
         try:
             exc = task.exception()
@@ -123,6 +155,8 @@ class RabbitMQConsumer:
 
         try:
             channel = await connection.channel()
+            # брокер не отдаст больше неподтверждённых сообщений, чем успевают обработать воркеры
+            await channel.set_qos(prefetch_count=self.conf.different.rabbit_prefetch_count)
 
             exchange = await channel.declare_exchange(
                 "events",
@@ -142,42 +176,65 @@ class RabbitMQConsumer:
 
             started_event.set()
 
-            message_queue: asyncio.Queue[aio_pika.IncomingMessage] = asyncio.Queue()
+            pool = EventWorkerPool(
+                process=self._process_message,
+                workers=self.conf.different.rabbit_workers,
+                lanes={MESSAGE_LANE: self.conf.different.rabbit_message_workers},
+                logger=self.logger,
+            )
+            pool.start()
+            self._pool = pool
 
             async def on_message(message: aio_pika.IncomingMessage):
-                await message_queue.put(message)
+                try:
+                    event = orjson.loads(message.body)
+                except orjson.JSONDecodeError as e:
+                    self.logger.error(f"Некорректное сообщение RabbitMQ ({message.routing_key}): {str(e)}")
+                    await message.reject()
+                    return
+
+                pool.submit(message.routing_key or "", self._partition_key(message.routing_key or "", event), (message, event))
 
             consumer_tag = await queue.consume(on_message, no_ack=False)
 
             try:
                 while not stop_event.is_set():
                     try:
-                        message: aio_pika.IncomingMessage = await asyncio.wait_for(
-                            message_queue.get(),
-                            timeout=0.5,
-                        )
+                        await asyncio.wait_for(stop_event.wait(), timeout=self.conf.different.rabbit_stats_interval)
                     except asyncio.TimeoutError:
-                        continue
-
-                    await self._process_message(message)
+                        self._log_stats()
 
             finally:
                 self.logger.info("Cancelling consumer %s", consumer_tag)
                 with suppress(Exception):
                     await queue.cancel(consumer_tag)
 
+                # принятые сообщения дообрабатываются до закрытия канала, иначе их не подтвердить
+                await pool.stop()
+                self._log_stats()
+
         finally:
             await connection.close()
 
-    async def _process_message(self, message: aio_pika.IncomingMessage):
+    @staticmethod
+    def _partition_key(routing_key: str, event: dict) -> Optional[Hashable]:
+        path = PARTITION_KEYS.get(routing_key)
+        if path is None:
+            return None
+
+        value = event.get("payload")
+        for field in path:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(field)
+        return value
+
+    async def _process_message(self, item: tuple[aio_pika.IncomingMessage, dict]):
+        """Ошибки обработчика логирует и учитывает в статистике `EventWorkerPool`"""
+        message, event = item
         try:
             async with message.process():
-                event = orjson.loads(message.body)
                 await self._event_handler(event)
 
         except aiormq.exceptions.ChannelInvalidStateError as e:
-            self.logger.error(f"Ошибка при работе с каналом: {str(e)}")
-        except Exception as e:
-            self.logger.exception(
-                f"Ошибка при обработке сообщения RabbitMQ: {str(e)}"
-            )
\ No newline at end of file
+            self.logger.error(f"Ошибка при работе с каналом: {str(e)}")
\ No newline at end of file
@@ -1,31 +1,81 @@
+import asyncio
+import os
+from collections import deque
 from datetime import datetime, timezone
 from logging import Logger
+from pathlib import Path
+from typing import Optional, List, Tuple
 
 import aio_pika
 import orjson
+from pydantic import BaseModel
+
+
+class ProducerStats(BaseModel):
+    buffered: int
+    max_buffered: int
+    published: int
+    spilled: int
+    replayed: int
+    overflows: int
 
 
 class RabbitMQProducer:
+    """
+    Публикация событий в exchange.
+
+    При `buffer_size > 0` `publish` только кладёт событие в буфер процесса, а фоновая задача
+    отправляет его пачками до `batch_size` сообщений, дожидаясь подтверждений брокера (publisher confirms).
+    События, которые не удалось отправить, дописываются в файл `spill_file` (по одному JSON в строке)
+    и переотправляются при следующем подключении. При переполнении буфера события сразу уходят в файл,
+    поэтому память процесса ограничена, а вызывающий код не ждёт брокер.
+    """
 
     def __init__(
         self,
         url: str,
         logger: Logger,
         exchange_name: str = "events",
+        buffer_size: int = 0,
+        batch_size: int = 100,
+        flush_interval: float = 0.05,
+        spill_file: Optional[Path] = None,
     ):
+        """
+        :param buffer_size: максимум событий в буфере, 0 - публиковать сразу при вызове `publish`
+        :param flush_interval: секунды, которые фоновая задача ждёт накопления пачки
+        """
         self.url = url
         self.logger = logger
         self.exchange_name = exchange_name
 
+        self.buffer_size = buffer_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.spill_file = spill_file
+
         self._connection: aio_pika.RobustConnection | None = None
         self._channel: aio_pika.abc.AbstractChannel | None = None
         self._exchange: aio_pika.abc.AbstractExchange | None = None
 
+        self._buffer: deque[Tuple[str, bytes]] = deque()
+        self._has_items = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._replay_task: Optional[asyncio.Task] = None
+        self._spill_lock = asyncio.Lock()
+        self._spill_pending = False
+
+        self.max_buffered = 0
+        self.published = 0
+        self.spilled = 0
+        self.replayed = 0
+        self.overflows = 0
+
     async def connect(self):
         """Инициализация (вызывать один раз при старте приложения)"""
         self._connection = await aio_pika.connect_robust(self.url)
 
-        self._channel = await self._connection.channel()
+        self._channel = await self._connection.channel(publisher_confirms=True)
 
         self._exchange = await self._channel.declare_exchange(
             self.exchange_name,
@@ -33,27 +83,194 @@ class RabbitMQProducer:
             durable=True,
         )
 
+        if self.buffer_size:
+            self._connection.reconnect_callbacks.add(self._on_reconnect)
+            self._flush_task = asyncio.create_task(self._flush_loop())
+            self._replay_task = asyncio.create_task(self.replay_spill())
+
         self.logger.info("RabbitMQ connected")
 
     async def close(self):
-        """Закрытие при shutdown"""
+        """Закрытие при shutdown. Неотправленные события остаются в файле и уйдут при следующем запуске"""
+        for task in (self._flush_task, self._replay_task):
+            if task and not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        self._flush_task = None
+        self._replay_task = None
+
+        await self.flush()
+
         if self._connection:
             await self._connection.close()
             self.logger.info("RabbitMQ connection closed")
 
     async def publish(self, event_data: dict, routing_key: str):
-        if not self._exchange:
-            raise RuntimeError("RabbitMQProducer not initialized")
-
         data = {
             "event": routing_key,
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "payload": event_data,
         }
+        body = orjson.dumps(data)
 
-        message = aio_pika.Message(
-            body=orjson.dumps(data),
-            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+        if not self.buffer_size:
+            if not self._exchange:
+                raise RuntimeError("RabbitMQProducer not initialized")
+            await self._exchange.publish(self._message(body), routing_key=routing_key)
+            return
+
+        if len(self._buffer) >= self.buffer_size:
+            self.overflows += 1
+            await self._spill([(routing_key, body)])
+            return
+
+        self._buffer.append((routing_key, body))
+        self.max_buffered = max(self.max_buffered, len(self._buffer))
+        self._has_items.set()
+
+    def stats(self) -> ProducerStats:
+        return ProducerStats(
+            buffered=len(self._buffer),
+            max_buffered=self.max_buffered,
+            published=self.published,
+            spilled=self.spilled,
+            replayed=self.replayed,
+            overflows=self.overflows,
+        )
+
+    async def flush(self) -> int:
+        """
+        Отправит всё, что накопилось в буфере
+        :return: количество событий, ушедших в файл
+        """
+        spilled = 0
+        while self._buffer:
+            batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+            try:
+                failed = await self._publish_batch(batch)
+            except asyncio.CancelledError:
+                # при остановке пачка возвращается в буфер и будет отправлена в `close`
+                self._buffer.extendleft(reversed(batch))
+                raise
+
+            self.published += len(batch) - len(failed)
+            if failed:
+                await self._spill(failed)
+                spilled += len(failed)
+        return spilled
+
+    async def replay_spill(self) -> int:
+        """
+        Переотправит события из файла. Файл сперва переименовывается, поэтому события,
+        не доставленные во время переотправки, попадают в новый файл и не теряются.
+        :return: количество доставленных событий
+        """
+        if not self.spill_file:
+            return 0
+
+        replay_file = self.spill_file.with_name(self.spill_file.name + ".replay")
+        async with self._spill_lock:
+            self._spill_pending = False
+            if not replay_file.exists():
+                if not self.spill_file.exists():
+                    return 0
+                await asyncio.to_thread(os.replace, self.spill_file, replay_file)
+
+        items = await asyncio.to_thread(self._read_spill, replay_file)
+
+        delivered = 0
+        for start in range(0, len(items), self.batch_size):
+            batch = items[start:start + self.batch_size]
+            failed = await self._publish_batch(batch)
+            delivered += len(batch) - len(failed)
+            if failed:
+                await self._spill(failed)
+
+        await asyncio.to_thread(replay_file.unlink, True)
+        self.replayed += delivered
+        if items:
+            self.logger.info("RabbitMQ: переотправлено событий из файла: %d из %d", delivered, len(items))
+        return delivered
+
+    def _on_reconnect(self, *_):
+        if self._replay_task is None or self._replay_task.done():
+            self._replay_task = asyncio.create_task(self.replay_spill())
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await self._has_items.wait()
+            # даём накопиться пачке, если буфер ещё не заполнен до её размера
+            if len(self._buffer) < self.batch_size:
+                await asyncio.sleep(self.flush_interval)
+            self._has_items.clear()
+
+            try:
+                spilled = await self.flush()
+            except Exception as e:
+                self.logger.exception(f"Ошибка отправки событий RabbitMQ: {str(e)}")
+                continue
+
+            # брокер снова принимает события - переотправляем то, что ушло в файл при сбое
+            if not spilled and self._spill_pending:
+                self._on_reconnect()
+
+    async def _publish_batch(self, batch: List[Tuple[str, bytes]]) -> List[Tuple[str, bytes]]:
+        """
+        Опубликует пачку и дождётся подтверждений брокера по всем сообщениям сразу
+        :return: события, которые не были подтверждены
+        """
+        if not self._exchange or not self._connection or self._connection.is_closed:
+            return batch
+
+        results = await asyncio.gather(
+            *(self._exchange.publish(self._message(body), routing_key=routing_key) for routing_key, body in batch),
+            return_exceptions=True,
+        )
+
+        failed = [item for item, result in zip(batch, results) if isinstance(result, BaseException)]
+        if failed:
+            self.logger.warning("RabbitMQ не подтвердил %d событий из %d", len(failed), len(batch))
+        return failed
+
+    async def _spill(self, items: List[Tuple[str, bytes]]) -> None:
+        if not self.spill_file:
+            self.logger.error("RabbitMQ: потеряно неотправленных событий: %d", len(items))
+            return
+
+        lines = b"".join(
+            orjson.dumps({"routing_key": routing_key, "body": orjson.Fragment(body)}) + b"\n"
+            for routing_key, body in items
         )
+        async with self._spill_lock:
+            await asyncio.to_thread(self._append_spill, lines)
+            self._spill_pending = True
+        self.spilled += len(items)
 
-        await self._exchange.publish(message, routing_key=routing_key)
\ No newline at end of file
+    def _append_spill(self, lines: bytes) -> None:
+        self.spill_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.spill_file, "ab") as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _read_spill(self, path: Path) -> List[Tuple[str, bytes]]:
+        items = []
+        with open(path, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    # строка могла оборваться при аварийной остановке во время записи
+                    self.logger.warning("RabbitMQ: пропущена повреждённая строка файла событий")
+                    continue
+                items.append((record["routing_key"], orjson.dumps(record["body"])))
+        return items
+
+    @staticmethod
+    def _message(body: bytes) -> aio_pika.Message:
+        return aio_pika.Message(
+            body=body,
+            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+        )
@@ -0,0 +1,131 @@
+import asyncio
+import itertools
+import time
+from logging import Logger
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+from pydantic import BaseModel
+
+
+class RoutingKeyStats(BaseModel):
+    processed: int
+    failed: int
+    in_flight: int
+    avg_latency_ms: float
+    max_latency_ms: float
+
+
+class _RoutingKeyCounters:
+
+    def __init__(self):
+        self.processed = 0
+        self.failed = 0
+        self.in_flight = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def to_stats(self) -> RoutingKeyStats:
+        done = self.processed + self.failed
+        return RoutingKeyStats(
+            processed=self.processed,
+            failed=self.failed,
+            in_flight=self.in_flight,
+            avg_latency_ms=self.total_latency / done * 1000 if done else 0.0,
+            max_latency_ms=self.max_latency * 1000,
+        )
+
+
+class EventWorkerPool:
+    """
+    Пул обработчиков событий RabbitMQ.
+
+    Каждый воркер читает свою очередь. Сообщения с одним ключом партиции (например, user_id)
+    всегда попадают к одному воркеру и обрабатываются строго по порядку, сообщения с разными
+    ключами обрабатываются параллельно. Сообщения без ключа раздаются воркерам по кругу.
+
+    Для событий, обработка которых упирается во внешние сервисы (отправка логов в Telegram),
+    выделяются отдельные группы воркеров (`lanes`), чтобы они не задерживали остальные события.
+    Размер очередей ограничивает prefetch канала: брокер не отдаёт больше неподтверждённых сообщений.
+    """
+
+    DEFAULT_LANE = "default"
+
+    def __init__(
+        self,
+        process: Callable[[Any], Awaitable[None]],
+        workers: int,
+        logger: Logger,
+        lanes: Optional[Dict[str, int]] = None,
+    ):
+        """
+        :param process: корутина обработки одного сообщения
+        :param workers: количество воркеров для событий без выделенной группы
+        :param lanes: Dict[префикс routing key, количество воркеров]
+        """
+        self.process = process
+        self.logger = logger
+
+        self._lane_sizes = {self.DEFAULT_LANE: workers, **(lanes or {})}
+        self._queues: Dict[str, List[asyncio.Queue]] = {}
+        self._round_robin: Dict[str, itertools.cycle] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._counters: Dict[str, _RoutingKeyCounters] = {}
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+
+        for lane, size in self._lane_sizes.items():
+            queues = [asyncio.Queue() for _ in range(max(size, 1))]
+            self._queues[lane] = queues
+            self._round_robin[lane] = itertools.cycle(range(len(queues)))
+            self._tasks.extend(asyncio.create_task(self._worker(queue)) for queue in queues)
+
+    async def stop(self) -> None:
+        """Дождётся обработки принятых сообщений и остановит воркеров"""
+        await asyncio.gather(*(queue.join() for queues in self._queues.values() for queue in queues))
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        self._tasks = []
+        self._queues = {}
+        self._round_robin = {}
+
+    def submit(self, routing_key: str, partition_key: Optional[Hashable], item: Any) -> None:
+        lane = self._lane(routing_key)
+        queues = self._queues[lane]
+
+        if partition_key is None:
+            index = next(self._round_robin[lane])
+        else:
+            index = hash(partition_key) % len(queues)
+
+        self._counters.setdefault(routing_key, _RoutingKeyCounters()).in_flight += 1
+        queues[index].put_nowait((routing_key, time.perf_counter(), item))
+
+    def stats(self) -> Dict[str, RoutingKeyStats]:
+        """:return: Dict[routing key, статистика]. Задержка считается от получения сообщения до конца обработки"""
+        return {routing_key: counters.to_stats() for routing_key, counters in self._counters.items()}
+
+    def _lane(self, routing_key: str) -> str:
+        prefix = routing_key.split(".")[0]
+        return prefix if prefix in self._lane_sizes else self.DEFAULT_LANE
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        while True:
+            routing_key, received_at, item = await queue.get()
+            counters = self._counters[routing_key]
+            try:
+                await self.process(item)
+                counters.processed += 1
+            except Exception as e:
+                counters.failed += 1
+                self.logger.exception(f"Ошибка при обработке сообщения RabbitMQ ({routing_key}): {str(e)}")
+            finally:
+                latency = time.perf_counter() - received_at
+                counters.in_flight -= 1
+                counters.total_latency += latency
+                counters.max_latency = max(counters.max_latency, latency)
+                queue.task_done()
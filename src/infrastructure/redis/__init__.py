@@ -1,6 +1,9 @@
 from src.infrastructure.redis.core import init_redis, close_redis
+from src.infrastructure.redis.local_cache import LocalCache, LocalCacheStats
 
 __all__ = [
     "init_redis",
     "close_redis",
+    "LocalCache",
+    "LocalCacheStats",
 ]
\ No newline at end of file
@@ -0,0 +1,177 @@
+import asyncio
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from logging import Logger
+from typing import Any, Optional
+from uuid import uuid4
+
+from orjson import orjson
+from pydantic import BaseModel
+from redis.asyncio import Redis
+
+
+class LocalCacheStats(BaseModel):
+    hits: int
+    misses: int
+    evictions: int
+    stale_puts: int
+    size: int
+
+
+class LocalCache:
+    """
+    Процессный L1-кэш перед Redis для редко меняющихся объектов.
+    Хранит уже провалидированные DTO (LRU с ограничением размера и TTL).
+
+    Согласованность между процессами бота поддерживается через Redis pub/sub:
+    при записи или удалении ключа репозиторий публикует сообщение об инвалидации,
+    а слушатель каждого процесса удаляет этот ключ у себя.
+    Возвращаемые объекты общие для всех запросов процесса, изменять их нельзя.
+
+    Чтение из Redis и запись в L1 разделены await: инвалидация, пришедшая между ними, не должна
+    затираться старым значением. Поэтому читающий берёт `version` до запроса к Redis и передаёт её в `put`,
+    любая инвалидация увеличивает версию, и устаревшая запись отбрасывается.
+    """
+
+    CHANNEL = "local_cache:invalidation"
+    MISSING = object()
+
+    def __init__(self, redis_session: Redis, max_items: int, ttl: float, logger: Logger):
+        self.redis_session = redis_session
+        self.max_items = max_items
+        self.ttl = ttl
+        self.logger = logger
+
+        self.instance_id = uuid4().hex
+        self._items: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._listener: Optional[asyncio.Task] = None
+
+        self.version = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.stale_puts = 0
+
+    # ==== локальные операции ====
+
+    def get(self, key: str) -> Any:
+        """:return: значение или `LocalCache.MISSING`"""
+        item = self._items.get(key)
+        if item is None:
+            self.misses += 1
+            return self.MISSING
+
+        expire_at, value = item
+        if expire_at < time.monotonic():
+            del self._items[key]
+            self.misses += 1
+            return self.MISSING
+
+        self._items.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any, version: Optional[int] = None) -> None:
+        """:param version: `self.version` на момент чтения значения из Redis"""
+        if version is not None and version != self.version:
+            self.stale_puts += 1
+            return
+
+        self._items[key] = (time.monotonic() + self.ttl, value)
+        self._items.move_to_end(key)
+
+        while len(self._items) > self.max_items:
+            self._items.popitem(last=False)
+            self.evictions += 1
+
+    def drop(self, key: str) -> None:
+        self.version += 1
+        self._items.pop(key, None)
+
+    def drop_pattern(self, pattern: str) -> None:
+        self.version += 1
+        for key in [k for k in self._items if fnmatchcase(k, pattern)]:
+            del self._items[key]
+
+    def clear(self) -> None:
+        self.version += 1
+        self._items.clear()
+
+    def stats(self) -> LocalCacheStats:
+        return LocalCacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            stale_puts=self.stale_puts,
+            size=len(self._items),
+        )
+
+    # ==== инвалидация во всех процессах ====
+
+    async def invalidate(self, *keys: str) -> None:
+        for key in keys:
+            self.drop(key)
+        await self._publish({"keys": list(keys)})
+
+    async def invalidate_pattern(self, pattern: str) -> None:
+        self.drop_pattern(pattern)
+        await self._publish({"pattern": pattern})
+
+    async def invalidate_all(self) -> None:
+        self.clear()
+        await self._publish({"pattern": "*"})
+
+    async def _publish(self, message: dict) -> None:
+        message["sender"] = self.instance_id
+        await self.redis_session.publish(self.CHANNEL, orjson.dumps(message))
+
+    def _apply(self, raw: bytes | str) -> None:
+        message = orjson.loads(raw)
+        if message.get("sender") == self.instance_id:
+            return
+
+        for key in message.get("keys", []):
+            self.drop(key)
+
+        pattern = message.get("pattern")
+        if pattern == "*":
+            self.clear()
+        elif pattern:
+            self.drop_pattern(pattern)
+
+    # ==== слушатель ====
+
+    async def listen(self) -> None:
+        while True:
+            try:
+                async with self.redis_session.pubsub() as pubsub:
+                    await pubsub.subscribe(self.CHANNEL)
+                    # пока подписки не было, сообщения могли потеряться
+                    self.clear()
+
+                    async for message in pubsub.listen():
+                        if message.get("type") == "message":
+                            self._apply(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"[LocalCache] Подписка на инвалидацию прервана: {str(e)}")
+                self.clear()
+                await asyncio.sleep(1)
+
+    def start_listener(self) -> None:
+        if self._listener is None:
+            self._listener = asyncio.create_task(self.listen())
+
+    async def stop_listener(self) -> None:
+        if self._listener is None:
+            return
+
+        self._listener.cancel()
+        try:
+            await self._listener
+        except asyncio.CancelledError:
+            pass
+        self._listener = None
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from aiogram import Bot
 from aiogram.exceptions import TelegramBadRequest, TelegramAPIError, TelegramForbiddenError, TelegramNotFound, \
@@ -27,20 +27,46 @@ def handle_telegram_errors(func):
 
 
 class TelegramClient:
-    def __init__(self, bot: Bot):
+    def __init__(
+        self,
+        bot: Bot,
+        on_retry_after: Optional[Callable[[float, Optional[int | str]], None]] = None,
+        on_unreachable: Optional[Callable[[int | str, str], None]] = None,
+    ):
+        """
+        :param on_retry_after: вызывается при RetryAfter с (секунды, chat_id), чтобы лимитер приостановил нужный чат
+        :param on_unreachable: вызывается с (chat_id, причина: 'forbidden' | 'not_found'), когда чат больше
+        не принимает сообщения бота (заблокировал бота или удалён)
+        """
         self.bot = bot
+        self.on_retry_after = on_retry_after
+        self.on_unreachable = on_unreachable
+        # TelegramAPIError - базовый класс остальных, поэтому проверяется последним
         self.ERROR_MAP = {
             TelegramBadRequest: TelegramBadRequestService,
-            TelegramAPIError: TelegramAPIErrorService,
             TelegramForbiddenError: TelegramForbiddenErrorService,
             TelegramNotFound: TelegramNotFoundService,
             TelegramRetryAfter: TelegramRetryAfterService,
+            TelegramAPIError: TelegramAPIErrorService,
         }
 
     async def _call(self, method, *args, **kwargs):
         try:
             return await method(*args, **kwargs)
 
+        except TelegramRetryAfter as e:
+            if self.on_retry_after:
+                self.on_retry_after(e.retry_after, kwargs.get("chat_id"))
+            raise TelegramRetryAfterService(str(e), retry_after=e.retry_after) from e
+
+        except (TelegramForbiddenError, TelegramNotFound) as e:
+            chat_id = kwargs.get("chat_id")
+            if self.on_unreachable and chat_id is not None:
+                self.on_unreachable(chat_id, "forbidden" if isinstance(e, TelegramForbiddenError) else "not_found")
+
+            mapped = TelegramForbiddenErrorService if isinstance(e, TelegramForbiddenError) else TelegramNotFoundService
+            raise mapped(str(e)) from e
+
         except Exception as e:
             # ищем, нужно ли маппить на сервисное исключение
             for exc, mapped in self.ERROR_MAP.items():
@@ -1,43 +1,255 @@
 import asyncio
 import time
 from collections import deque
+from enum import IntEnum
+from typing import Deque, Dict, Optional
+
+
+class Priority(IntEnum):
+    """Классы трафика бота. Чем меньше значение, тем раньше выдаётся токен"""
+    INTERACTIVE = 0  # ответы на действия пользователя
+    TRANSACTIONAL = 1  # уведомления о пополнениях, покупках, отправка файлов
+    BROADCAST = 2  # массовая рассылка
+    LOGS = 3  # канал логов
+
+
+class TokenBucket:
+    """
+    Ведро токенов: пополняется на `rate` токенов в секунду, вмещает не больше `capacity`.
+    Может быть приостановлено (например, по RetryAfter от Telegram).
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        if now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def wait_time(self, now: float) -> float:
+        """:return: через сколько секунд появится токен, 0 - доступен сейчас"""
+        if now < self.paused_until:
+            return self.paused_until - now
+
+        self._refill(now)
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def take(self, now: float) -> None:
+        self._refill(now)
+        self.tokens -= 1
+
+    def pause(self, seconds: float, now: float) -> None:
+        self.paused_until = max(self.paused_until, now + seconds)
+        # после паузы доступен один запрос, дальше ведро наполняется с обычной скоростью
+        self.tokens = 1
+        self.updated = self.paused_until
+
+    def is_idle(self, now: float) -> bool:
+        self._refill(now)
+        return self.tokens >= self.capacity and now >= self.paused_until
+
+
+class _Waiter:
+    __slots__ = ("future", "chat_id", "priority", "enqueued_at")
+
+    def __init__(self, future: asyncio.Future, chat_id: Optional[int | str], priority: Priority, enqueued_at: float):
+        self.future = future
+        self.chat_id = chat_id
+        self.priority = priority
+        self.enqueued_at = enqueued_at
 
 
 class RateLimiter:
     """
-    Позволяет ограничить число операций в единицу времени.
-    max_calls: сколько вызовов разрешено
-    period: за какое время (в секундах)
+    Ограничение запросов к Telegram для одного бота.
+
+    Общее ведро токенов (`max_calls` за `period`) плюс ведро на каждый чат: личные чаты ~1 сообщение в секунду,
+    группы и каналы (отрицательный chat_id) - `group_rate_per_minute` в минуту.
+
+    Если токенов нет, вызов встаёт в очередь своего класса `Priority`, и токены раздаёт одна фоновая задача:
+    ожидающие не держат общий lock и не спят по очереди друг за другом. Выбирается ожидающий с наименьшим
+    приоритетом с учётом времени ожидания (каждые `aging` секунд ожидания поднимают его на один класс),
+    поэтому логи и рассылка не простаивают бесконечно за уведомлениями. До INTERACTIVE ожидание
+    не поднимает: ответы пользователям всегда выдаются первыми.
+    Ожидающий, чей чат исчерпал свой лимит, не задерживает ожидающих из других чатов.
     """
-    def __init__(self, max_calls: int, period: float):
+
+    def __init__(
+        self,
+        max_calls: int,
+        period: float = 1.0,
+        chat_rate: float = 1.0,
+        chat_burst: int = 3,
+        group_rate_per_minute: int = 20,
+        aging: float = 10.0,
+        max_chat_buckets: int = 10_000,
+    ):
+        """
+        :param max_calls: сколько вызовов разрешено за `period` секунд всему боту
+        :param chat_rate: сообщений в секунду в один личный чат
+        :param chat_burst: сколько сообщений подряд можно отправить в один чат без ожидания
+        """
         self.max_calls = max_calls
         self.period = period
-        self.calls = deque()
-        self.lock = asyncio.Lock()
+        self.chat_rate = chat_rate
+        self.chat_burst = chat_burst
+        self.group_rate = group_rate_per_minute / 60
+        self.aging = aging
+        self.max_chat_buckets = max_chat_buckets
+
+        self._global = TokenBucket(rate=max_calls / period, capacity=max_calls)
+        self._chats: Dict[int | str, TokenBucket] = {}
+        self._paused_classes: Dict[Priority, float] = {}
+        self._queues: Dict[Priority, Deque[_Waiter]] = {priority: deque() for priority in Priority}
+
+        self._wakeup = asyncio.Event()
+        self._dispatcher: Optional[asyncio.Task] = None
 
-    async def acquire(self):
+    async def acquire(self, chat_id: Optional[int | str] = None, priority: Priority = Priority.INTERACTIVE):
         """
-        Блокирует выполнение, пока не станет возможно сделать новый вызов.
+        Дождётся разрешения на один запрос к Telegram
+        :param chat_id: чат получателя, None - учитывается только общий лимит
         """
-        async with self.lock:
-            now = time.monotonic()
+        now = time.monotonic()
+        if not self._has_waiters() and self._wait_time(chat_id, priority, now) == 0:
+            self._take(chat_id, now)
+            return
+
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), chat_id, priority, now)
+        self._queues[priority].append(waiter)
+        self._wake()
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if not waiter.future.done() or waiter.future.cancelled():
+                self._discard(waiter)
+            raise
+
+    def pause(self, seconds: float, chat_id: Optional[int | str] = None, priority: Optional[Priority] = None):
+        """
+        Приостановит выдачу токенов после RetryAfter от Telegram.
+        :param chat_id: приостановить только этот чат
+        :param priority: приостановить только этот класс трафика
+        Без `chat_id` и `priority` приостанавливается весь бот.
+        """
+        now = time.monotonic()
+        if chat_id is not None:
+            self._chat_bucket(chat_id).pause(seconds, now)
+        if priority is not None:
+            self._paused_classes[priority] = max(self._paused_classes.get(priority, 0.0), now + seconds)
+        if chat_id is None and priority is None:
+            self._global.pause(seconds, now)
+        self._wake()
+
+    def waiting(self) -> Dict[Priority, int]:
+        """:return: Dict[класс трафика, количество ожидающих]"""
+        return {priority: len(queue) for priority, queue in self._queues.items()}
+
+    # ==== внутреннее ====
+
+    def _has_waiters(self) -> bool:
+        return any(self._queues.values())
+
+    def _wake(self) -> None:
+        self._wakeup.set()
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+    def _discard(self, waiter: _Waiter) -> None:
+        try:
+            self._queues[waiter.priority].remove(waiter)
+        except ValueError:
+            pass
 
-            # удалить старые вызовы
-            while self.calls and (now - self.calls[0]) > self.period:
-                self.calls.popleft()
+    def _chat_bucket(self, chat_id: int | str) -> TokenBucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            is_group = isinstance(chat_id, int) and chat_id < 0
+            bucket = TokenBucket(
+                rate=self.group_rate if is_group else self.chat_rate,
+                capacity=self.chat_burst,
+            )
+            self._chats[chat_id] = bucket
+        return bucket
 
-            if len(self.calls) < self.max_calls:
-                # можно сразу выполнять
-                self.calls.append(now)
-                return
+    def _wait_time(self, chat_id: Optional[int | str], priority: Priority, now: float) -> float:
+        wait = max(self._paused_classes.get(priority, 0.0) - now, self._global.wait_time(now))
+        if chat_id is not None:
+            wait = max(wait, self._chat_bucket(chat_id).wait_time(now))
+        return wait
 
-            # иначе нужно подождать
-            sleep_time = self.period - (now - self.calls[0])
-            await asyncio.sleep(sleep_time)
+    def _take(self, chat_id: Optional[int | str], now: float) -> None:
+        self._global.take(now)
+        if chat_id is not None:
+            self._chat_bucket(chat_id).take(now)
 
-            # после ожидания обновляем список
+        if len(self._chats) > self.max_chat_buckets:
+            self._chats = {key: bucket for key, bucket in self._chats.items() if not bucket.is_idle(now)}
+
+    async def _dispatch(self) -> None:
+        while self._has_waiters():
+            self._wakeup.clear()
             now = time.monotonic()
-            while self.calls and (now - self.calls[0]) > self.period:
-                self.calls.popleft()
 
-            self.calls.append(now)
+            best: Optional[_Waiter] = None
+            best_score = (0.0, 0.0)
+            sleep_for = float("inf")
+
+            for priority, queue in self._queues.items():
+                class_wait = self._paused_classes.get(priority, 0.0) - now
+                if class_wait > 0:
+                    sleep_for = min(sleep_for, class_wait)
+                    continue
+
+                # первый в очереди класса, чей чат готов принять сообщение
+                for waiter in queue:
+                    if waiter.future.done():  # отменён, будет удалён из очереди в `acquire`
+                        continue
+                    chat_wait = self._chat_bucket(waiter.chat_id).wait_time(now) if waiter.chat_id is not None else 0
+                    if chat_wait == 0:
+                        score = (self._score(waiter, now), waiter.enqueued_at)
+                        if best is None or score < best_score:
+                            best, best_score = waiter, score
+                        break
+                    sleep_for = min(sleep_for, chat_wait)
+
+            if best is None:
+                await self._sleep(sleep_for)
+                continue
+
+            global_wait = self._global.wait_time(now)
+            if global_wait > 0:
+                await self._sleep(global_wait)
+                continue
+
+            self._queues[best.priority].remove(best)
+            self._take(best.chat_id, now)
+            best.future.set_result(None)
+
+            # даём получившим токен начать запрос
+            await asyncio.sleep(0)
+
+    def _score(self, waiter: _Waiter, now: float) -> float:
+        """
+        Приоритет с учётом ожидания, меньше - раньше. Фоновый трафик не обгоняет INTERACTIVE,
+        из дождавшихся потолка первым выдаётся ждущий дольше
+        """
+        score = waiter.priority - (now - waiter.enqueued_at) / self.aging
+        if waiter.priority > Priority.INTERACTIVE:
+            score = max(score, Priority.INTERACTIVE + 0.5)
+        return score
+
+    async def _sleep(self, seconds: float) -> None:
+        """Ждёт `seconds` или появления нового ожидающего / паузы"""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=seconds if seconds != float("inf") else None)
+        except asyncio.TimeoutError:
+            pass
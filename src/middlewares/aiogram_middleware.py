@@ -9,15 +9,13 @@ from aiogram.types import Message, TelegramObject, CallbackQuery
 
 from typing import Callable, Dict, Any, Awaitable, Type
 
-from sqlalchemy.orm import sessionmaker
-
 from src.application.bot import Messages
 from src.containers import RequestContainer
 from src.containers.app_container import AppContainer
-from src.application.models.modules import AdminModule
+from src.containers.lazy_proxy import LazyProxy
 from src.infrastructure.telegram.ui.keyboard import support_kb
 from src.infrastructure.translations import get_text
-from src.models.read_models import LogLevel, UsersDTO
+from src.models.read_models import LogLevel, UsersDTO, UserContextDTO
 
 # повышение значимости выводимого лога (имеется свой Logger)
 logging.getLogger("aiogram.event").setLevel(logging.WARNING)
@@ -25,21 +23,23 @@ logger = logging.getLogger("update_logger")
 
 
 class ModulesMiddleware(BaseMiddleware):
+    """
+    Открывает контекст апдейта: одна сессия БД (и сессия реплики, если она настроена)
+    и один RequestContainer на всю цепочку middleware и handler.
+    Сессия берёт соединение из пула только при первом запросе к БД, а модули собираются
+    лениво при первом обращении к ним.
+    """
     def __init__(self, app_container: AppContainer):
         self.app_container = app_container
 
     async def __call__(self, handler, event, data):
-        async_session_factory = self.app_container.conf.db_connection.session_local
+        async with self.app_container.request_scope() as request_container:
+            data["request_container"] = request_container
 
-        async with async_session_factory() as session:
-            request_container = self.app_container.get_request_container(session)
-
-            data["request_container_factory"] = self.app_container.get_request_container
-
-            data["profile_module"] = request_container.get_profile_modul()
-            data["catalog_modul"] = request_container.get_catalog_modul()
-            data["admin_module"] = request_container.get_admin_module()
-            data["messages_service"] = request_container.get_message_service()
+            data["profile_module"] = LazyProxy(request_container.get_profile_modul)
+            data["catalog_modul"] = LazyProxy(request_container.get_catalog_modul)
+            data["admin_module"] = LazyProxy(request_container.get_admin_module)
+            data["messages_service"] = LazyProxy(request_container.get_message_service)
             data["tg_client"] = request_container.get_tg_client()
             data["tg_logger_client"] = request_container.get_tg_logger_client()
             # создание модулей под другие разделы
@@ -78,14 +78,28 @@ class DeleteMessageOnErrorMiddleware(BaseMiddleware):
             return
 
 
+async def _get_user_context(data: Dict[str, Any]) -> UserContextDTO:
+    """
+    Вернёт контекст пользователя апдейта. Собирается один раз (одним запросом к Redis)
+    и переиспользуется всей цепочкой middleware.
+    """
+    context: UserContextDTO | None = data.get("user_context")
+    if context is None:
+        event_user = data["event_from_user"]
+        request_container: RequestContainer = data["request_container"]
+
+        context = await request_container.user_context_service.get_context(event_user.id, event_user.username)
+        data["user_context"] = context
+        data["user"] = context.user
+
+    return context
+
+
 class UserMiddleware(BaseMiddleware):
     """
-    Универсальный middleware, который добавляет объект пользователя (User)
+    Универсальный middleware, который добавляет контекст пользователя (UserContextDTO) и объект пользователя (User)
     в data для всех типов апдейтов, где есть from_user.
     """
-    def __init__(self, session_factory: Callable[[], Awaitable[sessionmaker]]):
-        self.session_factory = session_factory
-
     async def __call__(
         self,
         handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
@@ -93,21 +107,8 @@ class UserMiddleware(BaseMiddleware):
         data: Dict[str, Any],
     ) -> Any:
         # aiogram сам парсит объект апдейта и кладёт ключи вроде "event_from_user"
-        event_user = data.get("event_from_user")
-
-        if event_user:
-            async with self.session_factory() as session:
-                request_container = data["request_container_factory"](session)
-
-                admin_module: AdminModule = request_container.get_admin_module()
-
-                user = await admin_module.user_service.get_user(
-                    event_user.id,
-                    event_user.username,
-                    update_last_used=True
-                )
-
-                data["user"] = user
+        if data.get("event_from_user"):
+            await _get_user_context(data)
 
         # даже если from_user нет, не ломаем обработку
         return await handler(event, data)
@@ -118,85 +119,69 @@ class MaintenanceMiddleware(BaseMiddleware):
     Middleware для режима обслуживания (maintenance mode). Запрещает отправку сообщений от бота если идут тех работы.
     Администраторы смогут пользоваться ботом даже при техработах.
     """
-    def __init__(self, session_factory: Callable[[], Awaitable[sessionmaker]]):
-        self.session_factory = session_factory
-
     async def __call__(
         self,
         handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
         event: TelegramObject,
         data: Dict[str, Any]
     ) -> Any:
-        event_user = data.get("event_from_user")
+        context = await _get_user_context(data)
 
-        user_id = event_user.id
-
-        async with self.session_factory() as session:
-            request_container: RequestContainer = data["request_container_factory"](session)
+        # Проверяем режим обслуживания
+        if not context.maintenance_mode:
+            return await handler(event, data)
 
-            admin_module = request_container.get_admin_module()
-            messages_service = request_container.get_message_service()
+        if context.is_admin:
+            return await handler(event, data)
 
-            # Проверяем режим обслуживания
-            settings = await admin_module.settings_service.get_settings()
-            if not settings.maintenance_mode:
-                return await handler(event, data)
+        request_container: RequestContainer = data["request_container"]
+        language = context.user.language if context.user else request_container.config.app.default_lang
 
-            if await admin_module.admin_service.check_admin(user_id):
-                return await handler(event, data)
-
-            user = await admin_module.user_service.get_user(user_id, update_last_used=True)
-            language = user.language if user else admin_module.conf.app.default_lang
-
-            await messages_service.send_msg.send(
-                user_id,
-                message=get_text(
-                    language,
-                    "start_message",
-                    "temporarily_maintenance"
-                ),
-                event_message_key="technical_work"
-            )
+        messages_service = request_container.get_message_service()
+        await messages_service.send_msg.send(
+            context.user_id,
+            message=get_text(
+                language,
+                "start_message",
+                "temporarily_maintenance"
+            ),
+            event_message_key="technical_work"
+        )
 
 
 class CheckuserNotBlok(BaseMiddleware):
     """
         Проверит наличие бана у пользователя, если имеется, то отправит соответсвующее сообщение
     """
-    def __init__(self, session_factory: Callable[[], Awaitable[sessionmaker]]):
-        self.session_factory = session_factory
-
     async def __call__(
         self,
         handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
         event: TelegramObject,
         data: Dict[str, Any]
     ) -> Any:
-        user = data.get("event_from_user")
-
-        if not user:
+        if not data.get("event_from_user"):
             return
 
-        async with self.session_factory() as session:
-            request_container: RequestContainer = data["request_container_factory"](session)
-
-            admin_module = request_container.get_admin_module()
-            messages_service = request_container.get_message_service()
-            reason = await admin_module.banned_account_service.get_ban(user.id)
+        context = await _get_user_context(data)
 
-            if reason:
-                user_db = await admin_module.user_service.get_user(user.id)
-                message = f"Вы были забанены в боте по причине: {reason}"
+        if context.is_banned:
+            reason = context.ban_reason
+            message = f"Вы были забанены в боте по причине: {reason}"
 
-                if user_db:
-                    message = get_text(user_db.language, "kb_start", "you_banned").format(reason=reason)
+            if context.user:
+                message = get_text(context.user.language, "kb_start", "you_banned").format(reason=reason)
 
-                settings = await admin_module.settings_service.get_settings()
-                await messages_service.send_msg.send(
-                    user.id, message=message, reply_markup=await support_kb(admin_module.conf.app.default_lang, settings.support_username)
+            request_container: RequestContainer = data["request_container"]
+            messages_service = request_container.get_message_service()
+            await messages_service.send_msg.send(
+                context.user_id,
+                message=message,
+                reply_markup=await support_kb(
+                    request_container.config.app.default_lang, context.settings.support_username
                 )
+            )
 
-                return
+            return
 
         return await handler(event, data)
 
@@ -205,30 +190,22 @@ class OnlyAdminsMiddleware(BaseMiddleware):
     """
     middleware который пропускает только админов (использовать для работы с админ панелью)
     """
-    def __init__(self, session_factory: Callable[[], Awaitable[sessionmaker]]):
-        self.session_factory = session_factory
-
     async def __call__(
         self,
         handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
         event: TelegramObject,
         data: Dict[str, Any]
     ) -> Any:
-        user = data.get("event_from_user")
-
-        if not user:
+        if not data.get("event_from_user"):
             return
 
+        context = await _get_user_context(data)
 
-        async with self.session_factory() as session:
-            request_container: RequestContainer = data["request_container_factory"](session)
-
-            admin_module = request_container.get_admin_module()
-            if not await admin_module.admin_service.check_admin(user.id):
-                if isinstance(event, CallbackQuery):
-                    await event.answer("Access for administrators only", show_alert=True)
-                    await event.message.delete()
-                return
+        if not context.is_admin:
+            if isinstance(event, CallbackQuery):
+                await event.answer("Access for administrators only", show_alert=True)
+                await event.message.delete()
+            return
 
         return await handler(event, data)
 
@@ -242,11 +219,14 @@ class I18nKeyFilter(BaseFilter):
         # сообщение должно содержать текст
         if not getattr(message, "text", None):
             return False
-        try:
-            admin_module: AdminModule = data["admin_module"]
-            user = await admin_module.user_service.get_user(message.from_user.id, update_last_used=True)
-        except Exception:
-            return False
+        # пользователь уже получен в UserMiddleware для этого апдейта
+        user: UsersDTO | None = data.get("user")
+        if user is None:
+            try:
+                request_container: RequestContainer = data["request_container"]
+                user = await request_container.user_service.get_user(message.from_user.id, update_last_used=True)
+            except Exception:
+                return False
 
         if not user:
             return False
@@ -265,8 +245,8 @@ class ErrorLoggingMiddleware(BaseMiddleware):
             return await handler(event, data)
 
         except Exception as e:
-            admin_module: AdminModule = data["admin_module"]
-            user: UsersDTO = data["user"]
+            request_container: RequestContainer = data["request_container"]
+            context: UserContextDTO = data["user_context"]
             messages_service: Messages = data["messages_service"]
 
             user_id = None
@@ -280,7 +260,7 @@ class ErrorLoggingMiddleware(BaseMiddleware):
                 user_id = event.from_user.id
                 chat_id = event.message.chat.id if event.message else None
 
-            admin_module.logger.exception(
+            request_container.logger.exception(
                 "Unhandled exception",
                 extra={
                     "user_id": user_id,
@@ -289,16 +269,17 @@ class ErrorLoggingMiddleware(BaseMiddleware):
                 },
             )
 
+            language = context.user.language if context.user else request_container.config.app.default_lang
             try:
                 await messages_service.send_msg.send(
-                    user.user_id,
-                    get_text(user.language, "miscellaneous", "server_error"),
+                    context.user_id,
+                    get_text(language, "miscellaneous", "server_error"),
                 )
             except Exception:
-                admin_module.logger.exception("Failed to notify user about error")
+                request_container.logger.exception("Failed to notify user about error")
 
-            await admin_module.publish_event_handler.send_log(
-                text=f"#Ошибка: {str(e)}. \nID пользователя: {user.user_id}", log_lvl=LogLevel.ERROR
+            await request_container.publish_event_handler.send_log(
+                text=f"#Ошибка: {str(e)}. \nID пользователя: {context.user_id}", log_lvl=LogLevel.ERROR
             )
 
             raise
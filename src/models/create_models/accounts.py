@@ -22,6 +22,7 @@ class CreateAccountStorageDTO(BaseModel):
     password_encrypted: Optional[str] = None    # Зашифрованный Пароль
     password_nonce: Optional[str] = None        # используемый nonce при шифровании
     tg_id: Optional[int] = None                 # ID аккаунта в телеграмме. Только для ТГ аккаунтов
+    storage_uuid: Optional[str] = None          # Если не задан, генерируется при создании
 
 
 class CreateProductAccountDTO(BaseModel):
@@ -1,4 +1,4 @@
-from typing import Dict, Optional
+from typing import Dict, Literal, Optional
 
 from pydantic import BaseModel
 
@@ -15,4 +15,12 @@ class CreateSentMassMessages(BaseModel):
     photo_id: Optional[str]
     button_url: Optional[str]
     number_received: int  # число полученных сообщений (те которые фактически дошли до пользователя)
-    number_sent: int # число отправленных сообщений
\ No newline at end of file
+    number_sent: int # число отправленных сообщений
+
+
+class BroadcastSegment(BaseModel):
+    """Фильтр получателей рассылки, проверяется в SQL. Незаданные поля выборку не ограничивают"""
+    active_within_days: Optional[int] = None  # заходили в бота за последние N дней (users.last_used)
+    language: Optional[Literal["ru", "en"]] = None
+    has_purchased: Optional[bool] = None  # True - только покупатели, False - только без покупок
+    notification: Optional[Literal["referral_invitation", "referral_replenishment"]] = None  # включённое уведомление из NotificationSettings
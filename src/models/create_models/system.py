@@ -2,6 +2,8 @@ from typing import Optional
 
 from pydantic import BaseModel
 
+from src.database.models.system.models import BackupStatus
+
 
 class CreateFileDTO(BaseModel):
     file_path: str
@@ -25,3 +27,4 @@ class CreateBackupLogDTO(BaseModel):
     encrypted_dek_b64: str
     dek_nonce_b64: str
     size_bytes: int
+    status: Optional[BackupStatus] = None # если указан, создаётся запись BackupLogStats
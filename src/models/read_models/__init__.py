@@ -16,6 +16,7 @@ from src.models.read_models.categories.product_universal import (
     UniversalStorageTranslationDTO,
     SoldUniversalDTO,
     DeletedUniversalDTO,
+    UniversalIntegrityDTO,
 )
 
 from src.models.read_models.categories.purshanse_schem import ResultCheckCategory, StartPurchaseAccount, \
@@ -25,8 +26,9 @@ from src.models.read_models.events.filesystem import EventCreateUiImage
 from src.models.read_models.events.purchase import NewPurchaseAccount, NewPurchaseUniversal
 from src.models.read_models.events.referrals import ReferralReplenishmentCompleted, ReferralIncomeResult
 from src.models.read_models.events.replenishments import NewReplenishment, ReplenishmentCompleted, ReplenishmentFailed
-from src.models.read_models.events.message import LogLevel, EventSentLog
+from src.models.read_models.events.message import LogLevel, EventSentLog, EventSendUserMessage
 
+from src.models.read_models.pagination import PageCursor
 from src.models.read_models.referral_report import ReferralIncomeItemDTO, ReferralReportItemDTO, ReferralReportDTO
 
 from src.models.read_models.purchase import PurchaseRequestsDTO, StartPurchaseUniversalOne, StartPurchaseUniversal
@@ -34,6 +36,7 @@ from src.models.read_models.admins import AdminsDTO, AdminActionsDTO
 from src.models.read_models.other import (
     SettingsDTO,
     UsersDTO,
+    UserContextDTO,
     BannedAccountsDTO,
     StickersDTO,
     UiImagesDTO,
@@ -45,6 +48,8 @@ from src.models.read_models.other import (
 )
 
 __all__ = [
+    "PageCursor",
+
     "SoldAccountsDTO",
     "SoldAccountsTranslationDTO",
     'AccountStorageDTO',
@@ -66,6 +71,7 @@ __all__ = [
     "UniversalStorageTranslationDTO",
     "SoldUniversalDTO",
     "DeletedUniversalDTO",
+    "UniversalIntegrityDTO",
     "UniversalStoragePydantic",
     "ProductUniversalSmall",
     "ProductUniversalFull",
@@ -82,6 +88,7 @@ __all__ = [
     # Other models
     "SettingsDTO",
     "UsersDTO",
+    "UserContextDTO",
     "BannedAccountsDTO",
     "StickersDTO",
     "UiImagesDTO",
@@ -97,6 +104,7 @@ __all__ = [
     "NewActivationVoucher",
     "LogLevel",
     "EventSentLog",
+    "EventSendUserMessage",
     "NewPurchaseAccount",
     "NewPurchaseUniversal",
     "ReferralReplenishmentCompleted",
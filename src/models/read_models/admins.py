@@ -1,5 +1,7 @@
 from datetime import datetime
 
+from pydantic import BaseModel
+
 from src.models.base import ORMDTO
 
 
@@ -34,4 +36,48 @@ class SentMasMessagesDTO(ORMDTO):
     button_url: str | None           # URL для кнопки
     number_received: int             # число сообщений, которые дошли до пользователя
     number_sent: int                 # число отправленных сообщений
-    created_at: datetime
\ No newline at end of file
+    created_at: datetime
+
+
+class MassMailingJobDTO(ORMDTO):
+    job_id: int
+    user_id: int                     # ID админа, запустившего рассылку
+    status: str                      # 'running', 'completed', 'cancelled'
+    content: str
+    photo_path: str | None
+    photo_id: str | None
+    button_url: str | None
+    segment: dict | None             # BroadcastSegment, None - все пользователи
+    cursor_user_id: int | None       # последний обработанный user_id, None - рассылка ещё не начата
+    total_users: int                 # пользователей на момент запуска
+    number_received: int             # дошли до пользователя
+    number_sent: int                 # обработано всего
+    number_retried: int              # повторных отправок после RetryAfter
+    sent_message_id: int | None
+    created_at: datetime
+    updated_at: datetime
+    finished_at: datetime | None
+
+
+class MassMailingBatchDTO(ORMDTO):
+    batch_id: int
+    job_id: int
+    first_user_id: int
+    last_user_id: int
+    number_received: int
+    number_sent: int
+    number_retried: int
+    duration: float                  # секунды на отправку пачки
+    created_at: datetime
+
+
+class MassMailingProgress(BaseModel):
+    """Текущие показатели рассылки для админа"""
+    job_id: int
+    finished: bool
+    total_users: int
+    number_received: int
+    number_sent: int
+    number_retried: int
+    messages_per_second: float       # скорость с момента запуска (или продолжения) рассылки
+    eta_seconds: int | None          # оценка оставшегося времени, None - скорость ещё неизвестна
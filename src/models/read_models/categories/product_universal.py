@@ -53,6 +53,14 @@ class DeletedUniversalDTO(ORMDTO):
     create_at: datetime
 
 
+class UniversalIntegrityDTO(ORMDTO):
+    universal_storage_id: int
+    checksum: str | None
+    file_size: int | None
+    is_valid: bool
+    verified_at: datetime
+
+
 class UniversalStoragePydantic(ORMDTO):
     universal_storage_id: int
     storage_uuid: str
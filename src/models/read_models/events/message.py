@@ -14,4 +14,10 @@ class LogLevel(enum.Enum):
 class EventSentLog(BaseModel):
     text: str
     log_lvl: Optional[LogLevel] = None
-    channel_for_logging_id: Optional[int] = None
\ No newline at end of file
+    channel_for_logging_id: Optional[int] = None
+
+
+class EventSendUserMessage(BaseModel):
+    """Уведомление пользователю, отправляется обработчиками message.* через общий RateLimiter"""
+    user_id: int
+    text: str
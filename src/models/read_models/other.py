@@ -1,8 +1,10 @@
 from datetime import datetime
 from typing import Optional
 
+from pydantic import BaseModel, ConfigDict
+
 from src.database.models.categories import ProductType
-from src.database.models.system.models import ReplenishmentService
+from src.database.models.system.models import ReplenishmentService, BackupStatus
 from src.models.base import ORMDTO
 
 
@@ -30,6 +32,25 @@ class UsersDTO(ORMDTO):
     last_used: datetime
 
 
+class UserContextDTO(BaseModel):
+    """Всё, что нужно цепочке middleware о пользователе апдейта. Собирается один раз на апдейт"""
+    model_config = ConfigDict(frozen=True)
+
+    user_id: int
+    user: Optional[UsersDTO]
+    ban_reason: Optional[str]    # причина бана, None если пользователь не забанен
+    is_admin: bool
+    settings: Optional[SettingsDTO]
+
+    @property
+    def is_banned(self) -> bool:
+        return self.ban_reason is not None
+
+    @property
+    def maintenance_mode(self) -> bool:
+        return bool(self.settings and self.settings.maintenance_mode)
+
+
 class BannedAccountsDTO(ORMDTO):
     banned_account_id: int
     user_id: int
@@ -165,6 +186,17 @@ class FilesDTO(ORMDTO):
     updated_at: datetime
 
 
+class BackupLogStatsDTO(ORMDTO):
+    backup_log_id: int
+    status: BackupStatus
+    dump_size_bytes: int
+    duration_seconds: Optional[float] = None
+    throughput_bytes_per_second: Optional[int] = None
+    updated_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+
+
 class BackupLogsDTO(ORMDTO):
     backup_log_id: int
     storage_file_name: str
@@ -173,6 +205,12 @@ class BackupLogsDTO(ORMDTO):
     dek_nonce_b64: str
     size_bytes: int
     created_at: datetime
+    stats: Optional[BackupLogStatsDTO] = None
+
+    @property
+    def status(self) -> BackupStatus:
+        """Бэкапы без статистики сделаны до её появления и считаются успешными"""
+        return self.stats.status if self.stats else BackupStatus.COMPLETED
 
 
 class ActivatedPromoCodesDTO(ORMDTO):
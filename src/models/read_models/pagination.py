@@ -0,0 +1,70 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def _to_base36(value: int) -> str:
+    if value == 0:
+        return "0"
+
+    result = ""
+    while value:
+        value, remainder = divmod(value, 36)
+        result = _DIGITS[remainder] + result
+    return result
+
+
+class PageCursor(BaseModel):
+    """
+    Позиция страницы списка для keyset-пагинации. Передаётся в callback_data кнопок строкой `encode()`.
+
+    Страница строится от записи-якоря `anchor_id` по составному индексу (дата, id), а не через OFFSET,
+    поэтому её стоимость не зависит от номера страницы. `total` считается один раз при открытии списка
+    и дальше передаётся в курсоре, повторный COUNT на каждой странице не нужен.
+    Без якоря страница выбирается по номеру (первая страница и кнопки из старых сообщений вида `...:5`).
+    """
+    page: int = Field(default=1, ge=1)
+    total: Optional[int] = None
+    anchor_id: Optional[int] = None
+    backward: bool = False # страница перед якорем (кнопка "влево"), иначе после него
+
+    def encode(self) -> str:
+        """:return: Короткая строка без ':' вида 'page.total.anchor.b' в base36, в ней всегда есть точка"""
+        parts = [
+            _to_base36(self.page),
+            _to_base36(self.total) if self.total is not None else "",
+            _to_base36(self.anchor_id) if self.anchor_id is not None else "",
+            "b" if self.backward else "",
+        ]
+        while len(parts) > 2 and parts[-1] == "":
+            parts.pop()
+        return ".".join(parts)
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        """:exception ValueError: Некорректный токен"""
+        if "." not in token: # номер страницы из кнопок, созданных до перехода на курсоры
+            return cls(page=int(token))
+
+        page, total, anchor_id, direction = (token.split(".") + ["", "", ""])[:4]
+        return cls(
+            page=int(page, 36),
+            total=int(total, 36) if total else None,
+            anchor_id=int(anchor_id, 36) if anchor_id else None,
+            backward=direction == "b",
+        )
+
+    def next(self, last_id: int) -> "PageCursor":
+        return PageCursor(page=self.page + 1, total=self.total, anchor_id=last_id)
+
+    def recount(self) -> "PageCursor":
+        """Тот же курсор без `total`, чтобы кол-во пересчиталось (после удаления записи из списка)"""
+        return self.model_copy(update={"total": None})
+
+    def previous(self, first_id: int) -> "PageCursor":
+        if self.page <= 2:
+            return PageCursor(total=self.total)
+        return PageCursor(page=self.page - 1, total=self.total, anchor_id=first_id, backward=True)
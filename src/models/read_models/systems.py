@@ -9,6 +9,14 @@ class ReplenishmentPaymentSystem(BaseModel):
     amount_replenishments: int
 
 
+class SalesCategory(BaseModel):
+    category_id: int # 0 это продажи без известной категории
+    name: str
+    quantity_sale: int
+    amount_sale: int
+    total_net_profit: int
+
+
 class StatisticsData(BaseModel):
     active_users: int
     new_users: int
@@ -26,6 +34,8 @@ class StatisticsData(BaseModel):
     amount_sale_universal: int
     total_net_profit_universal: int
 
+    sales_by_category: List[SalesCategory] = [] # по убыванию суммы продаж
+
     quantity_replenishments: int
     amount_replenishments: int
     replenishment_payment_systems: List[ReplenishmentPaymentSystem]
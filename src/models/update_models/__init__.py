@@ -14,6 +14,7 @@ from src.models.update_models.system import (
     UpdateStickerDTO,
     UpdateUiImageDTO,
     UpdateTypePaymentDTO,
+    UpdateBackupLogDTO,
 )
 from src.models.update_models.referrals import UpdateReferralLevelDTO
 
@@ -31,5 +32,6 @@ __all__ = [
     "UpdateStickerDTO",
     "UpdateUiImageDTO",
     "UpdateTypePaymentDTO",
+    "UpdateBackupLogDTO",
     "UpdateReferralLevelDTO",
 ]
@@ -1,7 +1,10 @@
+from datetime import datetime
 from typing import Optional, Dict, Any
 
 from pydantic import BaseModel
 
+from src.database.models.system.models import BackupStatus
+
 
 class UpdateSettingsDTO(BaseModel):
     maintenance_mode: Optional[bool] = None
@@ -36,3 +39,13 @@ class UpdateTypePaymentDTO(BaseModel):
     commission: Optional[float] = None
     index: Optional[int] = None
     extra_data: Optional[Dict[str, Any]] = None
+
+
+class UpdateBackupLogDTO(BaseModel):
+    size_bytes: Optional[int] = None
+    status: Optional[BackupStatus] = None
+    dump_size_bytes: Optional[int] = None
+    duration_seconds: Optional[float] = None
+    throughput_bytes_per_second: Optional[int] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
@@ -251,10 +251,20 @@ async def import_tg_account(
 
     message_info = await gen_mes_info.__anext__()
 
+    async def on_progress(done: int, total: int):
+        await messages_service.edit_msg.edit(
+            message.from_user.id,
+            message_info.message_id,
+            get_text(user.language, "admins_editor_category", "import_accounts_progress").format(
+                done=done, total=total
+            ),
+        )
+
     gen_import_acc = admin_module.import_tg_account.import_telegram_accounts_from_archive(
         archive_path=save_path,
         category_id=data.category_id,
-        type_account_service=data.type_account_service
+        type_account_service=data.type_account_service,
+        on_progress=on_progress,
     )
     try:
         result = await gen_import_acc.__anext__()
@@ -124,7 +124,7 @@ async def editor_mes_mailing(
             user.language,
             "admins_editor_mass_mailing",
             "confirmation_broadcast_to_all_users"
-        ).format(need_seconds=await admin_module.user_service.get_quantity_users() // admin_module.conf.different.rate_send_msg_limit),
+        ).format(need_seconds=await messages_service.mass_tg_mailing.count_recipients() // admin_module.conf.different.rate_send_msg_limit),
         reply_markup=confirm_start_mailing_kb(user.language)
     )
 
@@ -133,35 +133,27 @@ async def editor_mes_mailing(
 async def start_mass_mailing(
     callback: CallbackQuery, user: UsersDTO, admin_module: AdminModule, messages_service: Messages,
 ):
-    i = 0
-    quantity_successfully = 0
-    quantity_users = await admin_module.user_service.get_quantity_users()
+    mass_tg_mailing = messages_service.mass_tg_mailing
     message_data = await admin_module.message_for_sending_service.get_msg(user.user_id)
     ui_image = await admin_module.ui_images_service.get_ui_image(message_data.ui_image_key)
     message = None
 
     try:
-        async for user_id, ok, exc in messages_service.mass_tg_mailing.broadcast_message_generator(
+        job = await mass_tg_mailing.start_broadcast(
             text=message_data.content,
             admin_id=user.user_id,
             photo_path=admin_module.path_builder.build_path_ui_image(file_name=ui_image.file_name),
             show_image=ui_image.show,
             button_url=message_data.button_url,
-        ):
-            i += 1
-
-            if ok:
-                quantity_successfully += 1
+        )
 
-            if i % 50 == 0: # каждый 50 вызов
+        # показатели обновляются после каждой сохранённой пачки
+        async for progress in mass_tg_mailing.run_broadcast(job.job_id):
+            if not progress.finished:
                 await messages_service.edit_msg.edit(
                     chat_id=user.user_id,
                     message_id=callback.message.message_id,
-                    message=get_text(
-                        user.language,
-                        "admins_editor_mass_mailing",
-                        "mailing_statistics"
-                    ).format(quantity_successfully=quantity_successfully, quantity_sent_total=i, quantity_users=quantity_users)
+                    message=mass_tg_mailing.format_progress(user.language, progress)
                 )
     except TextTooLong:
         message = get_text(
@@ -182,13 +174,7 @@ async def start_mass_mailing(
             user.language,
             "admins_editor_mass_mailing",
             "mailing_completed"
-        ).format(
-            result=get_text(
-                user.language,
-                "admins_editor_mass_mailing",
-                "mailing_statistics"
-            ).format(quantity_successfully=quantity_successfully, quantity_sent_total=i, quantity_users=quantity_users)
-        )
+        ).format(result=mass_tg_mailing.format_progress(user.language, progress))
 
     await messages_service.edit_msg.edit(
         chat_id=user.user_id,
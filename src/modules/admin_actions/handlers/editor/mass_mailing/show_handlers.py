@@ -29,7 +29,7 @@ async def admin_promo(callback: CallbackQuery, state: FSMContext, user: UsersDTO
 async def sent_message_list(
     callback: CallbackQuery, user: UsersDTO, admin_module: AdminModule, messages_service: Messages,
 ):
-    current_page = int(callback.data.split(":")[1])
+    current_page = callback.data.split(":")[1]
     await messages_service.edit_msg.edit(
         chat_id=user.user_id,
         message_id=callback.message.message_id,
@@ -42,7 +42,7 @@ async def sent_message_list(
 async def show_sent_mass_message(
     callback: CallbackQuery, user: UsersDTO, admin_module: AdminModule, messages_service: Messages,
 ):
-    current_page = int(callback.data.split(":")[1])
+    current_page = callback.data.split(":")[1]
     msg_id = int(callback.data.split(":")[2])
     msg = await admin_module.sent_mass_message_service.get_msg(msg_id)
     image_key = None
@@ -93,7 +93,7 @@ async def show_sent_mass_message(
 async def detail_mass_msg(
     callback: CallbackQuery, user: UsersDTO, admin_module: AdminModule, messages_service: Messages,
 ):
-    current_page = int(callback.data.split(":")[1])
+    current_page = callback.data.split(":")[1]
     msg_id = int(callback.data.split(":")[2])
     msg = await admin_module.sent_mass_message_service.get_msg(msg_id)
 
@@ -3,7 +3,7 @@ from aiogram.types import CallbackQuery
 
 from src.application.bot import Messages
 from src.application.models.modules import AdminModule
-from src.models.read_models import UsersDTO
+from src.models.read_models import UsersDTO, PageCursor
 from src.modules.admin_actions.keyboards import back_in_all_admin_promo_kb, confirm_deactivate_promo_code_kb
 
 from src.infrastructure.translations import get_text
@@ -18,7 +18,7 @@ async def confirm_deactivate_promo_code(
 ):
     promo_code_id = int(callback.data.split(":")[1])
     show_not_valid = bool(int(callback.data.split(":")[2]))
-    current_page = int(callback.data.split(':')[3])
+    current_page = callback.data.split(':')[3]
 
     promo_code = await admin_module.promo_code_service.get_promo_code(promo_code_id=promo_code_id)
 
@@ -47,7 +47,7 @@ async def deactivate_promo_code_handler(
 ):
     promo_code_id = int(callback.data.split(":")[1])
     show_not_valid = bool(int(callback.data.split(":")[2]))
-    current_page = int(callback.data.split(':')[3])
+    current_page = callback.data.split(':')[3]
 
     promo_code = await admin_module.promo_code_service.get_promo_code(promo_code_id=promo_code_id, get_only_valid=False)
 
@@ -62,5 +62,7 @@ async def deactivate_promo_code_handler(
         chat_id=callback.from_user.id,
         message_id=callback.message.message_id,
         message=text,
-        reply_markup=back_in_all_admin_promo_kb(user.language, current_page, show_not_valid)
+        reply_markup=back_in_all_admin_promo_kb(
+            user.language, PageCursor.decode(current_page).recount().encode(), show_not_valid
+        )
     )
\ No newline at end of file
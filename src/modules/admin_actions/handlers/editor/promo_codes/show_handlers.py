@@ -30,7 +30,7 @@ async def admin_promo_list(
     callback: CallbackQuery, user: UsersDTO, admin_module: AdminModule, messages_service: Messages,
 ):
     show_not_valid = bool(int(callback.data.split(":")[1]))
-    current_page = int(callback.data.split(":")[2])
+    current_page = callback.data.split(":")[2]
 
     await messages_service.edit_msg.edit(
         chat_id=callback.from_user.id,
@@ -49,7 +49,7 @@ async def admin_promo_list(
 async def show_admin_promo(
     callback: CallbackQuery, user: UsersDTO, admin_module: AdminModule, messages_service: Messages,
 ):
-    current_page = int(callback.data.split(':')[1])
+    current_page = callback.data.split(':')[1]
     show_not_valid = bool(int(callback.data.split(":")[2]))
     promo_code_id = int(callback.data.split(":")[3])
 
@@ -3,7 +3,7 @@ from aiogram.types import CallbackQuery
 
 from src.application.bot import Messages
 from src.application.models.modules import AdminModule
-from src.models.read_models import UsersDTO
+from src.models.read_models import UsersDTO, PageCursor
 from src.modules.admin_actions.keyboards import back_in_all_admin_voucher_kb, confirm_deactivate_admin_voucher_kb
 
 from src.infrastructure.translations import get_text
@@ -17,7 +17,7 @@ async def confirm_deactivate_admin_voucher(
     callback: CallbackQuery, user: UsersDTO, admin_module: AdminModule, messages_service: Messages
 ):
     voucher_id = int(callback.data.split(":")[1])
-    current_page = int(callback.data.split(':')[2])
+    current_page = callback.data.split(':')[2]
 
     voucher = await admin_module.voucher_service.get_voucher_by_id(voucher_id)
 
@@ -48,7 +48,7 @@ async def deactivate_admin_voucher(
     callback: CallbackQuery, user: UsersDTO, admin_module: AdminModule, messages_service: Messages
 ):
     voucher_id = int(callback.data.split(":")[1])
-    current_page = int(callback.data.split(':')[2])
+    current_page = callback.data.split(':')[2]
 
     voucher = await admin_module.voucher_service.get_voucher_by_id(voucher_id)
 
@@ -63,5 +63,5 @@ async def deactivate_admin_voucher(
             chat_id=callback.from_user.id,
             message_id=callback.message.message_id,
             message=text,
-            reply_markup=back_in_all_admin_voucher_kb(user.language, current_page)
+            reply_markup=back_in_all_admin_voucher_kb(user.language, PageCursor.decode(current_page).recount().encode())
     )
\ No newline at end of file
@@ -37,7 +37,7 @@ async def admin_voucher_list(
         message_id=callback.message.message_id,
         event_message_key='admin_panel',
         reply_markup=await all_admin_vouchers_kb(
-            current_page=int(current_page),
+            current_page=current_page,
             language=user.language,
             admin_module=admin_module,
         )
@@ -52,7 +52,7 @@ async def show_admin_voucher(
     messages_service: Messages,
     tg_client: TelegramClient,
 ):
-    current_page = int(callback.data.split(':')[1])
+    current_page = callback.data.split(':')[1]
     voucher_id = int(callback.data.split(":")[2])
 
     voucher = await admin_module.voucher_service.get_voucher_by_id(voucher_id)
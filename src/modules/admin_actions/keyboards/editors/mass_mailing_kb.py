@@ -1,12 +1,11 @@
-from math import ceil
-
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
 from src.application.models.modules import AdminModule
 from src.database.models.admins import SentMasMessages
-from src.application.keyboards.keyboard_with_pages import pagination_keyboard
+from src.application.keyboards.keyboard_with_pages import cursor_pagination_keyboard, load_cursor_page
 from src.infrastructure.translations import get_text
+from src.models.read_models import PageCursor
 
 
 def admin_mailing_kb(language: str):
@@ -73,13 +72,20 @@ def change_mailing_btn_url_kb(language: str):
     ])
 
 
-async def all_admin_mass_mailing_kb(language: str, current_page: int, admin_module: AdminModule,):
-    """Клавиатура со списком только активных ваучеров у администрации"""
-    records = await admin_module.sent_mass_message_service.get_msgs_by_page(
-        page=current_page, page_size=admin_module.conf.different.page_size
+async def all_admin_mass_mailing_kb(language: str, current_page: str, admin_module: AdminModule,):
+    """
+    Клавиатура со списком отправленных рассылок
+    :param current_page: Курсор страницы из `PageCursor.encode()` (или номер страницы).
+    """
+    service = admin_module.sent_mass_message_service
+    page_size = admin_module.conf.different.page_size
+
+    records, cursor = await load_cursor_page(
+        PageCursor.decode(current_page),
+        lambda c: service.get_msgs_by_page(page_size=page_size, cursor=c),
+        service.get_count_msgs,
     )
-    total = await admin_module.sent_mass_message_service.get_count_msgs()
-    total_pages = max(ceil(total / admin_module.conf.different.page_size), 1)
+    current_page = cursor.encode()
 
     def item_button(sent_message: SentMasMessages):
         return InlineKeyboardButton(
@@ -87,13 +93,13 @@ async def all_admin_mass_mailing_kb(language: str, current_page: int, admin_modu
             callback_data=f"show_sent_mass_message:{current_page}:{sent_message.message_id}"
         )
 
-    return pagination_keyboard(
+    return cursor_pagination_keyboard(
         records,
-        current_page,
-        total_pages,
+        cursor,
+        page_size,
+        lambda sent_message: sent_message.message_id,
         item_button,
-        left_prefix=f"sent_message_list",
-        right_prefix=f"sent_message_list",
+        prefix=f"sent_message_list",
         back_text=get_text(language, "kb_general", "back"),
         back_callback="admin_mailing",
     )
@@ -101,7 +107,7 @@ async def all_admin_mass_mailing_kb(language: str, current_page: int, admin_modu
 
 def show_sent_mass_message_kb(
     language: str,
-    current_page: int,
+    current_page: str,
     message_id: int,
     admin_module: AdminModule,
     button_url: str | None = None
@@ -124,7 +130,7 @@ def show_sent_mass_message_kb(
     return keyboard.as_markup()
 
 
-def back_in_show_sent_mass_message_kb(language: str, current_page: int, message_id: int, button_url: str | None = None):
+def back_in_show_sent_mass_message_kb(language: str, current_page: str, message_id: int, button_url: str | None = None):
     return InlineKeyboardMarkup(inline_keyboard=[
         [InlineKeyboardButton(
             text=get_text(language, "kb_general", "back"),
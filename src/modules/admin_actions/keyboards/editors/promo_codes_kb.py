@@ -1,12 +1,11 @@
-from math import ceil
-
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
 from src.application.models.modules import AdminModule
 from src.database.models.discount import PromoCodes
-from src.application.keyboards.keyboard_with_pages import pagination_keyboard
+from src.application.keyboards.keyboard_with_pages import cursor_pagination_keyboard, load_cursor_page
 from src.infrastructure.translations import get_text
+from src.models.read_models import PageCursor
 
 
 def admin_promo_kb(language: str):
@@ -17,13 +16,20 @@ def admin_promo_kb(language: str):
     ])
 
 
-async def all_admin_promo_kb(current_page: int, language: str, show_not_valid: bool, admin_module: AdminModule,):
-    """Клавиатура со списком только активных ваучеров у администрации"""
-    records = await admin_module.promo_code_service.get_promo_code_by_page(
-        page=current_page, page_size=admin_module.conf.different.page_size, show_not_valid=show_not_valid
+async def all_admin_promo_kb(current_page: str, language: str, show_not_valid: bool, admin_module: AdminModule,):
+    """
+    Клавиатура со списком промокодов
+    :param current_page: Курсор страницы из `PageCursor.encode()` (или номер страницы).
+    """
+    service = admin_module.promo_code_service
+    page_size = admin_module.conf.different.page_size
+
+    records, cursor = await load_cursor_page(
+        PageCursor.decode(current_page),
+        lambda c: service.get_promo_code_by_page(page_size=page_size, show_not_valid=show_not_valid, cursor=c),
+        lambda: service.get_count_promo_codes(consider_invalid=show_not_valid),
     )
-    total = await admin_module.promo_code_service.get_count_promo_codes(consider_invalid=show_not_valid)
-    total_pages = max(ceil(total / admin_module.conf.different.page_size), 1)
+    current_page = cursor.encode()
 
     def item_button(promo_code: PromoCodes):
         valid = get_text(language, "kb_admin_panel", "valid" if promo_code.is_valid else "not_valid")
@@ -32,13 +38,13 @@ async def all_admin_promo_kb(current_page: int, language: str, show_not_valid: b
             callback_data=f"show_admin_promo:{current_page}:{int(show_not_valid)}:{promo_code.promo_code_id}"
         )
 
-    return pagination_keyboard(
+    return cursor_pagination_keyboard(
         records,
-        current_page,
-        total_pages,
+        cursor,
+        page_size,
+        lambda promo_code: promo_code.promo_code_id,
         item_button,
-        left_prefix=f"admin_promo_list:{int(show_not_valid)}",
-        right_prefix=f"admin_promo_list:{int(show_not_valid)}",
+        prefix=f"admin_promo_list:{int(show_not_valid)}",
         back_text=get_text(language, "kb_general", "back"),
         back_callback="admin_promo",
         helpers_text=get_text(
@@ -70,7 +76,7 @@ def skip_expire_at_promo_or_in_start_kb(language: str):
     ])
 
 
-def show_admin_promo_kb(language: str, current_page: int, promo_code_id: int, show_not_valid: bool, is_valid: bool):
+def show_admin_promo_kb(language: str, current_page: str, promo_code_id: int, show_not_valid: bool, is_valid: bool):
     keyboard = InlineKeyboardBuilder()
 
     if is_valid:
@@ -94,7 +100,7 @@ def in_show_admin_promo_kb(language: str, current_page: int, promo_code_id: int,
     ])
 
 
-def confirm_deactivate_promo_code_kb(language: str, current_page: int, promo_code_id: int, show_not_valid: bool):
+def confirm_deactivate_promo_code_kb(language: str, current_page: str, promo_code_id: int, show_not_valid: bool):
     return InlineKeyboardMarkup(inline_keyboard=[
         [InlineKeyboardButton(
             text=get_text(language, "kb_general", "confirm"),
@@ -109,7 +115,7 @@ def confirm_deactivate_promo_code_kb(language: str, current_page: int, promo_cod
     ])
 
 
-def back_in_all_admin_promo_kb(language: str, current_page: int, show_not_valid: bool):
+def back_in_all_admin_promo_kb(language: str, current_page: str, show_not_valid: bool):
     return InlineKeyboardMarkup(inline_keyboard=[
         [InlineKeyboardButton(
             text=get_text(language, "kb_general", "back"),
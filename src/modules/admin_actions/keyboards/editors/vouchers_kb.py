@@ -1,11 +1,10 @@
-from math import ceil
-
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
-from src.application.keyboards.keyboard_with_pages import pagination_keyboard
+from src.application.keyboards.keyboard_with_pages import cursor_pagination_keyboard, load_cursor_page
 from src.application.models.modules import AdminModule
 from src.infrastructure.translations import get_text
+from src.models.read_models import PageCursor
 
 
 def admin_vouchers_kb(language: str):
@@ -30,13 +29,20 @@ def skip_expire_at_or_back_kb(language: str):
     ])
 
 
-async def all_admin_vouchers_kb(current_page: int, language: str, admin_module: AdminModule):
-    """Клавиатура со списком только активных ваучеров у администрации"""
-    records = await admin_module.voucher_service.get_valid_voucher_by_page(
-        page=current_page, page_size=admin_module.conf.different.page_size, only_created_admin=True
+async def all_admin_vouchers_kb(current_page: str, language: str, admin_module: AdminModule):
+    """
+    Клавиатура со списком только активных ваучеров у администрации
+    :param current_page: Курсор страницы из `PageCursor.encode()` (или номер страницы).
+    """
+    service = admin_module.voucher_service
+    page_size = admin_module.conf.different.page_size
+
+    records, cursor = await load_cursor_page(
+        PageCursor.decode(current_page),
+        lambda c: service.get_valid_voucher_by_page(page_size=page_size, only_created_admin=True, cursor=c),
+        lambda: service.get_count_voucher(by_admins=True),
     )
-    total = await admin_module.voucher_service.get_count_voucher(by_admins=True)
-    total_pages = max(ceil(total / admin_module.conf.different.page_size), 1)
+    current_page = cursor.encode()
 
     def item_button(voucher):
         valid = get_text(language, "kb_admin_panel", "valid" if voucher.is_valid else "not_valid")
@@ -45,19 +51,19 @@ async def all_admin_vouchers_kb(current_page: int, language: str, admin_module:
             callback_data=f"show_admin_voucher:{current_page}:{voucher.voucher_id}"
         )
 
-    return pagination_keyboard(
+    return cursor_pagination_keyboard(
         records,
-        current_page,
-        total_pages,
+        cursor,
+        page_size,
+        lambda voucher: voucher.voucher_id,
         item_button,
-        left_prefix=f"admin_voucher_list",
-        right_prefix=f"admin_voucher_list",
+        prefix=f"admin_voucher_list",
         back_text=get_text(language, "kb_general", "back"),
         back_callback="admin_vouchers",
     )
 
 
-def show_admin_voucher_kb(language: str, current_page: int, voucher_id: int):
+def show_admin_voucher_kb(language: str, current_page: str, voucher_id: int):
     return InlineKeyboardMarkup(inline_keyboard=[
         [InlineKeyboardButton(
             text=get_text(language, "kb_profile", 'deactivate'),
@@ -79,7 +85,7 @@ def in_admin_voucher_kb(language: str, current_page: int, voucher_id: int):
     ])
 
 
-def back_in_all_admin_voucher_kb(language: str, current_page: int):
+def back_in_all_admin_voucher_kb(language: str, current_page: str):
     return InlineKeyboardMarkup(inline_keyboard=[
         [InlineKeyboardButton(
             text=get_text(language, "kb_general", "back"),
@@ -87,7 +93,7 @@ def back_in_all_admin_voucher_kb(language: str, current_page: int):
         )]
     ])
 
-def confirm_deactivate_admin_voucher_kb(language: str, current_page: int, voucher_id: int, is_valid: bool):
+def confirm_deactivate_admin_voucher_kb(language: str, current_page: str, voucher_id: int, is_valid: bool):
     keyboard = InlineKeyboardBuilder()
 
     if is_valid:
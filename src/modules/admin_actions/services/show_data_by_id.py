@@ -3,8 +3,6 @@ from aiogram.types import InlineKeyboardMarkup
 
 from src.application.bot import Messages
 from src.application.models.modules import AdminModule
-from src.domain.crypto.decrypt import decrypt_text
-from src.domain.crypto.key_ops import unwrap_dek
 from src.models.read_models import UsersDTO
 from src.modules.admin_actions.keyboards.show_data_kb import back_in_show_data_by_id_kb, get_data_universal_product
 from src.modules.admin_actions.state.show_data_by_id import ShowDataById
@@ -133,20 +131,15 @@ async def get_message_sold_account_full(
 
     storage = sold_account_full.account_storage
 
-    crypto = admin_module.crypto_provider.get()
-    account_key = unwrap_dek(
-        storage.encrypted_key,
-        storage.encrypted_key_nonce,
-        crypto.kek,
-    )
+    crypto_service = admin_module.crypto_service
 
     if storage.login_encrypted:
-        login = decrypt_text(storage.login_encrypted, storage.login_nonce, account_key)
+        login = crypto_service.decrypt_text(storage, storage.login_encrypted, storage.login_nonce)
     else:
         login = get_text(language, "admins_show_data_by_id", "no")
 
     if storage.password_encrypted:
-        password = decrypt_text(storage.password_encrypted, storage.password_nonce, account_key)
+        password = crypto_service.decrypt_text(storage, storage.password_encrypted, storage.password_nonce)
     else:
         password = get_text(language, "admins_show_data_by_id", "no")
 
@@ -3,7 +3,7 @@ from src.infrastructure.translations import get_text
 
 
 async def get_statistics_message(interval_days: int, language: str, admin_module: AdminModule) -> str:
-    statistics = await admin_module.statistics_service.get_statistics(interval_days)
+    statistics = await admin_module.statistics_service.get_statistics(interval_days, language)
 
     interval_msg = get_text(
         language,
@@ -28,6 +28,25 @@ async def get_statistics_message(interval_days: int, language: str, admin_module
 
     payment_systems_block = "\n".join(payment_systems_text) if payment_systems_text else "-"
 
+    categories_text = []
+    for category in statistics.sales_by_category:
+        categories_text.append(
+            get_text(
+                language,
+                "admins_statistics",
+                "category_sales_stats"
+            ).format(
+                name=category.name or get_text(
+                    language, "admins_statistics", "unknown_category"
+                ).format(category_id=category.category_id),
+                quantity_sale=category.quantity_sale,
+                amount_sale=category.amount_sale,
+                total_net_profit=category.total_net_profit,
+            )
+        )
+
+    categories_block = "\n".join(categories_text) if categories_text else "-"
+
     return get_text(
         language,
         "admins_statistics",
@@ -51,6 +70,7 @@ async def get_statistics_message(interval_days: int, language: str, admin_module
         quantity_sale_universal=statistics.quantity_sale_universal,
         amount_sale_universal=statistics.amount_sale_universal,
         total_net_profit_universal=statistics.total_net_profit_universal,
+        sales_by_category=categories_block,
 
         # пополнения
         quantity_replenishments=statistics.quantity_replenishments,
@@ -23,7 +23,6 @@ async def cb_transaction_list(
     """Данный хендлер используется для админ панели и для пользователя"""
     _, target_user_id, page = callback.data.split(":")
     target_user_id = int(target_user_id)
-    page = int(page)
 
     await profile_module.permission_service.check_permission(
         current_user_id=user.user_id, target_user_id=target_user_id
@@ -75,5 +74,5 @@ async def cb_transaction_show(
         message_id=callback.message.message_id,
         message=text,
         event_message_key='history_transections',
-        reply_markup=back_in_wallet_transactions_kb(user.language, target_user_id, current_page=int(current_page))
+        reply_markup=back_in_wallet_transactions_kb(user.language, target_user_id, current_page=current_page)
     )
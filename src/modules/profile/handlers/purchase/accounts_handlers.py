@@ -1,10 +1,8 @@
 from aiogram import Router, F
 from aiogram.types import CallbackQuery
 
-from src.domain.crypto.decrypt import decrypt_text
-from src.domain.crypto.key_ops import unwrap_dek
 from src.models.create_models.accounts import CreateDeletedAccountDTO
-from src.models.read_models import UsersDTO
+from src.models.read_models import UsersDTO, PageCursor
 from src.models.update_models import UpdateAccountStorageDTO
 from src.modules.profile.keyboards import confirm_del_acc_kb, login_details_kb
 from src.modules.profile.services.purchases_accounts import show_all_sold_account, show_sold_account, get_file_for_login, \
@@ -38,7 +36,7 @@ async def all_sold_accounts(
     messages_service: Messages,
 ):
     type_str = callback.data.split(':')[1]
-    current_page = int(callback.data.split(':')[2])
+    current_page = callback.data.split(':')[2]
 
     type_account_service = profile_module.account_moduls.storage_service.get_type_service_account(type_str)
 
@@ -64,7 +62,7 @@ async def sold_account(
 ):
     sold_account_id = int(callback.data.split(':')[1])
     type_str = callback.data.split(':')[2]
-    current_page = int(callback.data.split(':')[3])
+    current_page = callback.data.split(':')[3]
 
     type_account_service = profile_module.account_moduls.storage_service.get_type_service_account(type_str)
 
@@ -102,7 +100,7 @@ async def login_details(
 ):
     sold_account_id = int(callback.data.split(':')[1])
     type_str = callback.data.split(':')[2]
-    current_page = int(callback.data.split(':')[3])
+    current_page = callback.data.split(':')[3]
 
     type_account_service = profile_module.account_moduls.storage_service.get_type_service_account(type_str)
 
@@ -222,18 +220,14 @@ async def get_log_pas(
     if not account:
         return
 
-    crypto = profile_module.crypto_provider.get()
-    account_key = unwrap_dek(
-        account.account_storage.encrypted_key,
-        account.account_storage.encrypted_key_nonce,
-        crypto.kek
-    )
+    crypto_service = profile_module.crypto_service
+    storage = account.account_storage
 
     await messages_service.send_msg.send(
         user.user_id,
         get_text(user.language, "profile_messages", "login_and_password_details").format(
-            login=decrypt_text(account.account_storage.login_encrypted, account.account_storage.login_nonce, account_key),
-            password=decrypt_text(account.account_storage.password_encrypted, account.account_storage.password_nonce, account_key)
+            login=crypto_service.decrypt_text(storage, storage.login_encrypted, storage.login_nonce),
+            password=crypto_service.decrypt_text(storage, storage.password_encrypted, storage.password_nonce)
         )
     )
 
@@ -247,7 +241,7 @@ async def chek_valid_acc(
 ):
     sold_account_id = int(callback.data.split(':')[1])
     type_str = callback.data.split(':')[2]
-    current_page = int(callback.data.split(':')[3])
+    current_page = callback.data.split(':')[3]
     current_validity = bool(int(callback.data.split(':')[4]))
 
     type_account_service = profile_module.account_moduls.storage_service.get_type_service_account(type_str)
@@ -315,7 +309,7 @@ async def confirm_del_acc(
 ):
     sold_account_id = int(callback.data.split(':')[1])
     type_str = callback.data.split(':')[2]
-    current_page = int(callback.data.split(':')[3])
+    current_page = callback.data.split(':')[3]
 
     type_account_service = profile_module.account_moduls.storage_service.get_type_service_account(type_str)
 
@@ -360,7 +354,7 @@ async def del_account(
 ):
     sold_account_id = int(callback.data.split(':')[1])
     type_str = callback.data.split(':')[2]
-    current_page = int(callback.data.split(':')[3])
+    current_page = callback.data.split(':')[3]
 
     type_account_service = profile_module.account_moduls.storage_service.get_type_service_account(type_str)
 
@@ -410,7 +404,7 @@ async def del_account(
         user_id=callback.from_user.id,
         language=user.language,
         message_id=callback.message.message_id,
-        current_page=current_page,
+        current_page=PageCursor.decode(current_page).recount().encode(),
         type_account_service=type_account_service,
         profile_module=profile_module,
         messages_service=messages_service
@@ -16,7 +16,7 @@ router = Router()
 async def all_sold_universal(
     callback: CallbackQuery, user: UsersDTO, messages_service: Messages, profile_module: ProfileModule,
 ):
-    current_page = int(callback.data.split(':')[1])
+    current_page = callback.data.split(':')[1]
 
     await show_all_sold_universal(
         user=user,
@@ -32,7 +32,7 @@ async def sold_universal(
     callback: CallbackQuery, user: UsersDTO, profile_module: ProfileModule, messages_service: Messages
 ):
     sold_universal_id = int(callback.data.split(':')[1])
-    current_page = int(callback.data.split(':')[2])
+    current_page = callback.data.split(':')[2]
 
     universal = await check_universal_product(callback, user, sold_universal_id, profile_module)
     if not universal:
@@ -64,7 +64,7 @@ async def confirm_del_universal(
     callback: CallbackQuery, user: UsersDTO, profile_module: ProfileModule, messages_service: Messages
 ):
     sold_universal_id = int(callback.data.split(':')[1])
-    current_page = int(callback.data.split(':')[2])
+    current_page = callback.data.split(':')[2]
 
     universal = await check_universal_product(callback, user, sold_universal_id, profile_module)
     if not universal:
@@ -106,7 +106,7 @@ async def del_universal(
     callback: CallbackQuery, user: UsersDTO, profile_module: ProfileModule, messages_service: Messages
 ):
     sold_universal_id = int(callback.data.split(':')[1])
-    current_page = int(callback.data.split(':')[2])
+    current_page = callback.data.split(':')[2]
 
     universal = await check_universal_product(callback, user, sold_universal_id, profile_module)
     if not universal:
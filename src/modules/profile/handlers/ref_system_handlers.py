@@ -73,7 +73,7 @@ async def accrual_ref_list(
         message=text,
         event_message_key='history_income_from_referrals',
         reply_markup= await accrual_ref_list_kb(
-            user.language, int(current_page), int(target_user_id), user.user_id, profile_module
+            user.language, current_page, int(target_user_id), user.user_id, profile_module
         )
     )
 
@@ -83,7 +83,7 @@ async def detail_income_from_ref(
     callback: CallbackQuery, user: Users, profile_module: ProfileModule, messages_service: Messages
 ):
     income_from_ref_id = callback.data.split(':')[1]
-    current_page = int(callback.data.split(':')[2])
+    current_page = callback.data.split(':')[2]
 
     income = await profile_module.referral_income_service.get_income_from_referral(int(income_from_ref_id))
 
@@ -1,13 +1,13 @@
-from math import ceil
 from typing import Optional
 
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
 from src.database.models.categories import ProductType, AccountServiceType
-from src.application.keyboards.keyboard_with_pages import pagination_keyboard
+from src.application.keyboards.keyboard_with_pages import cursor_pagination_keyboard, load_cursor_page
 from src.application.models.modules import ProfileModule
 from src.infrastructure.translations import get_text, n_get_text
+from src.models.read_models import PageCursor
 from src.utils.pars_number import e164_to_pretty
 
 
@@ -90,20 +90,28 @@ async def sold_account_type_service_kb(
 
 async def sold_accounts_kb(
     language: str,
-    current_page: int,
+    current_page: str,
     type_account_service: AccountServiceType,
     user_id: int,
     profile_module: ProfileModule,
 ):
-    records = await profile_module.account_moduls.sold_service.get_sold_account_by_page(
-        user_id=user_id,
-        type_account_service=type_account_service,
-        page=current_page,
-        language=language,
-        page_size=profile_module.conf.different.page_size
+    """:param current_page: Курсор страницы из `PageCursor.encode()` (или номер страницы)."""
+    sold_service = profile_module.account_moduls.sold_service
+    page_size = profile_module.conf.different.page_size
+
+    records, cursor = await load_cursor_page(
+        PageCursor.decode(current_page),
+        lambda c: sold_service.get_sold_account_by_page(
+            user_id=user_id,
+            type_account_service=type_account_service,
+            page=None,
+            language=language,
+            page_size=page_size,
+            cursor=c,
+        ),
+        lambda: sold_service.get_count_sold_account(user_id, type_account_service),
     )
-    total = await profile_module.account_moduls.sold_service.get_count_sold_account(user_id, type_account_service)
-    total_pages = max(ceil(total / profile_module.conf.different.page_size), 1)
+    current_page = cursor.encode()
 
     def item_button(acc):
         text = e164_to_pretty(acc.phone_number) if acc.phone_number else acc.name
@@ -112,13 +120,13 @@ async def sold_accounts_kb(
             callback_data=f"sold_account:{acc.sold_account_id}:{type_account_service.value}:{current_page}"
         )
 
-    return pagination_keyboard(
+    return cursor_pagination_keyboard(
         records=records,
-        current_page=current_page,
-        total_pages=total_pages,
+        cursor=cursor,
+        page_size=page_size,
+        record_id=lambda acc: acc.sold_account_id,
         item_button_func=item_button,
-        left_prefix=f"all_sold_accounts:{type_account_service.value}",
-        right_prefix=f"all_sold_accounts:{type_account_service.value}",
+        prefix=f"all_sold_accounts:{type_account_service.value}",
         back_text=get_text(language, "kb_general", "back"),
         back_callback="services_sold_account",
     )
@@ -128,7 +136,7 @@ def account_kb(
     language: str,
     sold_account_id: int,
     type_account_service: AccountServiceType,
-    current_page: int,
+    current_page: str,
     current_validity: bool
 ):
     return InlineKeyboardMarkup(inline_keyboard=[
@@ -156,7 +164,7 @@ def login_details_kb(
     language: str,
     sold_account_id: int,
     type_account_service: AccountServiceType,
-    current_page: int,
+    current_page: int | str,
     for_admin: bool = False
 ):
     keyboard = InlineKeyboardBuilder()
@@ -201,7 +209,7 @@ def login_details_kb(
     return keyboard.as_markup()
 
 
-def confirm_del_acc_kb(language: str, sold_account_id: int, type_account_service: AccountServiceType, current_page: int):
+def confirm_del_acc_kb(language: str, sold_account_id: int, type_account_service: AccountServiceType, current_page: str):
     return InlineKeyboardMarkup(inline_keyboard=[
         [InlineKeyboardButton(
             text=get_text(language, "kb_general", "confirm"),
@@ -1,10 +1,9 @@
-from math import ceil
 from typing import Optional
 
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
-from src.models.read_models import SoldUniversalSmall
-from src.application.keyboards.keyboard_with_pages import pagination_keyboard
+from src.models.read_models import SoldUniversalSmall, PageCursor
+from src.application.keyboards.keyboard_with_pages import cursor_pagination_keyboard, load_cursor_page
 from src.application.models.modules import ProfileModule
 from src.infrastructure.translations import get_text, n_get_text
 
@@ -32,15 +31,20 @@ def in_purchased_universal_product_kb(
 
 async def sold_universal_kb(
     language: str,
-    current_page: int,
+    current_page: str,
     user_id: int,
     profile_module: ProfileModule
 ):
-    records = await profile_module.universal_moduls.sold_service.get_sold_universal_by_page(
-        user_id, current_page, language, profile_module.conf.different.page_size
+    """:param current_page: Курсор страницы из `PageCursor.encode()` (или номер страницы)."""
+    sold_service = profile_module.universal_moduls.sold_service
+    page_size = profile_module.conf.different.page_size
+
+    records, cursor = await load_cursor_page(
+        PageCursor.decode(current_page),
+        lambda c: sold_service.get_sold_universal_by_page(user_id, None, language, page_size, cursor=c),
+        lambda: sold_service.get_count_sold_universal(user_id),
     )
-    total = await profile_module.universal_moduls.sold_service.get_count_sold_universal(user_id)
-    total_pages = max(ceil(total / profile_module.conf.different.page_size), 1)
+    current_page = cursor.encode()
 
     def item_button(sold_universal: SoldUniversalSmall):
         return InlineKeyboardButton(
@@ -48,13 +52,13 @@ async def sold_universal_kb(
             callback_data=f"sold_universal:{sold_universal.sold_universal_id}:{current_page}"
         )
 
-    return pagination_keyboard(
+    return cursor_pagination_keyboard(
         records=records,
-        current_page=current_page,
-        total_pages=total_pages,
+        cursor=cursor,
+        page_size=page_size,
+        record_id=lambda sold_universal: sold_universal.sold_universal_id,
         item_button_func=item_button,
-        left_prefix=f"all_sold_universal",
-        right_prefix=f"all_sold_universal",
+        prefix=f"all_sold_universal",
         back_text=get_text(language, "kb_general", "back"),
         back_callback="purchases",
     )
@@ -63,7 +67,7 @@ async def sold_universal_kb(
 def universal_kb(
     language: str,
     sold_universal_id: int,
-    current_page: int,
+    current_page: str,
 ):
     return InlineKeyboardMarkup(inline_keyboard=[
         [InlineKeyboardButton(
@@ -81,7 +85,7 @@ def universal_kb(
     ])
 
 
-def confirm_del_universal_kb(language: str, sold_universal_id: int, current_page: int):
+def confirm_del_universal_kb(language: str, sold_universal_id: int, current_page: str):
     return InlineKeyboardMarkup(inline_keyboard=[
         [InlineKeyboardButton(
             text=get_text(language, "kb_general", "confirm"),
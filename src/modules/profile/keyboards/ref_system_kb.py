@@ -1,10 +1,9 @@
-from math import ceil
-
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 
-from src.application.keyboards.keyboard_with_pages import pagination_keyboard
+from src.application.keyboards.keyboard_with_pages import cursor_pagination_keyboard, load_cursor_page
 from src.application.models.modules import ProfileModule
 from src.infrastructure.translations import get_text
+from src.models.read_models import PageCursor
 
 
 async def ref_system_kb(language: str, user_id: int):
@@ -29,20 +28,25 @@ async def ref_system_kb(language: str, user_id: int):
 
 async def accrual_ref_list_kb(
     language: str,
-    current_page: int,
+    current_page: str,
     target_user_id: int,
     user_id: int,
     profile_module: ProfileModule
 ):
     """
+    :param current_page: Курсор страницы из `PageCursor.encode()` (или номер страницы).
     :param target_user_id: Пользователь по которому будем искать.
     :param user_id: Пользователь, которому выведутся данные
     """
-    records = await profile_module.referral_income_service.get_referral_income_page(
-        target_user_id, current_page, profile_module.conf.different.page_size
+    service = profile_module.referral_income_service
+    page_size = profile_module.conf.different.page_size
+
+    records, cursor = await load_cursor_page(
+        PageCursor.decode(current_page),
+        lambda c: service.get_referral_income_page(target_user_id, page_size=page_size, cursor=c),
+        lambda: service.get_count_referral_income(target_user_id),
     )
-    total = await profile_module.referral_income_service.get_count_referral_income(target_user_id)
-    total_pages = max(ceil(total / profile_module.conf.different.page_size), 1)
+    current_page = cursor.encode()
 
     def item_button(inc):
         return InlineKeyboardButton(
@@ -50,18 +54,18 @@ async def accrual_ref_list_kb(
             callback_data=f"detail_income_from_ref:{inc.income_from_referral_id}:{current_page}"
         )
 
-    return pagination_keyboard(
+    return cursor_pagination_keyboard(
         records,
-        current_page,
-        total_pages,
+        cursor,
+        page_size,
+        lambda inc: inc.income_from_referral_id,
         item_button,
-        left_prefix=f"accrual_ref_list:{target_user_id}",
-        right_prefix=f"accrual_ref_list:{target_user_id}",
+        prefix=f"accrual_ref_list:{target_user_id}",
         back_text=get_text(language, "kb_general", "back"),
         back_callback=f"referral_system" if target_user_id == user_id else f"user_management:{target_user_id}",
     )
 
-def back_in_accrual_ref_list_kb(language: str, current_page_id: int, target_user_id: int):
+def back_in_accrual_ref_list_kb(language: str, current_page_id: str, target_user_id: int):
     return InlineKeyboardMarkup(inline_keyboard=[
         [InlineKeyboardButton(
             text=get_text(language, "kb_general", "back"),
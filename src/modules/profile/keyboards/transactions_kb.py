@@ -1,28 +1,32 @@
-from math import ceil
-
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 
-from src.application.keyboards.keyboard_with_pages import pagination_keyboard
+from src.application.keyboards.keyboard_with_pages import cursor_pagination_keyboard, load_cursor_page
 from src.application.models.modules import ProfileModule
 from src.infrastructure.translations import get_text
+from src.models.read_models import PageCursor
 
 
 async def wallet_transactions_kb(
     language: str,
-    current_page: int,
+    current_page: str,
     target_user_id: int,
     user_id: int,
     profile_module: ProfileModule
 ):
     """
+    :param current_page: Курсор страницы из `PageCursor.encode()` (или номер страницы).
     :param target_user_id: Пользователь по которому будем искать.
     :param user_id: Пользователь, которому выведутся данные
     """
-    records = await profile_module.wallet_transaction_service.get_wallet_transaction_page(
-        target_user_id, current_page, profile_module.conf.different.page_size
+    service = profile_module.wallet_transaction_service
+    page_size = profile_module.conf.different.page_size
+
+    records, cursor = await load_cursor_page(
+        PageCursor.decode(current_page),
+        lambda c: service.get_wallet_transaction_page(target_user_id, page_size=page_size, cursor=c),
+        lambda: service.get_count_wallet_transaction(target_user_id),
     )
-    total = await profile_module.wallet_transaction_service.get_count_wallet_transaction(target_user_id)
-    total_pages = max(ceil(total / profile_module.conf.different.page_size), 1)
+    current_page = cursor.encode()
 
     def item_button(t):
         return InlineKeyboardButton(
@@ -30,19 +34,19 @@ async def wallet_transactions_kb(
             callback_data=f"transaction_show:{target_user_id}:{t.wallet_transaction_id}:{current_page}"
         )
 
-    return pagination_keyboard(
+    return cursor_pagination_keyboard(
         records=records,
-        current_page=current_page,
-        total_pages=total_pages,
+        cursor=cursor,
+        page_size=page_size,
+        record_id=lambda t: t.wallet_transaction_id,
         item_button_func=item_button,
-        left_prefix=f"transaction_list:{target_user_id}",
-        right_prefix=f"transaction_list:{target_user_id}",
+        prefix=f"transaction_list:{target_user_id}",
         back_text=get_text(language, "kb_general", "back"),
         back_callback=f"profile" if target_user_id == user_id else f"user_management:{target_user_id}"
     )
 
 
-def back_in_wallet_transactions_kb(language: str, target_user_id: int, current_page: int):
+def back_in_wallet_transactions_kb(language: str, target_user_id: int, current_page: str):
     return InlineKeyboardMarkup(inline_keyboard=[[
         InlineKeyboardButton(
             text=get_text(language, "kb_general", "back"),
@@ -44,7 +44,7 @@ async def get_main_message_profile(
 async def message_income_ref(
     income: IncomeFromReferralsDTO,
     callback, language: str,
-    current_page: int,
+    current_page: str,
     messages_service: Messages,
     profile_module: ProfileModule,
 ):
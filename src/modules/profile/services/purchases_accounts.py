@@ -34,7 +34,7 @@ async def show_all_sold_account(
     user_id: int,
     language: str,
     message_id: int,
-    current_page: int,
+    current_page: str,
     type_account_service: AccountServiceType | None,
     profile_module: ProfileModule,
     messages_service: Messages,
@@ -66,7 +66,7 @@ async def show_sold_account(
     user: UsersDTO,
     account: SoldAccountFull,
     language: str,
-    current_page: int,
+    current_page: str,
     type_account_service: AccountServiceType | None,
     messages_service: Messages,
     profile_module: ProfileModule,
@@ -120,7 +120,7 @@ async def check_sold_account(
     language: str,
     messages_service: Messages,
     profile_module: ProfileModule,
-    current_page: Optional[int] = None,
+    current_page: Optional[str] = None,
     type_account_service: Optional[AccountServiceType] = None,
 ) -> SoldAccountFull | None:
     """
@@ -3,16 +3,15 @@ from pathlib import Path
 
 from aiogram.types import CallbackQuery
 
-from src.domain.crypto.key_ops import unwrap_dek
 from src.models.create_models.universal import CreateDeletedUniversalDTO
 from src.models.update_models import UpdateUniversalStorageDTO
 from src.modules.profile.keyboards.purchased_universals_kb import sold_universal_kb
 from src.database.models.categories import StorageStatus, UniversalMediaType
-from src.models.read_models import SoldUniversalFull, UsersDTO
+from src.models.read_models import SoldUniversalFull, UsersDTO, PageCursor
 from src.application.bot import Messages
 from src.infrastructure.files.file_system import create_temp_dir
 from src.application.models.modules import ProfileModule
-from src.domain.crypto.decrypt import decrypt_file, decrypt_text
+from src.domain.crypto.decrypt import decrypt_file
 from src.infrastructure.translations import get_text
 
 
@@ -40,7 +39,7 @@ async def check_universal_product(
 async def show_all_sold_universal(
     user: UsersDTO,
     message_id: int,
-    current_page: int,
+    current_page: str,
     messages_service: Messages,
     profile_module: ProfileModule,
 ):
@@ -71,19 +70,14 @@ async def send_media_sold_universal(
     description = None
 
     try:
-        crypto = profile_module.crypto_provider.get()
-
-        dek = unwrap_dek(
-            encrypted_data_b64=universal.universal_storage.encrypted_key,
-            nonce_b64=universal.universal_storage.encrypted_key_nonce,
-            kek=crypto.kek,
-        )
-
-        if universal.universal_storage.encrypted_tg_file_id:
-            file_id = decrypt_text(
-                encrypted_data_b64=universal.universal_storage.encrypted_tg_file_id,
-                nonce_b64=universal.universal_storage.encrypted_tg_file_id_nonce,
-                dek=dek
+        crypto_service = profile_module.crypto_service
+        storage = universal.universal_storage
+
+        if storage.encrypted_tg_file_id:
+            file_id = crypto_service.decrypt_text(
+                storage,
+                encrypted_data_b64=storage.encrypted_tg_file_id,
+                nonce_b64=storage.encrypted_tg_file_id_nonce,
             )
 
         if universal.universal_storage.original_filename:
@@ -93,16 +87,16 @@ async def send_media_sold_universal(
             )
             decrypted_file_path = create_temp_dir(profile_module.conf) / Path(universal.universal_storage.original_filename)
             decrypt_file(
-                dek=dek,
+                dek=crypto_service.unwrap_storage(storage),
                 encrypted_path=file_path,
                 decrypted_path=str(decrypted_file_path)
             )
 
         if universal.universal_storage.encrypted_description:
-            description = decrypt_text(
-                encrypted_data_b64=universal.universal_storage.encrypted_description,
-                nonce_b64=universal.universal_storage.encrypted_description_nonce,
-                dek=dek
+            description = crypto_service.decrypt_text(
+                storage,
+                encrypted_data_b64=storage.encrypted_description,
+                nonce_b64=storage.encrypted_description_nonce,
             )
 
         if file_id or decrypted_file_path:
@@ -134,7 +128,7 @@ async def delete_sold_universal_han(
     callback: CallbackQuery,
     user: UsersDTO,
     universal: SoldUniversalFull,
-    current_page: int,
+    current_page: str,
     messages_service: Messages,
     profile_module: ProfileModule,
 ):
@@ -172,7 +166,7 @@ async def delete_sold_universal_han(
     await show_all_sold_universal(
         user=user,
         message_id=callback.message.message_id,
-        current_page=current_page,
+        current_page=PageCursor.decode(current_page).recount().encode(),
         messages_service=messages_service,
         profile_module=profile_module,
     )
\ No newline at end of file
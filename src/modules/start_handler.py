@@ -167,6 +167,9 @@ async def cmd_start(
                 username=message.from_user.username,
             )
         )
+    else:
+        # пользователь снова запустил бота (например, разблокировал) - возвращаем его в рассылки
+        await profile_module.suppressed_recipients_service.restore(user.user_id, make_commit=True)
 
     if command_name == "voucher" and payload:
         if user:
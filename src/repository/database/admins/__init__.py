@@ -1,11 +1,13 @@
 from src.repository.database.admins.admin_actions import AdminActionsRepository
 from src.repository.database.admins.admins import AdminsRepository
+from src.repository.database.admins.mass_mailing_jobs import MassMailingJobsRepository
 from src.repository.database.admins.message_for_sending import MessageForSendingRepository
 from src.repository.database.admins.sent_message import SentMasMessagesRepository
 
 __all__ = [
     "AdminActionsRepository",
     "AdminsRepository",
+    "MassMailingJobsRepository",
     "MessageForSendingRepository",
     "SentMasMessagesRepository",
 ]
\ No newline at end of file
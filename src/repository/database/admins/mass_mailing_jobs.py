@@ -0,0 +1,90 @@
+from datetime import datetime, UTC
+from typing import List, Optional
+
+from sqlalchemy import select, update
+
+from src.database.models.admins import MassMailingJobs, MassMailingBatches
+from src.models.read_models.admins import MassMailingJobDTO, MassMailingBatchDTO
+from src.repository.database.base import DatabaseBase
+
+
+class MassMailingJobsRepository(DatabaseBase):
+
+    async def create_job(self, **values) -> MassMailingJobDTO:
+        created = await super().create(MassMailingJobs, **values)
+        return MassMailingJobDTO.model_validate(created)
+
+    async def get_job(self, job_id: int) -> Optional[MassMailingJobDTO]:
+        result = await self.session_db.execute(
+            select(MassMailingJobs).where(MassMailingJobs.job_id == job_id)
+        )
+        job = result.scalar_one_or_none()
+        return MassMailingJobDTO.model_validate(job) if job else None
+
+    async def get_jobs_by_status(self, status: str) -> List[MassMailingJobDTO]:
+        result = await self.session_db.execute(
+            select(MassMailingJobs)
+            .where(MassMailingJobs.status == status)
+            .order_by(MassMailingJobs.job_id)
+        )
+        return [MassMailingJobDTO.model_validate(job) for job in result.scalars().all()]
+
+    async def add_batch_result(
+        self,
+        job_id: int,
+        first_user_id: int,
+        last_user_id: int,
+        number_received: int,
+        number_sent: int,
+        number_retried: int,
+        duration: float,
+    ) -> Optional[MassMailingJobDTO]:
+        """
+        Запишет итог пачки и сдвинет курсор рассылки на `last_user_id`.
+        Счётчики рассылки увеличиваются на стороне БД.
+        :return: обновлённая рассылка
+        """
+        await super().create(
+            MassMailingBatches,
+            job_id=job_id,
+            first_user_id=first_user_id,
+            last_user_id=last_user_id,
+            number_received=number_received,
+            number_sent=number_sent,
+            number_retried=number_retried,
+            duration=duration,
+        )
+
+        result = await self.session_db.execute(
+            update(MassMailingJobs)
+            .where(MassMailingJobs.job_id == job_id)
+            .values(
+                cursor_user_id=last_user_id,
+                number_received=MassMailingJobs.number_received + number_received,
+                number_sent=MassMailingJobs.number_sent + number_sent,
+                number_retried=MassMailingJobs.number_retried + number_retried,
+            )
+            .returning(MassMailingJobs)
+        )
+        job = result.scalar_one_or_none()
+        return MassMailingJobDTO.model_validate(job) if job else None
+
+    async def finish_job(
+        self, job_id: int, status: str, sent_message_id: Optional[int] = None
+    ) -> Optional[MassMailingJobDTO]:
+        result = await self.session_db.execute(
+            update(MassMailingJobs)
+            .where(MassMailingJobs.job_id == job_id)
+            .values(status=status, sent_message_id=sent_message_id, finished_at=datetime.now(UTC))
+            .returning(MassMailingJobs)
+        )
+        job = result.scalar_one_or_none()
+        return MassMailingJobDTO.model_validate(job) if job else None
+
+    async def get_batches(self, job_id: int) -> List[MassMailingBatchDTO]:
+        result = await self.session_db.execute(
+            select(MassMailingBatches)
+            .where(MassMailingBatches.job_id == job_id)
+            .order_by(MassMailingBatches.batch_id)
+        )
+        return [MassMailingBatchDTO.model_validate(batch) for batch in result.scalars().all()]
@@ -6,7 +6,9 @@ from src.database.models.admins import (
     SentMasMessages,
 )
 from src.models.read_models.admins import SentMasMessagesDTO
+from src.models.read_models.pagination import PageCursor
 from src.repository.database.base import DatabaseBase
+from src.repository.database.pagination import paginate, restore_order
 
 
 class SentMasMessagesRepository(DatabaseBase):
@@ -30,21 +32,23 @@ class SentMasMessagesRepository(DatabaseBase):
         self,
         page: Optional[int] = None,
         page_size: Optional[int] = None,
+        cursor: Optional[PageCursor] = None,
     ) -> List[SentMasMessagesDTO]:
 
         if not page_size:
             page_size = self.conf.different.page_size
 
-        query = select(SentMasMessages).order_by(
-            SentMasMessages.created_at.desc()
+        query = paginate(
+            select(SentMasMessages),
+            SentMasMessages.created_at,
+            SentMasMessages.message_id,
+            page_size,
+            page=page or None,
+            cursor=cursor,
         )
 
-        if page:
-            offset = (page - 1) * page_size
-            query = query.limit(page_size).offset(offset)
-
         result = await self.session_db.execute(query)
-        list_msgs = list(result.scalars().all())
+        list_msgs = restore_order(list(result.scalars().all()), cursor)
 
         result_lust = []
         for msg in list_msgs:
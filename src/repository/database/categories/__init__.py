@@ -15,6 +15,7 @@ from src.repository.database.categories.accounts.tg_accounts_media import TgAcco
 from src.repository.database.categories.universal.delete_universal import DeletedUniversalRepository
 from src.repository.database.categories.universal.product_universal import ProductUniversalRepository
 from src.repository.database.categories.universal.sold_universal import SoldUniversalRepository
+from src.repository.database.categories.universal.universal_integrity import UniversalIntegrityRepository
 from src.repository.database.categories.universal.universal_storage import UniversalStorageRepository
 from src.repository.database.categories.universal.universal_translation import UniversalTranslationRepository
 
@@ -37,6 +38,7 @@ __all__ = [
     "DeletedUniversalRepository",
     "ProductUniversalRepository",
     "SoldUniversalRepository",
+    "UniversalIntegrityRepository",
     "UniversalStorageRepository",
     "UniversalTranslationRepository",
 ]
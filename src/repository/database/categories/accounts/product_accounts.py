@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Optional, List
 
-from sqlalchemy import select, delete, distinct
+from sqlalchemy import select, delete, distinct, insert
 from sqlalchemy.orm import selectinload
 
 from src.database.models.categories import (
@@ -123,6 +123,19 @@ class ProductAccountsRepository(DatabaseBase):
         created = await super().create(ProductAccounts, **values)
         return ProductAccountSmall.model_validate(created)
 
+    async def create_many(self, values: List[dict]) -> List[ProductAccountSmall]:
+        """
+        Создаст товары одним INSERT ... RETURNING
+        :return: Созданные товары в порядке `values`
+        """
+        if not values:
+            return []
+        result = await self.session_db.execute(
+            insert(ProductAccounts).returning(ProductAccounts, sort_by_parameter_order=True),
+            values,
+        )
+        return [ProductAccountSmall.model_validate(item) for item in result.scalars().all()]
+
     async def delete_by_account_id(self, account_id: int) -> None:
         await self.session_db.execute(
             delete(ProductAccounts).where(ProductAccounts.account_id == account_id)
@@ -185,6 +198,20 @@ class ProductAccountsRepository(DatabaseBase):
         result = await self.session_db.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_all_full_for_sale(self) -> List[ProductAccountFull]:
+        """Все аккаунты на продаже вместе с хранилищем (для прогрева кэша)"""
+        result = await self.session_db.execute(
+            select(ProductAccounts)
+            .join(ProductAccounts.account_storage)
+            .options(selectinload(ProductAccounts.account_storage))
+            .where(AccountStorage.status == StorageStatus.FOR_SALE)
+        )
+        products = list(result.scalars().all())
+        return [
+            ProductAccountFull.from_orm_model(product, product.account_storage)
+            for product in products
+        ]
+
     async def get_all_category_ids(self) -> List[int]:
         result = await self.session_db.execute(
             select(distinct(ProductAccounts.category_id))
@@ -11,7 +11,9 @@ from src.database.models.categories import (
     AccountServiceType,
 )
 from src.models.read_models import SoldAccountsDTO
+from src.models.read_models.pagination import PageCursor
 from src.repository.database.base import DatabaseBase
+from src.repository.database.pagination import paginate, restore_order
 
 
 class SoldAccountsRepository(DatabaseBase):
@@ -133,6 +135,7 @@ class SoldAccountsRepository(DatabaseBase):
         page: int,
         page_size: int,
         active_only: bool = True,
+        cursor: Optional[PageCursor] = None,
     ) -> List[SoldAccounts]:
         stmt = (
             select(SoldAccounts)
@@ -145,15 +148,16 @@ class SoldAccountsRepository(DatabaseBase):
                 (SoldAccounts.owner_id == owner_id)
                 & (AccountStorage.type_account_service == type_account_service)
             )
-            .order_by(SoldAccounts.sold_at.desc())
-            .limit(page_size)
-            .offset((page - 1) * page_size)
         )
         if active_only:
             stmt = stmt.where(SoldAccounts.account_storage.has(is_active=True))
 
+        stmt = paginate(
+            stmt, SoldAccounts.sold_at, SoldAccounts.sold_account_id, page_size, page=page, cursor=cursor
+        )
+
         result = await self.session_db.execute(stmt)
-        return list(result.scalars().all())
+        return restore_order(list(result.scalars().all()), cursor)
 
     async def get_distinct_account_service_types_by_owner(
         self,
@@ -207,6 +211,25 @@ class SoldAccountsRepository(DatabaseBase):
         )
         return result.scalar_one_or_none() is not None
 
+    async def get_all_with_relations(self, *, active_only: bool = True) -> List[SoldAccounts]:
+        """
+        Все проданные аккаунты с переводами и хранилищем (для прогрева кэша).
+        Отсортированы по владельцу, внутри владельца от новых к старым
+        """
+        stmt = (
+            select(SoldAccounts)
+            .options(
+                selectinload(SoldAccounts.translations),
+                selectinload(SoldAccounts.account_storage),
+            )
+            .order_by(SoldAccounts.owner_id, SoldAccounts.sold_at.desc())
+        )
+        if active_only:
+            stmt = stmt.where(SoldAccounts.account_storage.has(is_active=True))
+
+        result = await self.session_db.execute(stmt)
+        return list(result.scalars().unique().all())
+
     async def get_all_owner_ids(self) -> List[int]:
         result = await self.session_db.execute(
             select(distinct(SoldAccounts.owner_id))
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Optional, List, Any
 
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, update, delete, insert
 from sqlalchemy.orm import selectinload
 
 from src.database.models.categories import (
@@ -40,6 +40,19 @@ class AccountStorageRepository(DatabaseBase):
         created = await super().create(AccountStorage, **values)
         return AccountStorageDTO.model_validate(created)
 
+    async def create_many(self, values: List[dict]) -> List[AccountStorageDTO]:
+        """
+        Создаст хранилища одним INSERT ... RETURNING
+        :return: Созданные хранилища в порядке `values`
+        """
+        if not values:
+            return []
+        result = await self.session_db.execute(
+            insert(AccountStorage).returning(AccountStorage, sort_by_parameter_order=True),
+            values,
+        )
+        return [AccountStorageDTO.model_validate(item) for item in result.scalars().all()]
+
     async def update(
         self,
         account_storage_id: int,
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import Optional, Any
+from typing import Optional, Any, List
 
-from sqlalchemy import select, update
+from sqlalchemy import select, update, insert
 
 from src.database.models.categories import (
     TgAccountMedia,
@@ -29,6 +29,10 @@ class TgAccountMediaRepository(DatabaseBase):
         created = await super().create(TgAccountMedia, **values)
         return TgAccountMediaDTO.model_validate(created)
 
+    async def create_many(self, values: List[dict]) -> None:
+        if values:
+            await self.session_db.execute(insert(TgAccountMedia), values)
+
     async def update(
         self,
         tg_account_media_id: int,
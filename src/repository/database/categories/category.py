@@ -105,6 +105,16 @@ class CategoriesRepository(DatabaseBase):
         categories = list(result.scalars().all())
         return await self._load_translations_for_categories(categories)
 
+    async def get_all_with_translations(self) -> List[Categories]:
+        """
+        :return: Все категории с подгруженным переводами
+        """
+        result = await self.session_db.execute(
+            select(Categories).order_by(Categories.index.asc())
+        )
+        categories = list(result.scalars().all())
+        return await self._load_translations_for_categories(categories)
+
     async def get_main_categories(
         self,
     ) -> list[CategoriesDTO]:
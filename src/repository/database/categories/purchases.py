@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, insert
 
 from src.database.models.categories import Purchases
 from src.models.read_models import PurchasesDTO
@@ -22,6 +22,19 @@ class PurchasesRepository(DatabaseBase):
         created = await super().create(Purchases, **values)
         return PurchasesDTO.model_validate(created, from_attributes=True)
 
+    async def create_many(self, values: list[dict]) -> list[PurchasesDTO]:
+        """
+        Создаст покупки одним INSERT ... RETURNING
+        :return: Созданные покупки в порядке `values`
+        """
+        if not values:
+            return []
+        result = await self.session_db.execute(
+            insert(Purchases).returning(Purchases, sort_by_parameter_order=True),
+            values,
+        )
+        return [PurchasesDTO.model_validate(item, from_attributes=True) for item in result.scalars().all()]
+
     async def delete_by_ids(self, purchase_ids: list[int]) -> None:
         if not purchase_ids:
             return
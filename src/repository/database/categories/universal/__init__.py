@@ -1,6 +1,7 @@
 from src.repository.database.categories.universal.delete_universal import DeletedUniversalRepository
 from src.repository.database.categories.universal.product_universal import ProductUniversalRepository
 from src.repository.database.categories.universal.sold_universal import SoldUniversalRepository
+from src.repository.database.categories.universal.universal_integrity import UniversalIntegrityRepository
 from src.repository.database.categories.universal.universal_storage import UniversalStorageRepository
 from src.repository.database.categories.universal.universal_translation import UniversalTranslationRepository
 
@@ -8,6 +9,7 @@ __all__ = [
     "DeletedUniversalRepository",
     "ProductUniversalRepository",
     "SoldUniversalRepository",
+    "UniversalIntegrityRepository",
     "UniversalStorageRepository",
     "UniversalTranslationRepository",
 ]
\ No newline at end of file
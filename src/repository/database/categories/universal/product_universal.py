@@ -38,6 +38,20 @@ class ProductUniversalRepository(DatabaseBase):
         products = list(result.scalars().all())
         return [ProductUniversalDTO.model_validate(product) for product in products]
 
+    async def get_by_categories_for_sale(self, category_ids: List[int]) -> List[ProductUniversalDTO]:
+        if not category_ids:
+            return []
+        result = await self.session_db.execute(
+            select(ProductUniversal)
+            .join(ProductUniversal.storage)
+            .where(
+                (ProductUniversal.category_id.in_(category_ids))
+                & (UniversalStorage.status == StorageStatus.FOR_SALE)
+            )
+        )
+        products = list(result.scalars().all())
+        return [ProductUniversalDTO.model_validate(product) for product in products]
+
     async def get_full_by_id(
         self,
         product_id: int,
@@ -55,6 +69,25 @@ class ProductUniversalRepository(DatabaseBase):
         product = result.scalar_one_or_none()
         return ProductUniversalFull.from_orm_model(product, language) if product else None
 
+    async def get_full_by_ids(
+        self,
+        product_ids: List[int],
+        *,
+        language: str,
+    ) -> List[ProductUniversalFull]:
+        if not product_ids:
+            return []
+        result = await self.session_db.execute(
+            select(ProductUniversal)
+            .options(
+                selectinload(ProductUniversal.storage)
+                .selectinload(UniversalStorage.translations)
+            )
+            .where(ProductUniversal.product_universal_id.in_(product_ids))
+        )
+        products = list(result.scalars().all())
+        return [ProductUniversalFull.from_orm_model(prod, language) for prod in products]
+
     async def get_full_by_category(
         self,
         category_id: int,
@@ -113,6 +146,14 @@ class ProductUniversalRepository(DatabaseBase):
             .where(ProductUniversal.product_universal_id == product_id)
         )
 
+    async def delete_by_ids(self, product_ids: List[int]) -> None:
+        if not product_ids:
+            return
+        await self.session_db.execute(
+            delete(ProductUniversal)
+            .where(ProductUniversal.product_universal_id.in_(product_ids))
+        )
+
     async def get_for_update_by_category(
         self,
         category_id: int,
@@ -162,6 +203,26 @@ class ProductUniversalRepository(DatabaseBase):
         result = await self.session_db.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_all_for_sale(self) -> List[ProductUniversalDTO]:
+        result = await self.session_db.execute(
+            select(ProductUniversal)
+            .join(ProductUniversal.storage)
+            .where(UniversalStorage.status == StorageStatus.FOR_SALE)
+        )
+        products = list(result.scalars().all())
+        return [ProductUniversalDTO.model_validate(product) for product in products]
+
+    async def get_all_full(self, *, language: str) -> List[ProductUniversalFull]:
+        result = await self.session_db.execute(
+            select(ProductUniversal)
+            .options(
+                selectinload(ProductUniversal.storage)
+                .selectinload(UniversalStorage.translations)
+            )
+        )
+        products = list(result.scalars().all())
+        return [ProductUniversalFull.from_orm_model(prod, language) for prod in products]
+
     async def get_all_category_ids(self) -> List[int]:
         result = await self.session_db.execute(
             select(distinct(ProductUniversal.category_id))
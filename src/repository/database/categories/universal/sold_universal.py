@@ -1,11 +1,13 @@
 from typing import Optional, List
 
-from sqlalchemy import select, delete, func, distinct
+from sqlalchemy import select, delete, func, distinct, insert
 from sqlalchemy.orm import selectinload
 
 from src.database.models.categories import SoldUniversal, UniversalStorage
 from src.models.read_models import SoldUniversalDTO
+from src.models.read_models.pagination import PageCursor
 from src.repository.database.base import DatabaseBase
+from src.repository.database.pagination import paginate, restore_order
 
 
 class SoldUniversalRepository(DatabaseBase):
@@ -76,6 +78,7 @@ class SoldUniversalRepository(DatabaseBase):
         page: int,
         page_size: int,
         active_only: bool = True,
+        cursor: Optional[PageCursor] = None,
     ) -> List[SoldUniversal]:
         stmt = (
             select(SoldUniversal)
@@ -84,15 +87,16 @@ class SoldUniversalRepository(DatabaseBase):
                 .selectinload(UniversalStorage.translations)
             )
             .where(SoldUniversal.owner_id == owner_id)
-            .order_by(SoldUniversal.sold_at.desc())
-            .limit(page_size)
-            .offset((page - 1) * page_size)
         )
         if active_only:
             stmt = stmt.where(SoldUniversal.storage.has(is_active=True))
 
+        stmt = paginate(
+            stmt, SoldUniversal.sold_at, SoldUniversal.sold_universal_id, page_size, page=page, cursor=cursor
+        )
+
         result = await self.session_db.execute(stmt)
-        return list(result.scalars().all())
+        return restore_order(list(result.scalars().all()), cursor)
 
     async def count_by_owner(self, owner_id: int, *, active_only: bool = True) -> int:
         stmt = select(func.count(SoldUniversal.sold_universal_id)).where(
@@ -116,6 +120,22 @@ class SoldUniversalRepository(DatabaseBase):
         created = await super().create(SoldUniversal, **values)
         return SoldUniversalDTO.model_validate(created)
 
+    async def create_many(self, owner_id: int, universal_storage_ids: List[int]) -> List[SoldUniversalDTO]:
+        """
+        Создаст записи одним INSERT ... RETURNING
+        :return: Созданные записи в порядке `universal_storage_ids`
+        """
+        if not universal_storage_ids:
+            return []
+        result = await self.session_db.execute(
+            insert(SoldUniversal).returning(SoldUniversal, sort_by_parameter_order=True),
+            [
+                {"owner_id": owner_id, "universal_storage_id": storage_id}
+                for storage_id in universal_storage_ids
+            ],
+        )
+        return [SoldUniversalDTO.model_validate(item) for item in result.scalars().all()]
+
     async def delete(self, sold_id: int) -> None:
         await self.session_db.execute(
             delete(SoldUniversal)
@@ -130,6 +150,25 @@ class SoldUniversalRepository(DatabaseBase):
             .where(SoldUniversal.sold_universal_id.in_(sold_ids))
         )
 
+    async def get_all_with_relations(self, *, active_only: bool = True) -> List[SoldUniversal]:
+        """
+        Все проданные универсальные товары с хранилищем и переводами (для прогрева кэша).
+        Отсортированы по владельцу, внутри владельца от новых к старым
+        """
+        stmt = (
+            select(SoldUniversal)
+            .options(
+                selectinload(SoldUniversal.storage)
+                .selectinload(UniversalStorage.translations)
+            )
+            .order_by(SoldUniversal.owner_id, SoldUniversal.sold_at.desc())
+        )
+        if active_only:
+            stmt = stmt.where(SoldUniversal.storage.has(is_active=True))
+
+        result = await self.session_db.execute(stmt)
+        return list(result.scalars().all())
+
     async def get_all_owner_ids(self) -> List[int]:
         result = await self.session_db.execute(
             select(distinct(SoldUniversal.owner_id))
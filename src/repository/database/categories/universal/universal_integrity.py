@@ -0,0 +1,74 @@
+from datetime import datetime
+from typing import Dict, List
+
+from sqlalchemy import select, or_, func
+from sqlalchemy.dialects.postgresql import insert
+
+from src.database.models.categories import UniversalIntegrity, ProductUniversal, UniversalStorage, StorageStatus
+from src.models.read_models import UniversalIntegrityDTO
+from src.repository.database.base import DatabaseBase
+
+
+class UniversalIntegrityRepository(DatabaseBase):
+
+    async def get_by_storage_ids(self, storage_ids: List[int]) -> Dict[int, UniversalIntegrityDTO]:
+        """
+        :return: Dict(universal_storage_id, запись индекса). Товаров без записи в результате нет
+        """
+        if not storage_ids:
+            return {}
+
+        result = await self.session_db.execute(
+            select(UniversalIntegrity).where(UniversalIntegrity.universal_storage_id.in_(storage_ids))
+        )
+        return {
+            item.universal_storage_id: UniversalIntegrityDTO.model_validate(item)
+            for item in result.scalars().all()
+        }
+
+    async def upsert_many(self, values: List[dict]) -> None:
+        """
+        Создаст или перезапишет записи индекса одним запросом, `verified_at` выставляется в текущее время
+        :param values: List(dict(universal_storage_id, checksum, file_size, is_valid))
+        """
+        if not values:
+            return
+
+        stmt = insert(UniversalIntegrity).values(values)
+        await self.session_db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[UniversalIntegrity.universal_storage_id],
+                set_={
+                    "checksum": stmt.excluded.checksum,
+                    "file_size": stmt.excluded.file_size,
+                    "is_valid": stmt.excluded.is_valid,
+                    "verified_at": func.now(),
+                },
+            )
+        )
+
+    async def get_stale_product_ids(self, verified_before: datetime, limit: int) -> List[int]:
+        """
+        Товары на продаже без записи в индексе или с записью старше `verified_before`.
+        Сначала возвращаются не проверявшиеся ни разу, затем самые давние.
+        :return: List(product_universal_id)
+        """
+        result = await self.session_db.execute(
+            select(ProductUniversal.product_universal_id)
+            .join(UniversalStorage, UniversalStorage.universal_storage_id == ProductUniversal.universal_storage_id)
+            .outerjoin(
+                UniversalIntegrity,
+                UniversalIntegrity.universal_storage_id == ProductUniversal.universal_storage_id
+            )
+            .where(
+                UniversalStorage.status == StorageStatus.FOR_SALE,
+                UniversalStorage.is_active.is_(True),
+                or_(
+                    UniversalIntegrity.universal_storage_id.is_(None),
+                    UniversalIntegrity.verified_at < verified_before,
+                ),
+            )
+            .order_by(UniversalIntegrity.verified_at.asc().nulls_first())
+            .limit(limit)
+        )
+        return list(result.scalars().all())
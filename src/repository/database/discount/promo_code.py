@@ -5,7 +5,9 @@ from sqlalchemy import select, func, update, and_
 
 from src.database.models.discount import PromoCodes
 from src.models.read_models.other import PromoCodesDTO
+from src.models.read_models.pagination import PageCursor
 from src.repository.database.base import DatabaseBase
+from src.repository.database.pagination import paginate, restore_order
 
 
 class PromoCodeRepository(DatabaseBase):
@@ -35,34 +37,43 @@ class PromoCodeRepository(DatabaseBase):
         self,
         page: Optional[int] = None,
         page_size: Optional[int] = None,
-        show_not_valid: bool = False
+        show_not_valid: bool = False,
+        cursor: Optional[PageCursor] = None,
     ) -> List[PromoCodesDTO]:
         stmt = select(PromoCodes)
         if not show_not_valid:
             stmt = stmt.where(PromoCodes.is_valid == True)
 
-        if page is not None and page_size is not None:
-            stmt = stmt.limit(page_size).offset((page - 1) * page_size)
+        stmt = paginate(stmt, PromoCodes.start_at, PromoCodes.promo_code_id, page_size, page=page, cursor=cursor)
 
-        result = await self.session_db.execute(stmt.order_by(PromoCodes.start_at.desc()))
-        promos = list(result.scalars().all())
+        result = await self.session_db.execute(stmt)
+        promos = restore_order(list(result.scalars().all()), cursor)
         return [PromoCodesDTO.model_validate(promo) for promo in promos]
 
-    async def get_not_valid_promo_codes(self, data_time_to: datetime) -> List[PromoCodesDTO]:
+    async def deactivate_expired(self, data_time_to: datetime, limit: int) -> List[PromoCodesDTO]:
         """
-        :return: Промокоды где дата меньше чем `data_time_to`
+        Установит is_valid=False одним UPDATE ... RETURNING не более чем у `limit` действующих промокодов,
+        у которых `expire_at` не позже `data_time_to`. Строки, заблокированные другой транзакцией, пропускаются.
+        :return: Деактивированные промокоды
         """
-        result_db = await self.session_db.execute(
-            select(PromoCodes)
+        expired = (
+            select(PromoCodes.promo_code_id)
             .where(
                 and_(
                     PromoCodes.is_valid.is_(True),
                     PromoCodes.expire_at <= data_time_to
                 )
             )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
         )
-        promos = list(result_db.scalars().all())
-        return [PromoCodesDTO.model_validate(promo) for promo in promos]
+        result_db = await self.session_db.execute(
+            update(PromoCodes)
+            .where(PromoCodes.promo_code_id.in_(expired.scalar_subquery()))
+            .values(is_valid=False)
+            .returning(PromoCodes)
+        )
+        return [PromoCodesDTO.model_validate(promo) for promo in result_db.scalars().all()]
 
     async def count(self, consider_invalid: bool = False) -> int:
         stmt = select(func.count()).select_from(PromoCodes)
@@ -7,7 +7,9 @@ from sqlalchemy import func, select, update, and_
 
 from src.database.models.discount import Vouchers
 from src.models.read_models.other import VouchersDTO
+from src.models.read_models.pagination import PageCursor
 from src.repository.database.base import DatabaseBase
+from src.repository.database.pagination import paginate, restore_order
 
 
 class VouchersRepository(DatabaseBase):
@@ -49,11 +51,12 @@ class VouchersRepository(DatabaseBase):
         page: Optional[int] = None,
         page_size: Optional[int] = None,
         only_created_admin: bool = False,
+        cursor: Optional[PageCursor] = None,
     ) -> Sequence[VouchersDTO]:
         """
-        :param page: Если не указывать, то вернёт все ваучеры
+        :param page: Если не указывать (и не указывать `cursor`), то вернёт все ваучеры
         """
-        stmt = select(Vouchers).order_by(Vouchers.start_at.desc())
+        stmt = select(Vouchers)
 
         if only_created_admin:
             stmt = stmt.where(Vouchers.is_created_admin.is_(True))
@@ -65,24 +68,23 @@ class VouchersRepository(DatabaseBase):
             if user_id is not None:
                 stmt = stmt.where(Vouchers.creator_id == user_id)
 
-        if page is not None:
-            if page_size is None:
-                page_size = self.conf.different.page_size
+        if page_size is None:
+            page_size = self.conf.different.page_size
 
-            offset = (page - 1) * page_size
-            stmt = stmt.limit(page_size).offset(offset)
+        stmt = paginate(stmt, Vouchers.start_at, Vouchers.voucher_id, page_size, page=page, cursor=cursor)
 
         result = await self.session_db.execute(stmt)
-        vouchers = list(result.scalars().all())
+        vouchers = restore_order(list(result.scalars().all()), cursor)
         return [VouchersDTO.model_validate(voucher) for voucher in vouchers]
 
-    async def get_not_valid_voucher(self, data_time_to: datetime) -> List[VouchersDTO]:
+    async def deactivate_expired(self, data_time_to: datetime, limit: int) -> List[VouchersDTO]:
         """
-        Установит is_valid=False у ваучеров где дата меньше чем `data_time_to`
-        :return:
+        Установит is_valid=False одним UPDATE ... RETURNING не более чем у `limit` действующих ваучеров,
+        у которых `expire_at` не позже `data_time_to`. Строки, заблокированные другой транзакцией, пропускаются.
+        :return: Деактивированные ваучеры
         """
-        result_db = await self.session_db.execute(
-            select(Vouchers)
+        expired = (
+            select(Vouchers.voucher_id)
             .where(
                 and_(
                     Vouchers.is_valid.is_(True),
@@ -90,9 +92,16 @@ class VouchersRepository(DatabaseBase):
                     Vouchers.expire_at <= data_time_to
                 )
             )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
         )
-        vouchers = list(result_db.scalars().all())
-        return [VouchersDTO.model_validate(voucher) for voucher in vouchers]
+        result_db = await self.session_db.execute(
+            update(Vouchers)
+            .where(Vouchers.voucher_id.in_(expired.scalar_subquery()))
+            .values(is_valid=False)
+            .returning(Vouchers)
+        )
+        return [VouchersDTO.model_validate(voucher) for voucher in result_db.scalars().all()]
 
     async def count(
         self,
@@ -0,0 +1,60 @@
+from typing import Optional, List, TypeVar
+
+from sqlalchemy import Select, select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute, aliased
+
+from src.models.read_models.pagination import PageCursor
+
+
+RecordType = TypeVar("RecordType")
+
+
+def paginate(
+    stmt: Select,
+    sort_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    page_size: Optional[int],
+    page: Optional[int] = None,
+    cursor: Optional[PageCursor] = None,
+) -> Select:
+    """
+    Отсортирует `stmt` от новых записей к старым по (sort_column, id_column) и ограничит одной страницей.
+
+    С `cursor.anchor_id` страница берётся после записи-якоря (или перед ней при `cursor.backward`)
+    сравнением по составному индексу, ключ якоря достаётся подзапросом по первичному ключу.
+    Иначе используется OFFSET по номеру страницы, без номера и `page_size` вернётся весь список.
+    Результат страницы перед якорем нужно развернуть через `restore_order`.
+    """
+    if cursor is None or cursor.anchor_id is None:
+        if cursor is not None:
+            page = cursor.page
+
+        stmt = stmt.order_by(sort_column.desc(), id_column.desc())
+        if page is not None and page_size is not None:
+            stmt = stmt.limit(page_size).offset((page - 1) * page_size)
+        return stmt
+
+    anchor = aliased(sort_column.class_)
+    anchor_id_column = getattr(anchor, id_column.key)
+    anchor_key = (
+        select(getattr(anchor, sort_column.key), anchor_id_column)
+        .where(anchor_id_column == cursor.anchor_id)
+        .scalar_subquery()
+    )
+    key = tuple_(sort_column, id_column)
+
+    if cursor.backward:
+        stmt = stmt.where(key > anchor_key).order_by(sort_column.asc(), id_column.asc())
+    else:
+        stmt = stmt.where(key < anchor_key).order_by(sort_column.desc(), id_column.desc())
+
+    if page_size is not None:
+        stmt = stmt.limit(page_size)
+    return stmt
+
+
+def restore_order(records: List[RecordType], cursor: Optional[PageCursor]) -> List[RecordType]:
+    """Вернёт записи страницы в порядке от новых к старым"""
+    if cursor is not None and cursor.anchor_id is not None and cursor.backward:
+        return list(reversed(records))
+    return records
@@ -4,7 +4,9 @@ from sqlalchemy import select, func
 
 from src.database.models.referrals import IncomeFromReferrals
 from src.models.read_models.other import IncomeFromReferralsDTO
+from src.models.read_models.pagination import PageCursor
 from src.repository.database.base import DatabaseBase
+from src.repository.database.pagination import paginate, restore_order
 
 
 class ReferralIncomeRepository(DatabaseBase):
@@ -14,21 +16,22 @@ class ReferralIncomeRepository(DatabaseBase):
         user_id: int,
         page: Optional[int] = None,
         page_size: Optional[int] = None,
+        cursor: Optional[PageCursor] = None,
     ) -> Sequence[IncomeFromReferralsDTO]:
         if page_size is None:
             page_size = self.conf.different.page_size
 
-        stmt = (
-            select(IncomeFromReferrals)
-            .where(IncomeFromReferrals.owner_user_id == user_id)
-            .order_by(IncomeFromReferrals.created_at.desc())
+        stmt = paginate(
+            select(IncomeFromReferrals).where(IncomeFromReferrals.owner_user_id == user_id),
+            IncomeFromReferrals.created_at,
+            IncomeFromReferrals.income_from_referral_id,
+            page_size,
+            page=page,
+            cursor=cursor,
         )
 
-        if page is not None:
-            stmt = stmt.limit(page_size).offset((page - 1) * page_size)
-
         result = await self.session_db.execute(stmt)
-        incomes = list(result.scalars().all())
+        incomes = restore_order(list(result.scalars().all()), cursor)
         return [IncomeFromReferralsDTO.model_validate(income) for income in incomes]
 
     async def count_by_owner(self, user_id: int) -> int:
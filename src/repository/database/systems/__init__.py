@@ -1,6 +1,7 @@
 from src.repository.database.systems.backup_logs import BackupLogsRepository
 from src.repository.database.systems.files import FilesRepository
 from src.repository.database.systems.settings import SettingsRepository
+from src.repository.database.systems.statistics_rollups import StatisticsRollupRepository
 from src.repository.database.systems.stickers import StickersRepository
 from src.repository.database.systems.type_payments import TypePaymentsRepository
 from src.repository.database.systems.ui_images import UiImagesRepository
@@ -9,6 +10,7 @@ __all__ = [
     "BackupLogsRepository",
     "FilesRepository",
     "SettingsRepository",
+    "StatisticsRollupRepository",
     "StickersRepository",
     "TypePaymentsRepository",
     "UiImagesRepository",
@@ -1,32 +1,76 @@
 from typing import Optional
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, select, update
 
-from src.database.models.system import BackupLogs
-from src.models.read_models.other import BackupLogsDTO
+from src.database.models.system import BackupLogs, BackupLogStats
+from src.models.read_models.other import BackupLogsDTO, BackupLogStatsDTO
 from src.repository.database.base import DatabaseBase
 
 
+def _to_dto(log: BackupLogs, stats: Optional[BackupLogStats]) -> BackupLogsDTO:
+    return BackupLogsDTO.model_validate(log).model_copy(
+        update={"stats": BackupLogStatsDTO.model_validate(stats) if stats else None}
+    )
+
+
 class BackupLogsRepository(DatabaseBase):
 
+    def _select_with_stats(self):
+        return (
+            select(BackupLogs, BackupLogStats)
+            .outerjoin(BackupLogStats, BackupLogStats.backup_log_id == BackupLogs.backup_log_id)
+        )
+
     async def get_by_id(self, backup_log_id: int) -> Optional[BackupLogsDTO]:
         result = await self.session_db.execute(
-            select(BackupLogs).where(BackupLogs.backup_log_id == backup_log_id)
+            self._select_with_stats().where(BackupLogs.backup_log_id == backup_log_id)
         )
-        log = result.scalar_one_or_none()
-        return BackupLogsDTO.model_validate(log) if log else None
+        row = result.one_or_none()
+        return _to_dto(*row) if row else None
 
     async def get_all_desc(self) -> list[BackupLogsDTO]:
         result = await self.session_db.execute(
-            select(BackupLogs).order_by(BackupLogs.created_at.desc())
+            self._select_with_stats().order_by(BackupLogs.created_at.desc())
         )
-        logs = list(result.scalars().all())
-        return [BackupLogsDTO.model_validate(log) for log in logs]
+        return [_to_dto(log, stats) for log, stats in result.all()]
 
     async def create_backup_log(self, **values) -> BackupLogsDTO:
         created = await super().create(BackupLogs, **values)
         return BackupLogsDTO.model_validate(created)
 
+    async def update(self, backup_log_id: int, **values) -> Optional[BackupLogsDTO]:
+        if not values:
+            return await self.get_by_id(backup_log_id)
+
+        stmt = (
+            update(BackupLogs)
+            .where(BackupLogs.backup_log_id == backup_log_id)
+            .values(**values)
+            .returning(BackupLogs)
+        )
+        result = await self.session_db.execute(stmt)
+        updated = result.scalar_one_or_none()
+        return await self.get_by_id(backup_log_id) if updated else None
+
+    async def create_stats(self, backup_log_id: int, **values) -> BackupLogStatsDTO:
+        created = await super().create(BackupLogStats, backup_log_id=backup_log_id, **values)
+        await self.session_db.refresh(created)
+        return BackupLogStatsDTO.model_validate(created)
+
+    async def update_stats(self, backup_log_id: int, **values) -> Optional[BackupLogStatsDTO]:
+        if not values:
+            return None
+
+        stmt = (
+            update(BackupLogStats)
+            .where(BackupLogStats.backup_log_id == backup_log_id)
+            .values(**values)
+            .returning(BackupLogStats)
+        )
+        result = await self.session_db.execute(stmt)
+        updated = result.scalar_one_or_none()
+        return BackupLogStatsDTO.model_validate(updated) if updated else None
+
     async def delete(self, backup_log_id: int) -> Optional[BackupLogsDTO]:
         stmt = (
             delete(BackupLogs)
@@ -0,0 +1,233 @@
+from datetime import date, datetime, time, timedelta, UTC
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select, func, Date, cast, String, Integer, literal
+from sqlalchemy.dialects.postgresql import insert
+
+from src.database.models.categories import Purchases
+from src.database.models.system import StatisticsDailyUsers, StatisticsDailySales, StatisticsDailyReplenishments
+from src.database.models.users import Users, Replenishments
+from src.repository.database.base import DatabaseBase
+
+
+UNKNOWN_CATEGORY_ID = 0 # продажи, которые не попали в сводную статистику через событие покупки
+
+
+def day_start(day: date) -> datetime:
+    """Начало дня UTC"""
+    return datetime.combine(day, time.min, tzinfo=UTC)
+
+
+def utc_day(column):
+    """Дата UTC для колонки DateTime(timezone=True)"""
+    return cast(func.timezone("UTC", column), Date)
+
+
+class StatisticsRollupRepository(DatabaseBase):
+
+    async def add_sales(self, category_id: int, purchase_ids: List[int]) -> None:
+        """
+        Прибавит покупки к продажам категории за день покупки. Покупки которых уже нет в БД пропускаются.
+        Выполняется одним INSERT ... SELECT, дни и тип товара берутся из самих покупок.
+
+        Покупки за уже свёрнутый день (событие опоздало или пришло повторно) пропускаются: `_reconcile_sales`
+        уже учёл их в UNKNOWN_CATEGORY_ID. Перенести их оттуда в категорию нельзя: по строке UNKNOWN_CATEGORY_ID
+        не отличить опоздавшее событие от повтора уже учтённого.
+        """
+        if not purchase_ids:
+            return
+
+        day = utc_day(Purchases.purchase_date)
+        product_type = cast(Purchases.product_type, String)
+        source = (
+            select(
+                day.label("day"),
+                literal(category_id, Integer).label("category_id"),
+                product_type.label("product_type"),
+                func.count().label("quantity"),
+                func.sum(Purchases.purchase_price).label("amount"),
+                func.sum(Purchases.net_profit).label("profit"),
+            )
+            .where(
+                Purchases.purchase_id.in_(purchase_ids),
+                Purchases.product_type.is_not(None),
+                day > func.coalesce(select(func.max(StatisticsDailyUsers.day)).scalar_subquery(), date.min),
+            )
+            .group_by(day, product_type)
+        )
+        await self._increment_sales(source)
+
+    async def _increment_sales(self, source) -> None:
+        stmt = insert(StatisticsDailySales).from_select(
+            ["day", "category_id", "product_type", "quantity", "amount", "profit"], source
+        )
+        await self.session_db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[
+                    StatisticsDailySales.day, StatisticsDailySales.category_id, StatisticsDailySales.product_type
+                ],
+                set_={
+                    "quantity": StatisticsDailySales.quantity + stmt.excluded.quantity,
+                    "amount": StatisticsDailySales.amount + stmt.excluded.amount,
+                    "profit": StatisticsDailySales.profit + stmt.excluded.profit,
+                },
+            )
+        )
+
+    async def get_closed_until(self) -> Optional[date]:
+        """:return: Последний день, за который статистика свёрнута, None если ещё ни одного"""
+        result = await self.session_db.execute(select(func.max(StatisticsDailyUsers.day)))
+        return result.scalar()
+
+    async def get_first_activity_day(self) -> Optional[date]:
+        """:return: День регистрации первого пользователя, раньше него активности в боте нет"""
+        result = await self.session_db.execute(select(func.min(utc_day(Users.created_at))))
+        return result.scalar()
+
+    async def close_days(self, date_from: date, date_to: date) -> None:
+        """
+        Свернёт пользователей, пополнения и недостающие продажи за дни [date_from, date_to].
+        Повторный вызов за те же дни перезапишет пользователей и пополнения, продажи только дополнит.
+        """
+        if date_from > date_to:
+            return
+
+        await self._close_users(date_from, date_to)
+        await self._close_replenishments(date_from, date_to)
+        await self._reconcile_sales(date_from, date_to)
+
+    async def _close_users(self, date_from: date, date_to: date) -> None:
+        day = utc_day(Users.created_at)
+        result = await self.session_db.execute(
+            select(day.label("day"), func.count().label("quantity"))
+            .where(Users.created_at >= day_start(date_from), Users.created_at < day_start(date_to + timedelta(days=1)))
+            .group_by(day)
+        )
+        new_users = {row.day: row.quantity for row in result.all()}
+
+        # строка на каждый день, в том числе без новых пользователей: по ней видно, что день закрыт
+        values = [
+            {"day": date_from + timedelta(days=offset), "new_users": new_users.get(date_from + timedelta(days=offset), 0)}
+            for offset in range((date_to - date_from).days + 1)
+        ]
+        stmt = insert(StatisticsDailyUsers).values(values)
+        await self.session_db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[StatisticsDailyUsers.day],
+                set_={"new_users": stmt.excluded.new_users},
+            )
+        )
+
+    async def _close_replenishments(self, date_from: date, date_to: date) -> None:
+        day = utc_day(Replenishments.created_at)
+        source = (
+            select(
+                day.label("day"),
+                Replenishments.type_payment_id,
+                func.count().label("quantity"),
+                func.sum(Replenishments.amount).label("amount"),
+            )
+            .where(
+                Replenishments.created_at >= day_start(date_from),
+                Replenishments.created_at < day_start(date_to + timedelta(days=1)),
+            )
+            .group_by(day, Replenishments.type_payment_id)
+        )
+        stmt = insert(StatisticsDailyReplenishments).from_select(
+            ["day", "type_payment_id", "quantity", "amount"], source
+        )
+        await self.session_db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[StatisticsDailyReplenishments.day, StatisticsDailyReplenishments.type_payment_id],
+                set_={"quantity": stmt.excluded.quantity, "amount": stmt.excluded.amount},
+            )
+        )
+
+    async def _reconcile_sales(self, date_from: date, date_to: date) -> None:
+        """
+        Сравнит продажи по покупкам с уже свёрнутыми по категориям и допишет разницу в UNKNOWN_CATEGORY_ID.
+        Так в статистику попадают покупки до появления сводной статистики и покупки с потерянным событием.
+        """
+        day = utc_day(Purchases.purchase_date)
+        product_type = cast(Purchases.product_type, String)
+        live = (
+            select(
+                day.label("day"),
+                product_type.label("product_type"),
+                func.count().label("quantity"),
+                func.sum(Purchases.purchase_price).label("amount"),
+                func.sum(Purchases.net_profit).label("profit"),
+            )
+            .where(
+                Purchases.purchase_date >= day_start(date_from),
+                Purchases.purchase_date < day_start(date_to + timedelta(days=1)),
+                Purchases.product_type.is_not(None),
+            )
+            .group_by(day, product_type)
+            .subquery()
+        )
+        rolled = (
+            select(
+                StatisticsDailySales.day,
+                StatisticsDailySales.product_type,
+                func.sum(StatisticsDailySales.quantity).label("quantity"),
+                func.sum(StatisticsDailySales.amount).label("amount"),
+                func.sum(StatisticsDailySales.profit).label("profit"),
+            )
+            .where(StatisticsDailySales.day.between(date_from, date_to))
+            .group_by(StatisticsDailySales.day, StatisticsDailySales.product_type)
+            .subquery()
+        )
+        missing_quantity = live.c.quantity - func.coalesce(rolled.c.quantity, 0)
+        source = (
+            select(
+                live.c.day,
+                literal(UNKNOWN_CATEGORY_ID, Integer),
+                live.c.product_type,
+                missing_quantity,
+                live.c.amount - func.coalesce(rolled.c.amount, 0),
+                live.c.profit - func.coalesce(rolled.c.profit, 0),
+            )
+            .select_from(live)
+            .outerjoin(rolled, (rolled.c.day == live.c.day) & (rolled.c.product_type == live.c.product_type))
+            .where(missing_quantity > 0)
+        )
+        await self._increment_sales(source)
+
+    async def get_new_users(self, date_from: date, date_to: date) -> int:
+        result = await self.session_db.execute(
+            select(func.coalesce(func.sum(StatisticsDailyUsers.new_users), 0))
+            .where(StatisticsDailyUsers.day.between(date_from, date_to))
+        )
+        return result.scalar()
+
+    async def get_sales(self, date_from: date, date_to: date) -> Dict[Tuple[int, str], Tuple[int, int, int]]:
+        """:return: Dict((category_id, product_type), (quantity, amount, profit))"""
+        result = await self.session_db.execute(
+            select(
+                StatisticsDailySales.category_id,
+                StatisticsDailySales.product_type,
+                func.sum(StatisticsDailySales.quantity).label("quantity"),
+                func.sum(StatisticsDailySales.amount).label("amount"),
+                func.sum(StatisticsDailySales.profit).label("profit"),
+            )
+            .where(StatisticsDailySales.day.between(date_from, date_to))
+            .group_by(StatisticsDailySales.category_id, StatisticsDailySales.product_type)
+        )
+        return {
+            (row.category_id, row.product_type): (row.quantity, row.amount, row.profit)
+            for row in result.all()
+        }
+
+    async def get_replenishments(self, date_from: date, date_to: date) -> Dict[int, Tuple[int, int]]:
+        """:return: Dict(type_payment_id, (quantity, amount))"""
+        result = await self.session_db.execute(
+            select(
+                StatisticsDailyReplenishments.type_payment_id,
+                func.sum(StatisticsDailyReplenishments.quantity).label("quantity"),
+                func.sum(StatisticsDailyReplenishments.amount).label("amount"),
+            )
+            .where(StatisticsDailyReplenishments.day.between(date_from, date_to))
+            .group_by(StatisticsDailyReplenishments.type_payment_id)
+        )
+        return {row.type_payment_id: (row.quantity, row.amount) for row in result.all()}
@@ -1,5 +1,6 @@
 from src.repository.database.users.banned_accounts import BannedAccountsRepository
 from src.repository.database.users.notifications import NotificationSettingsRepository
+from src.repository.database.users.suppressed_recipients import SuppressedRecipientsRepository
 from src.repository.database.users.transfer_moneys import TransferMoneysRepository
 from src.repository.database.users.user_audit_logs import UserAuditLogsRepository
 from src.repository.database.users.users import UsersRepository
@@ -9,6 +10,7 @@ from src.repository.database.users.wallet_transactions import WalletTransactionR
 __all__ = [
     "BannedAccountsRepository",
     "NotificationSettingsRepository",
+    "SuppressedRecipientsRepository",
     "TransferMoneysRepository",
     "UserAuditLogsRepository",
     "UsersRepository",
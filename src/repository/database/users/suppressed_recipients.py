@@ -0,0 +1,42 @@
+from typing import Dict
+
+from sqlalchemy import select, delete, func
+from sqlalchemy.dialects.postgresql import insert
+
+from src.database.models.users import SuppressedRecipients
+from src.repository.database.base import DatabaseBase
+
+
+class SuppressedRecipientsRepository(DatabaseBase):
+
+    async def add_many(self, reasons: Dict[int, str]) -> None:
+        """
+        Добавит пользователей одним запросом, уже добавленные пропускаются
+        :param reasons: Dict(user_id, причина: 'forbidden' | 'not_found')
+        """
+        if not reasons:
+            return
+
+        stmt = insert(SuppressedRecipients).values(
+            [{"user_id": user_id, "reason": reason} for user_id, reason in reasons.items()]
+        )
+        await self.session_db.execute(stmt.on_conflict_do_nothing(index_elements=[SuppressedRecipients.user_id]))
+
+    async def delete(self, user_id: int) -> bool:
+        """:return: был ли пользователь в списке"""
+        result = await self.session_db.execute(
+            delete(SuppressedRecipients)
+            .where(SuppressedRecipients.user_id == user_id)
+            .returning(SuppressedRecipients.user_id)
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def exists(self, user_id: int) -> bool:
+        result = await self.session_db.execute(
+            select(SuppressedRecipients.user_id).where(SuppressedRecipients.user_id == user_id)
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def count_all(self) -> int:
+        result = await self.session_db.execute(select(func.count()).select_from(SuppressedRecipients))
+        return int(result.scalar() or 0)
@@ -1,6 +1,6 @@
-from typing import Sequence
+from typing import Sequence, List
 
-from sqlalchemy import select
+from sqlalchemy import select, insert
 
 from src.database.models.users import (
     UserAuditLogs,
@@ -22,3 +22,9 @@ class UserAuditLogsRepository(DatabaseBase):
     async def create_log(self, **values) -> UserAuditLogsDTO:
         created = await super().create(UserAuditLogs, **values)
         return UserAuditLogsDTO.model_validate(created)
+
+    async def create_many(self, values: List[dict]) -> None:
+        """Создаст логи одним INSERT"""
+        if not values:
+            return
+        await self.session_db.execute(insert(UserAuditLogs), values)
@@ -1,8 +1,11 @@
-from typing import Optional, Sequence, AsyncGenerator, List
+from datetime import datetime, timedelta, UTC
+from typing import Optional, Sequence, AsyncGenerator, List, Dict
 
-from sqlalchemy import func, select, update
+from sqlalchemy import func, select, update, exists, ColumnElement, values, column, BigInteger, Integer
 
-from src.database.models.users import Users
+from src.database.models.categories import Purchases
+from src.database.models.users import Users, NotificationSettings, SuppressedRecipients
+from src.models.create_models.admins import BroadcastSegment
 from src.models.read_models.other import UsersDTO
 from src.repository.database.base import DatabaseBase
 
@@ -50,6 +53,60 @@ class UsersRepository(DatabaseBase):
         async for uid in result:
             yield uid
 
+    async def get_user_ids_after(
+        self, after_user_id: Optional[int], limit: int, segment: Optional[BroadcastSegment] = None
+    ) -> List[int]:
+        """
+        Получатели рассылки с keyset-пагинацией по первичному ключу: следующие `limit` user_id
+        больше `after_user_id` по возрастанию. Каждая страница - короткий запрос по индексу, без OFFSET.
+        Пользователи из SuppressedRecipients и не подходящие под `segment` отбрасываются в SQL.
+        :param after_user_id: None - с первого пользователя
+        """
+        stmt = (
+            select(Users.user_id)
+            .where(*self._recipient_conditions(segment))
+            .order_by(Users.user_id)
+            .limit(limit)
+        )
+        if after_user_id is not None:
+            stmt = stmt.where(Users.user_id > after_user_id)
+
+        result = await self.session_db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def count_recipients(self, segment: Optional[BroadcastSegment] = None) -> int:
+        """Сколько пользователей получит рассылку с `segment` (без отправки)"""
+        result = await self.session_db.execute(
+            select(func.count()).select_from(Users).where(*self._recipient_conditions(segment))
+        )
+        return int(result.scalar() or 0)
+
+    @staticmethod
+    def _recipient_conditions(segment: Optional[BroadcastSegment]) -> List[ColumnElement[bool]]:
+        conditions = [~exists().where(SuppressedRecipients.user_id == Users.user_id)]
+        if segment is None:
+            return conditions
+
+        if segment.active_within_days is not None:
+            conditions.append(Users.last_used >= datetime.now(UTC) - timedelta(days=segment.active_within_days))
+
+        if segment.language is not None:
+            conditions.append(Users.language == segment.language)
+
+        if segment.has_purchased is not None:
+            purchased = exists().where(Purchases.user_id == Users.user_id)
+            conditions.append(purchased if segment.has_purchased else ~purchased)
+
+        if segment.notification is not None:
+            conditions.append(
+                exists().where(
+                    NotificationSettings.user_id == Users.user_id,
+                    getattr(NotificationSettings, segment.notification).is_(True),
+                )
+            )
+
+        return conditions
+
     async def count_all(self) -> int:
         result = await self.session_db.execute(select(func.count()).select_from(Users))
         return int(result.scalar() or 0)
@@ -72,6 +129,26 @@ class UsersRepository(DatabaseBase):
         updated = result.scalar_one_or_none()
         return UsersDTO.model_validate(updated, from_attributes=True) if updated else None
 
+    async def update_balances_by_delta(self, deltas: Dict[int, int]) -> List[UsersDTO]:
+        """
+        Изменит баланс нескольких пользователей одним UPDATE ... FROM (VALUES ...)
+        :param deltas: Dict(user_id, изменение баланса)
+        :return: Пользователи с новым балансом, несуществующих в результате нет
+        """
+        if not deltas:
+            return []
+
+        changes = values(
+            column("user_id", BigInteger), column("delta", Integer), name="changes"
+        ).data(list(deltas.items()))
+        result = await self.session_db.execute(
+            update(Users)
+            .where(Users.user_id == changes.c.user_id)
+            .values(balance=Users.balance + changes.c.delta)
+            .returning(Users)
+        )
+        return [UsersDTO.model_validate(user, from_attributes=True) for user in result.scalars().all()]
+
     async def update_balance_by_delta(self, user_id: int, delta: int) -> Optional[UsersDTO]:
         result = await self.session_db.execute(
             update(Users)
@@ -1,12 +1,14 @@
-from typing import Optional, Sequence
+from typing import Optional, Sequence, List
 
-from sqlalchemy import func, select, update
+from sqlalchemy import func, select, update, insert
 
 from src.database.models.users import (
     WalletTransaction,
 )
 from src.models.read_models.other import WalletTransactionDTO
+from src.models.read_models.pagination import PageCursor
 from src.repository.database.base import DatabaseBase
+from src.repository.database.pagination import paginate, restore_order
 
 
 class WalletTransactionRepository(DatabaseBase):
@@ -31,21 +33,22 @@ class WalletTransactionRepository(DatabaseBase):
         user_id: int,
         page: Optional[int] = None,
         page_size: Optional[int] = None,
+        cursor: Optional[PageCursor] = None,
     ) -> Sequence[WalletTransactionDTO]:
         if page_size is None:
             page_size = self.conf.different.page_size
 
-        stmt = (
-            select(WalletTransaction)
-            .where(WalletTransaction.user_id == user_id)
-            .order_by(WalletTransaction.created_at.desc())
+        stmt = paginate(
+            select(WalletTransaction).where(WalletTransaction.user_id == user_id),
+            WalletTransaction.created_at,
+            WalletTransaction.wallet_transaction_id,
+            page_size,
+            page=page,
+            cursor=cursor,
         )
 
-        if page is not None:
-            stmt = stmt.limit(page_size).offset((page - 1) * page_size)
-
         result = await self.session_db.execute(stmt)
-        transactions = list(result.scalars().all())
+        transactions = restore_order(list(result.scalars().all()), cursor)
         return [WalletTransactionDTO.model_validate(tx) for tx in transactions]
 
     async def count_by_user(self, user_id: int) -> int:
@@ -60,6 +63,19 @@ class WalletTransactionRepository(DatabaseBase):
         created = await super().create(WalletTransaction, **values)
         return WalletTransactionDTO.model_validate(created)
 
+    async def create_many(self, values: List[dict]) -> List[WalletTransactionDTO]:
+        """
+        Создаст транзакции одним INSERT ... RETURNING
+        :return: Созданные транзакции в порядке `values`
+        """
+        if not values:
+            return []
+        result = await self.session_db.execute(
+            insert(WalletTransaction).returning(WalletTransaction, sort_by_parameter_order=True),
+            values,
+        )
+        return [WalletTransactionDTO.model_validate(item) for item in result.scalars().all()]
+
     async def update(self, wallet_transaction_id: int, **values) -> Optional[WalletTransactionDTO]:
         if not values:
             return await self.get_by_id(wallet_transaction_id)
@@ -14,6 +14,7 @@ from src.repository.redis.other import (
     TypePaymentsCacheRepository,
     UiImagesCacheRepository,
     UsersCacheRepository,
+    UserContextCacheRepository,
     VouchersCacheRepository,
 )
 
@@ -43,6 +44,7 @@ __all__ = [
     "TypePaymentsCacheRepository",
     "UiImagesCacheRepository",
     "UsersCacheRepository",
+    "UserContextCacheRepository",
     "VouchersCacheRepository",
 
     # product_universal.py
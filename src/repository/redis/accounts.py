@@ -6,6 +6,8 @@ from src.repository.redis.base import BaseRedisRepo
 
 class AccountsCacheRepository(BaseRedisRepo):
 
+    indexed_prefixes = ("sold_accounts_by_owner_id:", "sold_account:")
+
     def _key_product_account_by_category(self, category_id: int) -> str:
         return f"product_accounts_by_category:{category_id}"
 
@@ -15,14 +17,14 @@ class AccountsCacheRepository(BaseRedisRepo):
     def _key_sold_accounts_by_owner_id(self, owner_id: int, language: str) -> str:
         return f"sold_accounts_by_owner_id:{owner_id}:{language}"
 
-    def _key_pattern_by_owner(self, owner_id: int) -> str:
-        return f"sold_accounts_by_owner_id:{owner_id}:*"
+    def _index_by_owner(self, owner_id: int) -> str:
+        return f"sold_accounts_by_owner_id:{owner_id}"
 
     def _key_sold_accounts_by_account_id(self, account_id: int, language: str) -> str:
         return f"sold_account:{account_id}:{language}"
 
-    def _key_pattern_by_account(self, account_id: int) -> str:
-        return f"sold_account:{account_id}:*"
+    def _index_by_account(self, account_id: int) -> str:
+        return f"sold_account:{account_id}"
 
     # ==== product_accounts_by_category ====
 
@@ -39,7 +41,7 @@ class AccountsCacheRepository(BaseRedisRepo):
         )
 
     async def delete_product_accounts_by_category(self, category_id: int) -> None:
-        await self.redis_session.delete(self._key_product_account_by_category(category_id))
+        await self._delete(self._key_product_account_by_category(category_id))
 
     # ==== product_account_by_account_id ====
 
@@ -56,7 +58,7 @@ class AccountsCacheRepository(BaseRedisRepo):
         )
 
     async def delete_product_account_by_account_id(self, account_id: int) -> None:
-        await self.redis_session.delete(self._key_product_account_by_account_id(account_id))
+        await self._delete(self._key_product_account_by_account_id(account_id))
 
     # ==== sold_accounts_by_owner_id ====
 
@@ -79,7 +81,7 @@ class AccountsCacheRepository(BaseRedisRepo):
         )
 
     async def delete_sold_accounts_by_owner_id(self, owner_id: int, ) -> None:
-        await self.delete_keys_by_pattern(self._key_pattern_by_owner(owner_id))
+        await self._delete_index(self._index_by_owner(owner_id))
 
     # ==== sold_accounts_by_account_id ====
 
@@ -96,4 +98,4 @@ class AccountsCacheRepository(BaseRedisRepo):
         )
 
     async def delete_sold_accounts_by_account_id(self, account_id: int, ) -> None:
-        await self.delete_keys_by_pattern(self._key_pattern_by_account(account_id))
\ No newline at end of file
+        await self._delete_index(self._index_by_account(account_id))
\ No newline at end of file
@@ -1,73 +1,239 @@
-from typing import TypeVar, Optional, Type, List
+import uuid
+from typing import TypeVar, Optional, Type, List, Sequence, Set, Tuple
 
 from orjson import orjson
 from redis.asyncio import Redis
+from redis.exceptions import ResponseError, WatchError
 
 from src.config import Config
+from src.infrastructure.redis.local_cache import LocalCache
 
 
 T = TypeVar("T")
 
+# Префикс множеств-индексов: "idx:category:5" хранит все языковые варианты "category:5:*"
+INDEX_PREFIX = "idx:"
+
+# Префиксы индексируемых ключей всех репозиториев, заполняется при объявлении подклассов BaseRedisRepo.
+# Нужен коду, который работает с ключами разных репозиториев сразу (сборка мусора прогрева)
+INDEXED_PREFIXES: Set[str] = set()
+
+
+def index_key_for(key: str) -> Optional[str]:
+    """:return: множество-индекс, в котором учитывается ключ любого репозитория, либо None"""
+    if key.startswith(tuple(INDEXED_PREFIXES)):
+        return INDEX_PREFIX + key.rsplit(":", 1)[0]
+    return None
+
+
+async def prune_index(redis_session: Redis, index: str) -> int:
+    """
+    Уберёт из индекса ключи, которых уже нет в Redis (истекли по ttl).
+    Индекс проверяется под WATCH: если во время проверки в него записали, ничего не удаляется,
+    иначе можно убрать ключ, который был перезаписан между EXISTS и SREM
+    :return int: количество убранных ключей
+    """
+    async with redis_session.pipeline(transaction=True) as pipe:
+        try:
+            await pipe.watch(index)
+            members = list(await pipe.smembers(index))
+            if not members:
+                return 0
+
+            async with redis_session.pipeline(transaction=False) as check:
+                for member in members:
+                    await check.exists(member)
+                exists = await check.execute()
+
+            dead = [member for member, alive in zip(members, exists) if not alive]
+            if not dead:
+                return 0
+
+            pipe.multi()
+            await pipe.srem(index, *dead)
+            await pipe.execute()
+        except WatchError:
+            return 0
+    return len(dead)
+
 
 class BaseRedisRepo:
 
-    def __init__(self, redis_session: Redis, config: Config):
+    # L1-кэш процесса включается только для редко меняющихся объектов
+    use_local_cache: bool = False
+
+    # Ключи с этими префиксами при записи добавляются в множество-индекс своей сущности
+    # ("category:5:ru" -> "idx:category:5"), чтобы удалять все варианты ключа без SCAN
+    indexed_prefixes: Tuple[str, ...] = ()
+
+    # Индекс живёт столько же, сколько последний записанный в него ключ с ttl.
+    # Отключается, если в одном индексе лежат ключи с разным ttl: истёкшие ключи
+    # из такого индекса убирает `prune_index`
+    expire_index: bool = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        INDEXED_PREFIXES.update(cls.indexed_prefixes)
+
+    def __init__(self, redis_session: Redis, config: Config, local_cache: Optional[LocalCache] = None):
         self.redis_session = redis_session
         self.conf = config
+        self.local_cache = local_cache if self.use_local_cache else None
 
-    async def _set_one(self, key: str, value: T, ttl: Optional[int] = None):
-        """Устанавливает единичную модель `model`"""
-        data = orjson.dumps(value.model_dump())
+    async def _invalidate_local(self, *keys: str):
+        if self.local_cache and keys:
+            await self.local_cache.invalidate(*keys)
 
+    def _index_key(self, key: str) -> Optional[str]:
+        """:return: множество-индекс, в котором учитывается ключ, либо None"""
+        if self.indexed_prefixes and key.startswith(self.indexed_prefixes):
+            return INDEX_PREFIX + key.rsplit(":", 1)[0]
+        return None
+
+    async def _pipe_set(self, pipe, key: str, data, ttl: Optional[int] = None):
+        """Добавит в pipeline запись ключа и, если он индексируется, его индекса"""
         if ttl:
+            await pipe.setex(key, ttl, data)
+        else:
+            await pipe.set(key, data)
+
+        index = self._index_key(key)
+        if index:
+            await pipe.sadd(index, key)
+            if ttl and self.expire_index:
+                await pipe.expire(index, ttl)
+
+    async def _delete(self, *keys: str):
+        """Удаляет ключи из Redis, их индексов и из L1-кэша всех процессов"""
+        async with self.redis_session.pipeline(transaction=False) as pipe:
+            await pipe.delete(*keys)
+            for key in keys:
+                index = self._index_key(key)
+                if index:
+                    await pipe.srem(index, key)
+            await pipe.execute()
+
+        await self._invalidate_local(*keys)
+
+    async def _delete_index(self, name: str) -> int:
+        """
+        Удалит все ключи из индекса `name` и сам индекс: SMEMBERS и один UNLINK вместо обхода SCAN.
+        Индекс сперва атомарно переименовывается, поэтому ключи, записанные во время удаления,
+        попадают уже в новый индекс и не теряются.
+        :param name: имя индекса без префикса, например "category:5"
+        :return int: количество ключей в индексе
+        """
+        index = INDEX_PREFIX + name
+        detached = f"{index}:del:{uuid.uuid4().hex}"
+        try:
+            await self.redis_session.rename(index, detached)
+        except ResponseError:  # индекса нет - удалять нечего
+            return 0
+
+        keys = [
+            key.decode("utf-8") if isinstance(key, bytes) else key
+            for key in await self.redis_session.smembers(detached)
+        ]
+        await self.redis_session.unlink(detached, *keys)
+        await self._invalidate_local(*keys)
+        return len(keys)
+
+    async def _prune_index(self, name: str) -> int:
+        """
+        Уберёт из индекса `name` истёкшие ключи
+        :param name: имя индекса без префикса, например "promo_code"
+        """
+        return await prune_index(self.redis_session, INDEX_PREFIX + name)
+
+    async def _set_raw(self, key: str, data, ttl: Optional[int] = None):
+        """Устанавливает ключ с уже сериализованным значением"""
+        index = self._index_key(key)
+        if index:
+            async with self.redis_session.pipeline(transaction=False) as pipe:
+                await self._pipe_set(pipe, key, data, ttl)
+                await pipe.execute()
+        elif ttl:
             await self.redis_session.setex(key, ttl, data)
         else:
             await self.redis_session.set(key, data)
 
+        await self._invalidate_local(key)
+
+    async def _set_one(self, key: str, value: T, ttl: Optional[int] = None):
+        """Устанавливает единичную модель `model`"""
+        await self._set_raw(key, orjson.dumps(value.model_dump()), ttl)
+
     async def _get_one(self, key: str, model: Type[T]) -> Optional[T]:
         """Извлекает единичную модель `model`"""
+        version = None
+        if self.local_cache:
+            cached = self.local_cache.get(key)
+            if cached is not LocalCache.MISSING:
+                return cached
+            version = self.local_cache.version
+
         raw = await self.redis_session.get(key)
         if not raw:
             return None
 
-        return model.model_validate(orjson.loads(raw))
+        result = model.model_validate(orjson.loads(raw))
+        if self.local_cache:
+            self.local_cache.put(key, result, version)
+        return result
 
     async def _set_many(self, key: str, values: List[T], ttl: Optional[int] = None):
         """Устанавливает список из `model`"""
-        data = orjson.dumps([v.model_dump() for v in values])
-
-        if ttl:
-            await self.redis_session.setex(key, ttl, data)
-        else:
-            await self.redis_session.set(key, data)
+        await self._set_raw(key, orjson.dumps([v.model_dump() for v in values]), ttl)
 
     async def _get_many(self, key: str, model: Type[T]) -> List[T]:
         """Извлекает список `model`"""
+        version = None
+        if self.local_cache:
+            cached = self.local_cache.get(key)
+            if cached is not LocalCache.MISSING:
+                return list(cached)
+            version = self.local_cache.version
+
         raw = await self.redis_session.get(key)
         if not raw:
             return []
 
-        return [model.model_validate(item) for item in orjson.loads(raw)]
+        result = [model.model_validate(item) for item in orjson.loads(raw)]
+        if self.local_cache:
+            self.local_cache.put(key, result, version)
+            return list(result)
+        return result
 
     async def delete_keys_by_pattern(self, pattern: str) -> int:
         """
-        Удаляет все ключи, соответствующие шаблону. Пример: 'user:*'
+        Удаляет все ключи, соответствующие шаблону, обходом SCAN. Пример: 'user:*'.
+        Для индексируемых ключей используется `_delete_index`
         :return int: количество удалённых записей
         """
         count = 0
         async for key in self.redis_session.scan_iter(match=pattern):
             await self.redis_session.delete(key)
             count += 1
+
+        if self.local_cache:
+            await self.local_cache.invalidate_pattern(pattern)
         return count
 
-    async def bulk_set(self, items: list[tuple[str, bytes, int]]):
+    async def bulk_set(self, items: list[tuple[str, bytes, int]], delete_keys: Sequence[str] = ()):
         """
+        Запишет и удалит ключи одним pipeline
         :param items: List[tuple[ключ, данные, ttl]]
+        :param delete_keys: ключи, которые необходимо удалить
         """
         async with self.redis_session.pipeline(transaction=False) as pipe:
             for key, value, ttl in items:
-                if ttl and ttl > 1:
-                    await pipe.setex(key, ttl, value)
-                else:
-                    await pipe.set(key, value)
-            await pipe.execute()
\ No newline at end of file
+                await self._pipe_set(pipe, key, value, ttl if ttl and ttl > 1 else None)
+            if delete_keys:
+                await pipe.delete(*delete_keys)
+                for key in delete_keys:
+                    index = self._index_key(key)
+                    if index:
+                        await pipe.srem(index, key)
+            await pipe.execute()
+
+        await self._invalidate_local(*(key for key, _, _ in items), *delete_keys)
\ No newline at end of file
@@ -6,23 +6,26 @@ from src.repository.redis.base import BaseRedisRepo
 
 class CategoriesCacheRepository(BaseRedisRepo):
 
+    use_local_cache = True
+    indexed_prefixes = ("main_categories:", "categories_by_parent:", "category:")
+
     def _key_main_categories(self, language: str) -> str:
         return f"main_categories:{language}"
 
-    def _key_pattern_by_main_categories(self) -> str:
-        return f"main_categories:*"
+    def _index_main_categories(self) -> str:
+        return "main_categories"
 
     def _key_categories_by_parent(self, parent_id: int, language: str) -> str:
         return f"categories_by_parent:{parent_id}:{language}"
 
-    def _key_pattern_by_parent(self, parent_id: int) -> str:
-        return f"categories_by_parent:{parent_id}:*"
+    def _index_by_parent(self, parent_id: int) -> str:
+        return f"categories_by_parent:{parent_id}"
 
     def _key_category(self, category_id: int, language: str) -> str:
         return f"category:{category_id}:{language}"
 
-    def _key_pattern_by_category(self, category_id: int) -> str:
-        return f"category:{category_id}:*"
+    def _index_by_category(self, category_id: int) -> str:
+        return f"category:{category_id}"
 
     # ==== main_categories ====
 
@@ -39,7 +42,7 @@ class CategoriesCacheRepository(BaseRedisRepo):
         )
 
     async def delete_main_categories(self) -> None:
-        await self.delete_keys_by_pattern(self._key_pattern_by_main_categories())
+        await self._delete_index(self._index_main_categories())
 
     # ==== categories_by_parent ====
 
@@ -56,7 +59,7 @@ class CategoriesCacheRepository(BaseRedisRepo):
         )
 
     async def delete_categories_by_parent(self, parent_id: int) -> None:
-        await self.delete_keys_by_pattern(self._key_pattern_by_parent(parent_id))
+        await self._delete_index(self._index_by_parent(parent_id))
 
     # ==== category ====
 
@@ -73,4 +76,4 @@ class CategoriesCacheRepository(BaseRedisRepo):
         )
 
     async def delete_category(self, category_id: int) -> None:
-        await self.delete_keys_by_pattern(self._key_pattern_by_category(category_id))
+        await self._delete_index(self._index_by_category(category_id))
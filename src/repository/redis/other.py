@@ -1,15 +1,20 @@
 from typing import Optional, List
 
 from orjson import orjson
+from redis.asyncio import Redis
 
+from src.config import Config
 from src.models.read_models import SettingsDTO, StickersDTO, UiImagesDTO
 from src.database.models.discount import SmallVoucher
-from src.models.read_models.other import ReferralLevelsDTO, TypePaymentsDTO, UsersDTO, PromoCodesDTO, VouchersDTO
+from src.models.read_models.other import ReferralLevelsDTO, TypePaymentsDTO, UsersDTO, PromoCodesDTO, VouchersDTO, \
+    UserContextDTO
 from src.repository.redis.base import BaseRedisRepo
 
 
 class SettingsCacheRepository(BaseRedisRepo):
 
+    use_local_cache = True
+
     def _key(self) -> str:
         return "settings"
 
@@ -20,7 +25,7 @@ class SettingsCacheRepository(BaseRedisRepo):
         return await self._get_one(self._key(), SettingsDTO)
 
     async def delete(self) -> None:
-        await self.redis_session.delete(self._key())
+        await self._delete(self._key())
 
 
 class UsersCacheRepository(BaseRedisRepo):
@@ -37,44 +42,54 @@ class UsersCacheRepository(BaseRedisRepo):
     async def delete(self, user_id: int) -> None:
         await self.redis_session.delete(self._key(user_id))
 
+    async def set_many(self, users: List[UsersDTO], ttl: int) -> None:
+        """Запишет пользователей одним pipeline"""
+        await self.bulk_set([
+            (self._key(user.user_id), orjson.dumps(user.model_dump()), ttl)
+            for user in users
+        ])
+
 
 class StickersCacheRepository(BaseRedisRepo):
 
+    use_local_cache = True
+    indexed_prefixes = ("sticker:",)
+
     def _key(self, key: str) -> str:
         return f"sticker:{key}"
 
-    def _pattern(self) -> str:
-        return "sticker:*"
+    def _index(self) -> str:
+        return "sticker"
 
     async def set(self, sticker: StickersDTO) -> None:
         await self._set_one(self._key(sticker.key), sticker)
 
     async def set_many(self, stickers: List[StickersDTO]) -> None:
-        async with self.redis_session.pipeline(transaction=False) as pipe:
-            for sticker in stickers:
-                await pipe.set(
-                    self._key(sticker.key),
-                    orjson.dumps(sticker.model_dump())
-                )
-            await pipe.execute()
+        await self.bulk_set([
+            (self._key(sticker.key), orjson.dumps(sticker.model_dump()), 0)
+            for sticker in stickers
+        ])
 
     async def get(self, key: str) -> Optional[StickersDTO]:
         return await self._get_one(self._key(key), StickersDTO)
 
     async def delete(self, key: str) -> None:
-        await self.redis_session.delete(self._key(key))
+        await self._delete(self._key(key))
 
     async def delete_all(self) -> None:
-        await self.delete_keys_by_pattern(self._pattern())
+        await self._delete_index(self._index())
 
 
 class UiImagesCacheRepository(BaseRedisRepo):
 
+    use_local_cache = True
+    indexed_prefixes = ("ui_image:",)
+
     def _key(self, key: str) -> str:
         return f"ui_image:{key}"
 
-    def _pattern(self) -> str:
-        return "ui_image:*"
+    def _index(self) -> str:
+        return "ui_image"
 
     async def set(self, image: UiImagesDTO) -> None:
         await self._set_one(self._key(image.key), image)
@@ -83,14 +98,16 @@ class UiImagesCacheRepository(BaseRedisRepo):
         return await self._get_one(self._key(key), UiImagesDTO)
 
     async def delete(self, key: str) -> None:
-        await self.redis_session.delete(self._key(key))
+        await self._delete(self._key(key))
 
     async def delete_all(self) -> None:
-        await self.delete_keys_by_pattern(self._pattern())
+        await self._delete_index(self._index())
 
 
 class ReferralLevelsCacheRepository(BaseRedisRepo):
 
+    use_local_cache = True
+
     def _key(self) -> str:
         return "referral_levels"
 
@@ -101,7 +118,7 @@ class ReferralLevelsCacheRepository(BaseRedisRepo):
         return await self._get_many(self._key(), ReferralLevelsDTO)
 
     async def delete(self) -> None:
-        await self.redis_session.delete(self._key())
+        await self._delete(self._key())
 
 
 class DollarRateCacheRepository(BaseRedisRepo):
@@ -128,14 +145,17 @@ class SubscriptionCacheRepository(BaseRedisRepo):
 
 class TypePaymentsCacheRepository(BaseRedisRepo):
 
+    use_local_cache = True
+    indexed_prefixes = ("type_payments:",)
+
     def _key_all(self) -> str:
         return "all_types_payments"
 
     def _key_one(self, type_payment_id: int) -> str:
         return f"type_payments:{type_payment_id}"
 
-    def _pattern(self) -> str:
-        return "type_payments:*"
+    def _index(self) -> str:
+        return "type_payments"
 
     async def set_all(self, items: List[TypePaymentsDTO]) -> None:
         await self._set_many(self._key_all(), items)
@@ -150,63 +170,72 @@ class TypePaymentsCacheRepository(BaseRedisRepo):
         await self._set_one(self._key_one(item.type_payment_id), item)
 
     async def delete_one(self, type_payment_id: int) -> None:
-        await self.redis_session.delete(self._key_one(type_payment_id))
+        await self._delete(self._key_one(type_payment_id))
 
     async def delete_all(self) -> None:
-        await self.redis_session.delete(self._key_all())
-        await self.delete_keys_by_pattern(self._pattern())
+        await self._delete(self._key_all())
+        await self._delete_index(self._index())
 
 
 class AdminsCacheRepository(BaseRedisRepo):
 
+    indexed_prefixes = ("admin:",)
+
     def _key(self, user_id: int) -> str:
         return f"admin:{user_id}"
 
-    def _pattern(self) -> str:
-        return "admin:*"
+    def _index(self) -> str:
+        return "admin"
 
     async def set(self, user_id: int) -> None:
-        await self.redis_session.set(self._key(user_id), "_")
+        await self._set_raw(self._key(user_id), "_")
 
     async def exists(self, user_id: int) -> bool:
         return await self.redis_session.exists(self._key(user_id)) == 1
 
     async def delete(self, user_id: int) -> None:
-        await self.redis_session.delete(self._key(user_id))
+        await self._delete(self._key(user_id))
 
     async def delete_all(self) -> None:
-        await self.delete_keys_by_pattern(self._pattern())
+        await self._delete_index(self._index())
 
 
 class BannedAccountsCacheRepository(BaseRedisRepo):
 
+    indexed_prefixes = ("banned_account:",)
+
     def _key(self, user_id: int) -> str:
         return f"banned_account:{user_id}"
 
-    def _pattern(self) -> str:
-        return "banned_account:*"
+    def _index(self) -> str:
+        return "banned_account"
 
     async def set(self, user_id: int, reason: str) -> None:
-        await self.redis_session.set(self._key(user_id), reason)
+        await self._set_raw(self._key(user_id), reason)
 
     async def get(self, user_id: int) -> Optional[str]:
         result = await self.redis_session.get(self._key(user_id))
         return result.decode("utf-8") if isinstance(result, bytes)  else result
 
     async def delete(self, user_id: int) -> None:
-        await self.redis_session.delete(self._key(user_id))
+        await self._delete(self._key(user_id))
 
     async def delete_all(self) -> None:
-        await self.delete_keys_by_pattern(self._pattern())
+        await self._delete_index(self._index())
 
 
 class PromoCodesCacheRepository(BaseRedisRepo):
 
+    indexed_prefixes = ("promo_code:",)
+    # у промокодов разный срок действия, индекс не должен истечь раньше последнего из них,
+    # истёкшие коды из него убирает `prune_index`
+    expire_index = False
+
     def _key(self, code: str) -> str:
         return f"promo_code:{code}"
 
-    def _pattern(self) -> str:
-        return "promo_code:*"
+    def _index(self) -> str:
+        return "promo_code"
 
     async def set(self, promo: PromoCodesDTO, ttl: Optional[int]) -> None:
         await self._set_one(self._key(promo.activation_code), promo, ttl=ttl)
@@ -215,10 +244,19 @@ class PromoCodesCacheRepository(BaseRedisRepo):
         return await self._get_one(self._key(code), PromoCodesDTO)
 
     async def delete(self, code: str) -> None:
-        await self.redis_session.delete(self._key(code))
+        await self._delete(self._key(code))
+
+    async def delete_many(self, codes: List[str]) -> None:
+        """Удалит промокоды одним pipeline"""
+        if codes:
+            await self._delete(*(self._key(code) for code in codes))
 
     async def delete_all(self) -> None:
-        await self.delete_keys_by_pattern(self._pattern())
+        await self._delete_index(self._index())
+
+    async def prune_index(self) -> int:
+        """Уберёт из индекса промокоды, истёкшие по ttl"""
+        return await self._prune_index(self._index())
 
 
 class VouchersCacheRepository(BaseRedisRepo):
@@ -253,5 +291,40 @@ class VouchersCacheRepository(BaseRedisRepo):
     async def delete_by_code(self, code: str) -> None:
         await self.redis_session.delete(self._key_one(code))
 
+    async def delete_many(self, codes: List[str], user_ids: List[int]) -> None:
+        """Удалит ваучеры по кодам и списки ваучеров пользователей одной командой"""
+        keys = [self._key_one(code) for code in codes] + [self._key_by_user(user_id) for user_id in user_ids]
+        if keys:
+            await self.redis_session.delete(*keys)
+
 
+class UserContextCacheRepository(BaseRedisRepo):
+    """
+    Читает пользователя, бан, флаг админа и настройки за один запрос к Redis.
+    Ключи совпадают с ключами соответствующих репозиториев.
+    """
 
+    def __init__(self, redis_session: Redis, config: Config):
+        super().__init__(redis_session, config)
+        self.users_cache = UsersCacheRepository(redis_session, config)
+        self.banned_cache = BannedAccountsCacheRepository(redis_session, config)
+        self.admins_cache = AdminsCacheRepository(redis_session, config)
+        self.settings_cache = SettingsCacheRepository(redis_session, config)
+
+    async def get(self, user_id: int) -> UserContextDTO:
+        async with self.redis_session.pipeline(transaction=False) as pipe:
+            await pipe.mget(
+                self.users_cache._key(user_id),
+                self.banned_cache._key(user_id),
+                self.settings_cache._key(),
+            )
+            await pipe.exists(self.admins_cache._key(user_id))
+            (raw_user, raw_ban, raw_settings), admin_exists = await pipe.execute()
+
+        return UserContextDTO(
+            user_id=user_id,
+            user=UsersDTO.model_validate(orjson.loads(raw_user)) if raw_user else None,
+            ban_reason=raw_ban.decode("utf-8") if isinstance(raw_ban, bytes) else raw_ban,
+            is_admin=admin_exists == 1,
+            settings=SettingsDTO.model_validate(orjson.loads(raw_settings)) if raw_settings else None,
+        )
@@ -6,11 +6,13 @@ from src.repository.redis.base import BaseRedisRepo
 
 class ProductUniversalCacheRepository(BaseRedisRepo):
 
+    indexed_prefixes = ("product_universal_by_category:",)
+
     def _key_by_category(self, category_id: int) -> str:
         return f"product_universal_by_category:{category_id}"
 
-    def _pattern_all(self) -> str:
-        return "product_universal_by_category:*"
+    def _index_all(self) -> str:
+        return "product_universal_by_category"
 
     async def set_by_category(
         self,
@@ -32,10 +34,10 @@ class ProductUniversalCacheRepository(BaseRedisRepo):
         )
 
     async def delete_by_category(self, category_id: int) -> None:
-        await self.redis_session.delete(self._key_by_category(category_id))
+        await self._delete(self._key_by_category(category_id))
 
     async def delete_all(self) -> None:
-        await self.delete_keys_by_pattern(self._pattern_all())
+        await self._delete_index(self._index_all())
 
 
 class ProductUniversalSingleCacheRepository(BaseRedisRepo):
@@ -43,9 +45,6 @@ class ProductUniversalSingleCacheRepository(BaseRedisRepo):
     def _key(self, product_universal_id: int) -> str:
         return f"product_universal:{product_universal_id}"
 
-    def _pattern(self, product_universal_id: int) -> str:
-        return f"product_universal:{product_universal_id}*"
-
     async def set(self, product: ProductUniversalFull) -> None:
         await self._set_one(
             self._key(product.product_universal_id),
@@ -62,16 +61,18 @@ class ProductUniversalSingleCacheRepository(BaseRedisRepo):
         )
 
     async def delete_by_product_id(self, product_universal_id: int) -> None:
-        await self.delete_keys_by_pattern(self._pattern(product_universal_id))
+        await self._delete(self._key(product_universal_id))
 
 
 class SoldUniversalCacheRepository(BaseRedisRepo):
 
+    indexed_prefixes = ("sold_universal_by_owner_id:",)
+
     def _key_by_owner(self, owner_id: int, language: str) -> str:
         return f"sold_universal_by_owner_id:{owner_id}:{language}"
 
-    def _pattern_by_owner(self, owner_id: int) -> str:
-        return f"sold_universal_by_owner_id:{owner_id}:*"
+    def _index_by_owner(self, owner_id: int) -> str:
+        return f"sold_universal_by_owner_id:{owner_id}"
 
     async def set_by_owner(
         self,
@@ -97,16 +98,18 @@ class SoldUniversalCacheRepository(BaseRedisRepo):
         )
 
     async def delete_by_owner(self, owner_id: int) -> None:
-        await self.delete_keys_by_pattern(self._pattern_by_owner(owner_id))
+        await self._delete_index(self._index_by_owner(owner_id))
 
 
 class SoldUniversalSingleCacheRepository(BaseRedisRepo):
 
+    indexed_prefixes = ("sold_universal:",)
+
     def _key(self, sold_universal_id: int, language: str) -> str:
         return f"sold_universal:{sold_universal_id}:{language}"
 
-    def _pattern(self, sold_universal_id: int) -> str:
-        return f"sold_universal:{sold_universal_id}:*"
+    def _index(self, sold_universal_id: int) -> str:
+        return f"sold_universal:{sold_universal_id}"
 
     async def set(
         self,
@@ -131,4 +134,4 @@ class SoldUniversalSingleCacheRepository(BaseRedisRepo):
         )
 
     async def delete_by_id(self, sold_universal_id: int) -> None:
-        await self.delete_keys_by_pattern(self._pattern(sold_universal_id))
\ No newline at end of file
+        await self._delete_index(self._index(sold_universal_id))
\ No newline at end of file
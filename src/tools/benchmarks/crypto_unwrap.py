@@ -0,0 +1,86 @@
+"""
+Бенчмарк горячего пути расшифровки товаров.
+
+Сравнивает прежнюю схему (unwrap_dek + decrypt_text на каждую расшифровку: свежие AESGCM(kek) и AESGCM(dek))
+с CryptoService (общий шифр KEK, кэш развёрнутых DEK и их шифров).
+Каждый из ITEMS товаров расшифровывается ROUNDS раз подряд, как при проверке, покупке и выдаче.
+Сервис хранения и БД не нужны: ключи создаются в памяти.
+
+Запуск: python -m src.tools.benchmarks.crypto_unwrap
+"""
+import time
+from types import SimpleNamespace
+
+from src.application.crypto.crypto_context import CryptoProvider
+from src.application.crypto.crypto_service import CryptoService
+from src.domain.crypto.decrypt import decrypt_text
+from src.domain.crypto.encrypt import make_account_key
+from src.domain.crypto.key_ops import encrypt_text, unwrap_dek
+from src.domain.crypto.models import CryptoContext
+from src.domain.crypto.utils import gen_key
+
+
+ITEMS = 2_500
+ROUNDS = 4 # ITEMS * ROUNDS = 10 000 развёртываний и расшифровок
+
+
+def make_storages(kek: bytes) -> list[SimpleNamespace]:
+    storages = []
+    for i in range(ITEMS):
+        encrypted_key, dek, key_nonce = make_account_key(kek)
+        login, login_nonce, _ = encrypt_text(f"login_{i}", dek)
+        storages.append(SimpleNamespace(
+            encrypted_key=encrypted_key,
+            encrypted_key_nonce=key_nonce,
+            login_encrypted=login,
+            login_nonce=login_nonce,
+        ))
+    return storages
+
+
+def bench_plain(storages: list[SimpleNamespace], kek: bytes) -> float:
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        for storage in storages:
+            dek = unwrap_dek(storage.encrypted_key, storage.encrypted_key_nonce, kek)
+            decrypt_text(storage.login_encrypted, storage.login_nonce, dek)
+    return time.perf_counter() - started
+
+
+def bench_service(storages: list[SimpleNamespace], service: CryptoService) -> float:
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        for storage in storages:
+            service.decrypt_text(storage, storage.login_encrypted, storage.login_nonce)
+    return time.perf_counter() - started
+
+
+def bench_batch_unwrap(storages: list[SimpleNamespace], service: CryptoService) -> float:
+    service.clear()
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        service.unwrap_many(storages)
+    return time.perf_counter() - started
+
+
+def main():
+    kek = gen_key()
+    provider = CryptoProvider()
+    provider.set(CryptoContext(kek=kek, dek=gen_key(), nonce_b64_dek=""))
+    service = CryptoService(provider, max_items=ITEMS, ttl=300)
+    storages = make_storages(kek)
+    total = ITEMS * ROUNDS
+
+    plain = bench_plain(storages, kek)
+    cached = bench_service(storages, service)
+    print(f"unwrap + decrypt, {total} раз")
+    print(f"  unwrap_dek + decrypt_text:  {plain * 1000:8.1f} мс ({plain / total * 1e6:.2f} мкс на товар)")
+    print(f"  CryptoService.decrypt_text: {cached * 1000:8.1f} мс ({cached / total * 1e6:.2f} мкс на товар)")
+
+    batch = bench_batch_unwrap(storages, service)
+    print(f"CryptoService.unwrap_many, {ROUNDS} пачек по {ITEMS}: {batch * 1000:.1f} мс")
+    print(f"кэш: {service.stats()}")
+
+
+if __name__ == "__main__":
+    main()
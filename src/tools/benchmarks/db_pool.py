@@ -0,0 +1,118 @@
+"""
+Нагрузочный бенчмарк пула соединений БД.
+
+Имитирует поток апдейтов: каждый обработчик открывает сессию и выполняет запросы типичного экрана истории
+(пользователь, страница транзакций и их количество). Обработчики запускаются пачками по CONCURRENCY штук.
+Сравнивает прежние настройки engine (пул по умолчанию) с DbEngineProfile и режимом PgBouncer,
+выводит p50/p99 времени обработчика и статистику пула.
+
+Запуск: python -m src.tools.benchmarks.db_pool
+"""
+import asyncio
+import statistics
+import time
+from typing import List
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from src.config.db_conf import DbEngineProfile, build_engine
+from src.containers.app_container import AppContainer
+from src.database.models.users import Users
+from src.infrastructure.database import PoolMetrics
+from src.repository.database.users import UsersRepository, WalletTransactionRepository
+
+
+HANDLERS = 2000
+CONCURRENCY = 50
+USERS = 100
+FIRST_USER_ID = 9_000_000_000 # вне диапазона id Telegram, пользователи удаляются после замера
+
+PROFILES = {
+    # прежний create_async_engine: QueuePool 5 + 10, без pre-ping и recycle, кэш диалекта по умолчанию
+    "before": DbEngineProfile(
+        pool_size=5, max_overflow=10, pool_timeout=30, pool_recycle=-1, pool_pre_ping=False, statement_cache_size=100
+    ),
+    "profile": DbEngineProfile(),
+    "pgbouncer": DbEngineProfile(pgbouncer=True),
+}
+
+
+async def seed_users(session_local: sessionmaker) -> List[int]:
+    async with session_local() as session:
+        user_ids = [FIRST_USER_ID + number for number in range(USERS)]
+        session.add_all([
+            Users(user_id=user_id, username="bench_pool", unique_referral_code=f"bench_pool_{user_id}")
+            for user_id in user_ids
+        ])
+        await session.commit()
+        return user_ids
+
+
+async def delete_users(session_local: sessionmaker, user_ids: List[int]):
+    async with session_local() as session:
+        await session.execute(delete(Users).where(Users.user_id.in_(user_ids)))
+        await session.commit()
+
+
+async def handle_update(session_local: sessionmaker, conf, user_id: int) -> float:
+    start = time.perf_counter()
+    async with session_local() as session:
+        users_repo = UsersRepository(session_db=session, config=conf)
+        transactions_repo = WalletTransactionRepository(session_db=session, config=conf)
+
+        await users_repo.get_by_id(user_id)
+        await transactions_repo.get_page(user_id=user_id, page=1)
+        await transactions_repo.count_by_user(user_id=user_id)
+    return time.perf_counter() - start
+
+
+async def run_profile(sql_db_url: str, conf, profile: DbEngineProfile, user_ids: List[int]):
+    metrics = PoolMetrics()
+    engine = build_engine(sql_db_url, profile, metrics)
+    session_local = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False, autoflush=False)
+
+    try:
+        # прогрев: соединения открыты, запросы подготовлены
+        await asyncio.gather(*(handle_update(session_local, conf, user_id) for user_id in user_ids[:CONCURRENCY]))
+        metrics.reset()
+
+        latencies = []
+        for offset in range(0, HANDLERS, CONCURRENCY):
+            latencies += await asyncio.gather(*(
+                handle_update(session_local, conf, user_ids[number % len(user_ids)])
+                for number in range(offset, offset + CONCURRENCY)
+            ))
+    finally:
+        await engine.dispose()
+
+    return latencies, metrics.stats()
+
+
+def _report(title: str, latencies: List[float], stats):
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{title:<10} p50: {quantiles[49] * 1000:7.2f} ms, p99: {quantiles[98] * 1000:7.2f} ms | "
+        f"pool wait avg: {stats.avg_wait_ms:6.2f} ms, p99: {stats.p99_wait_ms:6.2f} ms, "
+        f"max in use: {stats.max_in_use}, timeouts: {stats.timeouts}"
+    )
+
+
+async def main():
+    app_container = await AppContainer.create()
+    conf = app_container.conf
+    try:
+        user_ids = await seed_users(conf.db_connection.session_local)
+        try:
+            for title, profile in PROFILES.items():
+                latencies, stats = await run_profile(conf.db_connection.sql_db_url, conf, profile, user_ids)
+                _report(title, latencies, stats)
+        finally:
+            await delete_users(conf.db_connection.session_local, user_ids)
+    finally:
+        await app_container.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
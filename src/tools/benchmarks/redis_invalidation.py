@@ -0,0 +1,92 @@
+"""
+Бенчмарк инвалидации кэша категории в Redis.
+
+Сравнивает удаление языковых вариантов ключа обходом SCAN по шаблону (прежняя схема)
+с удалением по множеству-индексу (SMEMBERS + один UNLINK). Время SCAN растёт с общим числом ключей в Redis,
+время удаления по индексу зависит только от числа вариантов ключа.
+Создаются ключи с отрицательными id категорий, в конце они удаляются.
+
+Запуск: python -m src.tools.benchmarks.redis_invalidation
+"""
+import asyncio
+import time
+
+from src.containers.app_container import AppContainer
+from src.repository.redis import CategoriesCacheRepository
+
+
+KEYS_TOTAL = (10_000, 1_000_000)
+LANGUAGES = ("ru", "en")
+REPEATS = 5
+
+# размер pipeline при заполнении и очистке
+BATCH = 10_000
+
+
+def _keys(repo: CategoriesCacheRepository, start: int, stop: int) -> list[str]:
+    return [
+        repo._key_category(-category_id, language)
+        for category_id in range(start, stop)
+        for language in LANGUAGES
+    ]
+
+
+async def seed(repo: CategoriesCacheRepository, total: int) -> int:
+    """
+    Заполнит Redis `total` ключами категорий
+    :return: число категорий
+    """
+    categories = total // len(LANGUAGES)
+    step = BATCH // len(LANGUAGES)
+    for start in range(1, categories + 1, step):
+        keys = _keys(repo, start, min(start + step, categories + 1))
+        await repo.bulk_set([(key, b"{}", 0) for key in keys])
+    return categories
+
+
+async def cleanup(repo: CategoriesCacheRepository, categories: int) -> None:
+    step = BATCH // len(LANGUAGES)
+    for start in range(1, categories + 1, step):
+        stop = min(start + step, categories + 1)
+        await repo.redis_session.unlink(
+            *_keys(repo, start, stop),
+            *(f"idx:{repo._index_by_category(-category_id)}" for category_id in range(start, stop)),
+        )
+
+
+async def measure(repo: CategoriesCacheRepository, category_id: int, by_index: bool) -> float:
+    """:return: среднее время инвалидации одной категории, мс"""
+    elapsed = 0.0
+    for _ in range(REPEATS):
+        await repo.bulk_set([(repo._key_category(category_id, language), b"{}", 0) for language in LANGUAGES])
+
+        start = time.perf_counter()
+        if by_index:
+            await repo.delete_category(category_id)
+        else:
+            await repo.delete_keys_by_pattern(f"category:{category_id}:*")
+        elapsed += time.perf_counter() - start
+
+    return elapsed / REPEATS * 1000
+
+
+async def main():
+    app_container = await AppContainer.create()
+    repo = CategoriesCacheRepository(app_container.redis, app_container.conf)
+    try:
+        for total in KEYS_TOTAL:
+            categories = await seed(repo, total)
+            try:
+                target = -categories // 2
+                scan_ms = await measure(repo, target, by_index=False)
+                index_ms = await measure(repo, target, by_index=True)
+            finally:
+                await cleanup(repo, categories)
+
+            print(f"{total:>9} keys | SCAN: {scan_ms:10.2f} ms | index: {index_ms:8.2f} ms")
+    finally:
+        await app_container.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,97 @@
+"""
+Микро-бенчмарк сборки RequestContainer на один апдейт.
+
+Сравнивает старую схему (каждый middleware открывает свою сессию и собирает весь граф зависимостей)
+с текущей (одна сессия и ленивый контейнер на апдейт).
+
+Запуск: python -m src.tools.benchmarks.request_container
+"""
+import asyncio
+import time
+from functools import cached_property
+
+from src.containers import RequestContainer
+from src.containers.app_container import AppContainer
+
+
+UPDATES = 1000
+
+# количество middleware, которые раньше открывали собственную сессию и контейнер
+OLD_MIDDLEWARE_CHAIN = 5
+
+
+class CountingSessionFactory:
+    """Обёртка над sessionmaker, считающая количество открытых сессий"""
+
+    def __init__(self, session_factory):
+        self.session_factory = session_factory
+        self.opened = 0
+
+    def __call__(self):
+        self.opened += 1
+        return self.session_factory()
+
+
+def build_all(container: RequestContainer) -> int:
+    """Принудительно создаёт все зависимости контейнера (эквивалент прежней жадной сборки)"""
+    built = 0
+    for name, attr in type(container).__dict__.items():
+        if isinstance(attr, cached_property):
+            getattr(container, name)
+            built += 1
+    return built
+
+
+def build_typical_update(container: RequestContainer) -> int:
+    """Зависимости, которые затрагивает типичный callback: проверки middleware и отправка сообщения"""
+    _ = container.banned_account_service
+    _ = container.user_service
+    _ = container.settings_service
+    _ = container.admin_service
+    _ = container.get_message_service()
+    return len(container.__dict__)
+
+
+async def run_before(app_container: AppContainer, session_factory: CountingSessionFactory) -> float:
+    start = time.perf_counter()
+    for _ in range(UPDATES):
+        for _ in range(OLD_MIDDLEWARE_CHAIN):
+            async with session_factory() as session:
+                build_all(app_container.get_request_container(session))
+    return time.perf_counter() - start
+
+
+async def run_after(app_container: AppContainer, session_factory: CountingSessionFactory) -> float:
+    start = time.perf_counter()
+    for _ in range(UPDATES):
+        async with session_factory() as session:
+            build_typical_update(app_container.get_request_container(session))
+    return time.perf_counter() - start
+
+
+def _report(title: str, elapsed: float, sessions: int):
+    print(
+        f"{title:<8} build: {elapsed / UPDATES * 1000:.3f} ms/update, "
+        f"sessions: {sessions / UPDATES:.1f}/update"
+    )
+
+
+async def main():
+    app_container = await AppContainer.create()
+    try:
+        session_local = app_container.conf.db_connection.session_local
+
+        before_factory = CountingSessionFactory(session_local)
+        elapsed_before = await run_before(app_container, before_factory)
+
+        after_factory = CountingSessionFactory(session_local)
+        elapsed_after = await run_after(app_container, after_factory)
+
+        _report("before", elapsed_before, before_factory.opened)
+        _report("after", elapsed_after, after_factory.opened)
+    finally:
+        await app_container.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,161 @@
+"""
+Бенчмарк транзакции финализации покупки нескольких универсальных товаров.
+
+Сравнивает прежнюю схему (DELETE + INSERT SoldUniversal + INSERT Purchases + UPDATE UniversalStorage на каждый товар)
+с пакетной (одинаковое количество запросов независимо от размера заказа).
+Все данные создаются внутри транзакции, которая в конце откатывается.
+
+Запуск: python -m src.tools.benchmarks.universal_finalize
+"""
+import asyncio
+import time
+import uuid
+
+from sqlalchemy import event
+
+from src.containers import RequestContainer
+from src.containers.app_container import AppContainer
+from src.database.models.categories import (
+    Categories, ProductType, ProductUniversal, StorageStatus, UniversalMediaType, UniversalStorage
+)
+from src.database.models.system import UiImages
+from src.database.models.users import Users
+
+
+ORDER_SIZES = (10, 100, 1000)
+
+ORIGINAL_PRICE = 150
+PURCHASE_PRICE = 150
+COST_PRICE = 60
+
+
+class StatementCounter:
+    """Считает SQL-запросы, отправленные движком"""
+
+    def __init__(self, engine):
+        self.engine = engine.sync_engine
+        self.count = 0
+
+    def _on_execute(self, *args, **kwargs):
+        self.count += 1
+
+    def __enter__(self):
+        self.count = 0
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+
+async def seed(container: RequestContainer, quantity: int) -> tuple[int, list[tuple[int, int]]]:
+    """
+    Создаст пользователя, категорию и `quantity` товаров на продажу
+    :return: (user_id, [(product_universal_id, universal_storage_id)])
+    """
+    session = container.session_db
+    suffix = uuid.uuid4().hex[:12]
+
+    user = Users(user_id=-int(uuid.uuid4().int % 10**12), unique_referral_code=f"bench_{suffix}")
+    ui_image = UiImages(key=f"bench_{suffix}", file_name="bench.png")
+    session.add_all([user, ui_image])
+    await session.flush()
+
+    category = Categories(
+        ui_image_key=ui_image.key,
+        is_product_storage=True,
+        product_type=ProductType.UNIVERSAL,
+        price=ORIGINAL_PRICE,
+        cost_price=COST_PRICE,
+    )
+    session.add(category)
+    await session.flush()
+
+    storages = [
+        UniversalStorage(
+            checksum="0" * 64,
+            encrypted_key="key",
+            encrypted_key_nonce="nonce",
+            status=StorageStatus.FOR_SALE,
+            media_type=UniversalMediaType.DESCRIPTION,
+        )
+        for _ in range(quantity)
+    ]
+    session.add_all(storages)
+    await session.flush()
+
+    products = [
+        ProductUniversal(universal_storage_id=storage.universal_storage_id, category_id=category.category_id)
+        for storage in storages
+    ]
+    session.add_all(products)
+    await session.flush()
+
+    return user.user_id, [(p.product_universal_id, p.universal_storage_id) for p in products]
+
+
+def _purchase_values(user_id: int, storage_id: int) -> dict:
+    return {
+        "user_id": user_id,
+        "universal_storage_id": storage_id,
+        "product_type": ProductType.UNIVERSAL,
+        "original_price": ORIGINAL_PRICE,
+        "purchase_price": PURCHASE_PRICE,
+        "cost_price": COST_PRICE,
+        "net_profit": PURCHASE_PRICE - COST_PRICE,
+    }
+
+
+async def finalize_before(container: RequestContainer, user_id: int, products: list[tuple[int, int]]):
+    for product_id, storage_id in products:
+        await container.product_universal_repo.delete(product_id)
+        await container.sold_universal_repo.create_sold(owner_id=user_id, universal_storage_id=storage_id)
+        await container.purchases_repo.create_purchase(**_purchase_values(user_id, storage_id))
+        await container.universal_storage_repo.update(storage_id, status=StorageStatus.BOUGHT)
+
+
+async def finalize_after(container: RequestContainer, user_id: int, products: list[tuple[int, int]]):
+    storage_ids = [storage_id for _, storage_id in products]
+
+    await container.product_universal_repo.delete_by_ids([product_id for product_id, _ in products])
+    await container.sold_universal_repo.create_many(owner_id=user_id, universal_storage_ids=storage_ids)
+    await container.purchases_repo.create_many([_purchase_values(user_id, storage_id) for storage_id in storage_ids])
+    await container.universal_storage_repo.update_status_by_ids(storage_ids, status=StorageStatus.BOUGHT)
+
+
+async def measure(app_container: AppContainer, finalize, quantity: int) -> tuple[float, int]:
+    session_local = app_container.conf.db_connection.session_local
+
+    async with session_local() as session:
+        container = app_container.get_request_container(session)
+        try:
+            user_id, products = await seed(container, quantity)
+            session.expunge_all()
+
+            with StatementCounter(app_container.conf.db_connection.engine) as counter:
+                start = time.perf_counter()
+                await finalize(container, user_id, products)
+                elapsed = time.perf_counter() - start
+            return elapsed, counter.count
+        finally:
+            await session.rollback()
+
+
+async def main():
+    app_container = await AppContainer.create()
+    try:
+        for quantity in ORDER_SIZES:
+            elapsed_before, statements_before = await measure(app_container, finalize_before, quantity)
+            elapsed_after, statements_after = await measure(app_container, finalize_after, quantity)
+
+            print(
+                f"{quantity:>5} items | "
+                f"before: {elapsed_before * 1000:9.1f} ms, {statements_before:>5} statements | "
+                f"after: {elapsed_after * 1000:9.1f} ms, {statements_after:>5} statements"
+            )
+    finally:
+        await app_container.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
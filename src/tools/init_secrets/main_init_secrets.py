@@ -4,8 +4,7 @@ from pathlib import Path
 from venv import logger
 
 from src.config import init_env, PathSettings
-from src.infrastructure.crypto.secret_storage.client import SecretsStorageClient
-from src.infrastructure.crypto.secret_storage.http_secrets_storage import HttpSecretsStorage
+from src.infrastructure.crypto.secret_storage.factory import build_secrets_storage
 from src.infrastructure.crypto.secret_storage.secrets_storage import SecretsStorage
 from src.tools.init_secrets.bootstrap_service import CryptoBootstrapService
 from src.tools.init_secrets.config_dto import EnvInitSecrets
@@ -25,16 +24,7 @@ async def main():
 
     paths_conf = PathSettings.build(use_secret_storage=True, cert_dir=conf.cert_dir)
 
-    secret_client = SecretsStorageClient(
-        base_url=conf.storage_server_url,
-        cert=(
-            str(paths_conf.ssl_client_cert_file),
-            str(paths_conf.ssl_client_key_file),
-        ),
-        ca=str(paths_conf.ssl_ca_file),
-    )
-
-    storage: SecretsStorage = HttpSecretsStorage(secret_client)
+    storage: SecretsStorage = build_secrets_storage(conf.storage_server_url, paths_conf)
 
     passphrase = getpass("Enter master passphrase: ")
 
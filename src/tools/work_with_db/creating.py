@@ -6,7 +6,7 @@ from src.database.creating import create_database, create_table
 
 async def create():
     """Создает базу данных и все таблицы в ней (если существует, то ничего не произойдёт)"""
-    app_container = AppContainer()
+    app_container = await AppContainer.create()
     try:
         await create_database(app_container.conf)
         await create_table(app_container.conf)
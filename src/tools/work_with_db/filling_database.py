@@ -15,7 +15,7 @@ from src.database.models.admins import Admins
 
 async def filling():
     """Заполнит все необходимые данные в БД"""
-    app_container = AppContainer()
+    app_container = await AppContainer.create()
     try:
         conf = app_container.conf
 
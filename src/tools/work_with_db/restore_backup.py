@@ -1,15 +1,19 @@
 import argparse
 import asyncio
+import base64
+import hashlib
 import subprocess
-import tempfile
 import sys
-from pathlib import Path
 from getpass import getpass
+from typing import AsyncIterator
+
+import aiohttp
 
-from src.application.crypto.secrets_storage import get_storage_client
 from src.config import init_env, get_config
-from src.domain.crypto.decrypt import decrypt_bytes
+from src.domain.crypto.decrypt import decrypt_chunks
 from src.domain.crypto.key_ops import unwrap_dek
+from src.infrastructure.crypto.secret_storage.factory import build_async_secrets_storage
+from src.infrastructure.crypto.secret_storage.secrets_storage import AsyncSecretsStorage
 from src.domain.crypto.utils import derive_kek
 
 
@@ -19,7 +23,11 @@ def parse_args():
     parser.add_argument("--secret-file-name", required=True)
     parser.add_argument("--env", required=True, choices=["DEV", "PROD", "TEST"])
     parser.add_argument("--force", action="store_true")
-    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="только проверить бэкап: скачать, расшифровать, сверить sha256 и прочитать оглавление дампа",
+    )
     return parser.parse_args()
 
 
@@ -43,20 +51,79 @@ def get_kek() -> bytes:
     return kek
 
 
-def restore_postgres(dump_file: Path, config):
+async def stream_backup(storage: AsyncSecretsStorage, name: str, dek: bytes, dst: asyncio.StreamWriter) -> str:
+    """
+    Скачивает бэкап по частям и расшифровывает его в `dst` без временных файлов.
+    :return: sha256 (base64) скачанного зашифрованного файла
+    """
+    sha256 = hashlib.sha256()
+
+    async def chunks() -> AsyncIterator[bytes]:
+        async for chunk in storage.iter_secret_file(name):
+            sha256.update(chunk)
+            yield chunk
+
+    async for data in decrypt_chunks(chunks(), dek):
+        dst.write(data)
+        await dst.drain()
+    return base64.b64encode(sha256.digest()).decode("ascii")
+
+
+async def run_pg_restore(
+    args_pg_restore: list[str],
+    storage: AsyncSecretsStorage,
+    name: str,
+    dek: bytes,
+    **process_kwargs
+) -> str:
+    """Расшифрованный дамп подаётся в stdin pg_restore. При ошибке расшифровки pg_restore завершается"""
+    process = await asyncio.create_subprocess_exec(
+        "pg_restore", *args_pg_restore, stdin=asyncio.subprocess.PIPE, **process_kwargs
+    )
+    try:
+        sha256_b64 = await stream_backup(storage, name, dek, process.stdin)
+        process.stdin.close()
+        await process.stdin.wait_closed()
+    except BaseException:
+        process.kill()
+        await process.wait()
+        raise
+
+    returncode = await process.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, "pg_restore")
+    return sha256_b64
+
+
+async def verify_backup(storage: AsyncSecretsStorage, name: str, dek: bytes):
+    print("Verifying backup...")
+
+    sha256_b64 = await run_pg_restore(["--list"], storage, name, dek, stdout=asyncio.subprocess.DEVNULL)
+
+    expected = (await storage.get_secret_file_meta(name)).get("sha256")
+    if expected and expected != sha256_b64:
+        raise RuntimeError("sha256 of downloaded backup does not match storage metadata")
+
+    print("Backup verified successfully.")
+
+
+async def restore_postgres(storage: AsyncSecretsStorage, name: str, dek: bytes, config):
     print("Restoring PostgreSQL _database...")
 
-    subprocess.run(
+    # одна транзакция: если поток оборвётся на середине, pg_restore откатит всё
+    await run_pg_restore(
         [
-            "pg_restore",
             "--clean",
             "--if-exists",
+            "--single-transaction",
+            "--exit-on-error",
             "--dbname",
             f"postgresql://{config.env.db_user}:{config.secrets.db_password}"
             f"@{config.env.db_host}/{config.env.db_name}",
-            str(dump_file),
         ],
-        check=True,
+        storage,
+        name,
+        dek,
     )
 
     print("Database restored successfully.")
@@ -68,44 +135,28 @@ async def main():
     init_env()
 
     config = get_config()
-    confirm_destruction(args.env, args.force)
+    if not args.dry_run:
+        confirm_destruction(args.env, args.force)
 
     kek = get_kek()
-    storage = get_storage_client()
-
-    enc_dek = storage.get_secret_string(args.secret_srt_dek_name) # берём с сервиса хранения DEK
 
-    # расшифровка DEK
-    dek = unwrap_dek(
-        encrypted_data_b64=enc_dek["encrypted_data"],
-        nonce_b64=enc_dek["nonce"],
-        kek=kek,
-    )
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir = Path(tmpdir)
+    async with aiohttp.ClientSession() as http_session:
+        storage = build_async_secrets_storage(config.env.storage_server_url, config.paths, http_session)
 
-        enc_file = tmpdir / "backup.enc"
-        dump_file = tmpdir / "backup.dump"
+        enc_dek = await storage.get_secret(args.secret_srt_dek_name) # берём с сервиса хранения DEK
 
-        # скачать файл
-        storage.download_secret_file(
-            name=args.secret_file_name,
-            dst_path=enc_file,
+        # расшифровка DEK
+        dek = unwrap_dek(
+            encrypted_data_b64=enc_dek["encrypted_data"],
+            nonce_b64=enc_dek["nonce"],
+            kek=kek,
         )
 
-        # расшифровать
-        plaintext = decrypt_bytes(enc_file.read_bytes(), dek)
-        dump_file.write_bytes(plaintext)
-
         if args.dry_run:
-            print("Dry-run successful.")
+            await verify_backup(storage, args.secret_file_name, dek)
             return
 
-        restore_postgres(dump_file, config)
-
-        enc_file.unlink(missing_ok=True)
-        dump_file.unlink(missing_ok=True)
+        await restore_postgres(storage, args.secret_file_name, dek, config)
 
 
 if __name__ == '__main__':
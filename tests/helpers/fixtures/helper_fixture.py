@@ -24,7 +24,7 @@ from tests.helpers.func_fabrics import create_new_user_fabric, create_admin_fabr
     create_universal_storage_factory, create_product_universal_factory, create_sold_universal_factory
 from src.database.models.categories import ProductType, AccountServiceType, StorageStatus, UniversalMediaType, \
     ProductAccounts
-from src.database.models.system import Settings
+from src.database.models.system import Settings, BackupStatus
 from src.database.models.system.models import ReplenishmentService
 from src.database import get_session_factory
 from src.infrastructure.crypto_bot.core import CryptoBotProvider
@@ -533,7 +533,7 @@ async def create_universal_storage(container_fix: RequestContainer):
         description: str = "Universal product description",
         encrypted_tg_file_id: str | None = "fb3425dh12hbf34bfd5dh7sjg5f",
         encrypted_tg_file_id_nonce: str | None = None,
-        checksum: str = "checksum",
+        checksum: str | None = None,
         key_version: int = 1,
         encryption_algo: str = "AES-GCM-256",
         status: StorageStatus = StorageStatus.FOR_SALE,
@@ -663,6 +663,7 @@ async def create_backup_log(container_fix: RequestContainer):
         encrypted_dek_b64: str = "encrypted_dek_b64",
         dek_nonce_b64: str = "dek_nonce_b64",
         size_bytes: int = 12345,
+        status: BackupStatus | None = None,
     ):
         return await create_backup_log_fabric(
             container_fix=container_fix,
@@ -671,6 +672,7 @@ async def create_backup_log(container_fix: RequestContainer):
             encrypted_dek_b64=encrypted_dek_b64,
             dek_nonce_b64=dek_nonce_b64,
             size_bytes=size_bytes,
+            status=status,
         )
 
     return _factory
@@ -15,7 +15,7 @@ from src.database.models.system.models import ReplenishmentService
 from src.models.read_models import UsersDTO
 from src.repository.database.referrals.utils import create_unique_referral_code
 from src.database.models.system import TypePayments
-from src.database.models.system import UiImages, BackupLogs
+from src.database.models.system import UiImages, BackupLogs, BackupLogStats, BackupStatus
 from src.database.models.users import Users, Replenishments, NotificationSettings, WalletTransaction, \
     TransferMoneys
 from src.database.models.users import BalanceHolder
@@ -463,6 +463,7 @@ async def create_backup_log_fabric(
     encrypted_dek_b64: str = "encrypted_dek_b64",
     dek_nonce_b64: str = "dek_nonce_b64",
     size_bytes: int = 12345,
+    status: BackupStatus | None = None,
 ) -> BackupLogs:
     if storage_file_name is None:
         storage_file_name = str(uuid.uuid4())
@@ -479,6 +480,9 @@ async def create_backup_log_fabric(
             size_bytes = size_bytes
         )
         session_db.add(log)
+        await session_db.flush()
+        if status is not None:
+            session_db.add(BackupLogStats(backup_log_id=log.backup_log_id, status=status))
         await session_db.commit()
         await session_db.refresh(log)
 
@@ -9,6 +9,7 @@ from src.containers import RequestContainer
 from src.database.core import get_session_factory
 from src.domain.crypto.encrypt import encrypt_file, make_account_key
 from src.domain.crypto.key_ops import encrypt_text
+from src.domain.crypto.utils import sha256_file
 from tests.helpers.func_fabrics.category_fabric import create_category_factory
 from tests.helpers.func_fabrics.other_fabric import create_new_user_fabric
 from src.database.models.categories import UniversalMediaType, UniversalStorage, \
@@ -52,7 +53,7 @@ async def create_universal_storage_factory(
     encrypted_tg_file_id: str | None = "fb3425dh12hbf34bfd5dh7sjg5f",
     encrypted_tg_file_id_nonce: str | None = None,
 
-    checksum: str = "checksum",
+    checksum: str | None = None,  # по умолчанию SHA256 созданного файла
 
     key_version: int = 1,
     encryption_algo: str = "AES-GCM-256",
@@ -78,6 +79,11 @@ async def create_universal_storage_factory(
             container_fix=container_fix, dek=key, status=status, uuid=storage_uuid
         )
         original_filename = file_path.name
+        if checksum is None:
+            checksum = sha256_file(container_fix.path_builder.build_path_universal_storage(status, storage_uuid))
+
+    if checksum is None:
+        checksum = "checksum"
 
 
     async with get_session_factory() as session_db:
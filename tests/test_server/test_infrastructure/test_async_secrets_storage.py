@@ -0,0 +1,229 @@
+import asyncio
+import base64
+import datetime
+import ipaddress
+import ssl
+import time
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from src.application.crypto.crypto_context import GLOBAL_DEK_NAME
+from src.application.crypto.secrets_storage import PrefetchSecrets
+from src.config import PathSettings, SECRET_NAMES
+from src.domain.crypto.utils import gen_key
+from src.exceptions import StorageNotFound
+from src.infrastructure.crypto.secret_storage.cached_secrets_storage import CachedSecretsStorage, \
+    EncryptedSecretsCache
+from src.infrastructure.crypto.secret_storage.factory import build_async_secrets_storage
+
+RESPONSE_DELAY = 0.2
+
+
+def _cert(subject: str, key, issuer_name=None, issuer_key=None, ca: bool = False, server: bool = False):
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, subject)])
+    now = datetime.datetime.now(datetime.UTC)
+    builder = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(issuer_name or name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=1))
+        .not_valid_after(now + datetime.timedelta(hours=1))
+        .add_extension(x509.BasicConstraints(ca=ca, path_length=None), critical=True)
+    )
+    if server:
+        builder = builder.add_extension(
+            x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]), critical=False
+        )
+    return builder.sign(issuer_key or key, hashes.SHA256())
+
+
+def _write_pem(path, cert, key) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    if key is not None:
+        path.with_name(path.name.replace("cert", "key")).write_bytes(key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        ))
+
+
+class StubStorage:
+    """Заглушка сервиса хранения: строковые секреты с задержкой ответа и файлы"""
+
+    def __init__(self):
+        self.secrets = {}
+        self.files = {}
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_string(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(RESPONSE_DELAY)
+        finally:
+            self.in_flight -= 1
+
+        name = request.match_info["name"]
+        if name not in self.secrets:
+            raise web.HTTPNotFound()
+        return web.json_response(self.secrets[name])
+
+    async def create_string(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        self.secrets[body["name"]] = {"encrypted_data": body["encrypted_data"], "nonce": body["nonce"]}
+        return web.Response(status=201)
+
+    async def create_file(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        self.files[form["name"]] = {
+            "data": form["file"].file.read(),
+            "nonce": form["nonce"],
+            "sha256": form["sha256"],
+        }
+        return web.Response(status=201)
+
+    async def download_file(self, request: web.Request) -> web.Response:
+        return web.Response(body=self.files[request.match_info["name"]]["data"])
+
+    async def purge(self, request: web.Request) -> web.Response:
+        self.secrets.pop(request.match_info["name"], None)
+        self.files.pop(request.match_info["name"], None)
+        return web.Response(status=202)
+
+    def app(self) -> web.Application:
+        app = web.Application(client_max_size=64 * 1024 * 1024)
+        app.router.add_get("/secret_string/{name}", self.get_string)
+        app.router.add_post("/secrets_strings/create_string", self.create_string)
+        app.router.add_post("/secrets_files/create_files", self.create_file)
+        app.router.add_get("/secrets/files/{name}/download", self.download_file)
+        app.router.add_delete("/secrets/{name}/purge", self.purge)
+        return app
+
+
+@pytest_asyncio.fixture
+async def stub_storage(tmp_path):
+    """Заглушка на 127.0.0.1 с mTLS: сертификаты CA, сервера и клиента создаются на время теста"""
+    ca_key, server_key, client_key = (ec.generate_private_key(ec.SECP256R1()) for _ in range(3))
+    ca_cert = _cert("test ca", ca_key, ca=True)
+    server_cert = _cert("127.0.0.1", server_key, ca_cert.subject, ca_key, server=True)
+    client_cert = _cert("client", client_key, ca_cert.subject, ca_key)
+
+    cert_dir = tmp_path / "certs"
+    _write_pem(cert_dir / "ca" / "client_ca_chain.pem", ca_cert, None)
+    _write_pem(cert_dir / "client" / "client_cert.pem", client_cert, client_key)
+    _write_pem(cert_dir / "server" / "server_cert.pem", server_cert, server_key)
+
+    server_ssl = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH, cafile=cert_dir / "ca" / "client_ca_chain.pem")
+    server_ssl.load_cert_chain(cert_dir / "server" / "server_cert.pem", cert_dir / "server" / "server_key.pem")
+    server_ssl.verify_mode = ssl.CERT_REQUIRED
+
+    stub = StubStorage()
+    runner = web.AppRunner(stub.app())
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0, ssl_context=server_ssl)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    paths = PathSettings.build(use_secret_storage=True, cert_dir=str(cert_dir))
+    async with aiohttp.ClientSession() as http_session:
+        storage = build_async_secrets_storage(f"https://127.0.0.1:{port}", paths, http_session)
+        yield stub, storage
+
+    await runner.cleanup()
+
+
+class _Logger:
+    def info(self, *args, **kwargs):
+        pass
+
+    def warning(self, *args, **kwargs):
+        pass
+
+
+class TestAsyncSecretsStorage:
+
+    @pytest.mark.asyncio
+    async def test_get_secrets_in_parallel(self, stub_storage):
+        stub, storage = stub_storage
+        names = [f"secret_{i}" for i in range(6)]
+        for name in names:
+            stub.secrets[name] = {"encrypted_data": f"data_{name}", "nonce": "nonce"}
+
+        started = time.monotonic()
+        payloads = await storage.get_secrets(names)
+
+        # шесть ответов с задержкой пришли примерно за время одного
+        assert time.monotonic() - started < RESPONSE_DELAY * 3
+        assert stub.max_in_flight > 1
+        assert {name: payload["encrypted_data"] for name, payload in payloads.items()} == \
+               {name: f"data_{name}" for name in names}
+
+        with pytest.raises(StorageNotFound):
+            await storage.get_secrets(["secret_0", "missing"])
+
+    @pytest.mark.asyncio
+    async def test_file_stream_roundtrip(self, stub_storage):
+        stub, storage = stub_storage
+        data = bytes(i % 251 for i in range(300_000))
+
+        async def chunks():
+            for start in range(0, len(data), 65_536):
+                yield data[start:start + 65_536]
+
+        await storage.upload_secret_file_stream("backup.enc", chunks(), "bm9uY2U=", lambda: "sha")
+        assert stub.files["backup.enc"] == {"data": data, "nonce": "bm9uY2U=", "sha256": "sha"}
+
+        assert b"".join([chunk async for chunk in storage.iter_secret_file("backup.enc")]) == data
+
+        await storage.purge_secret("backup.enc")
+        assert stub.files == {}
+
+    @pytest.mark.asyncio
+    async def test_prefetch_uses_encrypted_disk_cache(self, stub_storage, tmp_path, monkeypatch):
+        stub, storage = stub_storage
+        names = [GLOBAL_DEK_NAME, *SECRET_NAMES.values()]
+        for name in names:
+            stub.secrets[name] = {"encrypted_data": base64.b64encode(name.encode()).decode(), "nonce": "nonce"}
+
+        kek = gen_key()
+        cache_path = tmp_path / "cache" / "secrets.enc"
+
+        def cached(kek_: bytes, ttl: float) -> CachedSecretsStorage:
+            return CachedSecretsStorage(storage, EncryptedSecretsCache(cache_path, kek_, ttl, _Logger()))
+
+        class _RuntimeConf:
+            class env:
+                use_secret_storage = True
+
+        prefetch = PrefetchSecrets(cached(kek, 60), _Logger(), _RuntimeConf())
+        snapshot = await prefetch.execute()
+        assert stub.requests == len(names)
+        assert snapshot.get_secret("DB_PASSWORD") == stub.secrets["DB_PASSWORD"]
+
+        # файл кэша зашифрован: ни имён, ни ответов в открытом виде
+        raw = cache_path.read_bytes()
+        assert b"DB_PASSWORD" not in raw and stub.secrets["DB_PASSWORD"]["encrypted_data"].encode() not in raw
+
+        # повторный запуск в пределах ttl без запросов к хранилищу
+        await PrefetchSecrets(cached(kek, 60), _Logger(), _RuntimeConf()).execute()
+        assert stub.requests == len(names)
+
+        # истёкший ttl или другой KEK: кэш не используется
+        real_time = time.time
+        monkeypatch.setattr(time, "time", lambda: real_time() + 120)
+        await PrefetchSecrets(cached(kek, 60), _Logger(), _RuntimeConf()).execute()
+        assert stub.requests == 2 * len(names)
+
+        await PrefetchSecrets(cached(gen_key(), 60), _Logger(), _RuntimeConf()).execute()
+        assert stub.requests == 3 * len(names)
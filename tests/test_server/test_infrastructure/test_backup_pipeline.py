@@ -0,0 +1,136 @@
+import asyncio
+import base64
+import hashlib
+import sys
+
+import pytest
+
+from src.database.models.system import BackupStatus
+from src.domain.crypto.decrypt import decrypt_chunks
+from src.domain.crypto.key_ops import unwrap_dek
+from src.domain.crypto.stream import HEADER_SIZE, parse_header
+
+DUMP_SIZE = 3 * 1024 * 1024 + 123
+
+
+class FakeStorage:
+
+    def __init__(self, fail_upload: bool = False):
+        self.fail_upload = fail_upload
+        self.secrets = {}
+        self.files = {}
+        self.purged = []
+
+    async def create_secret(self, name: str, encrypted_data: str, nonce: str, sha256: str) -> None:
+        self.secrets[name] = {"encrypted_data": encrypted_data, "nonce": nonce, "sha256": sha256}
+
+    async def upload_secret_file_stream(self, name: str, chunks, nonce_b64: str, sha256_b64) -> None:
+        data = bytearray()
+        async for chunk in chunks:
+            data += chunk
+            if self.fail_upload and len(data) > 1024 * 1024:
+                raise ConnectionError("storage unavailable")
+        self.files[name] = {"data": bytes(data), "nonce": nonce_b64, "sha256": sha256_b64()}
+
+    async def iter_secret_file(self, name: str, version: int | None = None):
+        data = self.files[name]["data"]
+        for start in range(0, len(data), 10_000):
+            yield data[start:start + 10_000]
+
+    async def purge_secret(self, name: str) -> None:
+        self.purged.append(name)
+
+
+def _fake_pg_dump(exit_code: int = 0):
+    # детерминированный "дамп": DUMP_SIZE байт, затем код завершения
+    script = (
+        "import sys\n"
+        f"data = bytes(i % 251 for i in range({DUMP_SIZE}))\n"
+        "sys.stdout.buffer.write(data)\n"
+        "sys.stderr.write('dump error')\n"
+        f"sys.exit({exit_code})\n"
+    )
+
+    async def start_pg_dump(**kwargs):
+        return await asyncio.create_subprocess_exec(
+            sys.executable, "-c", script,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+    return start_pg_dump
+
+
+async def _backup_logs(container_fix):
+    return await container_fix.backup_logs_service.get_all_backup_logs_desc()
+
+
+class TestBackupPipeline:
+
+    @pytest.mark.asyncio
+    async def test_streamed_backup_roundtrip(self, container_fix, monkeypatch):
+        monkeypatch.setattr(container_fix.config.different, "backup_progress_interval", 0.01)
+        storage = FakeStorage()
+        container_fix.secret_storage = storage
+        service = container_fix.get_backup_db()
+        service.start_pg_dump = _fake_pg_dump()
+
+        await service.backup_database()
+
+        [log] = await _backup_logs(container_fix)
+        assert log.status == BackupStatus.COMPLETED
+        assert log.stats.dump_size_bytes == DUMP_SIZE
+        assert log.stats.duration_seconds > 0
+        assert log.stats.throughput_bytes_per_second > 0
+
+        uploaded = storage.files[log.storage_file_name]
+        assert log.size_bytes == len(uploaded["data"])
+        assert uploaded["sha256"] == base64.b64encode(hashlib.sha256(uploaded["data"]).digest()).decode()
+        _, prefix = parse_header(uploaded["data"][:HEADER_SIZE])
+        assert uploaded["nonce"] == base64.b64encode(prefix).decode()
+
+        secret = storage.secrets[log.storage_encrypted_dek_name]
+        dek = unwrap_dek(secret["encrypted_data"], secret["nonce"], container_fix.crypto_provider.get().kek)
+        restored = b"".join([part async for part in decrypt_chunks(storage.iter_secret_file(log.storage_file_name), dek)])
+        assert restored == bytes(i % 251 for i in range(DUMP_SIZE))
+
+    @pytest.mark.asyncio
+    async def test_pg_dump_failure_marks_log_failed(self, container_fix):
+        storage = FakeStorage()
+        container_fix.secret_storage = storage
+        service = container_fix.get_backup_db()
+        service.start_pg_dump = _fake_pg_dump(exit_code=1)
+
+        await service.backup_database()
+
+        [log] = await _backup_logs(container_fix)
+        assert log.status == BackupStatus.FAILED
+        assert "dump error" in log.stats.error
+        assert storage.files == {}
+        assert sorted(storage.purged) == sorted([log.storage_file_name, log.storage_encrypted_dek_name])
+
+    @pytest.mark.asyncio
+    async def test_upload_failure_stops_backup(self, container_fix):
+        storage = FakeStorage(fail_upload=True)
+        container_fix.secret_storage = storage
+        service = container_fix.get_backup_db()
+        service.start_pg_dump = _fake_pg_dump()
+
+        await service.backup_database()
+
+        [log] = await _backup_logs(container_fix)
+        assert log.status == BackupStatus.FAILED
+        assert "storage unavailable" in log.stats.error
+
+    @pytest.mark.asyncio
+    async def test_cleanup_keeps_completed(self, container_fix, create_backup_log):
+        storage = FakeStorage()
+        container_fix.secret_storage = storage
+        completed = [await create_backup_log() for _ in range(3)]
+        failed = await create_backup_log(status=BackupStatus.FAILED)
+
+        await container_fix.get_backup_db().cleanup_old_backups(retain_last=2)
+
+        remaining = {log.backup_log_id for log in await _backup_logs(container_fix)}
+        assert failed.backup_log_id not in remaining
+        assert len(remaining & {log.backup_log_id for log in completed}) == 2
@@ -0,0 +1,39 @@
+import asyncio
+import logging
+
+import pytest
+
+from src.application.cache_warmup import CacheRefreshScheduler
+
+
+class TestCacheRefreshScheduler:
+
+    @pytest.mark.asyncio
+    async def test_marks_coalesced_within_window(self):
+        calls = []
+
+        async def refresh(category_ids, product_ids):
+            calls.append((category_ids, product_ids))
+
+        scheduler = CacheRefreshScheduler(refresh, logging.getLogger(__name__), window=0.05)
+        for product_id in range(10):
+            await scheduler.mark(category_ids=[1], product_universal_ids=[product_id])
+        await scheduler.mark(category_ids=[2])
+
+        assert calls == []  # покупки не ждут обновления кэша
+        await asyncio.sleep(0.15)
+
+        assert calls == [({1, 2}, set(range(10)))]
+
+    @pytest.mark.asyncio
+    async def test_without_window_refreshes_immediately(self, container_fix, create_product_universal):
+        _, full = await create_product_universal(filling_redis=False)
+
+        await container_fix.cache_refresh_scheduler.mark(
+            category_ids=[full.category_id],
+            product_universal_ids=[full.product_universal_id],
+        )
+
+        assert await container_fix.product_universal_cache_repo.get_by_category(full.category_id)
+        assert await container_fix.product_universal_single_cache_repo.get(full.product_universal_id) is not None
+        assert await container_fix.categories_cache_repo.get_category(full.category_id, "ru") is not None
@@ -0,0 +1,169 @@
+from fnmatch import fnmatchcase
+
+import pytest
+
+from src.application.cache_warmup.cache_warmup_service import (
+    WARMUP_GENERATION_KEY,
+    WARMUP_KEY_PATTERNS,
+    WARMUP_LOCK_KEY,
+)
+from src.repository.redis.base import INDEX_PREFIX
+
+
+class TestCacheWarmupService:
+
+    @pytest.mark.asyncio
+    async def test_warmup_fills_sections(
+        self,
+        container_fix,
+        create_new_user,
+        create_voucher,
+        create_category,
+        create_product_account,
+        create_sold_account,
+        create_product_universal,
+        create_sold_universal,
+    ):
+        user_without_vouchers = await create_new_user()
+        voucher = await create_voucher(filling_redis=False)
+        _, product_account = await create_product_account(filling_redis=False)
+        _, sold_account = await create_sold_account(filling_redis=False)
+        category = await create_category(is_product_storage=True, filling_redis=False)
+        product_universal, _ = await create_product_universal(category_id=category.category_id, filling_redis=False)
+        _, sold_universal = await create_sold_universal(filling_redis=False)
+
+        warmup = container_fix.get_cache_warmup_service()
+        assert await warmup.warmup()
+        await warmup.gc_task  # ключи нового поколения не должны попасть под удаление
+
+        vouchers_cache = container_fix.vouchers_cache__repo
+        assert [v.voucher_id for v in await vouchers_cache.get_small_by_user(voucher.creator_id)] == [voucher.voucher_id]
+        assert await vouchers_cache.exists_by_user(user_without_vouchers.user_id)
+        assert await vouchers_cache.get_by_code(voucher.activation_code)
+
+        accounts_cache = container_fix.accounts_cache_repo
+        by_category = await accounts_cache.get_product_accounts_by_category(product_account.category_id)
+        assert [p.account_id for p in by_category] == [product_account.account_id]
+        assert await accounts_cache.get_product_account_by_account_id(product_account.account_id)
+
+        owner_accounts = await accounts_cache.get_sold_accounts_by_owner_id(sold_account.owner_id, "ru")
+        assert [a.sold_account_id for a in owner_accounts] == [sold_account.sold_account_id]
+        assert await accounts_cache.get_sold_accounts_by_account_id(sold_account.sold_account_id, "ru")
+
+        universal_by_category = await container_fix.product_universal_cache_repo.get_by_category(category.category_id)
+        assert [p.product_universal_id for p in universal_by_category] == [product_universal.product_universal_id]
+        assert await container_fix.product_universal_single_cache_repo.get(product_universal.product_universal_id)
+
+        owner_universal = await container_fix.sold_universal_cache_repo.get_by_owner(sold_universal.owner_id, "ru")
+        assert [s.sold_universal_id for s in owner_universal] == [sold_universal.sold_universal_id]
+        assert await container_fix.sold_universal_single_cache_repo.get(sold_universal.sold_universal_id, "ru")
+
+    @pytest.mark.asyncio
+    async def test_write_uses_bounded_pipelines(self, container_fix, monkeypatch):
+        warmup = container_fix.get_cache_warmup_service()
+        monkeypatch.setattr(warmup.conf.different, "warmup_pipeline_size", 3)
+
+        batches = []
+        original_bulk_set = warmup.admins_cache_repo.bulk_set
+
+        async def counting_bulk_set(items, delete_keys=()):
+            batches.append(len(items))
+            await original_bulk_set(items, delete_keys)
+
+        monkeypatch.setattr(warmup.admins_cache_repo, "bulk_set", counting_bulk_set)
+
+        items = [(warmup.admins_cache_repo._key(user_id), b"_", 0) for user_id in range(8)]
+        assert await warmup._write(warmup.admins_cache_repo, items) == 8
+
+        assert batches == [3, 3, 2]
+        assert await warmup.admins_cache_repo.exists(7)
+
+    @pytest.mark.asyncio
+    async def test_warmup_keeps_foreign_keys_and_collects_stale(self, container_fix, create_category):
+        redis = container_fix.session_redis
+        warmup = container_fix.get_cache_warmup_service()
+        category = await create_category(filling_redis=False)
+
+        await redis.set("dollar_rate", 95.5)
+        await redis.set("product_account:-1", b"stale")
+        await redis.set("category:-1:ru", b"stale")
+
+        written = []
+        original_write = warmup._write
+
+        async def tracking_write(repo, items):
+            written.extend(key for key, _, _ in items)
+            return await original_write(repo, items)
+
+        warmup._write = tracking_write
+
+        generation_before = int(await redis.get(WARMUP_GENERATION_KEY) or 0)
+        assert await warmup.warmup()
+
+        # устаревшие ключи удаляются в фоне уже после переключения поколения
+        await warmup.gc_task
+
+        assert int(await redis.get(WARMUP_GENERATION_KEY)) == generation_before + 1
+        assert await redis.get("dollar_rate") is not None
+        assert await redis.get("product_account:-1") is None
+        assert await redis.get("category:-1:ru") is None
+        assert await container_fix.categories_cache_repo.get_category(category.category_id, "ru")
+        assert await redis.get(WARMUP_LOCK_KEY) is None
+
+        # всё, что пишет прогрев, подпадает под сборку мусора следующего поколения
+        assert written
+        assert all(any(fnmatchcase(key, pattern) for pattern in WARMUP_KEY_PATTERNS) for key in written)
+
+    @pytest.mark.asyncio
+    async def test_garbage_collection_stops_on_next_generation(self, container_fix):
+        redis = container_fix.session_redis
+        warmup = container_fix.get_cache_warmup_service()
+        generation = int(await redis.get(WARMUP_GENERATION_KEY) or 0)
+        await redis.set("product_account:-1", b"old")
+        await redis.set("product_account:-2", b"old")
+
+        # другая реплика уже прогревает следующее поколение и могла перезаписать эти ключи
+        await redis.set(WARMUP_LOCK_KEY, "other", ex=60)
+        try:
+            await warmup._collect_garbage({"product_account:-1"}, generation)
+        finally:
+            await redis.delete(WARMUP_LOCK_KEY)
+        assert await redis.get("product_account:-1") == b"old"
+
+        # следующее поколение уже завершено
+        await redis.incr(WARMUP_GENERATION_KEY)
+        await warmup._collect_garbage({"product_account:-1"}, generation)
+        assert await redis.get("product_account:-1") == b"old"
+
+        await warmup._collect_garbage({"product_account:-2"}, generation + 1)
+        assert await redis.get("product_account:-2") is None
+
+    @pytest.mark.asyncio
+    async def test_warmup_keeps_indexes_consistent(self, container_fix):
+        redis = container_fix.session_redis
+        warmup = container_fix.get_cache_warmup_service()
+
+        # ключ записан до появления индексов, в индексе банов ключ, истёкший по ttl
+        await redis.set("category:-1:ru", b"legacy")
+        await redis.sadd(INDEX_PREFIX + "banned_account", "banned_account:-1")
+
+        previous_keys, indexes = await warmup._scan_warmup_keys()
+        await warmup._backfill_indexes(previous_keys)
+        assert await redis.smembers(INDEX_PREFIX + "category:-1") == {b"category:-1:ru"}
+        assert INDEX_PREFIX + "banned_account" in indexes
+
+        generation = int(await redis.get(WARMUP_GENERATION_KEY) or 0)
+        await warmup._collect_garbage({"category:-1:ru"}, generation, indexes)
+
+        assert await redis.exists("category:-1:ru", INDEX_PREFIX + "category:-1") == 0
+        assert not await redis.sismember(INDEX_PREFIX + "banned_account", "banned_account:-1")
+
+    @pytest.mark.asyncio
+    async def test_warmup_skipped_when_other_replica_holds_lock(self, container_fix):
+        redis = container_fix.session_redis
+        await redis.set(WARMUP_LOCK_KEY, "other", ex=60)
+        try:
+            assert await container_fix.get_cache_warmup_service().warmup() is False
+            assert await redis.get(WARMUP_LOCK_KEY) == b"other"
+        finally:
+            await redis.delete(WARMUP_LOCK_KEY)
@@ -0,0 +1,80 @@
+import asyncio
+import logging
+
+import pytest
+
+from src.infrastructure.buffering import CoalescingBuffer
+
+
+def _buffer(window, handle=None) -> tuple[CoalescingBuffer, list]:
+    handled = []
+
+    async def default_handle(pending):
+        handled.append(pending)
+
+    return CoalescingBuffer(set, handle or default_handle, logging.getLogger(__name__), "test", window), handled
+
+
+class TestCoalescingBuffer:
+
+    @pytest.mark.asyncio
+    async def test_coalesced_within_window(self):
+        buffer, handled = _buffer(window=0.05)
+        for i in range(10):
+            buffer.pending.add(i % 3)
+            buffer.schedule()
+
+        assert handled == []  # вызывающий код не ждёт обработки
+        await asyncio.sleep(0.15)
+
+        assert handled == [{0, 1, 2}]
+
+    @pytest.mark.asyncio
+    async def test_added_during_handle_goes_to_next_window(self):
+        handled = []
+
+        async def handle(pending):
+            handled.append(pending)
+            if len(handled) == 1:
+                buffer.pending.add(2)
+                buffer.schedule()
+
+        buffer, _ = _buffer(window=0.02, handle=handle)
+        buffer.pending.add(1)
+        buffer.schedule()
+        await asyncio.sleep(0.15)
+
+        assert handled == [{1}, {2}]
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_pending(self):
+        buffer, handled = _buffer(window=60)
+        buffer.pending.add(1)
+        buffer.schedule()
+        await buffer.stop()
+
+        assert handled == [{1}]
+
+    @pytest.mark.asyncio
+    async def test_without_window_handles_immediately(self):
+        buffer, handled = _buffer(window=None)
+        buffer.pending.add(1)
+        await buffer.touch()
+
+        assert handled == [{1}]
+
+    @pytest.mark.asyncio
+    async def test_handle_error_does_not_stop_buffer(self):
+        handled = []
+
+        async def handle(pending):
+            handled.append(pending)
+            raise RuntimeError("boom")
+
+        buffer, _ = _buffer(window=None, handle=handle)
+        buffer.pending.add(1)
+        await buffer.touch()
+        buffer.pending.add(2)
+        await buffer.touch()
+
+        assert handled == [{1}, {2}]
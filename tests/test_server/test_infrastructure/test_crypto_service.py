@@ -0,0 +1,90 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from cryptography.exceptions import InvalidTag
+
+from src.application.crypto.crypto_context import CryptoProvider
+from src.application.crypto.crypto_service import CryptoService
+from src.domain.crypto.encrypt import make_account_key
+from src.domain.crypto.key_ops import encrypt_text
+from src.domain.crypto.models import CryptoContext
+from src.domain.crypto.utils import gen_key
+
+
+def _service(max_items: int = 16, ttl: float = 60) -> tuple[CryptoService, bytes]:
+    kek, dek = gen_key(), gen_key()
+    provider = CryptoProvider()
+    provider.set(CryptoContext(kek=kek, dek=dek, nonce_b64_dek=""))
+    return CryptoService(provider, max_items=max_items, ttl=ttl), dek
+
+
+def _storage(service: CryptoService, text: str = "login") -> tuple[SimpleNamespace, bytes]:
+    encrypted_key, dek, key_nonce = make_account_key(service.crypto_provider.get().kek)
+    data, nonce, _ = encrypt_text(text, dek)
+    return SimpleNamespace(
+        encrypted_key=encrypted_key, encrypted_key_nonce=key_nonce, data=data, nonce=nonce
+    ), dek
+
+
+class TestCryptoService:
+
+    def test_unwrap_is_cached(self):
+        service, _ = _service()
+        storage, dek = _storage(service, "secret login")
+
+        assert service.unwrap_storage(storage) == dek
+        assert service.decrypt_text(storage, storage.data, storage.nonce) == "secret login"
+        assert service.decrypt_text(storage, storage.data, storage.nonce) == "secret login"
+        assert service.stats() == {"size": 1, "hits": 2, "misses": 1, "evictions": 0}
+
+    def test_ttl_expiry(self, monkeypatch):
+        service, _ = _service(ttl=10)
+        storage, _ = _storage(service)
+        service.unwrap_storage(storage)
+        entry = service._keys[(storage.encrypted_key, storage.encrypted_key_nonce)]
+
+        real_monotonic = time.monotonic
+        monkeypatch.setattr(time, "monotonic", lambda: real_monotonic() + 11)
+        service.unwrap_storage(storage)
+
+        assert service.stats()["misses"] == 2
+        assert entry.key == bytearray(len(entry.key))  # просроченный ключ затёрт
+
+    def test_lru_eviction_zeroizes(self):
+        service, _ = _service(max_items=2)
+        first, second, third = (_storage(service)[0] for _ in range(3))
+
+        service.unwrap_storage(first)
+        service.unwrap_storage(second)
+        service.unwrap_storage(first)  # first становится самым свежим, вытесняется second
+        evicted = service._keys[(second.encrypted_key, second.encrypted_key_nonce)]
+        service.unwrap_storage(third)
+
+        assert (second.encrypted_key, second.encrypted_key_nonce) not in service._keys
+        assert evicted.key == bytearray(len(evicted.key))
+        assert service.stats()["evictions"] == 1
+
+    def test_unwrap_many_keeps_order(self):
+        service, _ = _service(max_items=1)
+        (first, first_dek), (second, second_dek) = _storage(service), _storage(service)
+
+        # кэш на один ключ, но повторы в пачке всё равно разворачиваются один раз
+        assert service.unwrap_many([first, second, first, second]) == [first_dek, second_dek, first_dek, second_dek]
+        assert service.stats()["misses"] == 2
+
+    def test_global_dek_and_clear(self):
+        service, dek = _service()
+        data, nonce, _ = encrypt_text("config value", dek)
+        assert service.decrypt_global_text(data, nonce) == "config value"
+
+        storage, _ = _storage(service)
+        service.unwrap_storage(storage)
+        entry = service._keys[(storage.encrypted_key, storage.encrypted_key_nonce)]
+        service.clear()
+        assert service.stats()["size"] == 0
+        assert entry.key == bytearray(len(entry.key))
+
+        other, _ = _storage(service)
+        with pytest.raises(InvalidTag):
+            service.decrypt_text(storage, other.data, other.nonce)
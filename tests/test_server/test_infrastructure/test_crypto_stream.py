@@ -0,0 +1,140 @@
+import io
+import os
+import zipfile
+
+import pytest
+
+from src.domain.crypto.decrypt import decrypt_chunks, decrypt_file, decrypt_folder, decrypt_file_to_bytes, \
+    open_decrypted, verify_encrypted_file
+from src.domain.crypto.encrypt import encrypt_bytes, encrypt_file, encrypt_folder
+from src.domain.crypto.stream import HEADER_SIZE, TAG_SIZE, EncryptingWriter, StreamFormatError, decrypt_stream, \
+    encrypt_stream
+from src.domain.crypto.utils import gen_key
+
+CHUNK = 1024
+
+
+def _encrypt(data: bytes, dek: bytes, chunk_size: int = CHUNK) -> bytes:
+    dst = io.BytesIO()
+    encrypt_stream(io.BytesIO(data), dst, dek, chunk_size)
+    return dst.getvalue()
+
+
+def _decrypt(encrypted: bytes, dek: bytes) -> bytes:
+    dst = io.BytesIO()
+    decrypt_stream(io.BytesIO(encrypted), dst, dek)
+    return dst.getvalue()
+
+
+class TestCryptoStream:
+
+    @pytest.mark.parametrize("size", [0, 1, CHUNK - 1, CHUNK, CHUNK + 1, 3 * CHUNK, 3 * CHUNK + 7])
+    def test_roundtrip_chunk_boundaries(self, size):
+        dek = gen_key()
+        data = os.urandom(size)
+
+        encrypted = _encrypt(data, dek)
+
+        chunks = size // CHUNK + 1 # последняя часть всегда неполная, при кратной длине пустая
+        assert len(encrypted) == HEADER_SIZE + size + chunks * TAG_SIZE
+        assert _decrypt(encrypted, dek) == data
+
+        reader = open_decrypted(io.BytesIO(encrypted), dek)
+        assert reader.read() == data
+        if size > 10:
+            reader.seek(size - 10)
+            assert reader.read(5) == data[-10:-5]
+
+    def test_tampering_detected(self):
+        dek = gen_key()
+        encrypted = _encrypt(os.urandom(3 * CHUNK + 10), dek)
+        block = CHUNK + TAG_SIZE
+        first, second = slice(HEADER_SIZE, HEADER_SIZE + block), slice(HEADER_SIZE + block, HEADER_SIZE + 2 * block)
+
+        damaged = {
+            "обрезан по границе части": encrypted[:HEADER_SIZE + 3 * block],
+            "обрезан внутри части": encrypted[:-5],
+            "переставлены части": encrypted[:HEADER_SIZE] + encrypted[second] + encrypted[first]
+                                  + encrypted[HEADER_SIZE + 2 * block:],
+            "изменён байт": encrypted[:HEADER_SIZE + 5] + bytes([encrypted[HEADER_SIZE + 5] ^ 1])
+                            + encrypted[HEADER_SIZE + 6:],
+            "изменён заголовок": encrypted[:HEADER_SIZE - 1] + bytes([encrypted[HEADER_SIZE - 1] ^ 1])
+                                 + encrypted[HEADER_SIZE:],
+            "данные после конца": encrypted + b"x",
+        }
+        for name, data in damaged.items():
+            with pytest.raises(StreamFormatError):
+                _decrypt(data, dek)
+            with pytest.raises(StreamFormatError):
+                open_decrypted(io.BytesIO(data), dek).read()
+
+        with pytest.raises(StreamFormatError):
+            _decrypt(encrypted, gen_key())
+
+    def test_files_and_legacy_format(self, tmp_path):
+        dek = gen_key()
+        data = os.urandom(200 * 1024)
+        (tmp_path / "plain.bin").write_bytes(data)
+
+        encrypt_file(str(tmp_path / "plain.bin"), str(tmp_path / "enc" / "file.enc"), dek)
+        decrypt_file(dek, str(tmp_path / "enc" / "file.enc"), str(tmp_path / "out" / "file.bin"))
+        assert (tmp_path / "out" / "file.bin").read_bytes() == data
+        verify_encrypted_file(str(tmp_path / "enc" / "file.enc"), dek)
+
+        # файлы, зашифрованные до потокового формата, читаются как раньше
+        (tmp_path / "legacy.enc").write_bytes(encrypt_bytes(data, dek))
+        assert decrypt_file_to_bytes(str(tmp_path / "legacy.enc"), dek) == data
+        decrypt_file(dek, str(tmp_path / "legacy.enc"), str(tmp_path / "legacy.bin"))
+        assert (tmp_path / "legacy.bin").read_bytes() == data
+        with pytest.raises(Exception):
+            verify_encrypted_file(str(tmp_path / "legacy.enc"), gen_key())
+
+    def test_folder_roundtrip(self, tmp_path):
+        dek = gen_key()
+        folder = tmp_path / "account"
+        (folder / "tdata" / "D877").mkdir(parents=True)
+        (folder / "tdata" / "key_datas").write_bytes(os.urandom(100 * 1024))
+        (folder / "tdata" / "D877" / "maps").write_bytes(b"maps")
+        (folder / "session.session").write_bytes(b"session")
+
+        encrypt_folder(str(folder), str(tmp_path / "account.enc"), dek)
+        extracted = decrypt_folder(str(tmp_path / "account.enc"), dek)
+
+        for path in ["tdata/key_datas", "tdata/D877/maps", "session.session"]:
+            assert open(os.path.join(extracted, path), "rb").read() == (folder / path).read_bytes()
+
+        # архив старого формата
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("session.session", b"old")
+        (tmp_path / "legacy.enc").write_bytes(encrypt_bytes(archive.getvalue(), dek))
+        extracted = decrypt_folder(str(tmp_path / "legacy.enc"), dek)
+        assert open(os.path.join(extracted, "session.session"), "rb").read() == b"old"
+
+    def test_writer_keeps_one_chunk(self):
+        dst = io.BytesIO()
+        with EncryptingWriter(dst, gen_key(), CHUNK) as writer:
+            for _ in range(50):
+                writer.write(os.urandom(CHUNK // 2 + 3))
+                assert len(writer.buffer) <= CHUNK
+
+    @pytest.mark.asyncio
+    async def test_decrypt_chunks(self):
+        dek = gen_key()
+        data = os.urandom(5 * CHUNK + 3)
+        encrypted = _encrypt(data, dek)
+
+        async def chunks(source: bytes, size: int):
+            for start in range(0, len(source), size):
+                yield source[start:start + size]
+
+        # части скачивания не совпадают с частями формата, заголовок может прийти по кусочкам
+        for size in (3, CHUNK - 1, CHUNK + TAG_SIZE, 10 * CHUNK):
+            assert b"".join([part async for part in decrypt_chunks(chunks(encrypted, size), dek)]) == data
+
+        legacy = encrypt_bytes(data, dek)
+        assert b"".join([part async for part in decrypt_chunks(chunks(legacy, 100), dek)]) == data
+
+        with pytest.raises(StreamFormatError):
+            async for _ in decrypt_chunks(chunks(encrypted[:-5], 100), dek):
+                pass
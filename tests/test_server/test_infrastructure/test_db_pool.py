@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text, exc
+
+from src.config import get_config
+from src.config.db_conf import DbEngineProfile, build_engine
+from src.infrastructure.database import PoolMetrics
+
+
+class TestDbEngineProfile:
+
+    def test_direct_mode_caches_prepared_statements(self):
+        connect_args = DbEngineProfile(statement_cache_size=300).connect_args()
+
+        assert connect_args["prepared_statement_cache_size"] == 300
+        assert "prepared_statement_name_func" not in connect_args
+
+    def test_pgbouncer_mode_disables_server_side_cache(self):
+        connect_args = DbEngineProfile(pgbouncer=True).connect_args()
+
+        assert connect_args["statement_cache_size"] == 0
+        assert connect_args["prepared_statement_cache_size"] == 0
+
+        name_func = connect_args["prepared_statement_name_func"]
+        assert name_func() != name_func()
+
+    @pytest.mark.asyncio
+    async def test_pgbouncer_mode_executes_queries(self):
+        engine = build_engine(get_config().db_connection.sql_db_url, DbEngineProfile(pgbouncer=True))
+        try:
+            async with engine.connect() as conn:
+                for number in range(3):
+                    result = await conn.execute(text("SELECT CAST(:number AS INTEGER)"), {"number": number})
+                    assert result.scalar() == number
+        finally:
+            await engine.dispose()
+
+
+class TestPoolMetrics:
+
+    @pytest.mark.asyncio
+    async def test_checkouts_and_wait(self):
+        metrics = PoolMetrics()
+        profile = DbEngineProfile(pool_size=1, max_overflow=0, pool_timeout=5)
+        engine = build_engine(get_config().db_connection.sql_db_url, profile, metrics)
+
+        async def query():
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT pg_sleep(0.05)"))
+
+        try:
+            await asyncio.gather(*(query() for _ in range(3)))
+        finally:
+            await engine.dispose()
+
+        stats = metrics.stats()
+        assert stats.checkouts == 3
+        assert stats.in_use == 0
+        assert stats.max_in_use == 1
+        # единственное соединение занято, последний запрос ждёт два предыдущих
+        assert stats.max_wait_ms >= 80
+        assert stats.avg_hold_ms >= 40
+
+    @pytest.mark.asyncio
+    async def test_timeout_counted(self):
+        metrics = PoolMetrics()
+        profile = DbEngineProfile(pool_size=1, max_overflow=0, pool_timeout=0.05)
+        engine = build_engine(get_config().db_connection.sql_db_url, profile, metrics)
+
+        try:
+            async with engine.connect():
+                with pytest.raises(exc.TimeoutError):
+                    async with engine.connect():
+                        pass
+        finally:
+            await engine.dispose()
+
+        assert metrics.stats().timeouts == 1
+
+    @pytest.mark.asyncio
+    async def test_metrics_survive_dispose(self):
+        metrics = PoolMetrics()
+        engine = build_engine(get_config().db_connection.sql_db_url, DbEngineProfile(), metrics)
+
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            await engine.dispose()
+
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        finally:
+            await engine.dispose()
+
+        assert metrics.stats().checkouts == 2
+        assert metrics.waits == 2
+
+
+class TestReadSession:
+
+    @pytest.mark.asyncio
+    async def test_history_read_through_read_session(self, container_fix, create_wallet_transaction):
+        transaction = await create_wallet_transaction()
+
+        async with get_config().db_connection.session_local() as read_session_db:
+            container_fix.read_session_db = read_session_db
+            service = container_fix.wallet_transaction_service
+
+            assert service.history_repo.session_db is read_session_db
+            assert service.wallet_transaction.session_db is container_fix.session_db
+
+            page = await service.get_wallet_transaction_page(transaction.user_id)
+            assert [item.wallet_transaction_id for item in page] == [transaction.wallet_transaction_id]
+            assert await service.get_count_wallet_transaction(transaction.user_id) == 1
+
+    def test_read_session_defaults_to_primary(self, container_fix):
+        assert container_fix.read_session_db is container_fix.session_db
+        assert container_fix.referral_income_service.history_repo.session_db is container_fix.session_db
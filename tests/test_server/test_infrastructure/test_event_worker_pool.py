@@ -0,0 +1,101 @@
+import asyncio
+import logging
+
+import pytest
+
+from src.infrastructure.rabbit_mq.consumer import RabbitMQConsumer
+from src.infrastructure.rabbit_mq.worker_pool import EventWorkerPool
+
+
+class TestEventWorkerPool:
+
+    @pytest.mark.asyncio
+    async def test_order_preserved_per_partition_key(self):
+        processed = []
+
+        async def process(item):
+            user_id, number = item
+            # более ранние сообщения обрабатываются дольше, порядок всё равно должен сохраниться
+            await asyncio.sleep(0.01 * (5 - number))
+            processed.append(item)
+
+        pool = EventWorkerPool(process, workers=4, logger=logging.getLogger(__name__))
+        pool.start()
+        for number in range(5):
+            for user_id in (1, 2):
+                pool.submit("purchase.account", user_id, (user_id, number))
+        await pool.stop()
+
+        for user_id in (1, 2):
+            assert [n for u, n in processed if u == user_id] == list(range(5))
+
+    @pytest.mark.asyncio
+    async def test_different_keys_processed_concurrently(self):
+        running = 0
+        max_running = 0
+
+        async def process(item):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+
+        pool = EventWorkerPool(process, workers=8, logger=logging.getLogger(__name__))
+        pool.start()
+        for user_id in range(8):
+            pool.submit("replenishment.new_replenishment", str(user_id), user_id)
+        await pool.stop()
+
+        assert max_running > 1
+
+    @pytest.mark.asyncio
+    async def test_slow_lane_does_not_block_other_events(self):
+        release_logs = asyncio.Event()
+        purchases_done = asyncio.Event()
+
+        async def process(item):
+            if item == "log":
+                await release_logs.wait()
+            else:
+                purchases_done.set()
+
+        pool = EventWorkerPool(process, workers=1, lanes={"message": 1}, logger=logging.getLogger(__name__))
+        pool.start()
+        pool.submit("message.send_log", None, "log")
+        pool.submit("purchase.universal", None, "purchase")
+
+        await asyncio.wait_for(purchases_done.wait(), timeout=1)
+        assert pool.stats()["message.send_log"].in_flight == 1
+
+        release_logs.set()
+        await pool.stop()
+
+    @pytest.mark.asyncio
+    async def test_stats_by_routing_key(self):
+        async def process(item):
+            if item == "bad":
+                raise ValueError(item)
+
+        pool = EventWorkerPool(process, workers=2, logger=logging.getLogger(__name__))
+        pool.start()
+        pool.submit("voucher.activated", 1, "ok")
+        pool.submit("voucher.activated", 1, "bad")
+        pool.submit("referral.new_referral", None, "ok")
+        await pool.stop()
+
+        stats = pool.stats()
+        assert stats["voucher.activated"].processed == 1
+        assert stats["voucher.activated"].failed == 1
+        assert stats["voucher.activated"].in_flight == 0
+        assert stats["referral.new_referral"].processed == 1
+        assert stats["referral.new_referral"].max_latency_ms >= stats["referral.new_referral"].avg_latency_ms
+
+    def test_partition_key_from_payload(self):
+        key = RabbitMQConsumer._partition_key
+        assert key("purchase.account", {"payload": {"user_id": 5, "owner_id": 7}}) == 5
+        assert key("voucher.activated", {"payload": {"voucher": {"creator_id": 7, "user_id": 5}}}) == 7
+        assert key("voucher.activated", {"payload": {"voucher": None}}) is None
+        assert key("message.send_log", {"payload": {"user_id": 5}}) is None  # ключ не объявлен
+        assert key("purchase.account", {"payload": {}}) is None
+        assert key("purchase.account", {}) is None
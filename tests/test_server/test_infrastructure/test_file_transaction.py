@@ -0,0 +1,90 @@
+import logging
+import shutil
+from pathlib import Path
+
+import pytest
+
+import src.infrastructure.files.file_transaction as file_transaction_module
+from src.infrastructure.files.file_transaction import FileTransaction
+
+
+def _create_files(work_dir: Path, count: int) -> list[tuple[str, str]]:
+    """:return: List(orig_path, final_path)"""
+    pairs = []
+    for i in range(count):
+        orig = work_dir / "for_sale" / f"uuid_{i}" / "file.enc"
+        orig.parent.mkdir(parents=True, exist_ok=True)
+        orig.write_text(str(i), encoding="utf-8")
+        pairs.append((str(orig), str(work_dir / "bought" / f"uuid_{i}" / "file.enc")))
+    return pairs
+
+
+@pytest.fixture
+def work_dir(container_fix):
+    path = container_fix.config.paths.temp_dir / "file_transaction"
+    path.mkdir(parents=True, exist_ok=True)
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+class TestFileTransaction:
+
+    @pytest.mark.asyncio
+    async def test_stage_and_commit(self, work_dir):
+        pairs = _create_files(work_dir, 20)
+        files = FileTransaction(logging.getLogger(__name__), max_workers=4)
+        for orig, final in pairs:
+            files.add(orig, final)
+
+        assert await files.stage()
+        assert len(files.mapping) == 20
+        assert await files.commit()
+
+        for i, (orig, final) in enumerate(pairs):
+            assert not Path(orig).parent.exists()
+            assert not Path(final + ".part").exists()
+            assert Path(final).read_text(encoding="utf-8") == str(i)
+
+    @pytest.mark.asyncio
+    async def test_stage_failure_rolls_back_batch(self, work_dir):
+        pairs = _create_files(work_dir, 5)
+        Path(pairs[2][0]).unlink()  # одного файла нет
+        files = FileTransaction(logging.getLogger(__name__), max_workers=4)
+        for orig, final in pairs:
+            files.add(orig, final)
+
+        assert not await files.stage()
+
+        assert files.mapping == []
+        for i, (orig, final) in enumerate(pairs):
+            if i == 2:
+                continue
+            assert Path(orig).read_text(encoding="utf-8") == str(i)
+            assert not Path(final + ".part").exists()
+
+    @pytest.mark.asyncio
+    async def test_commit_failure_rolls_back_batch(self, work_dir):
+        pairs = _create_files(work_dir, 5)
+        files = FileTransaction(logging.getLogger(__name__), max_workers=4)
+        for orig, final in pairs:
+            files.add(orig, final)
+        assert await files.stage()
+
+        original_rename = file_transaction_module.rename_sync
+        failed_temp = pairs[3][1] + ".part"
+
+        def fake_rename(src: str, dst: str) -> bool:
+            if src == failed_temp:
+                return False
+            return original_rename(src, dst)
+
+        file_transaction_module.rename_sync = fake_rename
+        try:
+            assert not await files.commit()
+        finally:
+            file_transaction_module.rename_sync = original_rename
+
+        for i, (orig, final) in enumerate(pairs):
+            assert Path(orig).read_text(encoding="utf-8") == str(i)
+            assert not Path(final).exists()
+            assert not Path(final + ".part").exists()
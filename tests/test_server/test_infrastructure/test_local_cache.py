@@ -0,0 +1,170 @@
+import asyncio
+import logging
+
+import orjson
+import pytest
+
+from src.infrastructure.redis import LocalCache
+from src.repository.redis import SettingsCacheRepository, UsersCacheRepository, CategoriesCacheRepository
+
+
+def _local_cache(container_fix, max_items: int = 100, ttl: float = 60) -> LocalCache:
+    return LocalCache(
+        redis_session=container_fix.session_redis,
+        max_items=max_items,
+        ttl=ttl,
+        logger=logging.getLogger(__name__),
+    )
+
+
+class TestLocalCache:
+
+    def test_lru_eviction(self, container_fix):
+        cache = _local_cache(container_fix, max_items=2)
+
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1  # "a" становится самым свежим
+        cache.put("c", 3)
+
+        assert cache.get("b") is LocalCache.MISSING
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats().evictions == 1
+
+    def test_ttl_expired(self, container_fix):
+        cache = _local_cache(container_fix, ttl=-1)
+
+        cache.put("a", 1)
+
+        assert cache.get("a") is LocalCache.MISSING
+        assert cache.stats().size == 0
+
+    def test_apply_invalidation_from_other_process(self, container_fix):
+        cache = _local_cache(container_fix)
+        cache.put("category:1:ru", 1)
+        cache.put("category:1:en", 2)
+        cache.put("settings", 3)
+
+        cache._apply(orjson.dumps({"sender": "other", "pattern": "category:1:*"}))
+        assert cache.get("category:1:ru") is LocalCache.MISSING
+        assert cache.get("category:1:en") is LocalCache.MISSING
+        assert cache.get("settings") == 3
+
+        cache._apply(orjson.dumps({"sender": "other", "keys": ["settings"]}))
+        assert cache.get("settings") is LocalCache.MISSING
+
+    def test_own_messages_ignored(self, container_fix):
+        cache = _local_cache(container_fix)
+        cache.put("settings", 1)
+
+        cache._apply(orjson.dumps({"sender": cache.instance_id, "keys": ["settings"]}))
+
+        assert cache.get("settings") == 1
+
+    @pytest.mark.asyncio
+    async def test_listener_invalidates_between_processes(self, container_fix):
+        first = _local_cache(container_fix)
+        second = _local_cache(container_fix)
+        second.start_listener()
+        await asyncio.sleep(0.1)  # ждём подписку
+
+        second.put("settings", 1)
+        await first.invalidate("settings")
+
+        for _ in range(50):
+            if second.get("settings") is LocalCache.MISSING:
+                break
+            await asyncio.sleep(0.02)
+
+        await second.stop_listener()
+        assert second.get("settings") is LocalCache.MISSING
+
+
+    def test_put_after_invalidation_is_skipped(self, container_fix):
+        cache = _local_cache(container_fix)
+        version = cache.version  # значение прочитано из Redis при этой версии
+
+        cache._apply(orjson.dumps({"sender": "other", "keys": ["settings"]}))
+        cache.put("settings", "stale", version)
+
+        assert cache.get("settings") is LocalCache.MISSING
+        assert cache.stats().stale_puts == 1
+
+        cache.put("settings", "fresh", cache.version)
+        assert cache.get("settings") == "fresh"
+
+
+class TestRedisRepoWithLocalCache:
+
+    @pytest.mark.asyncio
+    async def test_get_served_from_memory(self, container_fix):
+        cache = _local_cache(container_fix)
+        repo = SettingsCacheRepository(container_fix.session_redis, container_fix.config, local_cache=cache)
+        settings = await container_fix.settings_service.get_settings()
+        await repo.set(settings)
+
+        first = await repo.get()
+        # значение в Redis больше не читается
+        await container_fix.session_redis.delete("settings")
+        second = await repo.get()
+
+        assert first is second
+        assert cache.stats().hits == 1
+        assert cache.stats().misses == 1
+
+    @pytest.mark.asyncio
+    async def test_set_and_delete_invalidate(self, container_fix):
+        cache = _local_cache(container_fix)
+        repo = SettingsCacheRepository(container_fix.session_redis, container_fix.config, local_cache=cache)
+        settings = await container_fix.settings_service.get_settings()
+        await repo.set(settings)
+        await repo.get()
+
+        await repo.set(settings.model_copy(update={"shop_name": "new name"}))
+        assert (await repo.get()).shop_name == "new name"
+
+        await repo.delete()
+        assert await repo.get() is None
+
+    @pytest.mark.asyncio
+    async def test_pattern_delete_invalidates(self, container_fix, create_category):
+        cache = _local_cache(container_fix)
+        repo = CategoriesCacheRepository(container_fix.session_redis, container_fix.config, local_cache=cache)
+        category = await create_category()
+
+        await repo.set_main_categories([category], "ru")
+        assert len(await repo.get_main_categories("ru")) == 1
+
+        await repo.delete_main_categories()
+        assert await repo.get_main_categories("ru") == []
+
+    @pytest.mark.asyncio
+    async def test_repo_without_local_cache_support(self, container_fix):
+        cache = _local_cache(container_fix)
+        repo = UsersCacheRepository(container_fix.session_redis, container_fix.config, local_cache=cache)
+
+        assert repo.local_cache is None
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_redis_get_not_cached(self, container_fix):
+        cache = _local_cache(container_fix)
+        repo = SettingsCacheRepository(container_fix.session_redis, container_fix.config, local_cache=cache)
+        settings = await container_fix.settings_service.get_settings()
+        await repo.set(settings)
+
+        class _RedisWithInvalidation:
+            """Инвалидация из другого процесса приходит, пока ждём ответ Redis"""
+            def __init__(self, redis):
+                self.redis = redis
+
+            async def get(self, key):
+                raw = await self.redis.get(key)
+                cache._apply(orjson.dumps({"sender": "other", "keys": [key]}))
+                return raw
+
+        repo.redis_session = _RedisWithInvalidation(container_fix.session_redis)
+        await repo.get()
+
+        assert cache.stats().size == 0
+        assert cache.stats().stale_puts == 1
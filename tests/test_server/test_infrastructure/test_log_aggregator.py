@@ -0,0 +1,70 @@
+import asyncio
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from src.application.bot import SendLogs
+from src.application.bot.log_aggregator import LogAggregator, MESSAGE_LIMIT
+from src.infrastructure.telegram.rate_limit import RateLimiter
+
+
+class TestLogAggregator:
+
+    def test_pack_deduplicates_and_respects_limit(self):
+        pending = {"#Невалидный_продукт id=1": 3, "a" * 3000: 1, "b" * 2000: 1}
+
+        messages = LogAggregator.pack(pending)
+
+        assert messages[0].startswith("[x3] #Невалидный_продукт id=1")
+        assert all(len(message) <= MESSAGE_LIMIT for message in messages)
+        assert len(messages) == 2
+
+    def test_pack_splits_long_text(self):
+        messages = LogAggregator.pack({"short": 1, "x" * (MESSAGE_LIMIT * 2 + 10): 1})
+
+        assert messages[0] == "short"
+        assert [len(message) for message in messages[1:]] == [MESSAGE_LIMIT, MESSAGE_LIMIT, 10]
+
+    @pytest.mark.asyncio
+    async def test_logs_coalesced_within_window(self):
+        delivered = []
+
+        async def deliver(messages):
+            delivered.append(messages)
+
+        aggregator = LogAggregator(deliver, logging.getLogger(__name__), window=0.05)
+        for _ in range(100):
+            await aggregator.add("#Невалидный_продукт")
+        await aggregator.add("Ваучер истёк")
+
+        assert delivered == []  # вызывающий код не ждёт отправки
+        await asyncio.sleep(0.15)
+
+        assert delivered == [["[x100] #Невалидный_продукт\n\nВаучер истёк"]]
+
+    @pytest.mark.asyncio
+    async def test_send_logs_without_app_aggregator_sends_immediately(self, container_fix):
+        sent = []
+
+        class FakeLoggerClient:
+            async def send_message(self, chat_id, text):
+                sent.append((chat_id, text))
+
+        class FakeSettingsService:
+            async def get_settings(self):
+                return SimpleNamespace(channel_for_logging_id=-100, support_username=None)
+
+        log_limiter = RateLimiter(max_calls=10, period=60)
+        send_logs = SendLogs(
+            tg_logger_client=FakeLoggerClient(),
+            limiter=log_limiter,
+            settings_service=FakeSettingsService(),
+            conf=container_fix.config,
+            logger=logging.getLogger(__name__),
+        )
+
+        await send_logs.send_log("first")
+        await send_logs.send_log("second")
+
+        assert sent == [(-100, "first"), (-100, "second")]
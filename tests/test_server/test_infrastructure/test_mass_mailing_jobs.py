@@ -0,0 +1,226 @@
+import asyncio
+import logging
+from collections import Counter
+from datetime import datetime, timedelta, UTC
+
+import pytest
+
+from src.application.bot import MassTgMailingService
+from src.application.bot.suppression_recorder import SuppressionRecorder
+from src.exceptions.telegram import TelegramRetryAfterService, TelegramForbiddenErrorService
+from src.infrastructure.telegram.rate_limit import RateLimiter
+from src.models.create_models.admins import BroadcastSegment
+
+
+class FakeMailingClient:
+
+    def __init__(self, forbidden=(), retry_after=()):
+        self.sent = []
+        self.forbidden = set(forbidden)
+        self.retry_after = set(retry_after)  # RetryAfter только на первую попытку
+
+    async def send_message(self, chat_id, text, reply_markup=None, parse_mode=None):
+        if chat_id in self.retry_after:
+            self.retry_after.discard(chat_id)
+            raise TelegramRetryAfterService("Flood control exceeded", retry_after=0.05)
+        if chat_id in self.forbidden:
+            raise TelegramForbiddenErrorService("bot was blocked by the user")
+        self.sent.append((chat_id, text))
+
+
+def _mailing_service(container_fix, tg_client: FakeMailingClient) -> MassTgMailingService:
+    return MassTgMailingService(
+        tg_client=tg_client,
+        limiter=RateLimiter(max_calls=1000, chat_burst=100),
+        users_repo=container_fix.users_repo,
+        sent_mass_msg_service=container_fix.sent_mass_message_service,
+        mailing_jobs_service=container_fix.mass_mailing_jobs_service,
+        suppressed_recipients_service=container_fix.suppressed_recipients_service,
+        conf=container_fix.config,
+        logger=logging.getLogger(__name__),
+    )
+
+
+async def _create_users(create_new_user, quantity: int):
+    return [await create_new_user() for _ in range(quantity)]
+
+
+class TestMassMailingJobs:
+
+    @pytest.mark.asyncio
+    async def test_broadcast_saves_cursor_per_batch(self, container_fix, create_new_user, monkeypatch):
+        monkeypatch.setattr(container_fix.config.different, "mailing_batch_size", 2)
+        users = await _create_users(create_new_user, 5)
+        client = FakeMailingClient(forbidden=[users[3].user_id])
+        service = _mailing_service(container_fix, client)
+
+        job = await service.start_broadcast(text="Новости магазина", admin_id=users[0].user_id)
+        progress = [item async for item in service.run_broadcast(job.job_id)]
+
+        assert [item.number_sent for item in progress] == [2, 4, 5, 5]
+        assert [item.finished for item in progress] == [False, False, False, True]
+        assert progress[-1].number_received == 4
+        assert progress[-1].eta_seconds == 0
+
+        job = await container_fix.mass_mailing_jobs_service.get_job(job.job_id)
+        assert job.status == "completed"
+        assert job.cursor_user_id == users[-1].user_id
+
+        batches = await container_fix.mass_mailing_jobs_service.get_batches(job.job_id)
+        assert [(batch.first_user_id, batch.last_user_id) for batch in batches] == [
+            (users[0].user_id, users[1].user_id),
+            (users[2].user_id, users[3].user_id),
+            (users[4].user_id, users[4].user_id),
+        ]
+        assert [batch.number_received for batch in batches] == [2, 1, 1]
+
+        sent_msg = await container_fix.sent_mass_message_service.get_msg(job.sent_message_id)
+        assert sent_msg.number_received == 4
+        assert sent_msg.number_sent == 5
+
+    @pytest.mark.asyncio
+    async def test_interrupted_broadcast_resumes_from_cursor(self, container_fix, create_new_user, monkeypatch):
+        monkeypatch.setattr(container_fix.config.different, "mailing_batch_size", 2)
+        users = await _create_users(create_new_user, 5)
+        admin_id = users[0].user_id
+
+        client = FakeMailingClient()
+        service = _mailing_service(container_fix, client)
+        job = await service.start_broadcast(text="Новости магазина", admin_id=admin_id)
+
+        # процесс упал после первой сохранённой пачки
+        broadcast = service.run_broadcast(job.job_id)
+        await anext(broadcast)
+        await broadcast.aclose()
+
+        results = await _mailing_service(container_fix, client).resume_broadcasts()
+
+        assert len(results) == 1
+        assert results[0].finished
+        assert results[0].number_sent == 5
+
+        mailing = [chat_id for chat_id, text in client.sent if text == "Новости магазина"]
+        assert Counter(mailing) == Counter(user.user_id for user in users)
+
+        # админ узнаёт о завершении продолженной рассылки
+        assert any(chat_id == admin_id and text != "Новости магазина" for chat_id, text in client.sent)
+
+        assert await container_fix.mass_mailing_jobs_service.get_running_jobs() == []
+
+    @pytest.mark.asyncio
+    async def test_retry_after_requeued(self, container_fix, create_new_user):
+        users = await _create_users(create_new_user, 3)
+        client = FakeMailingClient(retry_after=[users[1].user_id])
+        service = _mailing_service(container_fix, client)
+
+        job = await service.start_broadcast(text="Новости магазина", admin_id=users[0].user_id)
+        progress = [item async for item in service.run_broadcast(job.job_id)]
+
+        assert progress[-1].number_received == 3
+        assert progress[-1].number_retried == 1
+        assert sorted(chat_id for chat_id, _ in client.sent) == sorted(user.user_id for user in users)
+
+    @pytest.mark.asyncio
+    async def test_finished_job_not_run_again(self, container_fix, create_new_user):
+        users = await _create_users(create_new_user, 2)
+        client = FakeMailingClient()
+        service = _mailing_service(container_fix, client)
+
+        job = await service.start_broadcast(text="Новости магазина", admin_id=users[0].user_id)
+        [item async for item in service.run_broadcast(job.job_id)]
+
+        assert [item async for item in service.run_broadcast(job.job_id)] == []
+        assert len(client.sent) == 2
+
+
+class TestBroadcastRecipients:
+
+    @pytest.mark.asyncio
+    async def test_blocked_users_suppressed_for_next_broadcast(self, container_fix, create_new_user):
+        users = [await create_new_user() for _ in range(4)]
+        blocked_id = users[2].user_id
+        client = FakeMailingClient(forbidden=[blocked_id])
+        service = _mailing_service(container_fix, client)
+
+        job = await service.start_broadcast(text="Первая рассылка", admin_id=users[0].user_id)
+        [item async for item in service.run_broadcast(job.job_id)]
+
+        assert await container_fix.suppressed_recipients_service.is_suppressed(blocked_id)
+        assert await service.count_recipients() == 3
+
+        client.sent.clear()
+        job = await service.start_broadcast(text="Вторая рассылка", admin_id=users[0].user_id)
+        progress = [item async for item in service.run_broadcast(job.job_id)]
+
+        assert progress[-1].number_sent == 3
+        assert progress[-1].number_received == 3
+        assert blocked_id not in [chat_id for chat_id, _ in client.sent]
+
+    @pytest.mark.asyncio
+    async def test_restore_returns_user_to_broadcasts(self, container_fix, create_new_user):
+        user = await create_new_user()
+        service = container_fix.suppressed_recipients_service
+
+        await service.suppress_many({user.user_id: "forbidden"}, make_commit=True)
+        await service.suppress_many({user.user_id: "not_found"}, make_commit=True)  # повтор не ломает запись
+        assert await container_fix.users_repo.count_recipients() == 0
+
+        assert await service.restore(user.user_id, make_commit=True)
+        assert not await service.restore(user.user_id, make_commit=True)
+        assert await container_fix.users_repo.count_recipients() == 1
+
+    @pytest.mark.asyncio
+    async def test_segment_filters(self, container_fix, create_new_user, create_purchase):
+        users = [await create_new_user() for _ in range(4)]
+        users_repo = container_fix.users_repo
+
+        await users_repo.update(users[0].user_id, language="en")
+        await users_repo.update(users[1].user_id, last_used=datetime.now(UTC) - timedelta(days=60))
+        await container_fix.notification_repo.update(users[2].user_id, referral_invitation=False)
+        await container_fix.session_db.commit()
+        await create_purchase(user_id=users[3].user_id)
+
+        async def recipients(segment: BroadcastSegment):
+            return await users_repo.get_user_ids_after(None, 100, segment)
+
+        assert await recipients(BroadcastSegment(language="en")) == [users[0].user_id]
+        assert users[1].user_id not in await recipients(BroadcastSegment(active_within_days=30))
+        assert await recipients(BroadcastSegment(has_purchased=True)) == [users[3].user_id]
+        assert users[3].user_id not in await recipients(BroadcastSegment(has_purchased=False))
+        assert users[2].user_id not in await recipients(BroadcastSegment(notification="referral_invitation"))
+
+        segment = BroadcastSegment(language="ru", has_purchased=False)
+        assert await users_repo.count_recipients(segment) == len(await recipients(segment)) == 2
+
+    @pytest.mark.asyncio
+    async def test_segment_stored_in_job(self, container_fix, create_new_user):
+        users = [await create_new_user() for _ in range(3)]
+        await container_fix.users_repo.update(users[1].user_id, language="en")
+        await container_fix.session_db.commit()
+
+        client = FakeMailingClient()
+        service = _mailing_service(container_fix, client)
+        job = await service.start_broadcast(
+            text="Only english", admin_id=users[0].user_id, segment=BroadcastSegment(language="en")
+        )
+        assert job.total_users == 1
+
+        [item async for item in service.run_broadcast(job.job_id)]
+        assert client.sent == [(users[1].user_id, "Only english")]
+
+    @pytest.mark.asyncio
+    async def test_recorder_coalesces_marks(self):
+        saved = []
+
+        async def save(reasons):
+            saved.append(reasons)
+
+        recorder = SuppressionRecorder(save, logging.getLogger(__name__), window=0.05)
+        recorder.mark(1, "forbidden")
+        recorder.mark(2, "not_found")
+        recorder.mark(1, "forbidden")
+        recorder.mark(-100, "forbidden")  # канал логов
+        recorder.mark("@channel", "not_found")
+
+        await asyncio.sleep(0.15)
+        assert saved == [{1: "forbidden", 2: "not_found"}]
@@ -0,0 +1,114 @@
+import pytest
+from sqlalchemy import text
+
+from src.database.creating import create_table
+from src.database.models.categories import AccountServiceType
+from src.models.read_models import PageCursor
+
+
+async def _create_transactions(create_new_user, create_wallet_transaction, quantity: int):
+    user = await create_new_user()
+    transactions = [await create_wallet_transaction(user.user_id, amount=number) for number in range(quantity)]
+    return user, [item.wallet_transaction_id for item in reversed(transactions)]  # от новых к старым
+
+
+class TestPageCursor:
+
+    def test_encode_decode(self):
+        cursors = [
+            PageCursor(),
+            PageCursor(page=12),
+            PageCursor(page=3, total=1000, anchor_id=987654, backward=True),
+        ]
+        for cursor in cursors:
+            token = cursor.encode()
+            assert ":" not in token
+            assert PageCursor.decode(token) == cursor
+
+    def test_legacy_page_number(self):
+        assert PageCursor.decode("1") == PageCursor()
+        assert PageCursor.decode("12") == PageCursor(page=12)
+
+    def test_invalid_token(self):
+        for token in ("", "abc", "0", "1.!"):
+            with pytest.raises(ValueError):
+                PageCursor.decode(token)
+
+    def test_previous_to_first_page_drops_anchor(self):
+        cursor = PageCursor(page=2, total=10, anchor_id=5)
+        assert cursor.previous(first_id=7) == PageCursor(total=10)
+        assert cursor.next(last_id=3) == PageCursor(page=3, total=10, anchor_id=3)
+
+
+class TestKeysetPagination:
+
+    @pytest.mark.asyncio
+    async def test_forward_and_backward(self, container_fix, create_new_user, create_wallet_transaction):
+        user, ids = await _create_transactions(create_new_user, create_wallet_transaction, 7)
+        service = container_fix.wallet_transaction_service
+
+        async def page_ids(cursor: PageCursor):
+            page = await service.get_wallet_transaction_page(user.user_id, page_size=3, cursor=cursor)
+            return [item.wallet_transaction_id for item in page]
+
+        first = PageCursor(total=7)
+        assert await page_ids(first) == ids[0:3]
+
+        second = first.next(ids[2])
+        assert await page_ids(second) == ids[3:6]
+
+        third = second.next(ids[5])
+        assert await page_ids(third) == ids[6:7]
+
+        # назад от третьей страницы вернётся та же вторая, в порядке от новых к старым
+        assert await page_ids(third.previous(ids[6])) == ids[3:6]
+        assert third.previous(ids[6]).backward
+
+        # старая кнопка с номером страницы
+        assert await page_ids(PageCursor.decode("2")) == ids[3:6]
+
+    @pytest.mark.asyncio
+    async def test_missing_anchor_returns_empty_page(self, container_fix, create_new_user, create_wallet_transaction):
+        user, ids = await _create_transactions(create_new_user, create_wallet_transaction, 2)
+
+        page = await container_fix.wallet_transaction_service.get_wallet_transaction_page(
+            user.user_id, page_size=3, cursor=PageCursor(page=2, total=50, anchor_id=max(ids) + 1000)
+        )
+        assert page == []
+
+    @pytest.mark.asyncio
+    async def test_sold_accounts_pages(self, container_fix, create_new_user, create_sold_account):
+        user = await create_new_user()
+        ids = [
+            (await create_sold_account(owner_id=user.user_id, phone_number=f"+7 920 107-42-1{number}"))[0].sold_account_id
+            for number in range(3)
+        ][::-1]
+        service = container_fix.account_sold_service
+
+        async def page_ids(cursor: PageCursor):
+            page = await service.get_sold_account_by_page(
+                user.user_id, AccountServiceType.TELEGRAM, None, "ru", page_size=2, cursor=cursor
+            )
+            return [item.sold_account_id for item in page]
+
+        first = PageCursor(total=3)
+        assert await page_ids(first) == ids[0:2]
+        assert await page_ids(first.next(ids[1])) == ids[2:3]
+
+
+class TestMissingIndexes:
+
+    @pytest.mark.asyncio
+    async def test_index_created_on_existing_table(self, container_fix):
+        async def index_exists() -> bool:
+            result = await container_fix.session_db.execute(
+                text("SELECT 1 FROM pg_indexes WHERE indexname = 'ix_wallet_transactions_user_created'")
+            )
+            return result.scalar() == 1
+
+        await container_fix.session_db.execute(text("DROP INDEX IF EXISTS ix_wallet_transactions_user_created"))
+        await container_fix.session_db.commit()
+        assert not await index_exists()
+
+        await create_table(container_fix.config)
+        assert await index_exists()
@@ -0,0 +1,113 @@
+import asyncio
+import logging
+
+import orjson
+import pytest
+
+from src.infrastructure.rabbit_mq.producer import RabbitMQProducer
+
+
+class FakeConnection:
+    is_closed = False
+
+    async def close(self):
+        self.is_closed = True
+
+
+class FakeExchange:
+
+    def __init__(self):
+        self.published = []
+        self.fail = False
+        self.gate = None
+
+    async def publish(self, message, routing_key):
+        if self.gate:
+            await self.gate.wait()
+        if self.fail:
+            raise ConnectionError("broker unavailable")
+        self.published.append((routing_key, orjson.loads(message.body)))
+
+
+def _producer(tmp_path, exchange: FakeExchange, **kwargs) -> RabbitMQProducer:
+    producer = RabbitMQProducer(
+        url="amqp://test",
+        logger=logging.getLogger(__name__),
+        buffer_size=kwargs.pop("buffer_size", 100),
+        batch_size=kwargs.pop("batch_size", 10),
+        flush_interval=0.01,
+        spill_file=tmp_path / "spill" / "events.jsonl",
+        **kwargs,
+    )
+    producer._exchange = exchange
+    producer._connection = FakeConnection()
+    return producer
+
+
+class TestRabbitMQProducer:
+
+    @pytest.mark.asyncio
+    async def test_publish_does_not_wait_for_broker(self, tmp_path):
+        exchange = FakeExchange()
+        exchange.gate = asyncio.Event()
+        producer = _producer(tmp_path, exchange)
+        producer._flush_task = asyncio.create_task(producer._flush_loop())
+
+        for number in range(25):
+            await asyncio.wait_for(producer.publish({"number": number}, "message.send_log"), timeout=0.1)
+
+        exchange.gate.set()
+        await producer.close()
+
+        assert [body["payload"]["number"] for _, body in exchange.published] == list(range(25))
+        assert producer.stats().published == 25
+        assert producer.stats().max_buffered == 25
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_spilled_and_replayed(self, tmp_path):
+        exchange = FakeExchange()
+        exchange.fail = True
+        producer = _producer(tmp_path, exchange)
+
+        await producer.publish({"user_id": 1}, "purchase.account")
+        await producer.publish({"user_id": 2}, "purchase.universal")
+        assert await producer.flush() == 2
+        assert producer.spill_file.exists()
+        assert exchange.published == []
+
+        exchange.fail = False
+        assert await producer.replay_spill() == 2
+
+        assert [(key, body["payload"]) for key, body in exchange.published] == [
+            ("purchase.account", {"user_id": 1}),
+            ("purchase.universal", {"user_id": 2}),
+        ]
+        assert not producer.spill_file.exists()
+        assert producer.stats().replayed == 2
+
+    @pytest.mark.asyncio
+    async def test_overflow_goes_to_spill_file(self, tmp_path):
+        exchange = FakeExchange()
+        producer = _producer(tmp_path, exchange, buffer_size=2)
+
+        for number in range(5):
+            await producer.publish({"number": number}, "message.send_log")
+
+        stats = producer.stats()
+        assert stats.buffered == 2
+        assert stats.overflows == 3
+        assert stats.spilled == 3
+        assert len(producer.spill_file.read_bytes().splitlines()) == 3
+
+    @pytest.mark.asyncio
+    async def test_replay_skips_broken_line(self, tmp_path):
+        exchange = FakeExchange()
+        producer = _producer(tmp_path, exchange)
+        producer.spill_file.parent.mkdir(parents=True)
+        producer.spill_file.write_bytes(
+            orjson.dumps({"routing_key": "voucher.activated", "body": {"event": "voucher.activated"}})
+            + b"\n{\"routing_key\": \"vou"
+        )
+
+        assert await producer.replay_spill() == 1
+        assert exchange.published == [("voucher.activated", {"event": "voucher.activated"})]
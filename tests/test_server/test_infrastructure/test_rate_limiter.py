@@ -0,0 +1,123 @@
+import asyncio
+import time
+
+import pytest
+
+from src.infrastructure.telegram.rate_limit import RateLimiter, Priority
+
+
+class TestRateLimiter:
+
+    @pytest.mark.asyncio
+    async def test_global_budget(self):
+        limiter = RateLimiter(max_calls=5, period=0.2, chat_burst=100)
+
+        started = time.monotonic()
+        await asyncio.gather(*(limiter.acquire(chat_id=user_id) for user_id in range(10)))
+
+        # первые 5 сразу, остальные по мере пополнения ведра (~0.04 с на токен)
+        assert 0.15 <= time.monotonic() - started < 1
+
+    @pytest.mark.asyncio
+    async def test_chat_limit_does_not_block_other_chats(self):
+        limiter = RateLimiter(max_calls=100, chat_rate=1, chat_burst=1)
+        await limiter.acquire(chat_id=1)
+
+        blocked = asyncio.create_task(limiter.acquire(chat_id=1))
+        await asyncio.sleep(0)
+
+        started = time.monotonic()
+        await asyncio.wait_for(limiter.acquire(chat_id=2), timeout=0.2)
+        assert time.monotonic() - started < 0.1
+        assert not blocked.done()
+
+        blocked.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await blocked
+        assert limiter.waiting()[Priority.INTERACTIVE] == 0
+
+    @pytest.mark.asyncio
+    async def test_interactive_served_before_broadcast(self):
+        limiter = RateLimiter(max_calls=1, period=0.05, chat_burst=100, aging=60)
+        await limiter.acquire()
+
+        order = []
+
+        async def acquire(priority: Priority, chat_id: int):
+            await limiter.acquire(chat_id=chat_id, priority=priority)
+            order.append(priority)
+
+        tasks = [asyncio.create_task(acquire(Priority.BROADCAST, user_id)) for user_id in range(3)]
+        tasks.append(asyncio.create_task(acquire(Priority.LOGS, -100)))
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(acquire(Priority.INTERACTIVE, 10)))
+        await asyncio.gather(*tasks)
+
+        assert order[0] == Priority.INTERACTIVE
+        assert order[-1] == Priority.LOGS
+
+    @pytest.mark.asyncio
+    async def test_waiting_broadcast_ages_ahead_of_new_transactional(self):
+        limiter = RateLimiter(max_calls=1, period=0.05, chat_burst=100, aging=0.01)
+        await limiter.acquire()
+
+        order = []
+
+        async def acquire(priority: Priority):
+            await limiter.acquire(priority=priority)
+            order.append(priority)
+
+        broadcast = asyncio.create_task(acquire(Priority.BROADCAST))
+        await asyncio.sleep(0.03)
+        transactional = asyncio.create_task(acquire(Priority.TRANSACTIONAL))
+        await asyncio.gather(broadcast, transactional)
+
+        assert order == [Priority.BROADCAST, Priority.TRANSACTIONAL]
+
+    @pytest.mark.asyncio
+    async def test_broadcast_backlog_never_overtakes_interactive(self):
+        limiter = RateLimiter(max_calls=1, period=0.2, chat_burst=100, aging=0.01)
+        await limiter.acquire()
+
+        order = []
+
+        async def acquire(priority: Priority, chat_id: int):
+            await limiter.acquire(chat_id=chat_id, priority=priority)
+            order.append(priority)
+
+        # рассылка ждёт в десять раз дольше, чем нужно для подъёма на все классы
+        tasks = [asyncio.create_task(acquire(Priority.BROADCAST, user_id)) for user_id in range(3)]
+        await asyncio.sleep(0.1)
+        tasks.append(asyncio.create_task(acquire(Priority.INTERACTIVE, 10)))
+        await asyncio.gather(*tasks)
+
+        assert order == [Priority.INTERACTIVE, Priority.BROADCAST, Priority.BROADCAST, Priority.BROADCAST]
+
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_only_chat(self):
+        limiter = RateLimiter(max_calls=100, chat_burst=100)
+        limiter.pause(0.2, chat_id=1)
+
+        await asyncio.wait_for(limiter.acquire(chat_id=2), timeout=0.05)
+
+        started = time.monotonic()
+        await limiter.acquire(chat_id=1)
+        assert time.monotonic() - started >= 0.15
+
+    @pytest.mark.asyncio
+    async def test_pause_priority_class(self):
+        limiter = RateLimiter(max_calls=100, chat_burst=100)
+        limiter.pause(0.2, priority=Priority.BROADCAST)
+
+        await asyncio.wait_for(limiter.acquire(chat_id=1, priority=Priority.INTERACTIVE), timeout=0.05)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(limiter.acquire(chat_id=2, priority=Priority.BROADCAST), timeout=0.05)
+
+    @pytest.mark.asyncio
+    async def test_group_chat_limit(self):
+        limiter = RateLimiter(max_calls=100, chat_burst=1, group_rate_per_minute=60)
+        await limiter.acquire(chat_id=-100, priority=Priority.LOGS)
+
+        started = time.monotonic()
+        await limiter.acquire(chat_id=-100, priority=Priority.LOGS)
+        assert time.monotonic() - started >= 0.9
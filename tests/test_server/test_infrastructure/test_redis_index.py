@@ -0,0 +1,111 @@
+import pytest
+
+from src.repository.redis import (
+    AccountsCacheRepository,
+    AdminsCacheRepository,
+    CategoriesCacheRepository,
+    ProductUniversalSingleCacheRepository,
+    PromoCodesCacheRepository,
+)
+from src.repository.redis.base import INDEX_PREFIX
+
+
+def _repo(container_fix, repo_cls):
+    return repo_cls(container_fix.session_redis, container_fix.config)
+
+
+class TestRedisIndex:
+
+    @pytest.mark.asyncio
+    async def test_set_adds_key_to_index_with_ttl(self, container_fix):
+        redis = container_fix.session_redis
+        repo = _repo(container_fix, AccountsCacheRepository)
+
+        await repo.set_sold_accounts_by_owner_id(7, [], "ru")
+        await repo.set_sold_accounts_by_owner_id(7, [], "en")
+
+        index = INDEX_PREFIX + repo._index_by_owner(7)
+        assert await redis.smembers(index) == {
+            b"sold_accounts_by_owner_id:7:ru",
+            b"sold_accounts_by_owner_id:7:en",
+        }
+        assert await redis.ttl(index) > 0
+
+    @pytest.mark.asyncio
+    async def test_delete_index_removes_only_entity_keys(self, container_fix):
+        redis = container_fix.session_redis
+        repo = _repo(container_fix, CategoriesCacheRepository)
+
+        for key in ("category:1:ru", "category:1:en", "category:10:ru", "category:11:ru"):
+            await repo._set_raw(key, b"[]")
+
+        await repo.delete_category(1)
+
+        assert await redis.exists("category:1:ru", "category:1:en") == 0
+        assert await redis.exists("category:10:ru", "category:11:ru") == 2
+        assert await redis.exists(INDEX_PREFIX + repo._index_by_category(1)) == 0
+        assert await redis.smembers(INDEX_PREFIX + repo._index_by_category(10)) == {b"category:10:ru"}
+
+    @pytest.mark.asyncio
+    async def test_delete_index_without_index(self, container_fix):
+        repo = _repo(container_fix, CategoriesCacheRepository)
+        assert await repo._delete_index(repo._index_by_category(404)) == 0
+
+    @pytest.mark.asyncio
+    async def test_delete_single_key_keeps_index_consistent(self, container_fix):
+        redis = container_fix.session_redis
+        repo = _repo(container_fix, AdminsCacheRepository)
+
+        await repo.set(1)
+        await repo.set(2)
+        await repo.delete(1)
+
+        assert await redis.smembers(INDEX_PREFIX + repo._index()) == {b"admin:2"}
+
+        await repo.delete_all()
+        assert not await repo.exists(2)
+
+    @pytest.mark.asyncio
+    async def test_bulk_set_indexes_keys(self, container_fix):
+        redis = container_fix.session_redis
+        repo = _repo(container_fix, AdminsCacheRepository)
+
+        await repo.bulk_set([(repo._key(user_id), b"_", 0) for user_id in range(3)], delete_keys=[repo._key(0)])
+
+        assert await redis.smembers(INDEX_PREFIX + repo._index()) == {b"admin:1", b"admin:2"}
+
+    @pytest.mark.asyncio
+    async def test_promo_index_not_expired_by_short_ttl(self, container_fix):
+        redis = container_fix.session_redis
+        repo = _repo(container_fix, PromoCodesCacheRepository)
+
+        await repo._set_raw(repo._key("FOREVER"), b"{}")
+        await repo._set_raw(repo._key("SHORT"), b"{}", ttl=60)
+
+        assert await redis.ttl(INDEX_PREFIX + repo._index()) == -1
+
+    @pytest.mark.asyncio
+    async def test_prune_index_removes_expired_keys(self, container_fix):
+        redis = container_fix.session_redis
+        repo = _repo(container_fix, PromoCodesCacheRepository)
+
+        await repo._set_raw(repo._key("FOREVER"), b"{}")
+        await repo._set_raw(repo._key("SHORT"), b"{}", ttl=60)
+        await redis.delete(repo._key("SHORT"))  # истёк по ttl, из индекса его никто не убрал
+
+        assert await repo.prune_index() == 1
+        assert await redis.smembers(INDEX_PREFIX + repo._index()) == {b"promo_code:FOREVER"}
+        assert await repo.prune_index() == 0
+
+    @pytest.mark.asyncio
+    async def test_delete_product_universal_exact_key(self, container_fix):
+        redis = container_fix.session_redis
+        repo = _repo(container_fix, ProductUniversalSingleCacheRepository)
+
+        await redis.set(repo._key(1), b"{}")
+        await redis.set(repo._key(10), b"{}")
+
+        await repo.delete_by_product_id(1)
+
+        assert await redis.exists(repo._key(1)) == 0
+        assert await redis.exists(repo._key(10)) == 1
@@ -0,0 +1,142 @@
+from datetime import datetime, timedelta, UTC
+
+import pytest
+from sqlalchemy import update, select, func
+
+from src.database.models.categories import Purchases, ProductType
+from src.database.models.system import StatisticsDailyUsers, StatisticsDailySales
+from src.database.models.users import Users, Replenishments
+
+
+async def _move_to_past(container_fix, days: int, user_ids=(), replenishment_ids=(), purchase_ids=()):
+    moment = datetime.now(UTC) - timedelta(days=days)
+    session = container_fix.session_db
+    await session.execute(update(Users).where(Users.user_id.in_(user_ids)).values(created_at=moment, last_used=moment))
+    await session.execute(
+        update(Replenishments).where(Replenishments.replenishment_id.in_(replenishment_ids)).values(created_at=moment)
+    )
+    await session.execute(update(Purchases).where(Purchases.purchase_id.in_(purchase_ids)).values(purchase_date=moment))
+    await session.commit()
+
+
+class TestStatisticsRollups:
+
+    @pytest.mark.asyncio
+    async def test_sales_by_category(self, container_fix, create_new_user, create_purchase, create_category):
+        user = await create_new_user()
+        category = await create_category(is_product_storage=True, name="Telegram RU")
+        purchases = [
+            await create_purchase(user_id=user.user_id, product_type=ProductType.ACCOUNT, purchase_price=100, net_profit=40)
+            for _ in range(2)
+        ]
+
+        await container_fix.statistics_rollup_service.record_sales(
+            category_id=category.category_id, purchase_ids=[purchase.purchase_id for purchase in purchases]
+        )
+        await container_fix.session_db.commit()
+
+        statistics = await container_fix.statistics_service.get_statistics(1)
+
+        assert statistics.quantity_sale_accounts == 2
+        assert statistics.amount_sale_accounts == 200
+        assert statistics.total_net_profit == 80
+        assert [(item.category_id, item.name, item.quantity_sale) for item in statistics.sales_by_category] == [
+            (category.category_id, "Telegram RU", 2)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_close_days_matches_live(
+        self, container_fix, create_new_user, create_replenishment, create_purchase
+    ):
+        old_user = await create_new_user()
+        old_replenishment = await create_replenishment(user_id=old_user.user_id, amount=300)
+        old_purchase = await create_purchase(user_id=old_user.user_id, product_type=ProductType.ACCOUNT)
+        await _move_to_past(
+            container_fix,
+            days=3,
+            user_ids=[old_user.user_id],
+            replenishment_ids=[old_replenishment.replenishment_id],
+            purchase_ids=[old_purchase.purchase_id],
+        )
+
+        # сегодняшние данные остаются несвёрнутыми и считаются по исходным таблицам
+        today_user = await create_new_user()
+        await create_replenishment(user_id=today_user.user_id, amount=50)
+
+        before = await container_fix.statistics_service.get_statistics(7)
+        await container_fix.statistics_rollup_service.close_days()
+        after = await container_fix.statistics_service.get_statistics(7)
+
+        closed_until = await container_fix.statistics_rollup_repo.get_closed_until()
+        assert closed_until == (datetime.now(UTC) - container_fix.statistics_rollup_service.close_delay).date() - timedelta(days=1)
+
+        assert after.new_users == 2
+        assert after.total_users == 2
+        assert after.active_users == 2
+        assert after.quantity_replenishments == 2
+        assert after.amount_replenishments == 350
+        assert (after.new_users, after.total_users, after.amount_replenishments) == \
+               (before.new_users, before.total_users, before.amount_replenishments)
+
+        # покупка без события покупки попадает в продажи без категории
+        assert after.quantity_sale_accounts == 1
+        assert [item.category_id for item in after.sales_by_category] == [0]
+
+        # за 1 день старых данных уже нет
+        last_day = await container_fix.statistics_service.get_statistics(1)
+        assert last_day.new_users == 1
+        assert last_day.amount_replenishments == 50
+        assert last_day.quantity_sale == 0
+
+    @pytest.mark.asyncio
+    async def test_close_days_does_not_duplicate_sales(
+        self, container_fix, create_new_user, create_purchase, create_category
+    ):
+        user = await create_new_user()
+        category = await create_category(is_product_storage=True)
+        recorded = await create_purchase(user_id=user.user_id, product_type=ProductType.ACCOUNT)
+        lost = await create_purchase(user_id=user.user_id, product_type=ProductType.ACCOUNT)
+        await _move_to_past(
+            container_fix, days=2, user_ids=[user.user_id], purchase_ids=[recorded.purchase_id, lost.purchase_id]
+        )
+
+        await container_fix.statistics_rollup_service.record_sales(category.category_id, [recorded.purchase_id])
+        await container_fix.session_db.commit()
+
+        service = container_fix.statistics_rollup_service
+        await service.close_days()
+        # повторное закрытие тех же дней ничего не добавляет
+        await container_fix.statistics_rollup_repo.close_days(
+            (datetime.now(UTC) - timedelta(days=3)).date(), (datetime.now(UTC) - timedelta(days=1)).date()
+        )
+        await container_fix.session_db.commit()
+
+        result = await container_fix.session_db.execute(
+            select(StatisticsDailySales.category_id, StatisticsDailySales.quantity)
+            .order_by(StatisticsDailySales.category_id)
+        )
+        assert result.all() == [(0, 1), (category.category_id, 1)]
+
+        result = await container_fix.session_db.execute(select(func.count()).select_from(StatisticsDailyUsers))
+        assert result.scalar() >= 2 # строка на каждый закрытый день, даже без новых пользователей
+
+    @pytest.mark.asyncio
+    async def test_late_event_for_closed_day_not_counted_twice(
+        self, container_fix, create_new_user, create_purchase, create_category
+    ):
+        user = await create_new_user()
+        category = await create_category(is_product_storage=True)
+        late = await create_purchase(user_id=user.user_id, product_type=ProductType.ACCOUNT, purchase_price=100)
+        await _move_to_past(container_fix, days=2, user_ids=[user.user_id], purchase_ids=[late.purchase_id])
+
+        # день закрыт до события: покупка уже в продажах без категории
+        await container_fix.statistics_rollup_service.close_days()
+
+        for _ in range(2):  # опоздавшее событие и его повтор
+            await container_fix.statistics_rollup_service.record_sales(category.category_id, [late.purchase_id])
+            await container_fix.session_db.commit()
+
+        statistics = await container_fix.statistics_service.get_statistics(7)
+        assert statistics.quantity_sale_accounts == 1
+        assert statistics.amount_sale_accounts == 100
+        assert [(item.category_id, item.quantity_sale) for item in statistics.sales_by_category] == [(0, 1)]
@@ -0,0 +1,108 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+
+from src.application.models.discounts.remove_invalid import EXPIRY_LOCK_KEY
+from src.database.models.discount import Vouchers, PromoCodes
+from src.database.models.users import Users, WalletTransaction
+
+
+class RecordingProducer:
+
+    def __init__(self):
+        self.events = []
+
+    async def publish(self, payload: dict, routing_key: str):
+        self.events.append((routing_key, payload))
+
+
+@pytest.fixture
+def producer(container_fix):
+    recording = RecordingProducer()
+    container_fix.publish_event_handler.producer = recording
+    return recording
+
+
+def _expired() -> datetime:
+    return datetime.now(timezone.utc) - timedelta(minutes=1)
+
+
+class TestRemoveInvalidDiscounts:
+
+    @pytest.mark.asyncio
+    async def test_vouchers_refunded_per_creator(self, container_fix, producer, create_new_user, create_voucher):
+        first = await create_new_user(balance=0)
+        second = await create_new_user(balance=10)
+        expired = [
+            await create_voucher(creator_id=first.user_id, expire_at=_expired(), number_of_activations=5),
+            await create_voucher(creator_id=first.user_id, expire_at=_expired(), number_of_activations=2),
+            await create_voucher(creator_id=second.user_id, expire_at=_expired(), number_of_activations=1),
+            await create_voucher(creator_id=second.user_id, expire_at=_expired(), is_created_admin=True),
+        ]
+        active = await create_voucher(creator_id=first.user_id)
+
+        await container_fix.get_remove_invalid_discount_use_case().execute()
+
+        result = await container_fix.session_db.execute(select(Vouchers.voucher_id, Vouchers.is_valid))
+        validity = dict(result.all())
+        assert not any(validity[voucher.voucher_id] for voucher in expired)
+        assert validity[active.voucher_id]
+
+        result = await container_fix.session_db.execute(select(Users.user_id, Users.balance))
+        balances = dict(result.all())
+        assert balances[first.user_id] == 700 # (5 + 2) активаций по 100
+        assert balances[second.user_id] == 110 # ваучер админа не возвращается
+
+        result = await container_fix.session_db.execute(
+            select(WalletTransaction).where(WalletTransaction.user_id == first.user_id)
+        )
+        transactions = result.scalars().all()
+        assert [(item.type, item.amount, item.balance_before, item.balance_after) for item in transactions] == [
+            ("refund", 700, 0, 700)
+        ]
+
+        cached_user = await container_fix.users_cache_repo.get(first.user_id)
+        assert cached_user.balance == 700
+
+        notified = [payload["user_id"] for key, payload in producer.events if key == "message.send_user"]
+        assert sorted(notified) == sorted([first.user_id, first.user_id, second.user_id])
+        assert any(key == "message.send_log" for key, _ in producer.events) # ваучер админа
+
+    @pytest.mark.asyncio
+    async def test_batches(self, container_fix, producer, monkeypatch, create_new_user, create_voucher, create_promo_code):
+        monkeypatch.setattr(container_fix.config.different, "discount_expiry_batch", 2)
+        user = await create_new_user(balance=0)
+        for _ in range(5):
+            await create_voucher(creator_id=user.user_id, expire_at=_expired(), number_of_activations=1)
+        for number in range(3):
+            await create_promo_code(activation_code=f"EXPIRED{number}", expire_at=_expired())
+        await create_promo_code(activation_code="ACTIVE")
+
+        await container_fix.get_remove_invalid_discount_use_case().execute()
+
+        result = await container_fix.session_db.execute(select(Users.balance).where(Users.user_id == user.user_id))
+        assert result.scalar() == 500
+
+        result = await container_fix.session_db.execute(select(Vouchers).where(Vouchers.is_valid.is_(True)))
+        assert result.scalars().all() == []
+
+        result = await container_fix.session_db.execute(
+            select(PromoCodes.activation_code).where(PromoCodes.is_valid.is_(True))
+        )
+        assert result.scalars().all() == ["ACTIVE"]
+        assert await container_fix.promo_code_cache_repo.get("EXPIRED0") is None
+        assert await container_fix.promo_code_cache_repo.get("ACTIVE") is not None
+
+    @pytest.mark.asyncio
+    async def test_skipped_while_locked(self, container_fix, producer, create_voucher):
+        voucher = await create_voucher(expire_at=_expired())
+        await container_fix.session_redis.set(EXPIRY_LOCK_KEY, "other", ex=60)
+
+        await container_fix.get_remove_invalid_discount_use_case().execute()
+
+        result = await container_fix.session_db.execute(
+            select(Vouchers.is_valid).where(Vouchers.voucher_id == voucher.voucher_id)
+        )
+        assert result.scalar() is True
+        assert await container_fix.session_redis.get(EXPIRY_LOCK_KEY) == b"other"
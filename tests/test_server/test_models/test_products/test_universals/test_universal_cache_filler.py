@@ -5,6 +5,7 @@ import pytest
 
 from src.application.models.products.universal.universal_cache_filler_service import UniversalCacheFillerService
 from src.database.models.categories.product_universal import (
+    ProductUniversal,
     SoldUniversal,
     StorageStatus,
     UniversalMediaType,
@@ -34,6 +35,32 @@ class TestUniversalCacheFillerService:
         assert cached
         assert any(item.product_universal_id == full.product_universal_id for item in cached)
 
+    @pytest.mark.asyncio
+    async def test_fill_product_universal_batch(
+        self,
+        container_fix,
+        create_product_universal,
+    ):
+        _, first = await create_product_universal(filling_redis=False)
+        _, second = await create_product_universal(filling_redis=False)
+        await container_fix.product_universal_single_cache_repo.set(first)
+        await container_fix.session_db.delete(
+            await container_fix.session_db.get(ProductUniversal, first.product_universal_id)
+        )
+        await container_fix.session_db.commit()
+
+        await container_fix.universal_cache_filler_service.fill_product_universal_batch(
+            category_ids=[first.category_id, second.category_id],
+            product_universal_ids=[first.product_universal_id, second.product_universal_id],
+        )
+
+        assert await container_fix.product_universal_cache_repo.get_by_category(first.category_id) == []
+        cached_second = await container_fix.product_universal_cache_repo.get_by_category(second.category_id)
+        assert [item.product_universal_id for item in cached_second] == [second.product_universal_id]
+
+        assert await container_fix.product_universal_single_cache_repo.get(first.product_universal_id) is None
+        assert await container_fix.product_universal_single_cache_repo.get(second.product_universal_id) is not None
+
     @pytest.mark.asyncio
     async def test_fill_product_universal_by_product_id_sets_cache(
         self,
@@ -1,7 +1,7 @@
 import pytest
 from sqlalchemy import select
 
-import src.application.models.purchases.accounts.account_purchase_service as account_purchase_module
+import src.infrastructure.files.file_transaction as file_transaction_module
 from src.database.models.categories import AccountServiceType, StorageStatus
 from src.database.models.categories.product_account import AccountStorage
 from src.database.models.categories.main_category_and_product import PurchaseRequests, Purchases
@@ -357,17 +357,17 @@ async def test_account_purchase_service_finalize_failure_uses_real_cancel_path(
     finally:
         container_fix.account_purchase_service.validate_other_account.check_valid = original_check_valid
 
-    original_move_file = account_purchase_module.move_file
+    original_stage_file = file_transaction_module.stage_file_sync
 
-    async def fake_move_file(*args, **kwargs):
+    def fake_stage_file(*args, **kwargs):
         return False
 
-    account_purchase_module.move_file = fake_move_file
+    file_transaction_module.stage_file_sync = fake_stage_file
     try:
         finalized = await container_fix.account_purchase_service.finalize_purchase(user.user_id, start_result)
         assert finalized is False
     finally:
-        account_purchase_module.move_file = original_move_file
+        file_transaction_module.stage_file_sync = original_stage_file
 
     request_db = await container_fix.session_db.get(PurchaseRequests, start_result.purchase_request_id)
     assert request_db.status == "failed"
@@ -1,10 +1,10 @@
 import pytest
 from sqlalchemy import select
 
-import src.application.models.purchases.universal.universal_purchase_service as universal_purchase_module
+import src.infrastructure.files.file_transaction as file_transaction_module
 from src.database.models.categories import ProductType, StorageStatus
 from src.database.models.categories.main_category_and_product import PurchaseRequests, Purchases
-from src.database.models.categories.product_universal import UniversalStorage, SoldUniversal
+from src.database.models.categories.product_universal import UniversalStorage, SoldUniversal, ProductUniversal
 from src.database.models.users import BalanceHolder
 from src.database.models.users.models_users import Users
 from tests.helpers.fixtures.helper_fixture import (
@@ -86,6 +86,79 @@ async def test_universal_purchase_service_start_and_finalize_different(
     assert any(item.status == StorageStatus.BOUGHT for item in storages)
     assert any(item.status == StorageStatus.FOR_SALE for item in storages)
 
+@pytest.mark.asyncio
+async def test_universal_purchase_service_finalize_different_bulk_movement(
+    container_fix,
+    create_category,
+    create_new_user,
+    create_product_universal,
+):
+    await container_fix.session_db.rollback()
+    user = await create_new_user(balance=3_000)
+    category = await create_category(
+        is_product_storage=True,
+        product_type=ProductType.UNIVERSAL,
+        reuse_product=False,
+        price=150,
+        cost_price=60,
+    )
+
+    service = container_fix.universal_purchase_service
+    original_check_valid = service.validations_universal_products.check_valid_universal_product
+    original_new_purchase = service.publish_event_handler.new_purchase_universal
+    published = []
+
+    async def fake_check_valid(*args, **kwargs):
+        return True
+
+    async def fake_new_purchase(data):
+        published.append(data)
+
+    service.validations_universal_products.check_valid_universal_product = fake_check_valid
+    service.publish_event_handler.new_purchase_universal = fake_new_purchase
+    try:
+        for _ in range(5):
+            await create_product_universal(category_id=category.category_id, language="ru")
+
+        start_result = await service.start_purchase(
+            user_id=user.user_id,
+            category_id=category.category_id,
+            quantity_products=5,
+            promo_code_id=None,
+            language="ru",
+        )
+        finalized = await service.finalize_purchase_different(user_id=user.user_id, data=start_result)
+        assert finalized is True
+    finally:
+        service.validations_universal_products.check_valid_universal_product = original_check_valid
+        service.publish_event_handler.new_purchase_universal = original_new_purchase
+
+    storage_ids = {p.universal_storage_id for p in start_result.full_reserved_products}
+
+    products_db = await container_fix.session_db.execute(
+        select(ProductUniversal).where(ProductUniversal.universal_storage_id.in_(storage_ids))
+    )
+    assert products_db.scalars().all() == []
+
+    storage_db = await container_fix.session_db.execute(
+        select(UniversalStorage).where(UniversalStorage.universal_storage_id.in_(storage_ids))
+    )
+    assert all(item.status == StorageStatus.BOUGHT for item in storage_db.scalars().all())
+
+    sold_db = await container_fix.session_db.execute(select(SoldUniversal).where(SoldUniversal.owner_id == user.user_id))
+    sold_by_id = {item.sold_universal_id: item for item in sold_db.scalars().all()}
+    purchase_db = await container_fix.session_db.execute(select(Purchases).where(Purchases.user_id == user.user_id))
+    purchase_by_id = {item.purchase_id: item for item in purchase_db.scalars().all()}
+
+    assert len(published) == 1
+    movement = published[0].product_movement
+    assert {item.universal_storage_id for item in movement} == storage_ids
+    for item in movement:
+        assert sold_by_id[item.sold_universal_id].universal_storage_id == item.universal_storage_id
+        assert purchase_by_id[item.purchase_id].universal_storage_id == item.universal_storage_id
+        assert item.net_profit == 150 - 60
+
+
 @pytest.mark.asyncio
 async def test_universal_purchase_service_start_and_finalize_one(
     container_fix,
@@ -186,12 +259,12 @@ async def test_universal_purchase_service_finalize_failure_uses_real_cancel_path
     finally:
         container_fix.universal_purchase_service.validations_universal_products.check_valid_universal_product = original_check_valid
 
-    original_move_file = universal_purchase_module.move_file
+    original_stage_file = file_transaction_module.stage_file_sync
 
-    async def fake_move_file(*args, **kwargs):
+    def fake_stage_file(*args, **kwargs):
         return False
 
-    universal_purchase_module.move_file = fake_move_file
+    file_transaction_module.stage_file_sync = fake_stage_file
     try:
         finalized = await container_fix.universal_purchase_service.finalize_purchase_different(
             user_id=user.user_id,
@@ -199,7 +272,7 @@ async def test_universal_purchase_service_finalize_failure_uses_real_cancel_path
         )
         assert finalized is False
     finally:
-        universal_purchase_module.move_file = original_move_file
+        file_transaction_module.stage_file_sync = original_stage_file
 
     request_db = await container_fix.session_db.get(PurchaseRequests, start_result.purchase_request_id)
     assert request_db.status == "failed"
@@ -0,0 +1,62 @@
+import pytest
+from pydantic import ValidationError
+
+from src.models.create_models.users import CreateBannedAccountsDTO
+from tests.helpers.helper_functions import comparison_models
+
+
+class TestUserContextService:
+
+    @pytest.mark.asyncio
+    async def test_get_context_from_cache(self, container_fix, create_new_user, create_admin_fix):
+        user = await create_new_user()
+        await create_admin_fix(user_id=user.user_id)
+        await container_fix.banned_account_service.create_ban(
+            user_id=user.user_id,
+            data=CreateBannedAccountsDTO(reason="spam"),
+            make_commit=True,
+            filling_redis=True,
+        )
+        settings = await container_fix.settings_service.get_settings()  # заполнит кэш настроек
+
+        context = await container_fix.user_context_service.get_context(user.user_id, user.username)
+
+        assert context.user_id == user.user_id
+        assert comparison_models(user, context.user)
+        assert context.is_banned
+        assert context.ban_reason == "spam"
+        assert context.is_admin
+        assert comparison_models(settings, context.settings)
+        assert context.maintenance_mode == settings.maintenance_mode
+
+    @pytest.mark.asyncio
+    async def test_get_context_falls_back_to_db(self, container_fix, create_new_user):
+        user = await create_new_user(filling_redis=False)
+
+        context = await container_fix.user_context_service.get_context(user.user_id, user.username)
+
+        assert context.user is not None
+        assert context.user.user_id == user.user_id
+        assert not context.is_banned
+        assert not context.is_admin
+        assert context.settings is not None
+
+        # пользователь и настройки попали в кэш
+        assert await container_fix.users_cache_repo.get(user.user_id) is not None
+        assert await container_fix.settings_cache_repo.get() is not None
+
+    @pytest.mark.asyncio
+    async def test_get_context_unknown_user(self, container_fix):
+        context = await container_fix.user_context_service.get_context(999_999, "nobody")
+
+        assert context.user is None
+        assert not context.is_banned
+        assert not context.is_admin
+
+    @pytest.mark.asyncio
+    async def test_context_is_frozen(self, container_fix, create_new_user):
+        user = await create_new_user()
+        context = await container_fix.user_context_service.get_context(user.user_id, user.username)
+
+        with pytest.raises(ValidationError):
+            context.is_admin = True
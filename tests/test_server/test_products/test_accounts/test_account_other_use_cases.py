@@ -10,7 +10,6 @@ from src.database.models.categories import AccountServiceType
 from src.database.models.categories.product_account import ProductAccounts
 from src.infrastructure.files.file_system import make_csv_bytes
 
-from src.application.products.accounts.other.use_cases import validate as validate_other_module
 
 
 
@@ -113,8 +112,8 @@ async def test_validate_other_accounts_use_case_false_on_unwrap_error(
         filling_redis=False,
     )
     monkeypatch.setattr(
-        validate_other_module,
-        "unwrap_dek",
+        container_fix.validate_other_account.crypto_service,
+        "_get",
         lambda *args, **kwargs: (_ for _ in ()).throw(ValueError("bad")),
     )
 
@@ -129,12 +129,9 @@ async def test_decryption_tg_account_extracts_folder(container_fix, create_accou
         status=StorageStatus.FOR_SALE,
         type_account_service=AccountServiceType.TELEGRAM,
     )
-    crypto = container_fix.crypto_provider.get()
-
     folder_path = Path(
         container_fix.account_service.decryption_tg_account(
             account_storage,
-            crypto,
             account_storage.status,
         )
     )
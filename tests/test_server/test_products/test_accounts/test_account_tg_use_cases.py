@@ -12,6 +12,7 @@ from tests.helpers.fake_moduls.fake_tg_account_client import FakeTelegramAccount
 from src.application.products.accounts.tg.dto.schemas import BaseAccountProcessingResult
 from src.application.products.accounts.tg.use_cases.upload import UploadTGAccountsUseCase
 from src.database.models.categories import AccountServiceType
+from src.exceptions import TheCategoryNotStorageAccount
 from src.utils.pars_number import phone_in_e164
 
 
@@ -188,7 +189,6 @@ async def test_upload_tg_accounts_use_case_yields_archives_and_cleans(
         conf=container_fix.config,
         account_service=container_fix.account_service,
         account_product_service=container_fix.account_product_service,
-        crypto_provider=container_fix.crypto_provider,
     )
 
     yielded = []
@@ -268,3 +268,89 @@ async def test_import_tg_accounts_use_case_orchestrates_batches(
     with pytest.raises(StopAsyncIteration):
         await anext(generator)
     shutil.rmtree(work_dir, ignore_errors=True)
+
+
+@pytest.mark.asyncio
+async def test_import_in_db_bulk_inserts_and_reports_progress(
+    container_fix,
+    create_category,
+    monkeypatch,
+):
+    use_case = container_fix.import_tg_account_use_case
+    monkeypatch.setattr(container_fix.config.different, "import_progress_interval", 0)
+    category = await create_category(is_product_storage=True)
+
+    work_dir = container_fix.config.paths.temp_dir
+    items = []
+    for i in range(3):
+        directory = work_dir / f"acc_{i}"
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / "session.session").write_text(f"session_{i}", encoding="utf-8")
+        items.append(BaseAccountProcessingResult.model_construct(
+            valid=True,
+            user=SimpleNamespace(id=1000 + i, phone=f"+7999111000{i}"),
+            phone=f"+7999111000{i}",
+            dir_path=str(directory),
+        ))
+    items.append(BaseAccountProcessingResult.model_construct(valid=False, dir_path=str(work_dir / "skip")))
+
+    fill_calls = []
+    original_fill = use_case.account_product_service.category_filler_service.fill_need_category
+    async def fill_need_category(*args, **kwargs):
+        fill_calls.append(kwargs)
+        return await original_fill(*args, **kwargs)
+    monkeypatch.setattr(use_case.account_product_service.category_filler_service, "fill_need_category", fill_need_category)
+
+    progress = []
+    async def on_progress(done, total):
+        progress.append((done, total))
+
+    added = await use_case._import_in_db(
+        items, AccountServiceType.TELEGRAM, str(work_dir / "invalid"), category.category_id, on_progress
+    )
+
+    assert added == 3
+    assert progress[-1] == (3, 3) and len(progress) == 3
+    assert len(fill_calls) == 1
+
+    products = await container_fix.account_product_service.get_product_accounts_by_category_id(
+        category.category_id, get_full=True
+    )
+    assert sorted(p.account_storage.tg_id for p in products) == [1000, 1001, 1002]
+    for product in products:
+        storage = product.account_storage
+        assert storage.phone_number == phone_in_e164(f"+7999111000{storage.tg_id - 1000}")
+        assert await container_fix.tg_account_media_repo.get_by_account_storage_id(storage.account_storage_id)
+
+        temp_dir = container_fix.account_service.decryption_tg_account(storage, storage.status)
+        session = Path(temp_dir) / "session.session"
+        assert session.read_text(encoding="utf-8") == f"session_{storage.tg_id - 1000}"
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    assert await container_fix.accounts_cache_repo.get_product_accounts_by_category(category.category_id)
+    shutil.rmtree(work_dir, ignore_errors=True)
+
+
+@pytest.mark.asyncio
+async def test_import_in_db_removes_files_when_insert_fails(
+    container_fix,
+    create_category,
+):
+    use_case = container_fix.import_tg_account_use_case
+    category = await create_category(is_product_storage=False)
+
+    work_dir = container_fix.config.paths.temp_dir
+    directory = work_dir / "acc"
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / "session.session").write_text("session", encoding="utf-8")
+    item = BaseAccountProcessingResult.model_construct(
+        valid=True, user=SimpleNamespace(id=2000, phone="+79991112000"), phone="+79991112000", dir_path=str(directory)
+    )
+
+    with pytest.raises(TheCategoryNotStorageAccount):
+        await use_case._import_in_db([item], AccountServiceType.TELEGRAM, str(work_dir / "invalid"), category.category_id)
+
+    accounts_dir = Path(container_fix.config.paths.accounts_dir)
+    assert not list(accounts_dir.rglob("account.enc"))
+    assert 2000 not in await container_fix.account_storage_service.get_all_tg_ids()
+    shutil.rmtree(work_dir, ignore_errors=True)
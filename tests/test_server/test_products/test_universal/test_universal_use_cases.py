@@ -1,4 +1,6 @@
+import os
 import shutil
+import time
 import zipfile
 import tempfile as pytempfile
 import pytest
@@ -108,6 +110,7 @@ async def test_import_universal_products_imports_generated_archive(
     container_fix,
     create_category,
     session_db_fix,
+    monkeypatch,
 ):
     work_dir = container_fix.config.paths.temp_dir
     category = await create_category(is_product_storage=True)
@@ -115,28 +118,137 @@ async def test_import_universal_products_imports_generated_archive(
     archive_path = work_dir / archive_source.name
     shutil.copy2(archive_source, archive_path)
 
-    original_mkdtemp = pytempfile.mkdtemp
-
     def workspace_mkdtemp(*args, **kwargs):
         path = work_dir / "extract"
         path.mkdir(parents=True, exist_ok=True)
         return str(path)
 
-    file_system_module.tempfile.mkdtemp = workspace_mkdtemp
+    monkeypatch.setattr(file_system_module.tempfile, "mkdtemp", workspace_mkdtemp)
 
     use_case = container_fix.import_universal_product_use_case
 
-    added = await use_case.execute(
-        archive_path,
-        UniversalMediaType.MIXED,
-        category.category_id,
-    )
+    try:
+        added = await use_case.execute(
+            archive_path,
+            UniversalMediaType.MIXED,
+            category.category_id,
+        )
+
+        assert added == 2
+
+        db_result = await session_db_fix.execute(
+            select(ProductUniversal).where(ProductUniversal.category_id == category.category_id)
+        )
+        imported = db_result.scalars().all()
+        assert len(imported) == 2
+
+        entries = await container_fix.universal_integrity_repo.get_by_storage_ids(
+            [product.universal_storage_id for product in imported]
+        )
+        assert len(entries) == 2
+        assert all(entry.is_valid for entry in entries.values())
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+@pytest.mark.asyncio
+async def test_validations_universal_products_uses_integrity_index(
+    container_fix,
+    create_category,
+    create_product_universal,
+):
+    category = await create_category(is_product_storage=True)
+    _, full = await create_product_universal(category_id=category.category_id)
+    validations = container_fix.validations_universal_products
+    storage_id = full.universal_storage.universal_storage_id
+
+    original_check_valid = validations.check_valid_universal_product
+    decrypted = []
+
+    async def counting_check_valid(product, status):
+        decrypted.append(product.universal_storage.universal_storage_id)
+        return await original_check_valid(product, status)
+
+    validations.check_valid_universal_product = counting_check_valid
+    try:
+        # записи в индексе ещё нет: полное дешифрование и запись результата
+        assert await validations.check_valid_universal_products([full], StorageStatus.FOR_SALE) == [True]
+        assert decrypted == [storage_id]
+
+        entries = await container_fix.universal_integrity_repo.get_by_storage_ids([storage_id])
+        assert entries[storage_id].is_valid is True
+        assert entries[storage_id].checksum == full.universal_storage.checksum
+
+        # свежая запись: проверка без дешифрования
+        assert await validations.check_valid_universal_products([full], StorageStatus.FOR_SALE) == [True]
+        assert decrypted == [storage_id]
+
+        path = container_fix.path_builder.build_path_universal_storage(
+            StorageStatus.FOR_SALE,
+            full.universal_storage.storage_uuid,
+        )
+        # mtime новее проверки, но содержимое то же: сверка хэша без дешифрования
+        future = time.time() + 60
+        os.utime(path, (future, future))
+        assert await validations.check_valid_universal_products([full], StorageStatus.FOR_SALE) == [True]
+        assert decrypted == [storage_id]
+
+        # файл изменился: запись больше не доверяется
+        with open(path, "ab") as f:
+            f.write(b"broken")
+
+        assert await validations.check_valid_universal_products([full], StorageStatus.FOR_SALE) == [False]
+        assert decrypted == [storage_id, storage_id]
+
+        entries = await container_fix.universal_integrity_repo.get_by_storage_ids([storage_id])
+        assert entries[storage_id].is_valid is False
+    finally:
+        validations.check_valid_universal_product = original_check_valid
 
-    assert added == 2
 
-    db_result = await session_db_fix.execute(
-        select(ProductUniversal).where(ProductUniversal.category_id == category.category_id)
+@pytest.mark.asyncio
+async def test_validations_universal_products_hashes_same_size_change(
+    container_fix,
+    create_category,
+    create_product_universal,
+):
+    category = await create_category(is_product_storage=True)
+    _, full = await create_product_universal(category_id=category.category_id)
+    validations = container_fix.validations_universal_products
+    storage_id = full.universal_storage.universal_storage_id
+
+    assert await validations.check_valid_universal_products([full], StorageStatus.FOR_SALE) == [True]
+
+    # содержимое заменено без изменения размера: индекс по размеру такое не заметит
+    path = container_fix.path_builder.build_path_universal_storage(
+        StorageStatus.FOR_SALE,
+        full.universal_storage.storage_uuid,
     )
-    assert len(db_result.scalars().all()) == 2
-    file_system_module.tempfile.mkdtemp = original_mkdtemp
-    shutil.rmtree(work_dir, ignore_errors=True)
+    with open(path, "r+b") as f:
+        f.seek(-1, os.SEEK_END)
+        last = f.read(1)
+        f.seek(-1, os.SEEK_END)
+        f.write(bytes([last[0] ^ 0xFF]))
+    future = time.time() + 60
+    os.utime(path, (future, future))
+
+    assert await validations.check_valid_universal_products([full], StorageStatus.FOR_SALE) == [False]
+    entries = await container_fix.universal_integrity_repo.get_by_storage_ids([storage_id])
+    assert entries[storage_id].is_valid is False
+
+
+@pytest.mark.asyncio
+async def test_verify_universal_integrity_use_case_indexes_products_for_sale(
+    container_fix,
+    create_category,
+    create_product_universal,
+):
+    category = await create_category(is_product_storage=True)
+    _, full = await create_product_universal(category_id=category.category_id)
+    storage_id = full.universal_storage.universal_storage_id
+
+    while await container_fix.verify_universal_integrity_use_case.execute():
+        pass
+
+    entries = await container_fix.universal_integrity_repo.get_by_storage_ids([storage_id])
+    assert entries[storage_id].is_valid is True